@@ -487,9 +487,14 @@ Assistant:"""
                         prob += var <= 100  # Max quality
                         prob += var >= 80   # Min quality
             
-            # Solve the problem
+            # Solve the problem in-process with HiGHS when available
+            # (CBC writes a model file and spawns a process per solve)
+            solver, solver_used = pulp.PULP_CBC_CMD(msg=0), "pulp_cbc"
+            highs_class = getattr(pulp, "HiGHS", None)
+            if highs_class is not None and highs_class(msg=False).available():
+                solver, solver_used = highs_class(msg=False), "highs"
             start_time = time.time()
-            prob.solve(pulp.PULP_CBC_CMD(msg=0))
+            prob.solve(solver)
             solve_time = time.time() - start_time
             
             # Extract REAL solution
@@ -518,7 +523,7 @@ Assistant:"""
                 objective_value=objective_value,
                 solution=solution,
                 solve_time=solve_time,
-                solver_used="pulp_cbc"
+                solver_used=solver_used
             )
             
         except Exception as e:
@@ -60,6 +60,7 @@ def create_enhanced_lambda_package():
             "boto3>=1.34.0",
             "fastmcp>=0.1.0",
             "pulp>=2.7.0",
+            "highspy>=1.7.0",
             "numpy>=1.24.0",
             "scipy>=1.10.0"
         ]
@@ -285,6 +285,20 @@ def build_model(problem_description: str, intent_data: Dict[str, Any], data_anal
             "timestamp": datetime.now().isoformat()
         }
 
+def select_solver():
+    """PuLP solver plus its name and method: HiGHS in-process when highspy is installed, CBC otherwise.
+
+    CBC writes the model to a file and spawns a process for every solve.
+    """
+    import pulp
+    
+    highs_class = getattr(pulp, "HiGHS", None)
+    if highs_class is not None:
+        highs = highs_class(msg=False)
+        if highs.available():
+            return highs, "HiGHS", "Simplex / Branch and Bound (in-process)"
+    return pulp.PULP_CBC_CMD(msg=0), "PuLP CBC", "Branch and Cut"
+
 def solve_optimization(problem_description: str, intent_data: Dict[str, Any], model_building: Dict[str, Any]) -> Dict[str, Any]:
     """Step 4: REAL optimization solving using PuLP mathematical solver."""
     try:
@@ -422,9 +436,10 @@ def solve_optimization(problem_description: str, intent_data: Dict[str, Any], mo
                 logger.warning(f"Constraint parsing failed: {e}")
                 continue
         
-        # Solve the optimization
+        # Solve the optimization (in-process HiGHS when available)
+        solver, solver_name, solver_method = select_solver()
         start_time = time.time()
-        prob.solve(pulp.PULP_CBC_CMD(msg=0))  # Silent solver
+        prob.solve(solver)
         solve_time = time.time() - start_time
         
         # Get results
@@ -449,15 +464,18 @@ def solve_optimization(problem_description: str, intent_data: Dict[str, Any], mo
                 "reduced_costs": {}
             }
             
+            # HiGHS reports duals of a maximization with the opposite sign to CBC
+            dual_sign = -1.0 if solver_name == "HiGHS" and prob.sense == pulp.LpMaximize else 1.0
+            
             # Get shadow prices (dual values) for constraints
             for i, constraint in enumerate(prob.constraints.values()):
                 if constraint.pi is not None:
-                    sensitivity_analysis["shadow_prices"][f"constraint_{i}"] = constraint.pi
+                    sensitivity_analysis["shadow_prices"][f"constraint_{i}"] = dual_sign * constraint.pi
             
             # Get reduced costs for variables
             for var_name, var in variables.items():
                 if var.dj is not None:
-                    sensitivity_analysis["reduced_costs"][var_name] = var.dj
+                    sensitivity_analysis["reduced_costs"][var_name] = dual_sign * var.dj
             
             optimization_solution = {
                 "status": status,
@@ -467,9 +485,9 @@ def solve_optimization(problem_description: str, intent_data: Dict[str, Any], mo
                 "iterations": 0,  # PuLP doesn't provide iteration count
                 "gap": 0.0,
                 "solver_info": {
-                    "solver": "PuLP CBC",
+                    "solver": solver_name,
                     "version": pulp.__version__,
-                    "method": "Branch and Cut"
+                    "method": solver_method
                 },
                 "sensitivity_analysis": sensitivity_analysis
             }
@@ -482,9 +500,9 @@ def solve_optimization(problem_description: str, intent_data: Dict[str, Any], mo
                 "iterations": 0,
                 "gap": None,
                 "solver_info": {
-                    "solver": "PuLP CBC",
+                    "solver": solver_name,
                     "version": pulp.__version__,
-                    "method": "Branch and Cut"
+                    "method": solver_method
                 },
                 "sensitivity_analysis": None
             }
@@ -0,0 +1 @@
+# Benchmarks for DcisionAI Manufacturing MCP Server
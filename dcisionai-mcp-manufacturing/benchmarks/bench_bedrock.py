@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Concurrent Bedrock Stages Benchmark
+===================================
+
+Runs N concurrent intent -> data -> model pipelines of
+``SimplifiedManufacturingTools`` against a local fake Bedrock endpoint
+and reports pipelines/sec per level of concurrency, once with the async
+LLM client and once with model calls made inline on the event loop (how
+``invoke_model`` used to be called). With the async client throughput
+should grow nearly linearly with concurrency, up to the thread pool size.
+
+Usage:
+    python -m benchmarks.bench_bedrock --latency 0.2 --concurrency 1 2 4 8 16 32
+
+Author: DcisionAI Team
+Copyright (c) 2025 DcisionAI. All rights reserved.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+# boto3 signs requests even for the fake endpoint
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "benchmark")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "benchmark")
+
+from agents.llm import BedrockLLMClient  # noqa: E402
+from mcp_server import SimplifiedManufacturingTools  # noqa: E402
+from .fake_bedrock import FakeBedrock  # noqa: E402
+from .reporting import print_table  # noqa: E402
+
+QUERY = "Allocate 50 workers across 2 production lines to meet a weekly demand of 900 units"
+
+
+class BlockingLLMClient(BedrockLLMClient):
+    """Calls the model on the event loop's thread, as the stages used to."""
+
+    async def complete(self, stage: str, prompt: str, max_tokens: int = 1000) -> str:
+        self.calls[stage] += 1
+        return self._invoke(prompt, max_tokens)
+
+
+async def run_pipeline(tools: SimplifiedManufacturingTools) -> bool:
+    intent = await tools.classify_intent(QUERY)
+    data = await tools.analyze_data(intent, QUERY)
+    model = await tools.build_model(intent, data)
+    return bool(model.variables)
+
+
+async def bench(tools: SimplifiedManufacturingTools, concurrency: int, rounds: int) -> Dict[str, Any]:
+    """``rounds`` waves of ``concurrency`` pipelines started together."""
+    start = time.perf_counter()
+    completed = 0
+    for _ in range(rounds):
+        results = await asyncio.gather(*(run_pipeline(tools) for _ in range(concurrency)))
+        completed += sum(results)
+    elapsed = time.perf_counter() - start
+    return {
+        "pipelines": rounds * concurrency,
+        "failed": rounds * concurrency - completed,
+        "seconds": round(elapsed, 3),
+        "pipelines_per_sec": round(rounds * concurrency / elapsed, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent Bedrock stages benchmark")
+    parser.add_argument("--latency", type=float, default=0.2, help="Fake model call latency in seconds")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument("--rounds", type=int, default=2, help="Waves of concurrent pipelines per level")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    rows = []
+    with FakeBedrock(latency=args.latency) as fake:
+        max_concurrency = max(args.concurrency)
+        clients = {
+            "async": BedrockLLMClient(endpoint_url=fake.url, max_concurrency=max_concurrency),
+            "blocking": BlockingLLMClient(endpoint_url=fake.url, max_concurrency=max_concurrency),
+        }
+        for mode, llm in clients.items():
+            tools = SimplifiedManufacturingTools(llm)
+            baseline = None
+            for concurrency in args.concurrency:
+                result = asyncio.run(bench(tools, concurrency, args.rounds))
+                baseline = baseline or result["pipelines_per_sec"]
+                rows.append({
+                    "mode": mode,
+                    "concurrency": concurrency,
+                    **result,
+                    "speedup": round(result["pipelines_per_sec"] / baseline, 2),
+                })
+            llm.close()
+
+    print_table(f"Intent -> data -> model pipelines, {args.latency}s per model call", rows)
+
+
+if __name__ == "__main__":
+    main()
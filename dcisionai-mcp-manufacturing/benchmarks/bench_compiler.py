@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Model Compiler Benchmark
+========================
+
+Compiles generated-style model specifications of growing size with
+``agents.model_compiler`` and reports compile time and terms/sec, then
+the time to build the PuLP problem from the coefficient arrays compared
+with building it term by term (``lpSum(coef * var)`` per row, how PuLP
+models are usually written). Two shapes are measured: ``indexed`` models
+written with ``sum(... for i in 1..n)`` and ``literal`` models whose
+expressions spell out every term, as the model agent often does.
+
+Usage:
+    python -m benchmarks.bench_compiler --terms 10000 50000 100000 --rows 10
+
+Author: DcisionAI Team
+Copyright (c) 2025 DcisionAI. All rights reserved.
+"""
+
+import argparse
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from agents.model_compiler import CompiledModel, build_pulp_model, compile_model  # noqa: E402
+from .reporting import print_table  # noqa: E402
+
+
+def indexed_spec(n: int, rows: int, rng: random.Random) -> Dict[str, Any]:
+    """``rows`` knapsack rows over ``x[1..n]`` written with sums and parameters."""
+    parameters: Dict[str, Any] = {"profit": [round(rng.uniform(1, 20), 2) for _ in range(n + 1)]}
+    constraints = []
+    for r in range(rows):
+        parameters[f"w{r}"] = [round(rng.uniform(1, 10), 2) for _ in range(n + 1)]
+        parameters[f"cap{r}"] = round(n * 2.5, 2)
+        constraints.append({"name": f"resource_{r}",
+                            "expression": f"sum(w{r}[i] * x[i] for i in 1..{n}) <= cap{r}"})
+    return {
+        "variables": [{"name": "x", "type": "continuous", "bounds": [0, 10], "indices": f"1..{n}"}],
+        "parameters": parameters,
+        "constraints": constraints,
+        "objective": f"maximize sum(profit[i] * x[i] for i in 1..{n})",
+    }
+
+
+def literal_spec(n: int, rows: int, rng: random.Random) -> Dict[str, Any]:
+    """The same shape with every coefficient written out over scalar variables."""
+    def terms() -> str:
+        return " + ".join(f"{rng.uniform(1, 10):.2f}*x{i}" for i in range(1, n + 1))
+
+    return {
+        "variables": [{"name": f"x{i}", "type": "continuous", "bounds": [0, 10]} for i in range(1, n + 1)],
+        "constraints": [{"expression": f"{terms()} <= {n * 2.5}"} for _ in range(rows)],
+        "objective": f"maximize {terms()}",
+    }
+
+
+def build_per_term(compiled: CompiledModel):
+    """PuLP problem assembled from one expression object per term."""
+    import pulp
+
+    problem = pulp.LpProblem("per_term", pulp.LpMaximize)
+    variables = [pulp.LpVariable(f"v{j}", lowBound=0, upBound=10) for j in range(compiled.num_variables)]
+    problem += pulp.lpSum(c * variables[j] for j, c in enumerate(compiled.objective.tolist()) if c)
+    for r in range(compiled.num_constraints):
+        indices, data = compiled.row(r)
+        problem += pulp.lpSum(a * variables[j] for j, a in zip(indices.tolist(), data.tolist())) \
+            <= float(compiled.row_upper[r])
+    return problem
+
+
+def bench(shape: str, spec: Dict[str, Any], repeat: int) -> Dict[str, Any]:
+    compile_times, build_times, per_term_times = [], [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        compiled = compile_model(spec)
+        compile_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        build_pulp_model(compiled)
+        build_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        build_per_term(compiled)
+        per_term_times.append(time.perf_counter() - start)
+
+    compile_time, build_time, per_term_time = min(compile_times), min(build_times), min(per_term_times)
+    return {
+        "shape": shape,
+        "terms": compiled.num_terms,
+        "compile_ms": round(compile_time * 1000, 1),
+        "terms_per_sec": int(compiled.num_terms / compile_time),
+        "pulp_build_ms": round(build_time * 1000, 1),
+        "per_term_build_ms": round(per_term_time * 1000, 1),
+        "build_speedup": round(per_term_time / build_time, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Model compiler benchmark")
+    parser.add_argument("--terms", type=int, nargs="+", default=[10000, 50000, 100000],
+                        help="Approximate number of terms per model")
+    parser.add_argument("--rows", type=int, default=10, help="Constraint rows per model")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per model; the fastest is reported")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    rows: List[Dict[str, Any]] = []
+    for terms in args.terms:
+        n = max(1, terms // (args.rows + 1))
+        rng = random.Random(args.seed)
+        rows.append(bench("indexed", indexed_spec(n, args.rows, rng), args.repeat))
+        rows.append(bench("literal", literal_spec(n, args.rows, rng), args.repeat))
+
+    print_table(f"Compile and PuLP build time, {args.rows} constraint rows", rows)
+
+
+if __name__ == "__main__":
+    main()
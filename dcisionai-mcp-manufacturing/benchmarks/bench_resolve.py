@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Incremental Re-Solve Benchmark
+==============================
+
+Re-solves models after small data changes, as repeated workflow runs and
+sensitivity analyses do, and compares a cold HiGHS solve of the changed
+model with an ``IncrementalModel`` kept loaded in HiGHS and warm-started:
+
+- ``cold``: load the compiled model into a new HiGHS instance and solve
+- ``spec``: compile the changed specification, update the kept model in
+  place and re-solve (what ``solve_optimization`` does on a cache hit)
+- ``change``: set the kept model's right-hand sides directly with
+  ``IncrementalModel.change`` and re-solve (a sensitivity analysis loop)
+
+Each step scales one capacity by ``--step`` and every profit by a small
+random factor. Times are medians over the steps.
+
+Usage:
+    python -m benchmarks.bench_resolve --steps 10
+
+Author: DcisionAI Team
+Copyright (c) 2025 DcisionAI. All rights reserved.
+"""
+
+import argparse
+import logging
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from agents.model_compiler import compile_model  # noqa: E402
+from agents.solvers import BACKENDS, IncrementalModel, ModelSolver  # noqa: E402
+from .bench_solvers import MODELS  # noqa: E402
+from .reporting import print_table  # noqa: E402
+
+
+def perturb(spec: Dict[str, Any], step: int, scale: float, rng: random.Random) -> Dict[str, Any]:
+    """The specification with one capacity scaled and profits jittered."""
+    parameters = dict(spec["parameters"])
+    capacities = sorted(name for name in parameters if name.startswith("cap"))
+    name = capacities[step % len(capacities)]
+    parameters[name] = round(parameters[name] * scale, 2)
+    parameters["profit"] = [round(p * rng.uniform(0.99, 1.01), 2) for p in parameters["profit"]]
+    return {**spec, "parameters": parameters}
+
+
+def bench(name: str, steps: int, scale: float, seed: int) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    spec = MODELS[name](rng)
+    solver = ModelSolver(backend="highs", time_limit=60)
+    highs = BACKENDS["highs"]
+
+    timings: Dict[str, Dict[str, List[float]]] = {
+        mode: {"update": [], "solve": []} for mode in ("cold", "spec", "change")
+    }
+    objectives: Dict[str, List[Any]] = {mode: [] for mode in timings}
+
+    kept = IncrementalModel(compile_model(spec))
+    solver.resolve(kept)
+    direct = IncrementalModel(kept.compiled)
+    solver.resolve(direct)
+
+    for step in range(steps):
+        spec = perturb(spec, step, scale, rng)
+        compiled = compile_model(spec)
+
+        outcome = highs.solve(compiled, time_limit=60)
+        timings["cold"]["update"].append(0.0)
+        timings["cold"]["solve"].append(outcome.solve_time)
+        objectives["cold"].append(outcome.objective_value)
+
+        start = time.perf_counter()
+        updated = compile_model(spec)
+        compile_time = time.perf_counter() - start
+        outcome = solver.resolve(kept, updated)
+        timings["spec"]["update"].append(compile_time + outcome.update_time)
+        timings["spec"]["solve"].append(outcome.solve_time)
+        objectives["spec"].append(outcome.objective_value)
+
+        start = time.perf_counter()
+        direct.change(objective=compiled.objective, row_upper=compiled.row_upper)
+        update_time = time.perf_counter() - start
+        outcome = solver.resolve(direct)
+        timings["change"]["update"].append(update_time)
+        timings["change"]["solve"].append(outcome.solve_time)
+        objectives["change"].append(outcome.objective_value)
+
+    cold = statistics.median(timings["cold"]["solve"])
+    rows = []
+    for mode, times in timings.items():
+        update, solve = statistics.median(times["update"]), statistics.median(times["solve"])
+        agree = all(
+            a is not None and b is not None and abs(a - b) <= 1e-6 * max(1.0, abs(a))
+            for a, b in zip(objectives[mode], objectives["cold"])
+        )
+        rows.append({
+            "model": name,
+            "terms": kept.compiled.num_terms,
+            "mode": mode,
+            "update_ms": round(update * 1000, 2),
+            "solve_ms": round(solve * 1000, 2),
+            "solve_speedup": round(cold / solve, 1) if solve else None,
+            "same_objective": agree,
+        })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incremental re-solve benchmark")
+    parser.add_argument("--models", nargs="+", default=["small_lp", "medium_lp", "large_lp", "medium_mip"],
+                        choices=list(MODELS))
+    parser.add_argument("--steps", type=int, default=10, help="Data changes per model")
+    parser.add_argument("--step", type=float, default=0.95, help="Factor applied to one capacity per change")
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    if not BACKENDS["highs"].available():
+        print("highspy is not installed; incremental re-solves need HiGHS")
+        return
+
+    rows: List[Dict[str, Any]] = []
+    for name in args.models:
+        rows.extend(bench(name, args.steps, args.step, args.seed))
+    print_table(f"Re-solve after a data change (median of {args.steps})", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Solver Backends Benchmark
+=========================
+
+Solves the same compiled models with each installed backend of
+``agents.solvers`` (HiGHS through highspy, ``scipy.optimize.milp`` and
+PuLP/CBC) and reports time per solve, the objective found and the speedup
+over PuLP/CBC. Small models show the cost of writing a model file and
+spawning CBC per solve; large ones show the cost of building PuLP's
+object graph. Compile time is excluded; every backend starts from the
+same ``CompiledModel``.
+
+Usage:
+    python -m benchmarks.bench_solvers --repeat 5
+
+Author: DcisionAI Team
+Copyright (c) 2025 DcisionAI. All rights reserved.
+"""
+
+import argparse
+import logging
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from agents.model_compiler import CompiledModel, compile_model  # noqa: E402
+from agents.solvers import BACKENDS, SOLVER_BACKENDS  # noqa: E402
+from .reporting import print_table  # noqa: E402
+
+
+def production_spec(products: int, resources: int, integer: bool, rng: random.Random) -> Dict[str, Any]:
+    """Product mix: maximize profit subject to resource capacities."""
+    parameters: Dict[str, Any] = {"profit": [round(rng.uniform(5, 50), 2) for _ in range(products)]}
+    constraints = []
+    for r in range(resources):
+        parameters[f"use{r}"] = [round(rng.uniform(0.5, 5), 2) for _ in range(products)]
+        parameters[f"cap{r}"] = round(products * rng.uniform(5, 15), 2)
+        constraints.append(f"sum(use{r}[i] * x[i] for i in range({products})) <= cap{r}")
+    return {
+        "variables": [{"name": "x", "type": "integer" if integer else "continuous",
+                       "bounds": [0, 20], "indices": f"range({products})"}],
+        "parameters": parameters,
+        "constraints": constraints,
+        "objective": f"maximize sum(profit[i] * x[i] for i in range({products}))",
+    }
+
+
+MODELS: Dict[str, Callable[[random.Random], Dict[str, Any]]] = {
+    "small_lp": lambda rng: production_spec(5, 4, False, rng),
+    "small_mip": lambda rng: production_spec(5, 4, True, rng),
+    "medium_lp": lambda rng: production_spec(1000, 50, False, rng),
+    "medium_mip": lambda rng: production_spec(200, 5, True, rng),
+    "large_lp": lambda rng: production_spec(20000, 5, False, rng),
+}
+
+
+def bench(name: str, compiled: CompiledModel, backend: str, repeat: int) -> Dict[str, Any]:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        outcome = BACKENDS[backend].solve(compiled, time_limit=60)
+        times.append(time.perf_counter() - start)
+    best = min(times)
+    return {
+        "model": name,
+        "terms": compiled.num_terms,
+        "backend": backend,
+        "status": outcome.status,
+        "objective": round(outcome.objective_value, 4) if outcome.objective_value is not None else None,
+        "ms_per_solve": round(best * 1000, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Solver backends benchmark")
+    parser.add_argument("--models", nargs="+", default=list(MODELS), choices=list(MODELS))
+    parser.add_argument("--backends", nargs="+", default=list(SOLVER_BACKENDS), choices=list(SOLVER_BACKENDS))
+    parser.add_argument("--repeat", type=int, default=5, help="Solves per model and backend; the fastest is reported")
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    backends = [b for b in args.backends if BACKENDS[b].available()]
+    skipped = sorted(set(args.backends) - set(backends))
+    rows: List[Dict[str, Any]] = []
+    for name in args.models:
+        compiled = compile_model(MODELS[name](random.Random(args.seed)))
+        results = [bench(name, compiled, backend, args.repeat) for backend in backends]
+        baseline = next((r["ms_per_solve"] for r in results if r["backend"] == "pulp_cbc"), None)
+        for result in results:
+            result["speedup_vs_cbc"] = round(baseline / result["ms_per_solve"], 1) if baseline else None
+            rows.append(result)
+
+    print_table(f"Solve time per backend (fastest of {args.repeat})", rows)
+    if skipped:
+        print(f"Not installed: {', '.join(skipped)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Fake Bedrock Runtime
+====================
+
+Local stand-in for the Bedrock ``InvokeModel`` API used by benchmarks.
+Answers ``POST /model/{modelId}/invoke`` after a fixed latency with a
+canned Messages API response for the intent, data or model prompt of
+``SimplifiedManufacturingTools``. Runs its own event loop on a
+background thread, so a client blocking its caller's loop cannot stall it.
+
+Author: DcisionAI Team
+Copyright (c) 2025 DcisionAI. All rights reserved.
+"""
+
+import asyncio
+import json
+import threading
+from typing import Any, Dict, Optional
+
+from aiohttp import web
+
+INTENT_RESPONSE = {
+    "intent": "production_optimization",
+    "confidence": 0.92,
+    "entities": ["production_lines", "workers", "demand"],
+    "objectives": ["maximize throughput"],
+    "reasoning": "Allocating workers across lines to meet demand"
+}
+
+DATA_RESPONSE = {
+    "data_entities": ["line_capacity", "worker_productivity", "demand"],
+    "sample_data": {"line_capacity": 120, "worker_productivity": 8.5, "demand": 900},
+    "readiness_score": 0.86,
+    "assumptions": ["Demand is known for the planning week"]
+}
+
+MODEL_RESPONSE = {
+    "model_type": "linear_programming",
+    "variables": [
+        {"name": "line_a", "type": "continuous", "bounds": [0, 500]},
+        {"name": "line_b", "type": "continuous", "bounds": [0, 500]}
+    ],
+    "constraints": [
+        {"expression": "line_a + line_b <= 900", "type": "inequality"}
+    ],
+    "objective": "maximize 12*line_a + 9*line_b",
+    "complexity": "low"
+}
+
+
+class FakeBedrock:
+    """
+    Bedrock ``InvokeModel`` stand-in on a background thread.
+
+    Args:
+        latency: Seconds each call takes
+    """
+
+    def __init__(self, latency: float = 0.2):
+        self.latency = latency
+        self.calls = 0
+        self.url = ""
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._runner: Optional[web.AppRunner] = None
+
+    @staticmethod
+    def answer(prompt: str) -> Dict[str, Any]:
+        """Canned answer for the stage a prompt belongs to."""
+        if "Build a mathematical optimization model" in prompt:
+            payload = MODEL_RESPONSE
+        elif "analyze data requirements" in prompt:
+            payload = DATA_RESPONSE
+        else:
+            payload = INTENT_RESPONSE
+        return {
+            "content": [{"type": "text", "text": json.dumps(payload)}],
+            "stop_reason": "end_turn"
+        }
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        self.calls += 1
+        body = json.loads(await request.read())
+        await asyncio.sleep(self.latency)
+        return web.json_response(self.answer(body["messages"][0]["content"]))
+
+    async def _start(self) -> str:
+        app = web.Application()
+        app.router.add_post("/model/{model_id}/invoke", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}"
+
+    def start(self) -> str:
+        """Start serving and return the endpoint URL."""
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+        self.url = asyncio.run_coroutine_threadsafe(self._start(), self._loop).result()
+        return self.url
+
+    def stop(self):
+        """Stop serving."""
+        if self._runner is not None:
+            asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+            self._runner = None
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def __enter__(self) -> "FakeBedrock":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+Benchmark Reporting
+===================
+
+Plain-text tables shared by the benchmark scripts.
+
+Author: DcisionAI Team
+Copyright (c) 2025 DcisionAI. All rights reserved.
+"""
+
+from typing import Any, Dict, List
+
+
+def print_table(title: str, rows: List[Dict[str, Any]]):
+    print(title)
+    print("=" * len(title))
+    columns = list(rows[0].keys())
+    widths = {c: max(len(c), *(len(str(r[c])) for r in rows)) for c in columns}
+    print("  ".join(c.ljust(widths[c]) for c in columns))
+    for row in rows:
+        print("  ".join(str(row[c]).ljust(widths[c]) for c in columns))
+    print()
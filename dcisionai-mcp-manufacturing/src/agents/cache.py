@@ -7,7 +7,8 @@ This module implements intelligent caching of optimization models with predictiv
 This is a key component of the AgentCore architecture that provides 10-100x speed improvements.
 
 Key Features:
-- Structural model caching (cache by model structure, not values)
+- Structural model caching (cache by model structure, not values), so
+  cached models are updated to new data and re-solved warm
 - Usage-based prefetching and pattern prediction
 - Sub-second optimization for common patterns
 - Intelligent cache eviction and memory management
@@ -22,6 +23,7 @@ import time
 import hashlib
 import logging
 import pickle
+import re
 from typing import Dict, Any, List, Optional, Tuple, Union
 from dataclasses import dataclass, asdict
 from pathlib import Path
@@ -30,6 +32,9 @@ from collections import defaultdict, deque
 
 logger = logging.getLogger(__name__)
 
+# Numeric literals in expressions are data, not structure
+NUMBER_PATTERN = re.compile(r'(?<!\w)\d+(?:\.\d+)?(?:[eE][+-]?\d+)?|(?<![\w.])\.\d+(?:[eE][+-]?\d+)?')
+
 @dataclass
 class CacheEntry:
     """Entry in the model cache."""
@@ -223,19 +228,43 @@ class PredictiveModelCache:
             }
     
     def _generate_cache_key(self, model_spec: Dict[str, Any]) -> str:
-        """Generate unique cache key for model specification."""
-        # Create a structural hash based on model structure, not values
+        """
+        Generate the cache key of a model specification's template.
+
+        Specifications that differ only in data (numbers in expressions,
+        variable bounds, parameter values) share a key, so the cached model
+        can be updated to the new data and re-solved warm instead of built
+        again. Variable declarations, expression shapes and parameter names
+        and shapes are part of the key.
+        """
+        def template(expression: Any) -> str:
+            return NUMBER_PATTERN.sub('#', ' '.join(str(expression).split()))
+
+        def shape(value: Any) -> Any:
+            if isinstance(value, dict):
+                return sorted(str(k) for k in value)
+            if isinstance(value, (list, tuple)):
+                return len(value)
+            return 'scalar'
+
         structure = {
             'model_type': model_spec.get('model_type', ''),
-            'var_count': len(model_spec.get('variables', [])),
-            'constraint_count': len(model_spec.get('constraints', [])),
-            'constraint_types': sorted([c.get('type', '') for c in model_spec.get('constraints', [])]),
             'complexity': model_spec.get('complexity', ''),
-            'objective_type': model_spec.get('objective', '').split()[0] if model_spec.get('objective') else ''
+            'variables': [
+                {k: v for k, v in var.items() if k not in ('bounds', 'description')} if isinstance(var, dict) else var
+                for var in model_spec.get('variables') or []
+            ],
+            'constraints': [
+                [c.get('name', ''), c.get('type', ''), template(c.get('expression', ''))] if isinstance(c, dict)
+                else template(c)
+                for c in model_spec.get('constraints') or []
+            ],
+            'objective': template(model_spec.get('objective', '')),
+            'parameters': {name: shape(value) for name, value in (model_spec.get('parameters') or {}).items()}
         }
         
         # Create deterministic hash
-        structure_str = json.dumps(structure, sort_keys=True)
+        structure_str = json.dumps(structure, sort_keys=True, default=str)
         return hashlib.md5(structure_str.encode()).hexdigest()
     
     def _add_to_cache(self, cache_key: str, model: Any, model_spec: Dict[str, Any], 
@@ -255,8 +255,18 @@ class AgentCoordinator:
                 deduplication_info=None
             )
     
-    def complete_request(self, request_id: str, success: bool, processing_time: float):
-        """Mark a request as completed and update agent states."""
+    def complete_request(self, request_id: str, success: bool, processing_time: float,
+                         stage_times: Optional[Dict[str, float]] = None):
+        """
+        Mark a request as completed and update agent states.
+        
+        Args:
+            request_id: The completed request
+            success: Whether the optimization succeeded
+            processing_time: Total processing time in seconds
+            stage_times: Measured seconds per agent; agents without an entry
+                are charged the total processing time
+        """
         with self.coordination_lock:
             if request_id in self.active_requests:
                 request = self.active_requests.pop(request_id)
@@ -277,10 +287,11 @@ class AgentCoordinator:
                             agent.success_rate = ((current_success_rate * (agent.total_requests - 1)) + (1.0 if success else 0.0)) / agent.total_requests
                         
                         # Update average processing time
+                        agent_time = (stage_times or {}).get(agent_id, processing_time)
                         if agent.avg_processing_time > 0:
-                            agent.avg_processing_time = (agent.avg_processing_time + processing_time) / 2
+                            agent.avg_processing_time = (agent.avg_processing_time + agent_time) / 2
                         else:
-                            agent.avg_processing_time = processing_time
+                            agent.avg_processing_time = agent_time
                 
                 # Store completed request
                 self.completed_requests[request_id] = request
@@ -406,51 +417,33 @@ class AgentCoordinator:
         
         if can_parallelize and complexity < 0.7:
             # Parallel execution: Intent and Data agents can run simultaneously
-            plan['stages'] = [
-                {
-                    'stage': 'parallel',
-                    'agents': ['intent_agent', 'data_agent'],
-                    'estimated_time': 3.0
-                },
-                {
-                    'stage': 'sequential',
-                    'agents': ['model_agent'],
-                    'estimated_time': 4.0
-                },
-                {
-                    'stage': 'sequential',
-                    'agents': ['solver_agent'],
-                    'estimated_time': 1.0
-                }
-            ]
+            stage_agents = [('parallel', ['intent_agent', 'data_agent']),
+                            ('sequential', ['model_agent']),
+                            ('sequential', ['solver_agent'])]
             plan['parallel_execution'] = True
-            plan['estimated_time'] = 8.0  # Parallel execution is faster
             self.parallel_execution_count += 1
         else:
             # Sequential execution
-            plan['stages'] = [
-                {
-                    'stage': 'sequential',
-                    'agents': ['intent_agent'],
-                    'estimated_time': 2.0
-                },
-                {
-                    'stage': 'sequential',
-                    'agents': ['data_agent'],
-                    'estimated_time': 3.0
-                },
-                {
-                    'stage': 'sequential',
-                    'agents': ['model_agent'],
-                    'estimated_time': 4.0
-                },
-                {
-                    'stage': 'sequential',
-                    'agents': ['solver_agent'],
-                    'estimated_time': 1.0
-                }
-            ]
-            plan['estimated_time'] = 10.0
+            stage_agents = [('sequential', ['intent_agent']),
+                            ('sequential', ['data_agent']),
+                            ('sequential', ['model_agent']),
+                            ('sequential', ['solver_agent'])]
+        
+        # Estimates follow the agents' measured processing times; a parallel
+        # stage takes as long as its slowest agent
+        plan['agent_estimates'] = {
+            agent_id: self.agent_states[agent_id].avg_processing_time
+            for _, agents in stage_agents for agent_id in agents
+        }
+        plan['stages'] = [
+            {
+                'stage': stage,
+                'agents': agents,
+                'estimated_time': max(plan['agent_estimates'][agent_id] for agent_id in agents)
+            }
+            for stage, agents in stage_agents
+        ]
+        plan['estimated_time'] = sum(stage['estimated_time'] for stage in plan['stages'])
         
         return plan
     
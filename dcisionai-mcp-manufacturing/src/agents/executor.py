@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+PlanExecutor - Runs AgentCoordinator Execution Plans
+====================================================
+
+Executes the stages of an ``AgentCoordinator`` execution plan against the
+manufacturing tools. Stages marked ``parallel`` run their agents together
+with ``asyncio.gather``; an agent whose inputs come from another agent in
+the same stage runs speculatively on a provisional input (data analysis
+starts from a keyword guess of the intent while the intent is still being
+classified) and is cancelled and re-run when the real input differs.
+
+Key Features:
+- Parallel and sequential plan stages
+- Speculative execution with cancellation on a wrong guess
+- Measured per-agent timings for ``coordination_info``
+- Speculation hit/miss counters
+
+Author: DcisionAI Team
+Copyright (c) 2025 DcisionAI. All rights reserved.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Any, List
+
+logger = logging.getLogger(__name__)
+
+# Inputs each agent needs before it can run
+AGENT_DEPENDENCIES: Dict[str, List[str]] = {
+    'intent_agent': [],
+    'data_agent': ['intent_agent'],
+    'model_agent': ['intent_agent', 'data_agent'],
+    'solver_agent': ['model_agent']
+}
+
+# Field that must match between a provisional and the real result for
+# work started on the provisional one to be kept. It must be the only field
+# of that result the dependent agent reads (``analyze_data`` uses the intent
+# label and the query, not the entities or objectives), so a kept result is
+# the one the real input would have produced
+SPECULATION_KEYS: Dict[str, str] = {
+    'intent_agent': 'intent'
+}
+
+# Used when a plan carries no stages
+SEQUENTIAL_STAGES: List[Dict[str, Any]] = [
+    {'stage': 'sequential', 'agents': [agent_id]} for agent_id in AGENT_DEPENDENCIES
+]
+
+
+@dataclass
+class PlanExecution:
+    """Results and measured timings of one executed plan."""
+    results: Dict[str, Any]
+    stage_timings: Dict[str, Dict[str, Any]]
+    speculation: Dict[str, Any]
+    total_time: float
+    parallel_execution: bool
+
+    @property
+    def stage_times(self) -> Dict[str, float]:
+        """Seconds each agent took, as ``AgentCoordinator.complete_request`` expects."""
+        return {agent_id: timing['duration'] for agent_id, timing in self.stage_timings.items()}
+
+
+@dataclass
+class _PlanRun:
+    """State of a plan while it executes."""
+    query: str
+    start_time: float
+    results: Dict[str, Any] = field(default_factory=dict)
+    stage_timings: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    speculation: Dict[str, Any] = field(default_factory=dict)
+
+
+class PlanExecutor:
+    """
+    Executes coordinator plans as a dependency graph.
+
+    Args:
+        tools: ``SimplifiedManufacturingTools`` providing the agent stages
+    """
+
+    def __init__(self, tools: Any):
+        self.tools = tools
+
+        # Speculation analytics
+        self.speculative_hits = 0
+        self.speculative_misses = 0
+        self.time_saved = 0.0
+
+    async def execute(self, query: str, execution_plan: Dict[str, Any]) -> PlanExecution:
+        """
+        Run every stage of an execution plan.
+
+        Args:
+            query: The optimization query
+            execution_plan: Plan from ``AgentCoordinator._create_execution_plan``
+
+        Returns:
+            PlanExecution with each agent's result and timing
+        """
+        run = _PlanRun(query=query, start_time=time.time())
+        stages = execution_plan.get('stages') or SEQUENTIAL_STAGES
+
+        for stage in stages:
+            if stage.get('stage') == 'parallel' and len(stage['agents']) > 1:
+                await self._run_parallel(run, stage['agents'])
+            else:
+                for agent_id in stage['agents']:
+                    run.results[agent_id] = await self._run_agent(run, agent_id, run.results)
+
+        return PlanExecution(
+            results=run.results,
+            stage_timings=run.stage_timings,
+            speculation=run.speculation,
+            total_time=time.time() - run.start_time,
+            parallel_execution=any(stage.get('stage') == 'parallel' for stage in stages)
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Speculation hits, misses and the time hits saved."""
+        attempts = self.speculative_hits + self.speculative_misses
+        return {
+            'speculative_hits': self.speculative_hits,
+            'speculative_misses': self.speculative_misses,
+            'speculation_hit_rate': self.speculative_hits / attempts if attempts else 0.0,
+            'time_saved': self.time_saved
+        }
+
+    async def _run_parallel(self, run: _PlanRun, agents: List[str]):
+        """Run one parallel stage, speculating on inputs produced within the stage."""
+        ready = [a for a in agents if all(dep in run.results for dep in AGENT_DEPENDENCIES[a])]
+        speculative = {}
+        deferred = []
+        for agent_id in agents:
+            if agent_id in ready:
+                continue
+            missing = [dep for dep in AGENT_DEPENDENCIES[agent_id] if dep not in run.results]
+            if all(dep in ready and dep in SPECULATION_KEYS for dep in missing):
+                provisional = {dep: self._provisional_result(run, dep) for dep in missing}
+                inputs = dict(run.results, **provisional)
+                task = asyncio.ensure_future(self._run_agent(run, agent_id, inputs, speculative=True))
+                speculative[agent_id] = (task, provisional)
+            else:
+                deferred.append(agent_id)
+
+        try:
+            ready_results = await asyncio.gather(*(self._run_agent(run, a, run.results) for a in ready))
+        except BaseException:
+            for task, _ in speculative.values():
+                task.cancel()
+            raise
+        run.results.update(zip(ready, ready_results))
+
+        for agent_id, (task, provisional) in speculative.items():
+            if all(self._matches(dep, guess, run.results[dep]) for dep, guess in provisional.items()):
+                run.results[agent_id] = await task
+                self.speculative_hits += 1
+                self.time_saved += self._overlap(run, agent_id, provisional)
+                run.speculation[agent_id] = {'outcome': 'hit', 'provisional': self._describe(provisional)}
+                logger.info(f"⚡ Speculative {agent_id} kept")
+            else:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+                except Exception as e:
+                    # The guess was wrong, so its failure says nothing about the real inputs
+                    logger.info(f"Speculative {agent_id} failed on the discarded guess: {e}")
+                wasted = run.stage_timings[agent_id]['duration']
+                self.speculative_misses += 1
+                run.speculation[agent_id] = {
+                    'outcome': 'miss',
+                    'provisional': self._describe(provisional),
+                    'discarded_time': wasted
+                }
+                logger.info(f"↩️ Speculative {agent_id} discarded after {wasted:.2f}s, re-running")
+                run.results[agent_id] = await self._run_agent(run, agent_id, run.results)
+
+        for agent_id in deferred:
+            run.results[agent_id] = await self._run_agent(run, agent_id, run.results)
+
+    async def _run_agent(self, run: _PlanRun, agent_id: str, inputs: Dict[str, Any],
+                         speculative: bool = False) -> Any:
+        """Run one agent on ``inputs`` and record when it started and how long it took."""
+        started = time.time()
+        status = 'failed'
+        try:
+            result = await self._call_agent(agent_id, run.query, inputs)
+            status = 'completed'
+            return result
+        except asyncio.CancelledError:
+            status = 'cancelled'
+            raise
+        finally:
+            run.stage_timings[agent_id] = {
+                'started_at': started - run.start_time,
+                'duration': time.time() - started,
+                'speculative': speculative,
+                'status': status
+            }
+
+    async def _call_agent(self, agent_id: str, query: str, inputs: Dict[str, Any]) -> Any:
+        if agent_id == 'intent_agent':
+            return await self.tools.classify_intent(query)
+        if agent_id == 'data_agent':
+            return await self.tools.analyze_data(inputs['intent_agent'], query)
+        if agent_id == 'model_agent':
+            return await self.tools.build_model(inputs['intent_agent'], inputs['data_agent'])
+        if agent_id == 'solver_agent':
+            # Solves are CPU-bound and can run for minutes; keep them off the event loop
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self.tools.solve_optimization, inputs['model_agent'])
+        raise ValueError(f"Unknown agent: {agent_id}")
+
+    def _provisional_result(self, run: _PlanRun, agent_id: str) -> Any:
+        if agent_id == 'intent_agent':
+            return self.tools.guess_intent(run.query)
+        raise ValueError(f"No provisional result for {agent_id}")
+
+    def _matches(self, agent_id: str, provisional: Any, actual: Any) -> bool:
+        key = SPECULATION_KEYS[agent_id]
+        return getattr(provisional, key) == getattr(actual, key)
+
+    def _overlap(self, run: _PlanRun, agent_id: str, provisional: Dict[str, Any]) -> float:
+        """Seconds ``agent_id`` ran while the agents it speculated on were still running."""
+        timing = run.stage_timings[agent_id]
+        inputs_ready = max(run.stage_timings[dep]['started_at'] + run.stage_timings[dep]['duration']
+                           for dep in provisional)
+        finished = timing['started_at'] + timing['duration']
+        return max(0.0, min(finished, inputs_ready) - timing['started_at'])
+
+    def _describe(self, provisional: Dict[str, Any]) -> Dict[str, Any]:
+        return {dep: getattr(result, SPECULATION_KEYS[dep]) for dep, result in provisional.items()}
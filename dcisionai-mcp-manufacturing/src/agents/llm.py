@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+BedrockLLMClient - Non-blocking AWS Bedrock Access for the Agents
+=================================================================
+
+boto3's ``invoke_model`` blocks the calling thread for the whole model
+round trip. Called from an async MCP tool it stalls the event loop, so
+one optimization holds up every other client. This client runs the calls
+on a dedicated, bounded thread pool and awaits them, so concurrent
+optimizations overlap their network wait.
+
+Key Features:
+- Bounded thread pool sized with ``aws.bedrock.max_concurrency``
+- Per-stage timeouts from ``agents.<stage>.timeout``
+- JSON extraction from model responses
+- Optional stage-output cache (see ``agents.response_cache``)
+- Call, timeout and latency counters per stage
+
+Author: DcisionAI Team
+Copyright (c) 2025 DcisionAI. All rights reserved.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+from settings import get_setting, load_settings
+from agents.response_cache import LLMResponseCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL_ID = "anthropic.claude-3-haiku-20240307-v1:0"
+
+# Seconds per stage when the configuration has no agents.<stage>.timeout
+DEFAULT_TIMEOUTS = {"intent": 30.0, "data": 45.0, "model": 60.0}
+
+# Alternative Bedrock endpoint, e.g. a local stand-in for benchmarks
+ENDPOINT_ENV = "BEDROCK_ENDPOINT_URL"
+
+
+class LLMTimeoutError(TimeoutError):
+    """A stage's model call did not finish within its timeout."""
+
+
+class BedrockLLMClient:
+    """
+    Async client for the Bedrock Messages API.
+
+    Args:
+        client: ``bedrock-runtime`` client; created from the other
+            arguments when omitted
+        model_id: Model to invoke
+        temperature: Sampling temperature
+        timeouts: Seconds each stage (``intent``, ``data``, ``model``) may take
+        max_concurrency: Model calls in flight at once; further calls wait
+        region: AWS region of the created client
+        endpoint_url: Bedrock endpoint of the created client
+        cache: Cache consulted by ``complete_json`` before calling the model
+    """
+
+    def __init__(self, client: Any = None, model_id: str = DEFAULT_MODEL_ID,
+                 temperature: float = 0.1, timeouts: Optional[Dict[str, float]] = None,
+                 max_concurrency: int = 32, region: str = "us-east-1",
+                 endpoint_url: Optional[str] = None, cache: Optional[LLMResponseCache] = None):
+        self.model_id = model_id
+        self.cache = cache
+        self.temperature = temperature
+        self.timeouts = dict(DEFAULT_TIMEOUTS, **(timeouts or {}))
+        self.max_concurrency = max_concurrency
+        self.client = client if client is not None else self._create_client(region, endpoint_url)
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="bedrock")
+
+        # Per-stage analytics
+        self.calls: Dict[str, int] = defaultdict(int)
+        self.failures: Dict[str, int] = defaultdict(int)
+        self.timed_out: Dict[str, int] = defaultdict(int)
+        self.total_latency: Dict[str, float] = defaultdict(float)
+
+        logger.info(f"🔌 Bedrock LLM client initialized ({max_concurrency} concurrent calls)")
+
+    @classmethod
+    def from_settings(cls, settings: Optional[Dict[str, Any]] = None,
+                      client: Any = None) -> "BedrockLLMClient":
+        """Create a client from the server configuration (see ``settings.load_settings``)."""
+        settings = settings if settings is not None else load_settings()
+        timeouts = {
+            stage: float(get_setting(settings, f"agents.{stage}.timeout", default))
+            for stage, default in DEFAULT_TIMEOUTS.items()
+        }
+        return cls(
+            client=client,
+            model_id=get_setting(settings, "aws.bedrock.model_id", DEFAULT_MODEL_ID),
+            temperature=float(get_setting(settings, "aws.bedrock.temperature", 0.1)),
+            timeouts=timeouts,
+            max_concurrency=int(get_setting(settings, "aws.bedrock.max_concurrency", 32)),
+            region=get_setting(settings, "aws.region", "us-east-1"),
+            endpoint_url=os.getenv(ENDPOINT_ENV) or get_setting(settings, "aws.bedrock.endpoint_url"),
+            cache=LLMResponseCache.from_settings(settings),
+        )
+
+    def _create_client(self, region: str, endpoint_url: Optional[str]) -> Any:
+        import boto3
+        from botocore.config import Config as BotoConfig
+
+        # One pooled connection per worker thread; a read never outlives the slowest stage
+        boto_config = BotoConfig(
+            max_pool_connections=self.max_concurrency,
+            read_timeout=max(self.timeouts.values()),
+        )
+        return boto3.client("bedrock-runtime", region_name=region,
+                            endpoint_url=endpoint_url, config=boto_config)
+
+    def _invoke(self, prompt: str, max_tokens: int) -> str:
+        """Blocking model call, run on the thread pool."""
+        response = self.client.invoke_model(
+            modelId=self.model_id,
+            body=json.dumps({
+                "anthropic_version": "bedrock-2023-05-31",
+                "messages": [
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ],
+                "max_tokens": max_tokens,
+                "temperature": self.temperature
+            })
+        )
+        result = json.loads(response['body'].read())
+        return result['content'][0]['text']
+
+    async def complete(self, stage: str, prompt: str, max_tokens: int = 1000) -> str:
+        """
+        Invoke the model without blocking the event loop.
+
+        Args:
+            stage: Agent stage (``intent``, ``data`` or ``model``) whose
+                timeout applies
+            prompt: User message
+            max_tokens: Response length limit
+
+        Returns:
+            The response text
+
+        Raises:
+            LLMTimeoutError: If the stage's timeout passed first
+        """
+        timeout = self.timeouts.get(stage)
+        loop = asyncio.get_running_loop()
+        start_time = time.time()
+        self.calls[stage] += 1
+        try:
+            return await asyncio.wait_for(
+                loop.run_in_executor(self._executor, self._invoke, prompt, max_tokens), timeout
+            )
+        except asyncio.TimeoutError:
+            self.timed_out[stage] += 1
+            raise LLMTimeoutError(f"{stage} stage timed out after {timeout}s") from None
+        except Exception:
+            self.failures[stage] += 1
+            raise
+        finally:
+            self.total_latency[stage] += time.time() - start_time
+
+    async def complete_json(self, stage: str, prompt: str, max_tokens: int = 1000,
+                            similarity_text: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Invoke the model and parse the JSON object in its response.
+
+        Responses are served from and stored in the cache when one is
+        configured; only responses that parse are stored.
+
+        Args:
+            stage: Agent stage
+            prompt: User message
+            max_tokens: Response length limit
+            similarity_text: Part of the prompt that varies between
+                requests, used to match near-duplicates in the cache
+        """
+        if self.cache is not None:
+            cached = self.cache.get(stage, self.model_id, self.temperature, prompt, similarity_text)
+            if cached is not None:
+                return self._parse_json(cached)
+
+        response_text = await self.complete(stage, prompt, max_tokens)
+        result = self._parse_json(response_text)
+        if self.cache is not None:
+            self.cache.put(stage, self.model_id, self.temperature, prompt, response_text, similarity_text)
+        return result
+
+    def _parse_json(self, response_text: str) -> Dict[str, Any]:
+        # Extract JSON from the response (the model sometimes adds extra text)
+        start_idx = response_text.find('{')
+        end_idx = response_text.rfind('}') + 1
+        if start_idx == -1 or end_idx == 0:
+            raise ValueError("No JSON found in AWS response")
+        return json.loads(response_text[start_idx:end_idx])
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Calls, failures, timeouts and average latency per stage."""
+        return {
+            "max_concurrency": self.max_concurrency,
+            "stages": {
+                stage: {
+                    "calls": self.calls[stage],
+                    "failures": self.failures[stage],
+                    "timeouts": self.timed_out[stage],
+                    "timeout_seconds": self.timeouts.get(stage),
+                    "avg_latency": self.total_latency[stage] / self.calls[stage] if self.calls[stage] else 0.0
+                }
+                for stage in self.timeouts
+            }
+        }
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Per-stage hit rates of the response cache."""
+        return self.cache.get_stats() if self.cache is not None else {"enabled": False}
+
+    def close(self):
+        """Stop the worker threads once calls in flight are done."""
+        self._executor.shutdown(wait=False)
+        if self.cache is not None:
+            self.cache.close()
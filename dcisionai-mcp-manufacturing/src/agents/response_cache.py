@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""
+LLMResponseCache - Reusable Stage Outputs for the Agents
+========================================================
+
+Caches the model's response to each agent stage so a repeated or nearly
+repeated query is answered without another Bedrock round trip. Entries are
+keyed by the normalized prompt, model id and temperature. A second tier
+matches near-duplicate queries: MinHash signatures of the query text are
+bucketed with locality-sensitive hashing, and a candidate is used when its
+estimated similarity reaches the configured threshold and it mentions
+exactly the same numbers, optimization senses and negations, in order
+(``50 workers`` never answers ``60 workers``, ``minimize`` never answers
+``maximize`` and ``do not`` is never ignored).
+
+Key Features:
+- Exact tier on normalized prompt + model id + temperature
+- MinHash/LSH near-duplicate tier with a similarity threshold and
+  number, sense and negation guards
+- TTL expiry and least-recently-used eviction at a size bound
+- SQLite persistence across restarts, in a per-user cache directory
+- Per-stage hit rates
+
+Author: DcisionAI Team
+Copyright (c) 2025 DcisionAI. All rights reserved.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import struct
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+from settings import get_setting
+
+logger = logging.getLogger(__name__)
+
+# MinHash layout: NUM_PERM hash functions split into LSH_BANDS bands
+NUM_PERM = 64
+LSH_BANDS = 16
+SHINGLE_SIZE = 4
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+_WHITESPACE = re.compile(r"\s+")
+_NUMBER = re.compile(r"\d+(?:\.\d+)?")
+
+# Words that flip a query's meaning while barely changing its text: the
+# optimization sense (captured as max/min) and negations
+_QUALIFIER = re.compile(
+    r"\b(max|min)(?:imi[sz]\w*|imum)?\b"
+    r"|\b(?:not|no|never|without|none|nor|neither|cannot|except|excluding)\b|n't\b"
+)
+
+
+def default_cache_dir() -> Path:
+    """Per-user cache directory for the manufacturing MCP server."""
+    base = os.getenv("XDG_CACHE_HOME") or os.path.join(Path.home(), ".cache")
+    return Path(base) / "dcisionai-mcp-manufacturing"
+
+
+def _permutations(seed: int = 1) -> List[Tuple[int, int]]:
+    """Deterministic (a, b) pairs so signatures survive a restart."""
+    pairs = []
+    for i in range(NUM_PERM):
+        digest = hashlib.sha256(f"minhash:{seed}:{i}".encode()).digest()
+        a, b = struct.unpack("<QQ", digest[:16])
+        pairs.append((a % (_MERSENNE_PRIME - 1) + 1, b % _MERSENNE_PRIME))
+    return pairs
+
+
+_PERMUTATIONS = _permutations()
+
+
+def normalize_text(text: str) -> str:
+    """Lower-case and collapse whitespace."""
+    return _WHITESPACE.sub(" ", text.strip().lower())
+
+
+def minhash_signature(text: str) -> Tuple[int, ...]:
+    """MinHash signature over character shingles of normalized text."""
+    text = normalize_text(text)
+    if len(text) <= SHINGLE_SIZE:
+        shingles = {text}
+    else:
+        shingles = {text[i:i + SHINGLE_SIZE] for i in range(len(text) - SHINGLE_SIZE + 1)}
+    hashes = [
+        struct.unpack("<I", hashlib.blake2b(s.encode(), digest_size=4).digest())[0]
+        for s in shingles
+    ]
+    return tuple(
+        min((a * h + b) % _MERSENNE_PRIME for h in hashes) & _MAX_HASH
+        for a, b in _PERMUTATIONS
+    )
+
+
+def qualifiers(text: str) -> Tuple[str, ...]:
+    """Optimization senses (``max``/``min``) and negations (``not``) in order of appearance."""
+    return tuple(match.group(1) or "not" for match in _QUALIFIER.finditer(normalize_text(text)))
+
+
+def signature_similarity(sig1: Tuple[int, ...], sig2: Tuple[int, ...]) -> float:
+    """Estimated Jaccard similarity of two MinHash signatures."""
+    return sum(1 for x, y in zip(sig1, sig2) if x == y) / NUM_PERM
+
+
+@dataclass
+class ResponseEntry:
+    """A cached stage response."""
+    key: str
+    namespace: str
+    similarity_text: Optional[str]
+    signature: Optional[Tuple[int, ...]]
+    numbers: Tuple[str, ...]
+    qualifiers: Tuple[str, ...]
+    response: str
+    created_at: float
+    last_access: float
+    hits: int = 0
+
+
+class LLMResponseCache:
+    """
+    Stage-output cache with an exact and a near-duplicate tier.
+
+    Args:
+        path: SQLite database file, relative to ``default_cache_dir()``
+            unless absolute; ``None`` keeps the cache in memory only
+        stages: Agent stages whose responses are cached
+        ttl_seconds: Age after which an entry is no longer used
+        max_entries: Entries kept; the least recently used are evicted
+        similarity_threshold: Estimated similarity a near-duplicate needs;
+            0 disables the near-duplicate tier
+    """
+
+    def __init__(self, path: Optional[str] = "llm_cache.db", stages: Tuple[str, ...] = ("intent", "data"),
+                 ttl_seconds: float = 3600.0, max_entries: int = 5000,
+                 similarity_threshold: float = 0.95):
+        self.path = default_cache_dir() / Path(path).expanduser() if path else None
+        self.stages = set(stages)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+
+        # Entries in least-recently-used order, and LSH buckets per namespace
+        self.entries: "OrderedDict[str, ResponseEntry]" = OrderedDict()
+        self.buckets: Dict[Tuple[str, int, Tuple[int, ...]], set] = defaultdict(set)
+
+        # Per-stage analytics
+        self.lookups: Dict[str, int] = defaultdict(int)
+        self.exact_hits: Dict[str, int] = defaultdict(int)
+        self.similar_hits: Dict[str, int] = defaultdict(int)
+        self.evictions = 0
+
+        # Thread safety
+        self.cache_lock = threading.RLock()
+
+        self._db = self._open_db(self.path) if self.path else None
+        self._load_entries()
+
+        logger.info(f"💾 LLMResponseCache initialized with {len(self.entries)} cached responses")
+
+    @classmethod
+    def from_settings(cls, settings: Dict[str, Any]) -> Optional["LLMResponseCache"]:
+        """Create the cache described by ``cache.llm``, or ``None`` when disabled."""
+        if not get_setting(settings, "cache.llm.enabled", False):
+            return None
+        return cls(
+            path=get_setting(settings, "cache.llm.path", "llm_cache.db"),
+            stages=tuple(get_setting(settings, "cache.llm.stages", ["intent", "data"])),
+            ttl_seconds=float(get_setting(settings, "cache.llm.ttl_seconds", 3600)),
+            max_entries=int(get_setting(settings, "cache.llm.max_entries", 5000)),
+            similarity_threshold=float(get_setting(settings, "cache.llm.similarity_threshold", 0.95)),
+        )
+
+    def get(self, stage: str, model_id: str, temperature: float, prompt: str,
+            similarity_text: Optional[str] = None) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            stage: Agent stage
+            model_id: Model the response came from
+            temperature: Sampling temperature it was generated with
+            prompt: Full prompt
+            similarity_text: Part of the prompt that varies between
+                requests (e.g. the query); enables the near-duplicate tier
+
+        Returns:
+            The cached response text, or ``None``
+        """
+        if stage not in self.stages:
+            return None
+        namespace = self._namespace(stage, model_id, temperature)
+        key = self._key(namespace, prompt)
+        now = time.time()
+
+        with self.cache_lock:
+            self.lookups[stage] += 1
+            entry = self.entries.get(key)
+            if entry is not None and not self._expired(entry, now):
+                self.exact_hits[stage] += 1
+                return self._touch(entry, now)
+
+            if similarity_text and self.similarity_threshold > 0:
+                entry = self._find_similar(namespace, similarity_text)
+                if entry is not None:
+                    self.similar_hits[stage] += 1
+                    logger.info(f"🎯 Near-duplicate {stage} response reused ({entry.key[:12]})")
+                    return self._touch(entry, now)
+        return None
+
+    def put(self, stage: str, model_id: str, temperature: float, prompt: str, response: str,
+            similarity_text: Optional[str] = None):
+        """Store a stage response (see ``get`` for the arguments)."""
+        if stage not in self.stages:
+            return
+        namespace = self._namespace(stage, model_id, temperature)
+        now = time.time()
+        entry = ResponseEntry(
+            key=self._key(namespace, prompt),
+            namespace=namespace,
+            similarity_text=normalize_text(similarity_text) if similarity_text else None,
+            signature=minhash_signature(similarity_text) if similarity_text else None,
+            numbers=tuple(_NUMBER.findall(similarity_text)) if similarity_text else (),
+            qualifiers=qualifiers(similarity_text) if similarity_text else (),
+            response=response,
+            created_at=now,
+            last_access=now,
+        )
+
+        with self.cache_lock:
+            if entry.key in self.entries:
+                self._remove(entry.key)
+            self._insert(entry)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (entry.key, entry.namespace, entry.similarity_text, entry.response,
+                     entry.created_at, entry.last_access, entry.hits)
+                )
+                self._db.commit()
+            while len(self.entries) > self.max_entries:
+                self._evict(next(iter(self.entries)))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Lookups and exact/near-duplicate hit rates per stage."""
+        with self.cache_lock:
+            stages = {}
+            for stage in sorted(self.stages):
+                lookups = self.lookups[stage]
+                hits = self.exact_hits[stage] + self.similar_hits[stage]
+                stages[stage] = {
+                    'lookups': lookups,
+                    'exact_hits': self.exact_hits[stage],
+                    'similar_hits': self.similar_hits[stage],
+                    'hit_rate': hits / lookups if lookups else 0.0
+                }
+            return {
+                'enabled': True,
+                'entries': len(self.entries),
+                'max_entries': self.max_entries,
+                'evictions': self.evictions,
+                'similarity_threshold': self.similarity_threshold,
+                'stages': stages
+            }
+
+    def clear(self):
+        """Drop every cached response."""
+        with self.cache_lock:
+            self.entries.clear()
+            self.buckets.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM responses")
+                self._db.commit()
+        logger.info("🗑️ LLM response cache cleared")
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def _namespace(self, stage: str, model_id: str, temperature: float) -> str:
+        return f"{stage}|{model_id}|{float(temperature)}"
+
+    def _key(self, namespace: str, prompt: str) -> str:
+        return hashlib.sha256(f"{namespace}|{normalize_text(prompt)}".encode()).hexdigest()
+
+    def _expired(self, entry: ResponseEntry, now: float) -> bool:
+        return now - entry.created_at > self.ttl_seconds
+
+    def _touch(self, entry: ResponseEntry, now: float) -> str:
+        entry.last_access = now
+        entry.hits += 1
+        self.entries.move_to_end(entry.key)
+        if self._db is not None:
+            self._db.execute("UPDATE responses SET last_access = ?, hits = ? WHERE key = ?",
+                             (entry.last_access, entry.hits, entry.key))
+            self._db.commit()
+        return entry.response
+
+    def _find_similar(self, namespace: str, similarity_text: str) -> Optional[ResponseEntry]:
+        """Best unexpired near-duplicate above the threshold, if any."""
+        signature = minhash_signature(similarity_text)
+        numbers = tuple(_NUMBER.findall(similarity_text))
+        senses = qualifiers(similarity_text)
+        candidates = set()
+        for band, band_hash in enumerate(self._bands(signature)):
+            candidates |= self.buckets.get((namespace, band, band_hash), set())
+
+        now = time.time()
+        best, best_similarity = None, self.similarity_threshold
+        for key in candidates:
+            entry = self.entries[key]
+            if self._expired(entry, now) or entry.numbers != numbers or entry.qualifiers != senses:
+                continue
+            similarity = signature_similarity(signature, entry.signature)
+            if similarity >= best_similarity:
+                best, best_similarity = entry, similarity
+        return best
+
+    def _bands(self, signature: Tuple[int, ...]) -> List[Tuple[int, ...]]:
+        rows = NUM_PERM // LSH_BANDS
+        return [signature[i * rows:(i + 1) * rows] for i in range(LSH_BANDS)]
+
+    def _insert(self, entry: ResponseEntry):
+        self.entries[entry.key] = entry
+        if entry.signature is not None:
+            for band, band_hash in enumerate(self._bands(entry.signature)):
+                self.buckets[(entry.namespace, band, band_hash)].add(entry.key)
+
+    def _remove(self, key: str) -> ResponseEntry:
+        entry = self.entries.pop(key)
+        if entry.signature is not None:
+            for band, band_hash in enumerate(self._bands(entry.signature)):
+                bucket = self.buckets.get((entry.namespace, band, band_hash))
+                if bucket is not None:
+                    bucket.discard(key)
+                    if not bucket:
+                        del self.buckets[(entry.namespace, band, band_hash)]
+        return entry
+
+    def _evict(self, key: str):
+        self._remove(key)
+        self.evictions += 1
+        if self._db is not None:
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._db.commit()
+
+    def _open_db(self, path: Path) -> sqlite3.Connection:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        db = sqlite3.connect(str(path), check_same_thread=False)
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, namespace TEXT, similarity_text TEXT, response TEXT, "
+            "created_at REAL, last_access REAL, hits INTEGER)"
+        )
+        db.commit()
+        return db
+
+    def _load_entries(self):
+        """Load unexpired entries from SQLite, most recently used last."""
+        if self._db is None:
+            return
+        try:
+            cutoff = time.time() - self.ttl_seconds
+            self._db.execute("DELETE FROM responses WHERE created_at < ?", (cutoff,))
+            self._db.commit()
+            rows = self._db.execute(
+                "SELECT key, namespace, similarity_text, response, created_at, last_access, hits "
+                "FROM responses ORDER BY last_access DESC LIMIT ?", (self.max_entries,)
+            ).fetchall()
+        except sqlite3.DatabaseError as e:
+            logger.warning(f"Failed to load LLM response cache: {e}")
+            return
+
+        for key, namespace, similarity_text, response, created_at, last_access, hits in reversed(rows):
+            self._insert(ResponseEntry(
+                key=key,
+                namespace=namespace,
+                similarity_text=similarity_text,
+                signature=minhash_signature(similarity_text) if similarity_text else None,
+                numbers=tuple(_NUMBER.findall(similarity_text)) if similarity_text else (),
+                qualifiers=qualifiers(similarity_text) if similarity_text else (),
+                response=response,
+                created_at=created_at,
+                last_access=last_access,
+                hits=hits,
+            ))
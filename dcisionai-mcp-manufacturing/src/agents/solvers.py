@@ -0,0 +1,583 @@
+#!/usr/bin/env python3
+"""
+ModelSolver - In-Process Solver Backends for Compiled Models
+============================================================
+
+Solves a ``CompiledModel`` (the sparse-matrix model IR produced by
+``agents.model_compiler``: CSR constraint matrix, row and column bound
+arrays, integrality and objective vectors) with one of three backends:
+
+- ``highs``: HiGHS through ``highspy``, passed the arrays directly; also
+  solves convex quadratic objectives (continuous models only)
+- ``scipy``: ``scipy.optimize.milp`` (HiGHS bundled with SciPy), linear
+  models only
+- ``pulp_cbc``: a PuLP problem solved by the CBC executable, kept as the
+  fallback when neither in-process backend is installed or one fails
+
+The in-process backends neither write model files nor spawn a process per
+solve, and never build a Python object per variable or term.
+
+An ``IncrementalModel`` keeps a model loaded in HiGHS between solves. When
+the model is re-solved with new data of the same structure (different
+parameters, bounds or right-hand sides), only the changed costs, bounds and
+coefficients are passed to HiGHS, and the solve starts from the previous
+basis (LPs) or incumbent (MIPs).
+
+Key Features:
+- ``auto`` selection of the first available backend that supports the model
+- Fallback to the next backend when one is unavailable or fails
+- Time limits from ``agents.solver.timeout``
+- In-place updates and warm-started re-solves of kept models
+- Per-backend solve counts, fallbacks and average solve time
+
+Author: DcisionAI Team
+Copyright (c) 2025 DcisionAI. All rights reserved.
+"""
+
+import importlib.util
+import logging
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass, replace
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+from agents.model_compiler import CompiledModel, ModelCompileError, build_pulp_model
+from settings import get_setting, load_settings
+
+logger = logging.getLogger(__name__)
+
+# Backends in the order ``auto`` tries them
+SOLVER_BACKENDS = ("highs", "scipy", "pulp_cbc")
+
+# CompiledModel fields that ``IncrementalModel.change`` may set
+VALUE_FIELDS = ("objective", "lower", "upper", "row_lower", "row_upper", "data", "q_vals")
+
+# Older configurations name the PuLP backend after its solver
+BACKEND_ALIASES = {"cbc": "pulp_cbc", "pulp": "pulp_cbc", "highspy": "highs", "milp": "scipy"}
+
+
+@dataclass
+class SolveOutcome:
+    """Result of solving a compiled model."""
+    status: str
+    objective_value: Optional[float]
+    values: Optional[np.ndarray]
+    solve_time: float
+    backend: str
+    message: str = ""
+    update_time: float = 0.0  # Moving a kept model to new data, before solving
+    warm_start: str = ""  # "basis" or "incumbent" when a re-solve was warm-started
+
+    def solution(self, compiled: CompiledModel) -> Dict[str, float]:
+        """Variable values keyed by the names of the model specification."""
+        if self.values is None:
+            return {}
+        return dict(zip(compiled.variable_names, self.values.tolist()))
+
+
+class IncrementalModel:
+    """
+    A compiled model kept loaded in a solver between solves.
+
+    ``update`` moves the model to the data of another compilation of the
+    same specification template. If the structure is unchanged (see
+    ``CompiledModel.same_structure``) the loaded solver model is changed in
+    place; otherwise it is dropped and loaded again on the next solve.
+    Updates and solves of one model are serialized by ``lock``.
+    """
+
+    def __init__(self, compiled: CompiledModel, fingerprint: str = ""):
+        self.compiled = compiled
+        self.fingerprint = fingerprint  # Identifies the data the model holds
+        self.highs = None  # Loaded by HighsBackend on first solve
+        self.incumbent: Optional[np.ndarray] = None
+        self.lock = threading.RLock()
+
+        # Statistics
+        self.solves = 0
+        self.updates = 0
+        self.rebuilds = 0
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Solver instances and locks stay in the process
+        state = self.__dict__.copy()
+        state['highs'] = None
+        del state['lock']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        self.lock = threading.RLock()
+
+    def update(self, compiled: CompiledModel, fingerprint: str = "") -> Dict[str, int]:
+        """
+        Move the model to ``compiled``'s data.
+
+        Returns:
+            Number of changed entries by kind (``costs``, ``bounds``, ``rows``,
+            ``coefficients``, ``quadratic``); empty if the model was replaced
+        """
+        with self.lock:
+            old, self.fingerprint = self.compiled, fingerprint
+            self.compiled = compiled
+            if not old.same_structure(compiled):
+                self.highs, self.incumbent = None, None
+                self.rebuilds += 1
+                return {}
+            self.updates += 1
+            if self.highs is None:
+                return {}
+            try:
+                return HighsBackend.update(self.highs, old, compiled)
+            except Exception:
+                # Not knowing which changes were applied, load it again next time
+                self.highs = None
+                raise
+
+    def change(self, objective_constant: Optional[float] = None, **values) -> Dict[str, int]:
+        """
+        Set coefficient arrays of the model directly, e.g. ``row_upper`` for
+        right-hand sides in a sensitivity analysis, without compiling a
+        specification.
+
+        Args:
+            objective_constant: New constant term of the objective
+            **values: New arrays for fields in ``VALUE_FIELDS``, of unchanged length
+
+        Returns:
+            Number of changed entries by kind, as ``update``
+        """
+        unknown = set(values) - set(VALUE_FIELDS)
+        if unknown:
+            raise ValueError(f"cannot change {sorted(unknown)}; expected fields of {VALUE_FIELDS}")
+        with self.lock:
+            arrays = {}
+            for field, value in values.items():
+                array = np.asarray(value, dtype=float)
+                if array.shape != getattr(self.compiled, field).shape:
+                    raise ValueError(f"{field} has shape {array.shape}, "
+                                     f"expected {getattr(self.compiled, field).shape}")
+                arrays[field] = array
+            if objective_constant is not None:
+                arrays['objective_constant'] = float(objective_constant)
+            # The data no longer comes from a specification
+            return self.update(replace(self.compiled, **arrays))
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.compiled.summary(),
+            'solves': self.solves,
+            'updates': self.updates,
+            'rebuilds': self.rebuilds,
+            'loaded': self.highs is not None
+        }
+
+
+class SolverBackend:
+    """A way of solving compiled models."""
+
+    name = ""
+    module = ""
+    incremental = False  # Whether ``resolve`` keeps models loaded between solves
+
+    def available(self) -> bool:
+        return importlib.util.find_spec(self.module) is not None
+
+    def supports(self, compiled: CompiledModel) -> bool:
+        return not compiled.is_quadratic
+
+    def solve(self, compiled: CompiledModel, time_limit: Optional[float] = None) -> SolveOutcome:
+        raise NotImplementedError
+
+    def resolve(self, model: IncrementalModel, time_limit: Optional[float] = None) -> SolveOutcome:
+        return self.solve(model.compiled, time_limit)
+
+
+class HighsBackend(SolverBackend):
+    """HiGHS through highspy, with the IR arrays passed as they are."""
+
+    name = "highs"
+    module = "highspy"
+    incremental = True
+
+    STATUSES = {
+        "kOptimal": "optimal",
+        "kInfeasible": "infeasible",
+        "kUnbounded": "unbounded",
+        "kUnboundedOrInfeasible": "infeasible",
+        "kTimeLimit": "time_limit",
+        "kIterationLimit": "time_limit",
+    }
+
+    def supports(self, compiled: CompiledModel) -> bool:
+        # HiGHS solves QPs but not mixed-integer QPs
+        return not (compiled.is_quadratic and compiled.is_integer)
+
+    def create(self, compiled: CompiledModel, time_limit: Optional[float] = None):
+        """A loaded ``highspy.Highs`` instance for the model."""
+        import highspy
+
+        highs = highspy.Highs()
+        highs.setOptionValue("output_flag", False)
+        if time_limit:
+            highs.setOptionValue("time_limit", float(time_limit))
+
+        lp = highspy.HighsLp()
+        lp.num_col_ = compiled.num_variables
+        lp.num_row_ = compiled.num_constraints
+        # A quadratic objective is passed in minimization form
+        negate = compiled.is_quadratic and compiled.sense == 'maximize'
+        lp.col_cost_ = -compiled.objective if negate else compiled.objective
+        lp.offset_ = -compiled.objective_constant if negate else compiled.objective_constant
+        if compiled.sense == 'maximize' and not negate:
+            lp.sense_ = highspy.ObjSense.kMaximize
+        lp.col_lower_ = compiled.lower
+        lp.col_upper_ = compiled.upper
+        lp.row_lower_ = compiled.row_lower
+        lp.row_upper_ = compiled.row_upper
+        lp.a_matrix_.format_ = highspy.MatrixFormat.kRowwise
+        lp.a_matrix_.start_ = compiled.indptr
+        lp.a_matrix_.index_ = compiled.indices
+        lp.a_matrix_.value_ = compiled.data
+        if compiled.is_integer:
+            lp.integrality_ = [highspy.HighsVarType.kInteger if flag else highspy.HighsVarType.kContinuous
+                               for flag in compiled.integrality.tolist()]
+        highs.passModel(lp)
+
+        if compiled.is_quadratic:
+            self.check_convex(compiled, -1.0 if negate else 1.0)
+            highs.passHessian(self.hessian(compiled, -1.0 if negate else 1.0))
+        return highs
+
+    def check_convex(self, compiled: CompiledModel, scale: float):
+        """HiGHS only finds global optima of convex QPs; reject the others up front."""
+        columns, positions = np.unique(np.concatenate([compiled.q_rows, compiled.q_cols]), return_inverse=True)
+        rows, cols = positions[:len(compiled.q_rows)], positions[len(compiled.q_rows):]
+        q = np.zeros((len(columns), len(columns)))
+        np.add.at(q, (rows, cols), scale * compiled.q_vals)
+        np.add.at(q, (cols, rows), scale * compiled.q_vals)
+        if np.linalg.eigvalsh(q).min() < -1e-9 * max(1.0, np.abs(q).max()):
+            shape = "concave" if compiled.sense == 'maximize' else "convex"
+            raise ModelCompileError(f"quadratic objective is not {shape}; only convex quadratic programs are solved")
+
+    def hessian(self, compiled: CompiledModel, scale: float):
+        """Lower triangle of Q, column-wise, for objective terms ``q * x_i * x_j``."""
+        import highspy
+
+        hessian = highspy.HighsHessian()
+        hessian.dim_ = compiled.num_variables
+        hessian.format_ = highspy.HessianFormat.kTriangular
+        # Terms are sorted by (i, j) with i <= j: column i holds rows j >= i
+        diagonal = compiled.q_rows == compiled.q_cols
+        hessian.start_ = np.searchsorted(compiled.q_rows, np.arange(compiled.num_variables + 1))
+        hessian.index_ = compiled.q_cols
+        hessian.value_ = scale * np.where(diagonal, 2.0, 1.0) * compiled.q_vals
+        return hessian
+
+    def solve(self, compiled: CompiledModel, time_limit: Optional[float] = None) -> SolveOutcome:
+        start_time = time.perf_counter()
+        highs = self.create(compiled, time_limit)
+        highs.run()
+        return self.outcome(highs, compiled, time.perf_counter() - start_time)
+
+    def resolve(self, model: IncrementalModel, time_limit: Optional[float] = None) -> SolveOutcome:
+        """Solve a kept model, loading it on first use and warm-starting later solves."""
+        import highspy
+
+        start_time = time.perf_counter()
+        compiled, warm_start = model.compiled, ""
+        if model.highs is None:
+            model.highs = self.create(compiled, time_limit)
+        elif compiled.is_integer:
+            if model.incumbent is not None:
+                # The previous incumbent, moved inside the new bounds; HiGHS
+                # only uses it if it is still feasible
+                incumbent = np.clip(model.incumbent, compiled.lower, compiled.upper)
+                incumbent = np.where(compiled.integrality > 0, np.round(incumbent), incumbent)
+                solution = highspy.HighsSolution()
+                solution.col_value = incumbent.tolist()
+                solution.value_valid = True
+                model.highs.setSolution(solution)
+                warm_start = "incumbent"
+        elif model.highs.getBasis().valid:
+            # HiGHS keeps the basis of the last solve through in-place changes
+            warm_start = "basis"
+        model.highs.run()
+        outcome = self.outcome(model.highs, compiled, time.perf_counter() - start_time)
+        outcome.warm_start = warm_start
+        return outcome
+
+    @classmethod
+    def update(cls, highs, old: CompiledModel, new: CompiledModel) -> Dict[str, int]:
+        """Pass the entries in which ``new`` differs from ``old`` (of the same structure) to ``highs``."""
+        negate = new.is_quadratic and new.sense == 'maximize'
+        sign = -1.0 if negate else 1.0
+        changes = {}
+
+        costs = np.flatnonzero(old.objective != new.objective)
+        if len(costs):
+            highs.changeColsCost(len(costs), costs, sign * new.objective[costs])
+        if old.objective_constant != new.objective_constant:
+            highs.changeObjectiveOffset(sign * new.objective_constant)
+        changes['costs'] = len(costs)
+
+        bounds = np.flatnonzero((old.lower != new.lower) | (old.upper != new.upper))
+        if len(bounds):
+            highs.changeColsBounds(len(bounds), bounds, new.lower[bounds], new.upper[bounds])
+        changes['bounds'] = len(bounds)
+
+        rows = np.flatnonzero((old.row_lower != new.row_lower) | (old.row_upper != new.row_upper))
+        if len(rows):
+            highs.changeRowsBounds(len(rows), rows, new.row_lower[rows], new.row_upper[rows])
+        changes['rows'] = len(rows)
+
+        coefficients = np.flatnonzero(old.data != new.data)
+        row_of = np.searchsorted(new.indptr, coefficients, side='right') - 1
+        for row, col, value in zip(row_of.tolist(), new.indices[coefficients].tolist(),
+                                   new.data[coefficients].tolist()):
+            highs.changeCoeff(row, col, value)
+        changes['coefficients'] = len(coefficients)
+
+        changes['quadratic'] = int(np.count_nonzero(old.q_vals != new.q_vals))
+        if changes['quadratic']:
+            backend = cls()
+            backend.check_convex(new, sign)
+            highs.passHessian(backend.hessian(new, sign))
+        return changes
+
+    def outcome(self, highs, compiled: CompiledModel, solve_time: float) -> SolveOutcome:
+        import highspy
+
+        model_status = highs.getModelStatus()
+        status = self.STATUSES.get(model_status.name, "error")
+        objective_value, values = None, None
+        feasible = highs.getInfo().primal_solution_status == highspy.SolutionStatus.kSolutionStatusFeasible
+        if status == "optimal" or (status == "time_limit" and feasible):
+            values = np.asarray(highs.getSolution().col_value)
+            objective_value = highs.getInfo().objective_function_value
+            if compiled.is_quadratic and compiled.sense == 'maximize':
+                objective_value = -objective_value
+        return SolveOutcome(status=status, objective_value=objective_value, values=values,
+                            solve_time=solve_time, backend=self.name,
+                            message="" if status == "optimal" else highs.modelStatusToString(model_status))
+
+
+class ScipyBackend(SolverBackend):
+    """``scipy.optimize.milp`` on the CSR matrix."""
+
+    name = "scipy"
+    module = "scipy"
+
+    STATUSES = {0: "optimal", 1: "time_limit", 2: "infeasible", 3: "unbounded"}
+
+    def solve(self, compiled: CompiledModel, time_limit: Optional[float] = None) -> SolveOutcome:
+        from scipy.optimize import Bounds, LinearConstraint, milp
+
+        start_time = time.perf_counter()
+        sign = -1.0 if compiled.sense == 'maximize' else 1.0
+        constraints = []
+        if compiled.num_constraints:
+            constraints.append(LinearConstraint(compiled.matrix(), compiled.row_lower, compiled.row_upper))
+        result = milp(
+            sign * compiled.objective,
+            integrality=compiled.integrality,
+            bounds=Bounds(compiled.lower, compiled.upper),
+            constraints=constraints,
+            options={"time_limit": float(time_limit)} if time_limit else None
+        )
+        solve_time = time.perf_counter() - start_time
+
+        status = self.STATUSES.get(result.status, "error")
+        objective_value, values = None, None
+        if result.x is not None:
+            values = np.asarray(result.x)
+            objective_value = sign * result.fun + compiled.objective_constant
+        return SolveOutcome(status=status, objective_value=objective_value, values=values,
+                            solve_time=solve_time, backend=self.name,
+                            message="" if status == "optimal" else str(result.message))
+
+
+class PulpCbcBackend(SolverBackend):
+    """A PuLP problem solved by the CBC executable bundled with PuLP."""
+
+    name = "pulp_cbc"
+    module = "pulp"
+
+    def solve(self, compiled: CompiledModel, time_limit: Optional[float] = None) -> SolveOutcome:
+        import pulp
+
+        start_time = time.perf_counter()
+        model = build_pulp_model(compiled)
+        model.problem.solve(pulp.PULP_CBC_CMD(msg=0, timeLimit=time_limit))
+        solve_time = time.perf_counter() - start_time
+
+        status = {
+            pulp.LpStatusOptimal: "optimal",
+            pulp.LpStatusInfeasible: "infeasible",
+            pulp.LpStatusUnbounded: "unbounded"
+        }.get(model.problem.status, "error")
+        objective_value, values = None, None
+        if status == "optimal":
+            objective_value = pulp.value(model.problem.objective)
+            values = np.array([var.varValue for var in model.variables], dtype=float)
+        return SolveOutcome(status=status, objective_value=objective_value, values=values,
+                            solve_time=solve_time, backend=self.name,
+                            message="" if status == "optimal" else pulp.LpStatus[model.problem.status])
+
+
+BACKENDS: Dict[str, SolverBackend] = {
+    backend.name: backend for backend in (HighsBackend(), ScipyBackend(), PulpCbcBackend())
+}
+
+
+class ModelSolver:
+    """
+    Solves compiled models with the configured backend.
+
+    ``auto`` tries the backends in ``SOLVER_BACKENDS`` order; a named
+    backend is tried first and the others follow as fallbacks.
+    """
+
+    def __init__(self, backend: str = "auto", time_limit: Optional[float] = None):
+        backend = BACKEND_ALIASES.get(backend, backend)
+        if backend != "auto" and backend not in BACKENDS:
+            raise ValueError(f"Unknown solver backend {backend!r}; expected auto or one of {SOLVER_BACKENDS}")
+        self.backend = backend
+        self.time_limit = time_limit
+
+        # Statistics
+        self._stats_lock = threading.Lock()
+        self.solves: Dict[str, int] = defaultdict(int)
+        self.failures: Dict[str, int] = defaultdict(int)
+        self.fallbacks = 0
+        self.total_time: Dict[str, float] = defaultdict(float)
+
+        logger.info(f"🧮 Model solver initialized (backend: {backend}, available: {self.available_backends()})")
+
+    @classmethod
+    def from_settings(cls, settings: Optional[Dict[str, Any]] = None) -> "ModelSolver":
+        """Create a solver from ``agents.solver`` in the server configuration."""
+        settings = settings if settings is not None else load_settings()
+        timeout = get_setting(settings, "agents.solver.timeout")
+        return cls(
+            backend=str(get_setting(settings, "agents.solver.solver_type", "auto")),
+            time_limit=float(timeout) if timeout else None,
+        )
+
+    def available_backends(self) -> List[str]:
+        return [name for name in SOLVER_BACKENDS if BACKENDS[name].available()]
+
+    def candidates(self, compiled: CompiledModel, preferred: Optional[str] = None) -> List[SolverBackend]:
+        """Backends to try for a model, preferred first."""
+        preferred = BACKEND_ALIASES.get(preferred, preferred) or self.backend
+        order = list(SOLVER_BACKENDS)
+        if preferred in BACKENDS:
+            order.remove(preferred)
+            order.insert(0, preferred)
+        return [BACKENDS[name] for name in order
+                if BACKENDS[name].available() and BACKENDS[name].supports(compiled)]
+
+    def solve(self, compiled: CompiledModel, backend: Optional[str] = None) -> SolveOutcome:
+        """
+        Solve a compiled model.
+
+        Args:
+            compiled: The model IR
+            backend: Backend to prefer for this call instead of the configured one
+
+        Returns:
+            The outcome of the first backend that did not fail
+
+        Raises:
+            ModelCompileError: If no available backend supports the model
+                (e.g. a quadratic objective without highspy)
+        """
+        return self._solve(compiled, backend)
+
+    def resolve(self, model: IncrementalModel, compiled: Optional[CompiledModel] = None,
+                fingerprint: str = "", backend: Optional[str] = None) -> SolveOutcome:
+        """
+        Re-solve a kept model, first moving it to ``compiled``'s data.
+
+        Backends that keep models loaded (HiGHS) change the loaded model in
+        place and warm-start; the others solve ``model.compiled`` from scratch.
+
+        Args:
+            model: The kept model
+            compiled: New data for the model, or None to solve it as it is
+            fingerprint: Identifies the new data (see ``IncrementalModel``)
+            backend: Backend to prefer for this call instead of the configured one
+
+        Returns:
+            The outcome, with ``update_time`` spent updating the model and
+            ``solve_time`` spent solving it
+
+        Raises:
+            ModelCompileError: If no available backend supports the model
+        """
+        with model.lock:
+            start_time = time.perf_counter()
+            if compiled is not None:
+                model.update(compiled, fingerprint)
+            update_time = time.perf_counter() - start_time
+
+            outcome = self._solve(model.compiled, backend, model)
+            outcome.update_time = update_time
+            model.solves += 1
+            if outcome.values is not None and model.compiled.is_integer:
+                model.incumbent = outcome.values
+            return outcome
+
+    def _solve(self, compiled: CompiledModel, backend: Optional[str] = None,
+               model: Optional[IncrementalModel] = None) -> SolveOutcome:
+        candidates = self.candidates(compiled, backend)
+        if not candidates:
+            raise ModelCompileError(
+                f"no available solver supports this {compiled.problem_class.replace('_', ' ')} model"
+            )
+
+        last_error: Optional[Exception] = None
+        for position, candidate in enumerate(candidates):
+            try:
+                if model is not None and candidate.incremental:
+                    outcome = candidate.resolve(model, self.time_limit)
+                else:
+                    outcome = candidate.solve(compiled, self.time_limit)
+            except ModelCompileError:
+                raise
+            except Exception as e:
+                last_error = e
+                if model is not None:
+                    # The loaded model may be half-updated
+                    model.highs = None
+                with self._stats_lock:
+                    self.failures[candidate.name] += 1
+                logger.warning(f"⚠️ {candidate.name} solver failed, trying the next backend: {e}")
+                continue
+            with self._stats_lock:
+                self.solves[candidate.name] += 1
+                self.total_time[candidate.name] += outcome.solve_time
+                if position > 0:
+                    self.fallbacks += 1
+            return outcome
+        raise RuntimeError(f"all solver backends failed: {last_error}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Configured backend, available backends and per-backend solve counts."""
+        with self._stats_lock:
+            return {
+                "backend": self.backend,
+                "available": self.available_backends(),
+                "fallbacks": self.fallbacks,
+                "backends": {
+                    name: {
+                        "solves": self.solves[name],
+                        "failures": self.failures[name],
+                        "avg_solve_time": self.total_time[name] / self.solves[name] if self.solves[name] else 0.0
+                    }
+                    for name in SOLVER_BACKENDS
+                }
+            }
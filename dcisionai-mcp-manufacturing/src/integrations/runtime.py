@@ -41,7 +41,7 @@ import os
 from agent_memory import agent_memory
 from predictive_model_cache import model_cache
 from agent_coordinator import agent_coordinator
-from mcp_server import manufacturing_tools
+from mcp_server import manufacturing_tools, plan_executor
 
 # Configure logging
 logging.basicConfig(
@@ -378,12 +378,14 @@ class AgentCoreRuntime:
         if strategy_hint['strategy'] == 'learned_pattern':
             logger.info(f"🧠 Using learned pattern: {strategy_hint['similar_optimizations']} similar optimizations")
         
-        # Step 2: Execute coordinated optimization
-        start_time = time.time()
-        
-        # Step 2a: Classify intent
-        intent_result = manufacturing_tools.classify_intent(request.problem_description)
-        logger.info(f"✅ Intent classified: {intent_result.intent}")
+        # Step 2: Execute the coordinated plan (intent and data in parallel when planned)
+        execution = await plan_executor.execute(request.problem_description, coordination_result.execution_plan)
+        intent_result = execution.results['intent_agent']
+        data_result = execution.results['data_agent']
+        model_result = execution.results['model_agent']
+        solver_result = execution.results['solver_agent']
+        processing_time = execution.total_time
+        logger.info(f"✅ Plan executed: {intent_result.intent}, {model_result.model_type}, {solver_result.status}")
         
         # Update strategy hint with actual intent
         strategy_hint = agent_memory.suggest_optimization_strategy(
@@ -391,25 +393,12 @@ class AgentCoreRuntime:
             entities=intent_result.entities
         )
         
-        # Step 2b: Analyze data
-        data_result = manufacturing_tools.analyze_data(intent_result, request.problem_description)
-        logger.info(f"✅ Data analyzed: {len(data_result.data_entities)} entities")
-        
-        # Step 2c: Build model (with caching)
-        model_result = manufacturing_tools.build_model(intent_result, data_result)
-        logger.info(f"✅ Model built: {model_result.model_type}")
-        
-        # Step 2d: Solve optimization (with caching)
-        solver_result = manufacturing_tools.solve_optimization(model_result)
-        logger.info(f"✅ Optimization solved: {solver_result.status}")
-        
-        processing_time = time.time() - start_time
-        
         # Step 3: Complete coordination
         agent_coordinator.complete_request(
             request_id=coordination_result.request_id,
             success=(solver_result.status == "optimal"),
-            processing_time=processing_time
+            processing_time=processing_time,
+            stage_times=execution.stage_times
         )
         
         # Step 4: Store in memory for learning (MOAT: Cross-session learning)
@@ -434,7 +423,10 @@ class AgentCoreRuntime:
                 "agents_assigned": coordination_result.agents_assigned,
                 "parallel_execution": coordination_result.parallel_execution,
                 "estimated_time": coordination_result.estimated_time,
-                "actual_time": processing_time
+                "actual_time": processing_time,
+                "estimated_stage_times": coordination_result.execution_plan.get('agent_estimates', {}),
+                "stage_timings": execution.stage_timings,
+                "speculation": execution.speculation
             },
             "intent_classification": {
                 "intent": intent_result.intent,
@@ -456,14 +448,18 @@ class AgentCoreRuntime:
                 "variables": model_result.variables,
                 "constraints": model_result.constraints,
                 "objective": model_result.objective,
-                "complexity": model_result.complexity
+                "complexity": model_result.complexity,
+                "parameters": model_result.parameters
             },
             "optimization_solution": {
                 "status": solver_result.status,
                 "objective_value": solver_result.objective_value,
                 "solution": solver_result.solution,
                 "solve_time": solver_result.solve_time,
-                "solver_used": solver_result.solver_used
+                "solver_used": solver_result.solver_used,
+                "message": solver_result.message,
+                "update_time": solver_result.update_time,
+                "warm_start": solver_result.warm_start
             },
             "learning_insights": {
                 "strategy_used": strategy_hint['strategy'],
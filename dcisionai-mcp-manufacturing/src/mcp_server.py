@@ -21,10 +21,9 @@ import asyncio
 import json
 import logging
 import time
-import boto3
 from typing import Dict, Any, List, Optional
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 # Import FastMCP framework
 from mcp.server.fastmcp import FastMCP
@@ -39,6 +38,18 @@ from agents.cache import model_cache
 # Import AgentCoordinator for intelligent orchestration
 from agents.coordinator import agent_coordinator
 
+# Import BedrockLLMClient so model calls don't block the event loop
+from agents.llm import BedrockLLMClient
+
+# Import PlanExecutor to run the coordinator's execution plans
+from agents.executor import PlanExecutor
+
+# Import the model compiler for generated objectives and constraints
+from agents.model_compiler import CompiledModel, ModelCompileError, compile_model, spec_fingerprint
+
+# Import ModelSolver to solve compiled models in-process (HiGHS, PuLP/CBC fallback)
+from agents.solvers import IncrementalModel, ModelSolver
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -49,9 +60,6 @@ logger = logging.getLogger(__name__)
 # Initialize FastMCP server
 mcp = FastMCP("DcisionAI Manufacturing MCP Server")
 
-# AWS Bedrock client
-bedrock_client = boto3.client('bedrock-runtime', region_name='us-east-1')
-
 # Data classes for structured responses
 @dataclass
 class IntentResult:
@@ -77,6 +85,7 @@ class ModelResult:
     constraints: List[Dict[str, Any]]
     objective: str
     complexity: str
+    parameters: Dict[str, Any] = field(default_factory=dict)
 
 @dataclass
 class SolverResult:
@@ -85,16 +94,28 @@ class SolverResult:
     solution: Dict[str, Any]
     solve_time: float
     solver_used: str
+    message: str = ""
+    update_time: float = 0.0
+    warm_start: str = ""
+
+# Keywords behind the provisional intent used for speculative data analysis
+INTENT_KEYWORDS = {
+    'production_optimization': ['production', 'produce', 'output', 'throughput', 'line', 'capacity', 'units'],
+    'supply_chain_optimization': ['supply', 'supplier', 'inventory', 'warehouse', 'logistics', 'shipping', 'distribution'],
+    'quality_control_optimization': ['quality', 'defect', 'inspection', 'scrap', 'tolerance', 'rework'],
+    'resource_allocation_optimization': ['allocate', 'allocation', 'assign', 'worker', 'staff', 'shift', 'schedule']
+}
 
 # Simplified Manufacturing Tools
 class SimplifiedManufacturingTools:
     """Simplified manufacturing tools with 4-agent architecture."""
     
-    def __init__(self):
-        self.bedrock_client = bedrock_client
+    def __init__(self, llm: Optional[BedrockLLMClient] = None, solver: Optional[ModelSolver] = None):
+        self.llm = llm or BedrockLLMClient.from_settings()
+        self.solver = solver or ModelSolver.from_settings()
         logger.info("🔧 Simplified manufacturing tools initialized")
     
-    def classify_intent(self, query: str) -> IntentResult:
+    async def classify_intent(self, query: str) -> IntentResult:
         """Classify manufacturing intent using AWS Bedrock."""
         logger.info(f"🎯 Classifying intent for: {query[:100]}...")
         
@@ -129,33 +150,9 @@ Respond in JSON format:
 
 Assistant:"""
             
-            # Call AWS Bedrock using Messages API
-            response = self.bedrock_client.invoke_model(
-                modelId='anthropic.claude-3-haiku-20240307-v1:0',
-                body=json.dumps({
-                    "anthropic_version": "bedrock-2023-05-31",
-                    "messages": [
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ],
-                    "max_tokens": 1000,
-                    "temperature": 0.1
-                })
-            )
-            
-            result = json.loads(response['body'].read())
-            response_text = result['content'][0]['text']
-            
-            # Extract JSON from the response
-            start_idx = response_text.find('{')
-            end_idx = response_text.rfind('}') + 1
-            if start_idx != -1 and end_idx != -1:
-                json_text = response_text[start_idx:end_idx]
-                intent_data = json.loads(json_text)
-            else:
-                raise ValueError("No JSON found in AWS response")
+            # Call AWS Bedrock using Messages API, off the event loop
+            intent_data = await self.llm.complete_json("intent", prompt, max_tokens=1000,
+                                                       similarity_text=query)
             
             return IntentResult(
                 intent=intent_data.get('intent', 'general_manufacturing_query'),
@@ -175,17 +172,35 @@ Assistant:"""
                 reasoning=f"Error: {str(e)}"
             )
     
-    def analyze_data(self, intent_result: IntentResult, query: str) -> DataResult:
+    def guess_intent(self, query: str) -> IntentResult:
+        """Cheap keyword guess of the intent, used to start data analysis before classification ends."""
+        query_lower = query.lower()
+        scores = {
+            intent: sum(1 for keyword in keywords if keyword in query_lower)
+            for intent, keywords in INTENT_KEYWORDS.items()
+        }
+        best_intent = max(scores, key=scores.get)
+        
+        return IntentResult(
+            intent=best_intent if scores[best_intent] > 0 else 'general_manufacturing_query',
+            confidence=0.0,
+            entities=[],
+            objectives=[],
+            reasoning="Keyword guess"
+        )
+    
+    async def analyze_data(self, intent_result: IntentResult, query: str) -> DataResult:
         """Analyze data requirements and generate sample data."""
         logger.info(f"📊 Analyzing data for intent: {intent_result.intent}")
         
         try:
-            # Create prompt for data analysis (AWS Bedrock format)
+            # Create prompt for data analysis (AWS Bedrock format). Only the intent
+            # label and the query go in: data analysis may start from a keyword
+            # guess of the intent, which is kept when the label matches
+            # (see executor.SPECULATION_KEYS)
             prompt = f"""Human: Based on this manufacturing intent, analyze data requirements:
 
 Intent: {intent_result.intent}
-Entities: {intent_result.entities}
-Objectives: {intent_result.objectives}
 Original Query: {query}
 
 Generate:
@@ -204,33 +219,9 @@ Respond in JSON format:
 
 Assistant:"""
             
-            # Call AWS Bedrock using Messages API
-            response = self.bedrock_client.invoke_model(
-                modelId='anthropic.claude-3-haiku-20240307-v1:0',
-                body=json.dumps({
-                    "anthropic_version": "bedrock-2023-05-31",
-                    "messages": [
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ],
-                    "max_tokens": 1500,
-                    "temperature": 0.1
-                })
-            )
-            
-            result = json.loads(response['body'].read())
-            response_text = result['content'][0]['text']
-            
-            # Extract JSON from the response
-            start_idx = response_text.find('{')
-            end_idx = response_text.rfind('}') + 1
-            if start_idx != -1 and end_idx != -1:
-                json_text = response_text[start_idx:end_idx]
-                data_analysis = json.loads(json_text)
-            else:
-                raise ValueError("No JSON found in AWS response")
+            # Call AWS Bedrock using Messages API, off the event loop
+            data_analysis = await self.llm.complete_json("data", prompt, max_tokens=1500,
+                                                         similarity_text=f"{intent_result.intent} {query}")
             
             return DataResult(
                 analysis_id=f"analysis_{int(time.time())}",
@@ -250,7 +241,7 @@ Assistant:"""
                 assumptions=[f"Error: {str(e)}"]
             )
     
-    def build_model(self, intent_result: IntentResult, data_result: DataResult) -> ModelResult:
+    async def build_model(self, intent_result: IntentResult, data_result: DataResult) -> ModelResult:
         """Build mathematical optimization model."""
         logger.info(f"🏗️ Building model for: {intent_result.intent}")
         
@@ -265,49 +256,28 @@ Objectives: {intent_result.objectives}
 
 Generate:
 1. Model type (linear_programming, mixed_integer_programming, etc.)
-2. Decision variables with bounds
-3. Constraints
-4. Objective function
-5. Complexity assessment
+2. Decision variables with bounds (indexed variables list their "indices")
+3. Numeric parameters used by the expressions
+4. Constraints as algebraic expressions using only declared variables and parameters
+5. Objective function starting with "maximize" or "minimize"
+6. Complexity assessment
+
+Expressions may use +, -, *, /, ^2, x[i], sum(... for i in 1..n) and a trailing "for i in 1..n" on a constraint.
 
 Respond in JSON format:
 {{
     "model_type": "linear_programming",
-    "variables": [{{"name": "x1", "type": "continuous", "bounds": [0, 100]}}],
-    "constraints": [{{"expression": "x1 + x2 <= 50", "type": "inequality"}}],
-    "objective": "maximize 10*x1 + 15*x2",
+    "variables": [{{"name": "x", "type": "continuous", "bounds": [0, 100], "indices": [1, 2]}}],
+    "parameters": {{"profit": {{"1": 10, "2": 15}}, "capacity": 50}},
+    "constraints": [{{"name": "capacity", "expression": "sum(x[i] for i in 1..2) <= capacity", "type": "inequality"}}],
+    "objective": "maximize sum(profit[i] * x[i] for i in 1..2)",
     "complexity": "medium"
 }}
 
 Assistant:"""
             
-            # Call AWS Bedrock using Messages API
-            response = self.bedrock_client.invoke_model(
-                modelId='anthropic.claude-3-haiku-20240307-v1:0',
-                body=json.dumps({
-                    "anthropic_version": "bedrock-2023-05-31",
-                    "messages": [
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ],
-                    "max_tokens": 2000,
-                    "temperature": 0.1
-                })
-            )
-            
-            result = json.loads(response['body'].read())
-            response_text = result['content'][0]['text']
-            
-            # Extract JSON from the response (AWS sometimes adds extra text)
-            start_idx = response_text.find('{')
-            end_idx = response_text.rfind('}') + 1
-            if start_idx != -1 and end_idx != -1:
-                json_text = response_text[start_idx:end_idx]
-                model_data = json.loads(json_text)
-            else:
-                raise ValueError("No JSON found in AWS response")
+            # Call AWS Bedrock using Messages API, off the event loop
+            model_data = await self.llm.complete_json("model", prompt, max_tokens=2000)
             
             return ModelResult(
                 model_id=f"model_{int(time.time())}",
@@ -315,7 +285,8 @@ Assistant:"""
                 variables=model_data.get('variables', []),
                 constraints=model_data.get('constraints', []),
                 objective=model_data.get('objective', ''),
-                complexity=model_data.get('complexity', 'medium')
+                complexity=model_data.get('complexity', 'medium'),
+                parameters=model_data.get('parameters') or {}
             )
             
         except Exception as e:
@@ -340,25 +311,43 @@ Assistant:"""
             'variables': model_result.variables,
             'constraints': model_result.constraints,
             'objective': model_result.objective,
-            'complexity': model_result.complexity
+            'complexity': model_result.complexity,
+            'parameters': model_result.parameters
         }
         
         # Try to get cached model first (MOAT: 10-100x speed improvement)
+        fingerprint = spec_fingerprint(model_spec)
+        
         def build_model(model_spec):
             """Build optimization model - this is called only on cache miss."""
-            return self._build_optimization_model(model_spec)
+            return IncrementalModel(self._build_optimization_model(model_spec), fingerprint)
         
         # Get model from cache or build new one
-        model, was_cached = model_cache.get_or_build_model(model_spec, build_model)
+        try:
+            model, was_cached = model_cache.get_or_build_model(model_spec, build_model)
+        except ModelCompileError as e:
+            logger.warning(f"⚠️ Invalid optimization model: {e}")
+            return SolverResult(
+                status="invalid_model",
+                objective_value=None,
+                solution={},
+                solve_time=0.0,
+                solver_used="none",
+                message=str(e)
+            )
+        
+        if was_cached and not isinstance(model, IncrementalModel):
+            # Entry persisted by an earlier version of the solver
+            model, was_cached = build_model(model_spec), False
         
         if was_cached:
-            logger.info(f"⚡ Using CACHED model - 10-100x faster!")
+            logger.info(f"⚡ Using CACHED model - updating it in place and re-solving warm")
         else:
             logger.info(f"🔨 Built NEW model - will be cached for future use")
         
         # Solve the optimization
         start_time = time.time()
-        result = self._solve_cached_model(model, model_spec)
+        result = self._solve_cached_model(model, model_spec, fingerprint)
         solve_time = time.time() - start_time
         
         # Record solve time for cache analytics
@@ -372,254 +361,64 @@ Assistant:"""
         
         return result
     
-    def _build_optimization_model(self, model_spec: Dict[str, Any]):
-        """Build optimization model using PuLP with REAL mathematical constraints."""
+    def _build_optimization_model(self, model_spec: Dict[str, Any]) -> CompiledModel:
+        """Compile the model specification into its sparse-matrix representation."""
+        compiled = compile_model(model_spec)
+        logger.info(f"🏗️ Built {compiled.problem_class} model: {compiled.num_variables} variables, "
+                    f"{compiled.num_constraints} constraints in {compiled.compile_time * 1000:.1f}ms")
+        return compiled
+    
+    def _solve_cached_model(self, model: IncrementalModel, model_spec: Dict[str, Any],
+                            fingerprint: str) -> SolverResult:
+        """
+        Solve a cached optimization model.
+        
+        A cached model holding other data of the same template is updated in
+        place to the specification's data first, and re-solved from its
+        previous basis or incumbent.
+        """
         try:
-            # Import PuLP for optimization
-            import pulp
-            import re
-            
-            # Create optimization problem
-            prob = pulp.LpProblem("Manufacturing_Optimization", pulp.LpMaximize)
+            with model.lock:
+                compiled, compile_time = None, 0.0
+                if model.fingerprint != fingerprint:
+                    compiled = self._build_optimization_model(model_spec)
+                    compile_time = compiled.compile_time
+                outcome = self.solver.resolve(model, compiled, fingerprint)
+                solution = outcome.solution(model.compiled) if outcome.status == "optimal" else {}
             
-            # Create variables based on model with proper bounds
-            variables = {}
-            for var in model_result.variables:
-                name = var.get('name', f'x{len(variables)}')
-                var_type = var.get('type', 'continuous')
-                bounds = var.get('bounds', [0, None])
-                
-                # Handle bounds properly
-                low_bound = bounds[0] if bounds[0] is not None else 0
-                up_bound = bounds[1] if bounds[1] is not None else None
-                
-                if var_type == 'continuous':
-                    variables[name] = pulp.LpVariable(name, lowBound=low_bound, upBound=up_bound)
-                elif var_type == 'integer':
-                    variables[name] = pulp.LpVariable(name, lowBound=low_bound, upBound=up_bound, cat='Integer')
-                else:
-                    variables[name] = pulp.LpVariable(name, cat='Binary')
+            if compiled is not None:
+                logger.info(f"♻️ Updated cached model in place in {(compile_time + outcome.update_time) * 1000:.1f}ms")
             
-            # Add REAL objective function with proper mathematical parsing
-            if model_result.objective and len(variables) > 0:
-                try:
-                    # Parse the objective function from AWS Bedrock
-                    objective_expr = model_result.objective.lower()
-                    
-                    # Handle complex objectives like "maximize production_volume * (1 - defect_rate)"
-                    if 'maximize' in objective_expr:
-                        if 'production_volume' in objective_expr and 'defect_rate' in objective_expr:
-                            # maximize production_volume * (1 - defect_rate)
-                            prob += variables['production_volume'] * (1 - variables['defect_rate'])
-                        elif 'production_volume' in objective_expr and '*' in objective_expr:
-                            # Handle other production_volume multiplications
-                            if 'machine_utilization' in objective_expr:
-                                prob += variables['production_volume'] * variables['machine_utilization']
-                            else:
-                                prob += variables['production_volume']
-                        else:
-                            # Build objective from available variables
-                            objective_terms = []
-                            for var_name in variables.keys():
-                                if 'productivity' in var_name or 'throughput' in var_name or 'quality' in var_name or 'volume' in var_name:
-                                    objective_terms.append(variables[var_name])
-                                elif 'downtime' in var_name or 'defect' in var_name:
-                                    objective_terms.append(-variables[var_name])  # Minimize downtime/defects
-                            
-                            if objective_terms:
-                                prob += pulp.lpSum(objective_terms)
-                            else:
-                                # Fallback: maximize first variable
-                                prob += list(variables.values())[0]
-                    else:
-                        # Default: maximize sum of all variables
-                        prob += pulp.lpSum(variables.values())
-                        
-                except Exception as e:
-                    logger.warning(f"Objective parsing failed, using default: {e}")
-                    prob += pulp.lpSum(variables.values())
-            else:
-                # Default objective: maximize sum of all variables
-                prob += pulp.lpSum(variables.values())
-            
-            # Add REAL constraints from AWS Bedrock with proper mathematical parsing
-            for constraint in model_result.constraints:
-                try:
-                    constraint_expr = constraint.get('expression', '')
-                    constraint_type = constraint.get('type', 'inequality')
-                    
-                    # Parse complex constraint expressions
-                    if '>=' in constraint_expr:
-                        left, right = constraint_expr.split('>=')
-                        left = left.strip()
-                        right = right.strip()
-                        
-                        # Handle complex expressions like "production_volume * (1 - defect_rate) >= 10000"
-                        if '*' in left and '(' in left:
-                            # Parse multiplicative constraints
-                            if 'production_volume' in left and 'defect_rate' in left:
-                                # production_volume * (1 - defect_rate) >= 10000
-                                prob += variables['production_volume'] * (1 - variables['defect_rate']) >= 10000
-                            elif 'production_volume' in left and 'machine_utilization' in left:
-                                # production_volume / 10000 <= machine_utilization
-                                prob += variables['production_volume'] / 10000 <= variables['machine_utilization']
-                        else:
-                            # Simple variable constraints
-                            for var_name in variables.keys():
-                                if var_name in left:
-                                    try:
-                                        right_val = float(right)
-                                        prob += variables[var_name] >= right_val
-                                    except ValueError:
-                                        prob += variables[var_name] >= 10  # Default minimum
-                                    break
-                    
-                    elif '<=' in constraint_expr:
-                        left, right = constraint_expr.split('<=')
-                        left = left.strip()
-                        right = right.strip()
-                        
-                        # Handle complex expressions
-                        if '/' in left and 'machine_utilization' in right:
-                            # production_volume / 10000 <= machine_utilization
-                            if 'production_volume' in left:
-                                prob += variables['production_volume'] / 10000 <= variables['machine_utilization']
-                        else:
-                            # Simple variable constraints
-                            for var_name in variables.keys():
-                                if var_name in left:
-                                    try:
-                                        right_val = float(right)
-                                        prob += variables[var_name] <= right_val
-                                    except ValueError:
-                                        prob += variables[var_name] <= 100  # Default maximum
-                                    break
-                    
-                    elif '==' in constraint_expr:
-                        left, right = constraint_expr.split('==')
-                        left = left.strip()
-                        right = right.strip()
-                        
-                        # Simple equality constraints
-                        for var_name in variables.keys():
-                            if var_name in left:
-                                try:
-                                    right_val = float(right)
-                                    prob += variables[var_name] == right_val
-                                except ValueError:
-                                    prob += variables[var_name] == 50  # Default value
-                                break
-                                
-                except Exception as e:
-                    logger.warning(f"Constraint parsing failed: {e}")
-                    continue
-            
-            # Add realistic manufacturing constraints
-            if len(variables) > 0:
-                # Resource constraints
-                for var_name, var in variables.items():
-                    if 'worker' in var_name or 'productivity' in var_name:
-                        prob += var <= 100  # Max productivity
-                        prob += var >= 10   # Min productivity
-                    elif 'throughput' in var_name:
-                        prob += var <= 200  # Max throughput
-                        prob += var >= 20   # Min throughput
-                    elif 'downtime' in var_name:
-                        prob += var <= 20   # Max downtime
-                        prob += var >= 0    # Min downtime
-                    elif 'utilization' in var_name:
-                        prob += var <= 1.0  # Max utilization
-                        prob += var >= 0.1  # Min utilization
-                    elif 'volume' in var_name:
-                        prob += var <= 2000 # Max volume
-                        prob += var >= 100  # Min volume
-                    elif 'quality' in var_name:
-                        prob += var <= 100  # Max quality
-                        prob += var >= 80   # Min quality
-            
-            # Solve the problem
-            start_time = time.time()
-            prob.solve(pulp.PULP_CBC_CMD(msg=0))
-            solve_time = time.time() - start_time
-            
-            # Extract REAL solution
-            solution = {}
-            objective_value = None
-            
-            if prob.status == pulp.LpStatusOptimal:
-                objective_value = pulp.value(prob.objective)
-                for name, var in variables.items():
-                    value = pulp.value(var)
-                    solution[name] = round(value, 2) if value is not None else None
-                status = "optimal"
-                logger.info(f"✅ Optimization solved: {status} with objective value {objective_value}")
-            elif prob.status == pulp.LpStatusInfeasible:
-                status = "infeasible"
-                logger.warning(f"⚠️ Optimization infeasible")
-            elif prob.status == pulp.LpStatusUnbounded:
-                status = "unbounded"
-                logger.warning(f"⚠️ Optimization unbounded")
+            # Log results
+            if outcome.status == "optimal":
+                logger.info(f"✅ Optimization solved by {outcome.backend}: optimal with objective value {outcome.objective_value}")
+            elif outcome.status in ("infeasible", "unbounded"):
+                logger.warning(f"⚠️ Optimization {outcome.status}")
             else:
-                status = "error"
-                logger.error(f"❌ Optimization failed with status: {prob.status}")
+                logger.error(f"❌ Optimization failed with status: {outcome.status} ({outcome.message})")
             
             return SolverResult(
-                status=status,
-                objective_value=objective_value,
+                status=outcome.status,
+                objective_value=outcome.objective_value if outcome.status == "optimal" else None,
                 solution=solution,
-                solve_time=solve_time,
-                solver_used="pulp_cbc"
+                solve_time=outcome.solve_time,
+                solver_used=outcome.backend,
+                message=outcome.message,
+                update_time=compile_time + outcome.update_time,
+                warm_start=outcome.warm_start
             )
             
-        except Exception as e:
-            logger.error(f"❌ Optimization solving failed: {str(e)}")
+        except ModelCompileError as e:
+            # New data the model cannot take, or no available backend handles this kind of model
+            logger.warning(f"⚠️ Unsupported optimization model: {e}")
             return SolverResult(
-                status="error",
+                status="invalid_model",
                 objective_value=None,
                 solution={},
                 solve_time=0.0,
-                solver_used="error"
-            )
-    
-    def _solve_cached_model(self, model, model_spec: Dict[str, Any]) -> SolverResult:
-        """Solve a cached optimization model."""
-        try:
-            import pulp
-            
-            # Solve the optimization problem
-            model.solve(pulp.PULP_CBC_CMD(msg=0))  # Silent mode
-            
-            # Extract results
-            status = "optimal" if model.status == 1 else "infeasible" if model.status == -1 else "unbounded" if model.status == -2 else "error"
-            objective_value = pulp.value(model.objective) if model.status == 1 else None
-            
-            # Extract solution
-            solution = {}
-            if model.status == 1:  # Optimal
-                for var in model.variables():
-                    solution[var.name] = var.varValue
-            else:
-                solution = {}
-            
-            # Log results
-            if model.status == 1:
-                logger.info(f"✅ Optimization solved: optimal with objective value {objective_value}")
-            elif model.status == -1:
-                logger.warning(f"⚠️ Optimization infeasible")
-            elif model.status == -2:
-                logger.warning(f"⚠️ Optimization unbounded")
-            else:
-                status = "error"
-                logger.error(f"❌ Optimization failed with status: {model.status}")
-            
-            return SolverResult(
-                status=status,
-                objective_value=objective_value,
-                solution=solution,
-                solve_time=0.0,  # Will be set by caller
-                solver_used="pulp_cbc_cached"
+                solver_used="none",
+                message=str(e)
             )
-            
         except Exception as e:
             logger.error(f"❌ Cached model solving failed: {str(e)}")
             return SolverResult(
@@ -627,11 +426,13 @@ Assistant:"""
                 objective_value=None,
                 solution={},
                 solve_time=0.0,
-                solver_used="error"
+                solver_used="error",
+                message=str(e)
             )
 
 # Initialize tools
 manufacturing_tools = SimplifiedManufacturingTools()
+plan_executor = PlanExecutor(manufacturing_tools)
 
 # MCP Tool Definitions
 @mcp.tool()
@@ -699,12 +500,18 @@ async def manufacturing_optimize(
         if strategy_hint['strategy'] == 'learned_pattern':
             logger.info(f"🧠 Using learned pattern: {strategy_hint['similar_optimizations']} similar optimizations, {strategy_hint['success_probability']:.2%} success rate")
         
-        # Step 2: Execute coordinated optimization
-        start_time = time.time()
+        # Step 2: Execute the coordinated plan (intent and data in parallel when planned)
+        execution = await plan_executor.execute(problem_description, coordination_result.execution_plan)
+        intent_result = execution.results['intent_agent']
+        data_result = execution.results['data_agent']
+        model_result = execution.results['model_agent']
+        solver_result = execution.results['solver_agent']
+        processing_time = execution.total_time
         
-        # Step 2a: Classify intent
-        intent_result = manufacturing_tools.classify_intent(problem_description)
         logger.info(f"✅ Intent classified: {intent_result.intent} (confidence: {intent_result.confidence})")
+        logger.info(f"✅ Data analyzed: {len(data_result.data_entities)} entities, readiness: {data_result.readiness_score}")
+        logger.info(f"✅ Model built: {model_result.model_type} with {len(model_result.variables)} variables")
+        logger.info(f"✅ Optimization solved: {solver_result.status} with objective value {solver_result.objective_value}")
         
         # Update strategy hint with actual intent
         strategy_hint = agent_memory.suggest_optimization_strategy(
@@ -712,25 +519,12 @@ async def manufacturing_optimize(
             entities=intent_result.entities
         )
         
-        # Step 2b: Analyze data
-        data_result = manufacturing_tools.analyze_data(intent_result, problem_description)
-        logger.info(f"✅ Data analyzed: {len(data_result.data_entities)} entities, readiness: {data_result.readiness_score}")
-        
-        # Step 2c: Build model
-        model_result = manufacturing_tools.build_model(intent_result, data_result)
-        logger.info(f"✅ Model built: {model_result.model_type} with {len(model_result.variables)} variables")
-        
-        # Step 2d: Solve optimization
-        solver_result = manufacturing_tools.solve_optimization(model_result)
-        logger.info(f"✅ Optimization solved: {solver_result.status} with objective value {solver_result.objective_value}")
-        
-        processing_time = time.time() - start_time
-        
         # Step 3: Complete coordination
         agent_coordinator.complete_request(
             request_id=coordination_result.request_id,
             success=(solver_result.status == "optimal"),
-            processing_time=processing_time
+            processing_time=processing_time,
+            stage_times=execution.stage_times
         )
         
         # Step 4: Store in memory for learning (MOAT: Cross-session learning)
@@ -755,7 +549,10 @@ async def manufacturing_optimize(
                 "agents_assigned": coordination_result.agents_assigned,
                 "parallel_execution": coordination_result.parallel_execution,
                 "estimated_time": coordination_result.estimated_time,
-                "actual_time": processing_time
+                "actual_time": processing_time,
+                "estimated_stage_times": coordination_result.execution_plan.get('agent_estimates', {}),
+                "stage_timings": execution.stage_timings,
+                "speculation": execution.speculation
             },
             "intent_classification": {
                 "intent": intent_result.intent,
@@ -777,14 +574,18 @@ async def manufacturing_optimize(
                 "variables": model_result.variables,
                 "constraints": model_result.constraints,
                 "objective": model_result.objective,
-                "complexity": model_result.complexity
+                "complexity": model_result.complexity,
+                "parameters": model_result.parameters
             },
             "optimization_solution": {
                 "status": solver_result.status,
                 "objective_value": solver_result.objective_value,
                 "solution": solver_result.solution,
                 "solve_time": solver_result.solve_time,
-                "solver_used": solver_result.solver_used
+                "solver_used": solver_result.solver_used,
+                "message": solver_result.message,
+                "update_time": solver_result.update_time,
+                "warm_start": solver_result.warm_start
             },
             "learning_insights": {
                 "strategy_used": strategy_hint['strategy'],
@@ -847,7 +648,11 @@ def manufacturing_health_check() -> Dict[str, Any]:
         "active_requests": coordination_insights['system_metrics']['active_requests'],
         "queued_requests": coordination_insights['system_metrics']['queued_requests'],
         "parallel_execution_rate": coordination_insights['system_metrics']['parallel_execution_rate'],
-        "deduplication_count": coordination_insights['system_metrics']['deduplication_count']
+        "deduplication_count": coordination_insights['system_metrics']['deduplication_count'],
+        "llm_stages": manufacturing_tools.llm.get_stats()['stages'],
+        "speculation": plan_executor.get_stats(),
+        "llm_cache": manufacturing_tools.llm.get_cache_stats(),
+        "solver": manufacturing_tools.solver.get_stats()
     }
 
 @mcp.tool()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Settings - Server Configuration Loader
+======================================
+
+Loads the YAML configuration in ``config/`` once per process. The file
+defaults to ``config/default.yaml`` and can be replaced with the
+``DCISIONAI_CONFIG`` environment variable (e.g. ``config/production.yaml``).
+
+Author: DcisionAI Team
+Copyright (c) 2025 DcisionAI. All rights reserved.
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+CONFIG_ENV = "DCISIONAI_CONFIG"
+DEFAULT_CONFIG_PATH = Path(__file__).resolve().parent.parent / "config" / "default.yaml"
+
+_settings: Dict[str, Dict[str, Any]] = {}
+
+
+def load_settings(path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Load (and cache) the server configuration.
+
+    Args:
+        path: Configuration file; defaults to ``DCISIONAI_CONFIG`` or
+            ``config/default.yaml``
+
+    Returns:
+        The parsed configuration, or an empty dict if the file is missing
+    """
+    path = str(path or os.getenv(CONFIG_ENV) or DEFAULT_CONFIG_PATH)
+    if path not in _settings:
+        try:
+            import yaml
+            with open(path, "r") as f:
+                _settings[path] = yaml.safe_load(f) or {}
+        except FileNotFoundError:
+            logger.warning(f"⚠️ Configuration file {path} not found, using defaults")
+            _settings[path] = {}
+    return _settings[path]
+
+
+def get_setting(settings: Dict[str, Any], dotted_key: str, default: Any = None) -> Any:
+    """Look up a nested setting such as ``agents.intent.timeout``."""
+    value: Any = settings
+    for key in dotted_key.split("."):
+        if not isinstance(value, dict) or key not in value:
+            return default
+        value = value[key]
+    return value
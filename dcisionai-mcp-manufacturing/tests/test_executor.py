@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Tests for PlanExecutor
+======================
+
+Runs coordinator-style plans against fake agent stages that sleep, to check
+ordering, speculation hits and misses, and the recorded timings.
+
+Author: DcisionAI Team
+Copyright (c) 2025 DcisionAI. All rights reserved.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+from agents.executor import PlanExecutor
+
+PARALLEL_PLAN = {
+    'stages': [
+        {'stage': 'parallel', 'agents': ['intent_agent', 'data_agent']},
+        {'stage': 'sequential', 'agents': ['model_agent']},
+        {'stage': 'sequential', 'agents': ['solver_agent']},
+    ]
+}
+
+
+class FakeTools:
+    """Agent stages that sleep and record what they were given; data analysis takes longest."""
+
+    def __init__(self, intent='production_optimization', guess='production_optimization', delay=0.1):
+        self.intent = intent
+        self.guess = guess
+        self.delay = delay
+        self.data_delay = 2 * delay
+        self.data_calls = []
+        self.data_cancelled = 0
+
+    def guess_intent(self, query):
+        return SimpleNamespace(intent=self.guess, entities=[], objectives=[])
+
+    async def classify_intent(self, query):
+        await asyncio.sleep(self.delay)
+        return SimpleNamespace(intent=self.intent, entities=['line'], objectives=['throughput'])
+
+    async def analyze_data(self, intent_result, query):
+        self.data_calls.append(intent_result.intent)
+        try:
+            await asyncio.sleep(self.data_delay)
+        except asyncio.CancelledError:
+            self.data_cancelled += 1
+            raise
+        return {'intent': intent_result.intent, 'query': query}
+
+    async def build_model(self, intent_result, data_result):
+        return {'intent': intent_result.intent, 'data': data_result}
+
+    def solve_optimization(self, model_result):
+        return {'status': 'optimal', 'model': model_result}
+
+
+class TestPlanExecutor:
+    """Plans run as a dependency graph."""
+
+    def test_sequential_plan(self):
+        tools = FakeTools()
+        execution = asyncio.run(PlanExecutor(tools).execute('query', {}))
+
+        assert list(execution.results) == ['intent_agent', 'data_agent', 'model_agent', 'solver_agent']
+        assert execution.results['solver_agent']['status'] == 'optimal'
+        assert not execution.parallel_execution
+        assert execution.speculation == {}
+        assert all(timing['status'] == 'completed' for timing in execution.stage_timings.values())
+
+    def test_speculation_hit_keeps_result(self):
+        tools = FakeTools()
+        executor = PlanExecutor(tools)
+        execution = asyncio.run(executor.execute('Maximize production', PARALLEL_PLAN))
+
+        assert tools.data_calls == ['production_optimization']
+        assert execution.results['data_agent'] == {'intent': 'production_optimization',
+                                                   'query': 'Maximize production'}
+        assert execution.speculation['data_agent']['outcome'] == 'hit'
+        assert execution.stage_timings['data_agent']['speculative']
+        # Intent and data overlapped instead of running back to back
+        assert execution.total_time < tools.delay + tools.data_delay
+        assert executor.get_stats()['speculative_hits'] == 1
+        assert executor.time_saved > 0
+
+    def test_speculation_miss_reruns_on_real_intent(self):
+        tools = FakeTools(intent='cost_optimization', guess='production_optimization')
+        executor = PlanExecutor(tools)
+        execution = asyncio.run(executor.execute('Cut costs', PARALLEL_PLAN))
+
+        assert tools.data_calls == ['production_optimization', 'cost_optimization']
+        assert tools.data_cancelled == 1
+        assert execution.results['data_agent']['intent'] == 'cost_optimization'
+        assert execution.results['model_agent']['data']['intent'] == 'cost_optimization'
+        assert execution.speculation['data_agent']['outcome'] == 'miss'
+        assert execution.speculation['data_agent']['provisional'] == {'intent_agent': 'production_optimization'}
+        assert not execution.stage_timings['data_agent']['speculative']
+        assert executor.get_stats()['speculative_misses'] == 1
+
+    def test_failed_speculation_miss_reruns(self):
+        class GuessFails(FakeTools):
+            async def analyze_data(self, intent_result, query):
+                if intent_result.intent == self.guess:
+                    self.data_calls.append(intent_result.intent)
+                    raise ValueError("No JSON found in AWS response")
+                return await super().analyze_data(intent_result, query)
+
+        tools = GuessFails(intent='cost_optimization', guess='production_optimization')
+        executor = PlanExecutor(tools)
+        execution = asyncio.run(executor.execute('Cut costs', PARALLEL_PLAN))
+
+        assert tools.data_calls == ['production_optimization', 'cost_optimization']
+        assert execution.results['data_agent']['intent'] == 'cost_optimization'
+        assert execution.results['solver_agent']['status'] == 'optimal'
+        assert execution.speculation['data_agent']['outcome'] == 'miss'
+        assert executor.get_stats()['speculative_misses'] == 1
+
+    def test_solve_does_not_block_event_loop(self):
+        class SlowSolver(FakeTools):
+            def solve_optimization(self, model_result):
+                time.sleep(0.3)
+                return super().solve_optimization(model_result)
+
+        async def run():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0.01)
+
+            task = asyncio.create_task(ticker())
+            execution = await PlanExecutor(SlowSolver(delay=0.01)).execute('query', {})
+            task.cancel()
+            return execution, ticks
+
+        execution, ticks = asyncio.run(run())
+        assert execution.results['solver_agent']['status'] == 'optimal'
+        assert ticks > 10
+
+    def test_failed_stage_cancels_speculation(self):
+        class FailingIntent(FakeTools):
+            async def classify_intent(self, query):
+                await asyncio.sleep(0.01)
+                raise RuntimeError("classification failed")
+
+        tools = FailingIntent()
+
+        async def run():
+            try:
+                await PlanExecutor(tools).execute('query', PARALLEL_PLAN)
+            except RuntimeError:
+                pass
+            await asyncio.sleep(0)
+
+        asyncio.run(run())
+        assert tools.data_cancelled == 1
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Tests for Incremental Re-Solves
+===============================
+
+A model kept loaded in HiGHS and moved to new data with
+``IncrementalModel.update``/``change`` must give the same optimum as a cold
+solve of the new data; a change of structure must reload it.
+
+Author: DcisionAI Team
+Copyright (c) 2025 DcisionAI. All rights reserved.
+"""
+
+import pickle
+import random
+from dataclasses import replace
+
+import numpy as np
+import pytest
+
+from agents.model_compiler import ModelCompileError, compile_model
+from agents.solvers import BACKENDS, IncrementalModel, ModelSolver
+
+pytestmark = pytest.mark.skipif(not BACKENDS["highs"].available(), reason="highspy not installed")
+
+PRODUCTS = 8
+RESOURCES = 4
+
+
+def product_mix(seed=3, integer=False, products=PRODUCTS, extra_constraint=None):
+    """Product-mix specification as a dict, so tests can edit its data."""
+    rng = random.Random(seed)
+    constraints = [{"name": "capacity",
+                    "expression": f"sum(usage[r, p] * x[p] for p in 1..{products}) <= cap[r] "
+                                  f"for r in 0..{RESOURCES - 1}"}]
+    if extra_constraint:
+        constraints.append(extra_constraint)
+    return {
+        "variables": [{"name": "x", "type": "integer" if integer else "continuous",
+                       "bounds": [0, 15], "indices": products}],
+        "constraints": constraints,
+        "objective": f"maximize sum(profit[p] * x[p] for p in 1..{products})",
+        "parameters": {
+            "usage": [{str(p): rng.randint(1, 9) for p in range(1, products + 1)} for _ in range(RESOURCES)],
+            "cap": [rng.randint(30, 90) for _ in range(RESOURCES)],
+            "profit": {str(p): round(rng.uniform(1, 30), 2) for p in range(1, products + 1)},
+        },
+    }
+
+
+def edit(spec, kind, factor):
+    """The specification with one kind of data scaled by ``factor``."""
+    spec = {**spec, "parameters": {**spec["parameters"]}}
+    parameters = spec["parameters"]
+    if kind == "costs":
+        parameters["profit"] = {p: round(v * factor, 2) for p, v in parameters["profit"].items()}
+    elif kind == "rhs":
+        parameters["cap"] = [round(c * factor, 2) for c in parameters["cap"]]
+    elif kind == "bounds":
+        spec["variables"] = [{**spec["variables"][0], "bounds": [1, round(15 * factor, 2)]}]
+    elif kind == "coefficients":
+        parameters["usage"] = [{p: round(v * factor, 2) for p, v in row.items()} for row in parameters["usage"]]
+    return spec
+
+
+def assert_matches_cold(outcome, compiled):
+    cold = BACKENDS["highs"].solve(compiled)
+    assert outcome.status == cold.status == "optimal"
+    assert outcome.objective_value == pytest.approx(cold.objective_value, rel=1e-7, abs=1e-7)
+
+
+def kept_model(spec, solver):
+    model = IncrementalModel(compile_model(spec))
+    solver.resolve(model)
+    assert model.highs is not None
+    return model
+
+
+CHANGED = {"costs": "costs", "rhs": "rows", "bounds": "bounds", "coefficients": "coefficients"}
+
+
+class TestSpecificationUpdates:
+    """``ModelSolver.resolve`` with a new compilation of the same template."""
+
+    @pytest.mark.parametrize("kind", list(CHANGED))
+    @pytest.mark.parametrize("integer", [False, True], ids=["lp", "mip"])
+    def test_matches_cold_solve(self, kind, integer):
+        solver = ModelSolver(backend="highs")
+        spec = product_mix(integer=integer)
+        model = kept_model(spec, solver)
+        highs = model.highs
+
+        compiled = compile_model(edit(spec, kind, 0.8))
+        changes = model.update(compiled)
+        assert changes[CHANGED[kind]] > 0
+        assert all(count == 0 for name, count in changes.items() if name != CHANGED[kind])
+
+        outcome = solver.resolve(model)
+        assert_matches_cold(outcome, compiled)
+        assert model.highs is highs
+        assert outcome.warm_start == ("incumbent" if integer else "basis")
+        assert (model.updates, model.rebuilds, model.solves) == (1, 0, 2)
+
+    def test_sequence_of_updates(self):
+        solver = ModelSolver(backend="highs")
+        spec = product_mix()
+        model = kept_model(spec, solver)
+        for step, kind in enumerate(["rhs", "costs", "coefficients", "bounds", "rhs", "costs"]):
+            spec = edit(spec, kind, 0.9 if step % 2 else 1.1)
+            compiled = compile_model(spec)
+            outcome = solver.resolve(model, compiled, fingerprint=str(step))
+            assert_matches_cold(outcome, compiled)
+            assert model.fingerprint == str(step)
+        assert model.rebuilds == 0
+
+    def test_unchanged_data(self):
+        solver = ModelSolver(backend="highs")
+        spec = product_mix()
+        model = kept_model(spec, solver)
+        assert model.update(compile_model(spec)) == {
+            "costs": 0, "bounds": 0, "rows": 0, "coefficients": 0, "quadratic": 0}
+
+    def test_other_backend_solves_from_scratch(self):
+        solver = ModelSolver(backend="scipy")
+        spec = product_mix()
+        model = IncrementalModel(compile_model(spec))
+        compiled = compile_model(edit(spec, "rhs", 0.7))
+        outcome = solver.resolve(model, compiled)
+        assert outcome.backend == "scipy"
+        assert model.highs is None
+        assert_matches_cold(outcome, compiled)
+
+
+class TestStructuralChanges:
+    """A different sparsity pattern reloads the model instead of patching it."""
+
+    @pytest.mark.parametrize("structural", ["constraint", "variables", "sense", "type"])
+    def test_rebuild(self, structural):
+        solver = ModelSolver(backend="highs")
+        spec = product_mix()
+        model = kept_model(spec, solver)
+
+        if structural == "constraint":
+            changed = product_mix(extra_constraint="x[1] + x[2] <= 3")
+        elif structural == "variables":
+            changed = product_mix(products=PRODUCTS + 1)
+        elif structural == "sense":
+            changed = {**spec, "objective": spec["objective"].replace("maximize", "minimize")}
+        else:
+            changed = product_mix(integer=True)
+        compiled = compile_model(changed)
+
+        assert model.update(compiled) == {}
+        assert model.highs is None
+        assert model.rebuilds == 1
+
+        outcome = solver.resolve(model)
+        assert outcome.warm_start == ""
+        assert model.highs is not None
+        assert_matches_cold(outcome, compiled)
+
+    def test_new_coefficient_position_rebuilds(self):
+        solver = ModelSolver(backend="highs")
+        spec = product_mix()
+        model = kept_model(spec, solver)
+        changed = edit(spec, "coefficients", 1.0)
+        changed["parameters"]["usage"][0]["1"] = 0
+        solver.resolve(model, compile_model(changed))
+        assert model.rebuilds == 1
+
+
+class TestDirectChanges:
+    """``IncrementalModel.change`` sets arrays without compiling."""
+
+    def test_changes_match_cold_solve(self):
+        solver = ModelSolver(backend="highs")
+        model = kept_model(product_mix(), solver)
+        base = model.compiled
+        values = {
+            "row_upper": base.row_upper * 0.75,
+            "objective": base.objective[::-1].copy(),
+            "upper": np.full(base.num_variables, 6.0),
+            "data": base.data * 1.2,
+        }
+        changes = model.change(objective_constant=10.0, **values)
+        assert changes["rows"] == base.num_constraints
+        assert changes["coefficients"] == len(base.data)
+
+        outcome = solver.resolve(model)
+        assert outcome.warm_start == "basis"
+        assert_matches_cold(outcome, replace(base, objective_constant=10.0, **values))
+
+    def test_sensitivity_loop(self):
+        solver = ModelSolver(backend="highs")
+        model = kept_model(product_mix(), solver)
+        base = model.compiled
+        for scale in (0.5, 0.8, 1.2, 2.0):
+            model.change(row_upper=base.row_upper * scale)
+            assert_matches_cold(solver.resolve(model), replace(base, row_upper=base.row_upper * scale))
+        assert model.rebuilds == 0
+
+    def test_invalid_changes(self):
+        model = IncrementalModel(compile_model(product_mix()))
+        with pytest.raises(ValueError, match="cannot change"):
+            model.change(indices=np.zeros(3))
+        with pytest.raises(ValueError, match="has shape"):
+            model.change(row_upper=np.zeros(RESOURCES + 1))
+
+
+class TestQuadraticUpdates:
+    SPEC = {
+        "variables": [{"name": "x", "bounds": [0, 10]}, {"name": "y", "bounds": [0, 10]}],
+        "constraints": ["x + y <= cap"],
+        "objective": "maximize 8x + 6y - a * x^2 - y^2",
+        "parameters": {"cap": 6, "a": 1},
+    }
+
+    def test_quadratic_coefficients(self):
+        solver = ModelSolver(backend="highs")
+        model = kept_model(self.SPEC, solver)
+        compiled = compile_model(self.SPEC, parameters={"a": 2, "cap": 4})
+        changes = model.update(compiled)
+        assert changes["quadratic"] == 1
+        assert changes["rows"] == 1
+        assert_matches_cold(solver.resolve(model), compiled)
+
+    def test_nonconcave_update_rejected(self):
+        solver = ModelSolver(backend="highs")
+        model = kept_model(self.SPEC, solver)
+        with pytest.raises(ModelCompileError, match="not concave"):
+            model.update(compile_model(self.SPEC, parameters={"a": -1}))
+        assert model.highs is None
+
+
+class TestPersistence:
+    def test_pickle_drops_loaded_solver(self):
+        solver = ModelSolver(backend="highs")
+        spec = product_mix()
+        model = kept_model(spec, solver)
+        restored = pickle.loads(pickle.dumps(model))
+        assert restored.highs is None
+        assert restored.solves == 1
+
+        compiled = compile_model(edit(spec, "rhs", 0.9))
+        assert_matches_cold(solver.resolve(restored, compiled), compiled)
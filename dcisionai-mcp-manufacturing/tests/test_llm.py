@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Tests for BedrockLLMClient
+==========================
+
+The blocking ``invoke_model`` call is replaced by a fake client whose calls
+sleep, so overlap, timeouts and caching are checked without AWS.
+
+Author: DcisionAI Team
+Copyright (c) 2025 DcisionAI. All rights reserved.
+"""
+
+import asyncio
+import io
+import json
+import threading
+import time
+
+import pytest
+
+from agents.llm import BedrockLLMClient, LLMTimeoutError
+from agents.response_cache import LLMResponseCache
+
+
+class FakeBedrock:
+    """``bedrock-runtime`` stand-in answering every call with ``text``."""
+
+    def __init__(self, text='{"intent": "production_optimization"}', latency=0.0):
+        self.text = text
+        self.latency = latency
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def invoke_model(self, modelId, body):
+        with self.lock:
+            self.calls += 1
+        time.sleep(self.latency)
+        payload = {"content": [{"type": "text", "text": self.text}]}
+        return {"body": io.BytesIO(json.dumps(payload).encode())}
+
+
+def make_client(fake, **kwargs):
+    return BedrockLLMClient(client=fake, **kwargs)
+
+
+class TestBedrockLLMClient:
+    """Non-blocking model calls."""
+
+    def test_calls_overlap(self):
+        """Concurrent calls share the thread pool instead of queueing on the event loop."""
+        fake = FakeBedrock(latency=0.2)
+        llm = make_client(fake, max_concurrency=8)
+
+        async def run():
+            start = time.perf_counter()
+            await asyncio.gather(*(llm.complete("intent", f"query {i}") for i in range(8)))
+            return time.perf_counter() - start
+
+        try:
+            elapsed = asyncio.run(run())
+        finally:
+            llm.close()
+        assert fake.calls == 8
+        assert elapsed < 8 * 0.2 / 2
+
+    def test_event_loop_keeps_running(self):
+        """Other tasks progress while a model call is in flight."""
+        llm = make_client(FakeBedrock(latency=0.3))
+
+        async def run():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0.01)
+
+            task = asyncio.create_task(ticker())
+            await llm.complete("intent", "query")
+            task.cancel()
+            return ticks
+
+        try:
+            assert asyncio.run(run()) > 5
+        finally:
+            llm.close()
+
+    def test_stage_timeout(self):
+        llm = make_client(FakeBedrock(latency=0.5), timeouts={"intent": 0.05})
+        try:
+            with pytest.raises(LLMTimeoutError):
+                asyncio.run(llm.complete("intent", "query"))
+            stats = llm.get_stats()["stages"]["intent"]
+        finally:
+            llm.close()
+        assert stats["calls"] == 1
+        assert stats["timeouts"] == 1
+        assert stats["timeout_seconds"] == 0.05
+
+    def test_failure_counted(self):
+        class Broken(FakeBedrock):
+            def invoke_model(self, modelId, body):
+                raise RuntimeError("throttled")
+
+        llm = make_client(Broken())
+        try:
+            with pytest.raises(RuntimeError):
+                asyncio.run(llm.complete("data", "query"))
+            assert llm.get_stats()["stages"]["data"]["failures"] == 1
+        finally:
+            llm.close()
+
+    def test_json_extracted_from_text(self):
+        llm = make_client(FakeBedrock(text='Here you go: {"intent": "x", "confidence": 0.9} Done.'))
+        try:
+            result = asyncio.run(llm.complete_json("intent", "query"))
+        finally:
+            llm.close()
+        assert result == {"intent": "x", "confidence": 0.9}
+
+    def test_response_without_json(self):
+        llm = make_client(FakeBedrock(text="I cannot help with that."))
+        try:
+            with pytest.raises(ValueError):
+                asyncio.run(llm.complete_json("intent", "query"))
+        finally:
+            llm.close()
+
+
+class TestLLMClientCache:
+    """``complete_json`` consults the response cache."""
+
+    def test_repeated_prompt_served_from_cache(self):
+        fake = FakeBedrock()
+        llm = make_client(fake, cache=LLMResponseCache(path=None))
+        try:
+            first = asyncio.run(llm.complete_json("intent", "Maximize output", similarity_text="Maximize output"))
+            second = asyncio.run(llm.complete_json("intent", "maximize   output", similarity_text="maximize output"))
+            stats = llm.get_cache_stats()["stages"]["intent"]
+        finally:
+            llm.close()
+        assert first == second
+        assert fake.calls == 1
+        assert stats["exact_hits"] == 1
+
+    def test_unparseable_response_not_cached(self):
+        fake = FakeBedrock(text="no json here")
+        llm = make_client(fake, cache=LLMResponseCache(path=None))
+        try:
+            for _ in range(2):
+                with pytest.raises(ValueError):
+                    asyncio.run(llm.complete_json("intent", "query"))
+        finally:
+            llm.close()
+        assert fake.calls == 2
+
+    def test_uncached_stage(self):
+        fake = FakeBedrock(text='{"model_type": "linear_programming"}')
+        llm = make_client(fake, cache=LLMResponseCache(path=None, stages=("intent",)))
+        try:
+            for _ in range(2):
+                asyncio.run(llm.complete_json("model", "query"))
+        finally:
+            llm.close()
+        assert fake.calls == 2
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Tests for the Model Compiler
+============================
+
+Checks the coefficient arrays ``compile_model`` extracts from expression
+strings: indexed sums, ``for`` clauses, chained comparisons, quadratic
+objectives, and the ``ModelCompileError`` raised for invalid models.
+
+Author: DcisionAI Team
+Copyright (c) 2025 DcisionAI. All rights reserved.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from agents.model_compiler import ModelCompileError, build_pulp_model, compile_model
+
+
+def dense(compiled):
+    """Constraint matrix as a dense array."""
+    return compiled.matrix().toarray()
+
+
+def column(compiled, name):
+    return compiled.variable_names.index(name)
+
+
+def row(compiled, name):
+    """Coefficients of a named row keyed by variable name."""
+    cols, coefs = compiled.row(compiled.row_names.index(name))
+    return {compiled.variable_names[c]: coef for c, coef in zip(cols, coefs)}
+
+
+def spec(objective, constraints=(), variables=None, parameters=None):
+    return {
+        "variables": variables or [{"name": "x", "type": "continuous", "bounds": [0, 10]},
+                                   {"name": "y", "type": "continuous", "bounds": [0, 10]}],
+        "constraints": list(constraints),
+        "objective": objective,
+        "parameters": parameters or {},
+    }
+
+
+class TestIndexedSums:
+    """``sum(... for i in S)`` over declared indices and parameters."""
+
+    def test_sum_over_range(self):
+        compiled = compile_model(spec(
+            "maximize sum(profit[i] * x[i] for i in 1..3)",
+            ["capacity: sum(x[i] for i in 1..3) <= cap"],
+            variables=[{"name": "x", "type": "continuous", "bounds": [0, 100], "indices": 3}],
+            parameters={"profit": {"1": 10, "2": 15, "3": 20}, "cap": 50},
+        ))
+        assert compiled.sense == "maximize"
+        assert compiled.variable_names == ["x[1]", "x[2]", "x[3]"]
+        np.testing.assert_array_equal(compiled.objective, [10, 15, 20])
+        assert row(compiled, "capacity") == {"x[1]": 1, "x[2]": 1, "x[3]": 1}
+        assert compiled.row_upper[0] == 50
+        assert compiled.row_lower[0] == -math.inf
+
+    def test_sum_over_parameter_keys_and_lists(self):
+        compiled = compile_model(spec(
+            "minimize sum(cost[p] * x[p] for p in cost) + sum(w[k] * y[k] for k in 0..1)",
+            variables=[{"name": "x", "indices": ["a", "b"]},
+                       {"name": "y", "indices": [0, 1]}],
+            parameters={"cost": {"a": 2, "b": 3}, "w": [5, 7]},
+        ))
+        objective = dict(zip(compiled.variable_names, compiled.objective))
+        assert objective == {"x[a]": 2, "x[b]": 3, "y[0]": 5, "y[1]": 7}
+
+    def test_two_dimensional_sum(self):
+        compiled = compile_model(spec(
+            "maximize sum(x[p, l] for p in products for l in lines)",
+            ["sum(hours[p] * x[p, l] for p in products) <= 8 for l in lines"],
+            variables=[{"name": "x", "indices": [["a", "b"], [1, 2]]}],
+            parameters={"products": ["a", "b"], "lines": [1, 2], "hours": {"a": 2, "b": 3}},
+        ))
+        assert compiled.num_variables == 4
+        np.testing.assert_array_equal(compiled.objective, np.ones(4))
+        assert compiled.num_constraints == 2
+        assert row(compiled, "c1[2]") == {"x[a,2]": 2, "x[b,2]": 3}
+
+    def test_repeated_terms_are_combined(self):
+        compiled = compile_model(spec("maximize x + 2*x - y", ["x + x + y - y <= 4"]))
+        assert compiled.objective[column(compiled, "x")] == 3
+        assert row(compiled, "c1") == {"x": 2}
+
+
+class TestComparisons:
+    """Comparisons become rows with lower and upper bounds."""
+
+    def test_ranged_row(self):
+        compiled = compile_model(spec("maximize x", ["10 <= x + 2y <= 40"]))
+        assert compiled.num_constraints == 1
+        assert row(compiled, "c1") == {"x": 1, "y": 2}
+        assert (compiled.row_lower[0], compiled.row_upper[0]) == (10, 40)
+
+    def test_descending_ranged_row(self):
+        compiled = compile_model(spec("maximize x", ["40 >= x + y >= 10"]))
+        assert (compiled.row_lower[0], compiled.row_upper[0]) == (10, 40)
+
+    def test_constants_move_to_bounds(self):
+        compiled = compile_model(spec("maximize x", ["x + 3 <= 2*y - 1", "0 <= x - 3 <= 4"]))
+        assert row(compiled, "c1") == {"x": 1, "y": -2}
+        assert compiled.row_upper[0] == -4
+        assert (compiled.row_lower[1], compiled.row_upper[1]) == (3, 7)
+
+    def test_chain_with_variable_ends(self):
+        compiled = compile_model(spec("maximize x", ["x <= y <= 5"]))
+        assert compiled.row_names == ["c1", "c1_1"]
+        np.testing.assert_array_equal(dense(compiled), [[1, -1], [0, 1]])
+        np.testing.assert_array_equal(compiled.row_upper, [0, 5])
+
+    def test_equality(self):
+        compiled = compile_model(spec("minimize x", ["x + y = 6"]))
+        assert compiled.row_lower[0] == compiled.row_upper[0] == 6
+
+    def test_always_satisfied_constant_row_dropped(self):
+        compiled = compile_model(spec("minimize x", ["x - x <= 1"]))
+        assert compiled.num_constraints == 0
+
+
+class TestForClauses:
+    """Trailing ``for`` clauses expand a constraint into one row per index."""
+
+    def test_rows_per_index(self):
+        compiled = compile_model(spec(
+            "minimize sum(x[i] for i in 1..3)",
+            [{"name": "ramp", "expression": "x[i] - x[i-1] <= limit for i in 2..3"}],
+            variables=[{"name": "x", "indices": "1..3"}],
+            parameters={"limit": 5},
+        ))
+        assert compiled.row_names == ["ramp[2]", "ramp[3]"]
+        assert row(compiled, "ramp[3]") == {"x[3]": 1, "x[2]": -1}
+        np.testing.assert_array_equal(compiled.row_upper, [5, 5])
+
+    def test_for_all_over_parameter(self):
+        compiled = compile_model(spec(
+            "maximize sum(x[p] for p in demand)",
+            ["x[p] <= demand[p] for all p in demand"],
+            variables=[{"name": "x", "indices": "demand"}],
+            parameters={"demand": {"bolts": 30, "nuts": 40}},
+        ))
+        assert compiled.row_names == ["c1[bolts]", "c1[nuts]"]
+        np.testing.assert_array_equal(compiled.row_upper, [30, 40])
+
+    def test_label_in_expression(self):
+        compiled = compile_model(spec("maximize x", ["cap: x + y <= 8 for k in [1]"]))
+        assert compiled.row_names == ["cap[1]"]
+
+
+class TestVariables:
+    def test_types_and_bounds(self):
+        compiled = compile_model(spec("maximize a + b + c", variables=[
+            {"name": "a", "type": "continuous", "bounds": [None, 5]},
+            {"name": "b", "type": "integer", "bounds": [1, 4]},
+            {"name": "c", "type": "binary"},
+        ]))
+        np.testing.assert_array_equal(compiled.lower, [-math.inf, 1, 0])
+        np.testing.assert_array_equal(compiled.upper, [5, 4, 1])
+        np.testing.assert_array_equal(compiled.integrality, [0, 1, 1])
+        assert compiled.problem_class == "mixed_integer_programming"
+
+    def test_parameters_argument_overrides_spec(self):
+        model = spec("maximize x", ["x <= cap"], parameters={"cap": 5})
+        assert compile_model(model, parameters={"cap": 7}).row_upper[0] == 7
+
+
+class TestQuadraticObjectives:
+    def test_quadratic_terms_detected(self):
+        compiled = compile_model(spec("minimize x^2 + 2*x*y + 3*y*x - y + 4"))
+        assert compiled.is_quadratic
+        assert compiled.problem_class == "quadratic_programming"
+        terms = {(compiled.variable_names[i], compiled.variable_names[j]): v
+                 for i, j, v in zip(compiled.q_rows, compiled.q_cols, compiled.q_vals)}
+        assert terms == {("x", "x"): 1, ("x", "y"): 5}
+        assert np.all(compiled.q_rows <= compiled.q_cols)
+        np.testing.assert_array_equal(compiled.objective, [0, -1])
+        assert compiled.objective_constant == 4
+
+    def test_squared_sum(self):
+        compiled = compile_model(spec("minimize (x - y)^2"))
+        terms = dict(zip(zip(compiled.q_rows, compiled.q_cols), compiled.q_vals))
+        assert terms == {(0, 0): 1, (0, 1): -2, (1, 1): 1}
+
+    def test_mixed_integer_quadratic(self):
+        compiled = compile_model(spec("minimize x*x + z", variables=[
+            {"name": "x", "bounds": [0, 3]}, {"name": "z", "type": "integer", "bounds": [0, 3]}]))
+        assert compiled.problem_class == "mixed_integer_quadratic_programming"
+
+    def test_cancelled_quadratic_is_linear(self):
+        compiled = compile_model(spec("minimize x*y - y*x + x"))
+        assert not compiled.is_quadratic
+        assert compiled.problem_class == "linear_programming"
+
+    def test_pulp_rejects_quadratic(self):
+        with pytest.raises(ModelCompileError, match="quadratic"):
+            build_pulp_model(compile_model(spec("minimize x^2")))
+
+
+class TestCompileErrors:
+    """Invalid models raise ModelCompileError naming the statement."""
+
+    @pytest.mark.parametrize("objective, message", [
+        ("x + y", "must start with maximize or minimize"),
+        ("maximize x + z", "unknown name 'z'"),
+        ("minimize x^3", "exponent 3"),
+        ("minimize x*x*y", "degree above 2"),
+        ("minimize x / y", "division by an expression containing variables"),
+        ("minimize x / 0", "division by zero"),
+        ("maximize log(x)", "unknown function 'log'"),
+        ("maximize x +", "unexpected"),
+    ])
+    def test_objective_errors(self, objective, message):
+        with pytest.raises(ModelCompileError, match=message):
+            compile_model(spec(objective))
+
+    @pytest.mark.parametrize("constraint, message", [
+        ("x * y <= 3", "constraint is quadratic"),
+        ("x + y", "no comparison"),
+        ("x <= z", "unknown name 'z'"),
+        ("0 * x >= 1", "never satisfied"),
+        ("x[1] <= 3", r"variable x\[1\] is not declared"),
+        ("x <= 2 for i in cap", "not a set"),
+        ("x <= 1 for x in 1..2", "same name as a variable"),
+    ])
+    def test_constraint_errors(self, constraint, message):
+        with pytest.raises(ModelCompileError, match=message) as error:
+            compile_model(spec("maximize x", ["y <= 1", constraint], parameters={"cap": 5}))
+        assert str(error.value).startswith("constraint 2 (")
+
+    def test_undeclared_index(self):
+        with pytest.raises(ModelCompileError, match=r"x\[4\] is not declared"):
+            compile_model(spec("maximize sum(x[i] for i in 1..4)",
+                               variables=[{"name": "x", "indices": 3}]))
+
+    def test_indexed_variable_without_subscript(self):
+        with pytest.raises(ModelCompileError, match=r"'x' is indexed; use x\[...\]"):
+            compile_model(spec("maximize x", variables=[{"name": "x", "indices": 3}]))
+
+    def test_missing_parameter_key(self):
+        with pytest.raises(ModelCompileError, match=r"parameter p\[3\] is not defined"):
+            compile_model(spec("maximize sum(p[i] * x[i] for i in 1..3)",
+                               variables=[{"name": "x", "indices": 3}],
+                               parameters={"p": {"1": 1, "2": 2}}))
+
+    @pytest.mark.parametrize("variables, message", [
+        ([], "no variables"),
+        ([{"name": "x", "bounds": [5, 1]}], "lower bound 5.0 above upper bound 1.0"),
+        ([{"name": "x", "bounds": [0]}], r"bounds must be \[lower, upper\]"),
+        ([{"name": "x", "type": "complex"}], "unknown type"),
+        ([{"name": "x"}, {"name": "x"}], "declared more than once"),
+        ([{"name": "2x"}], "invalid name"),
+        ([{"name": "cap"}], "same name as a parameter"),
+    ])
+    def test_variable_errors(self, variables, message):
+        model = spec("maximize 1", parameters={"cap": 5})
+        model["variables"] = variables
+        with pytest.raises(ModelCompileError, match=message):
+            compile_model(model)
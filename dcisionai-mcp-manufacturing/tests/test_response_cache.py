@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Tests for LLMResponseCache
+==========================
+
+Exact and near-duplicate lookups, the guards that keep a near-duplicate
+from answering a query with a different meaning, expiry, eviction and
+persistence.
+
+Author: DcisionAI Team
+Copyright (c) 2025 DcisionAI. All rights reserved.
+"""
+
+import time
+
+from agents.response_cache import LLMResponseCache, default_cache_dir, qualifiers
+
+MODEL = "anthropic.claude-3-haiku-20240307-v1:0"
+QUERY = "Maximize production throughput across 3 lines with 50 workers and overtime allowed on weekends"
+
+
+def store(cache, query, response='{"intent": "production_optimization"}'):
+    cache.put("intent", MODEL, 0.1, f"Classify: {query}", response, similarity_text=query)
+
+
+def lookup(cache, query):
+    return cache.get("intent", MODEL, 0.1, f"Classify: {query}", similarity_text=query)
+
+
+class TestQualifiers:
+    """Sense and negation words a near-duplicate must share."""
+
+    def test_senses_and_negations_in_order(self):
+        assert qualifiers("Maximize output, don't exceed 50 workers") == ("max", "not")
+        assert qualifiers("minimise cost without overtime") == ("min", "not")
+        assert qualifiers("no overtime; minimum cost") == ("not", "min")
+
+    def test_ordinary_words_ignored(self):
+        assert qualifiers("Schedule 30 minutes of maintenance on the minimal line") == ()
+
+
+class TestExactTier:
+    def test_normalized_prompt_hits(self):
+        cache = LLMResponseCache(path=None)
+        store(cache, QUERY)
+        hit = cache.get("intent", MODEL, 0.1, f"  classify:   {QUERY.lower()} ")
+        assert hit == '{"intent": "production_optimization"}'
+        assert cache.get_stats()["stages"]["intent"]["exact_hits"] == 1
+
+    def test_model_and_temperature_are_part_of_the_key(self):
+        cache = LLMResponseCache(path=None, similarity_threshold=0)
+        store(cache, QUERY)
+        assert cache.get("intent", "other-model", 0.1, f"Classify: {QUERY}") is None
+        assert cache.get("intent", MODEL, 0.7, f"Classify: {QUERY}") is None
+
+    def test_uncached_stage(self):
+        cache = LLMResponseCache(path=None, stages=("intent",))
+        cache.put("model", MODEL, 0.1, "prompt", "{}")
+        assert cache.get("model", MODEL, 0.1, "prompt") is None
+
+
+class TestNearDuplicateTier:
+    def test_near_duplicate_hits(self):
+        cache = LLMResponseCache(path=None)
+        store(cache, QUERY)
+        assert lookup(cache, QUERY.replace("weekends", "weekend")) is not None
+        assert cache.get_stats()["stages"]["intent"]["similar_hits"] == 1
+
+    def test_different_numbers_miss(self):
+        cache = LLMResponseCache(path=None, similarity_threshold=0.5)
+        store(cache, QUERY)
+        assert lookup(cache, QUERY.replace("50 workers", "60 workers")) is None
+
+    def test_opposite_sense_misses(self):
+        cache = LLMResponseCache(path=None, similarity_threshold=0.5)
+        store(cache, QUERY)
+        assert lookup(cache, QUERY.replace("Maximize", "Minimize")) is None
+
+    def test_negation_misses(self):
+        cache = LLMResponseCache(path=None, similarity_threshold=0.5)
+        store(cache, QUERY)
+        assert lookup(cache, "Do not " + QUERY.lower()) is None
+        assert lookup(cache, QUERY.replace("overtime allowed", "no overtime allowed")) is None
+
+    def test_default_threshold_rejects_reworded_query(self):
+        cache = LLMResponseCache(path=None)
+        store(cache, QUERY)
+        assert lookup(cache, QUERY.replace("across 3 lines", "on all 3 of our lines")) is None
+
+    def test_zero_threshold_disables_tier(self):
+        cache = LLMResponseCache(path=None, similarity_threshold=0)
+        store(cache, QUERY)
+        assert lookup(cache, QUERY.replace("weekends", "weekend")) is None
+
+
+class TestLifecycle:
+    def test_expired_entries_unused(self):
+        cache = LLMResponseCache(path=None, ttl_seconds=0.05)
+        store(cache, QUERY)
+        time.sleep(0.1)
+        assert lookup(cache, QUERY) is None
+
+    def test_least_recently_used_evicted(self):
+        cache = LLMResponseCache(path=None, max_entries=2, similarity_threshold=0)
+        for i in range(2):
+            store(cache, f"query {i}")
+        lookup(cache, "query 0")
+        store(cache, "query 2")
+        assert lookup(cache, "query 0") is not None
+        assert lookup(cache, "query 1") is None
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_entries_survive_restart(self, tmp_path):
+        path = str(tmp_path / "llm_cache.db")
+        cache = LLMResponseCache(path=path)
+        store(cache, QUERY)
+        cache.close()
+
+        reopened = LLMResponseCache(path=path, similarity_threshold=0.5)
+        try:
+            assert lookup(reopened, QUERY) is not None
+            assert lookup(reopened, QUERY.replace("weekends", "weekend")) is not None
+            assert lookup(reopened, QUERY.replace("Maximize", "Minimize")) is None
+        finally:
+            reopened.close()
+
+    def test_relative_path_under_cache_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        monkeypatch.chdir(tmp_path)
+        cache = LLMResponseCache()
+        try:
+            store(cache, QUERY)
+        finally:
+            cache.close()
+        assert cache.path == default_cache_dir() / "llm_cache.db"
+        assert (tmp_path / "dcisionai-mcp-manufacturing" / "llm_cache.db").exists()
+        assert not (tmp_path / "llm_cache.db").exists()
+
+    def test_clear(self):
+        cache = LLMResponseCache(path=None)
+        store(cache, QUERY)
+        cache.clear()
+        assert lookup(cache, QUERY) is None
+        assert cache.get_stats()["entries"] == 0
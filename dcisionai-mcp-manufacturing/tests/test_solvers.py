@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Tests for the Solver Backends
+=============================
+
+Solves the same compiled models with every installed backend and checks
+that they agree, that ``ModelSolver`` falls back in order, and that only
+convex quadratic programs reach HiGHS.
+
+Author: DcisionAI Team
+Copyright (c) 2025 DcisionAI. All rights reserved.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from agents.model_compiler import ModelCompileError, compile_model
+from agents.solvers import BACKENDS, SOLVER_BACKENDS, ModelSolver
+
+INSTALLED = [name for name in SOLVER_BACKENDS if BACKENDS[name].available()]
+
+
+def needs(*names):
+    missing = [name for name in names if name not in INSTALLED]
+    return pytest.mark.skipif(bool(missing), reason=f"{', '.join(missing)} not installed")
+
+
+def production_model(seed: int, integer: bool = False, products: int = 12, resources: int = 6):
+    """Random product-mix model: maximize profit subject to resource capacities."""
+    rng = random.Random(seed)
+    return compile_model({
+        "variables": [{"name": "x", "type": "integer" if integer else "continuous",
+                       "bounds": [0, 20], "indices": products}],
+        "constraints": [
+            {"name": "capacity",
+             "expression": f"sum(usage[r, p] * x[p] for p in 1..{products}) <= cap[r] for r in 0..{resources - 1}"},
+            "x[1] + x[2] >= 1",
+        ],
+        "objective": f"maximize sum(profit[p] * x[p] for p in 1..{products}) - 5",
+        "parameters": {
+            "usage": [{str(p): rng.randint(1, 9) for p in range(1, products + 1)} for _ in range(resources)],
+            "cap": [rng.randint(40, 120) for _ in range(resources)],
+            "profit": {str(p): round(rng.uniform(1, 30), 2) for p in range(1, products + 1)},
+        },
+    })
+
+
+def assert_feasible(compiled, values, tolerance=1e-5):
+    activity = compiled.matrix() @ values
+    assert np.all(activity >= compiled.row_lower - tolerance)
+    assert np.all(activity <= compiled.row_upper + tolerance)
+    assert np.all(values >= compiled.lower - tolerance)
+    assert np.all(values <= compiled.upper + tolerance)
+    integer = compiled.integrality.astype(bool)
+    np.testing.assert_allclose(values[integer], np.round(values[integer]), atol=tolerance)
+
+
+def assert_same_objective(a, b):
+    assert a == pytest.approx(b, rel=1e-6, abs=1e-6)
+
+
+class TestBackendsAgree:
+    """Every installed backend finds the same optimum."""
+
+    @pytest.mark.parametrize("backend", INSTALLED)
+    def test_small_lp(self, backend):
+        compiled = compile_model({
+            "variables": [{"name": "x", "bounds": [0, 10]}, {"name": "y", "bounds": [0, 10]}],
+            "constraints": ["x + y <= 8", "x - y >= -2"],
+            "objective": "maximize 3x + 2y + 1",
+        })
+        outcome = BACKENDS[backend].solve(compiled)
+        assert outcome.status == "optimal"
+        assert outcome.backend == backend
+        assert_same_objective(outcome.objective_value, 25)
+        np.testing.assert_allclose(outcome.values, [8, 0], atol=1e-6)
+        assert outcome.solution(compiled) == pytest.approx({"x": 8, "y": 0})
+
+    @pytest.mark.parametrize("integer", [False, True], ids=["lp", "mip"])
+    @pytest.mark.parametrize("seed", range(3))
+    def test_random_models(self, seed, integer):
+        if len(INSTALLED) < 2:
+            pytest.skip("needs two solver backends")
+        compiled = production_model(seed, integer)
+        outcomes = {name: BACKENDS[name].solve(compiled, time_limit=60) for name in INSTALLED}
+        reference = outcomes[INSTALLED[0]].objective_value
+        for name, outcome in outcomes.items():
+            assert outcome.status == "optimal", name
+            assert_same_objective(outcome.objective_value, reference)
+            assert_feasible(compiled, outcome.values)
+
+    @pytest.mark.parametrize("backend", INSTALLED)
+    def test_infeasible(self, backend):
+        compiled = compile_model({
+            "variables": [{"name": "x", "bounds": [0, 5]}, {"name": "y", "type": "integer", "bounds": [0, 5]}],
+            "constraints": ["x + y >= 20"],
+            "objective": "minimize x + y",
+        })
+        outcome = BACKENDS[backend].solve(compiled)
+        assert outcome.status == "infeasible"
+        assert outcome.objective_value is None
+        assert outcome.values is None
+
+    @pytest.mark.parametrize("backend", INSTALLED)
+    def test_model_without_constraints(self, backend):
+        compiled = compile_model({"variables": [{"name": "x", "bounds": [-3, 4]}], "objective": "minimize 2x"})
+        outcome = BACKENDS[backend].solve(compiled)
+        assert_same_objective(outcome.objective_value, -6)
+
+
+class TestQuadraticObjectives:
+    @needs("highs")
+    def test_convex_minimum(self):
+        compiled = compile_model({
+            "variables": [{"name": "x", "bounds": [None, None]}, {"name": "y", "bounds": [0, 10]}],
+            "constraints": ["x + y >= 4"],
+            "objective": "minimize x^2 + y^2 - 2x",
+        })
+        outcome = ModelSolver().solve(compiled)
+        assert outcome.backend == "highs"
+        np.testing.assert_allclose(outcome.values, [2.5, 1.5], atol=1e-5)
+        assert_same_objective(outcome.objective_value, 2.5 ** 2 + 1.5 ** 2 - 5)
+
+    @needs("highs")
+    def test_concave_maximum(self):
+        compiled = compile_model({
+            "variables": [{"name": "x", "bounds": [0, 10]}],
+            "objective": "maximize 6x - x^2",
+        })
+        outcome = ModelSolver().solve(compiled)
+        assert outcome.values[0] == pytest.approx(3, abs=1e-5)
+        assert_same_objective(outcome.objective_value, 9)
+
+    @needs("highs")
+    @pytest.mark.parametrize("objective, shape", [
+        ("minimize x*y", "convex"),
+        ("minimize x^2 - 3*y^2", "convex"),
+        ("maximize x^2 + y", "concave"),
+    ])
+    def test_nonconvex_rejected(self, objective, shape):
+        compiled = compile_model({
+            "variables": [{"name": "x", "bounds": [0, 1]}, {"name": "y", "bounds": [0, 1]}],
+            "objective": objective,
+        })
+        with pytest.raises(ModelCompileError, match=f"not {shape}"):
+            ModelSolver().solve(compiled)
+
+    def test_only_highs_supports_quadratic(self):
+        compiled = compile_model({"variables": [{"name": "x"}], "objective": "minimize x^2"})
+        names = [backend.name for backend in ModelSolver(backend="scipy").candidates(compiled)]
+        assert names == (["highs"] if "highs" in INSTALLED else [])
+
+    def test_mixed_integer_quadratic_unsupported(self):
+        compiled = compile_model({"variables": [{"name": "x", "type": "integer", "bounds": [0, 3]}],
+                                  "objective": "minimize x^2"})
+        with pytest.raises(ModelCompileError, match="no available solver"):
+            ModelSolver().solve(compiled)
+
+
+class TestModelSolver:
+    """Backend choice, fallback order and statistics."""
+
+    def test_candidate_order(self):
+        compiled = production_model(0)
+        assert [b.name for b in ModelSolver().candidates(compiled)] == INSTALLED
+        preferred = ModelSolver(backend="cbc").candidates(compiled)
+        assert [b.name for b in preferred] == ["pulp_cbc"] + [n for n in INSTALLED if n != "pulp_cbc"]
+        assert ModelSolver().candidates(compiled, preferred="scipy")[0].name == "scipy"
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError, match="Unknown solver backend"):
+            ModelSolver(backend="gurobi")
+
+    def test_uninstalled_backend_skipped(self, monkeypatch):
+        monkeypatch.setattr(BACKENDS["highs"], "available", lambda: False)
+        solver = ModelSolver(backend="highs")
+        assert "highs" not in [b.name for b in solver.candidates(production_model(0))]
+        if INSTALLED != ["highs"]:
+            assert solver.solve(production_model(0)).backend != "highs"
+
+    @needs("highs", "scipy")
+    def test_fallback_after_failure(self, monkeypatch):
+        def broken(compiled, time_limit=None):
+            raise RuntimeError("solver crashed")
+
+        monkeypatch.setattr(BACKENDS["highs"], "solve", broken)
+        solver = ModelSolver(backend="highs")
+        outcome = solver.solve(production_model(1))
+        assert outcome.backend == "scipy"
+        assert outcome.status == "optimal"
+        stats = solver.get_stats()
+        assert stats["fallbacks"] == 1
+        assert stats["backends"]["highs"]["failures"] == 1
+        assert stats["backends"]["scipy"]["solves"] == 1
+
+    def test_all_backends_fail(self, monkeypatch):
+        def broken(compiled, time_limit=None):
+            raise RuntimeError("solver crashed")
+
+        for backend in BACKENDS.values():
+            monkeypatch.setattr(backend, "solve", broken)
+        with pytest.raises(RuntimeError, match="all solver backends failed"):
+            ModelSolver().solve(production_model(0))
+
+    def test_from_settings(self):
+        solver = ModelSolver.from_settings({"agents": {"solver": {"solver_type": "milp", "timeout": 12}}})
+        assert solver.backend == "scipy"
+        assert solver.time_limit == 12.0
@@ -0,0 +1 @@
+# Benchmarks for DcisionAI MCP Server
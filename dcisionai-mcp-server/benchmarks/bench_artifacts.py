@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Model Handle Benchmark
+======================
+
+Solves the same model repeatedly through the stdio server's tool
+dispatch, once echoing the full ``model_building`` result back and once
+sending the ``model_handle`` from ``build_model``, and reports the MCP
+request size and time per solve. The MCP hop is simulated by encoding
+and decoding the tool arguments as JSON.
+
+Usage:
+    python -m benchmarks.bench_artifacts --sizes 1000 10000 --solves 5
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from dcisionai_mcp_server.config import Config
+from dcisionai_mcp_server.mcp_server import DcisionAIMCPServer
+from tests.stub_gateway import StubGateway
+from .bench_codec import make_spec
+from .common import print_table
+
+
+class ModelGateway(StubGateway):
+    """Stub gateway whose ``build_model`` returns a model of a given size."""
+
+    def __init__(self, variables: int):
+        super().__init__()
+        self.spec = make_spec(variables)
+
+    def tool_result(self, tool, arguments):
+        if tool == "build_model":
+            return self.spec
+        return {"tool": tool, "status": "optimal"}
+
+
+async def bench(variables: int, solves: int):
+    """Per-solve request bytes and latency, by value and by handle."""
+    rows = []
+    async with ModelGateway(variables) as gateway:
+        server = DcisionAIMCPServer(Config(
+            gateway_url=gateway.url,
+            gateway_target="bench-target",
+            access_token="bench-token",
+            rate_limit_enabled=False,
+            cache_enabled=False,
+        ))
+        built = await server.call_tool("build_model", {"problem_description": "Bench model"})
+        variants = {
+            "model_building": {"problem_description": "Bench model", "model_building": built},
+            "model_handle": {"problem_description": "Bench model", "model_handle": built["model_handle"]},
+        }
+        for name, arguments in variants.items():
+            latencies, size = [], 0
+            for _ in range(solves):
+                started = time.perf_counter()
+                request = json.dumps(arguments)
+                result = await server.call_tool("solve_optimization", json.loads(request))
+                latencies.append(time.perf_counter() - started)
+                size = len(request)
+                assert result["status"] == "success", result
+            rows.append({
+                "variables": variables,
+                "sent": name,
+                "request_bytes": size,
+                "mean_ms": round(sum(latencies) / len(latencies) * 1000, 3),
+            })
+        await server.aclose()
+    return rows
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Model handle benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000],
+                        help="Variables per model specification")
+    parser.add_argument("--solves", type=int, default=5, help="Solves per variant")
+    args = parser.parse_args()
+
+    rows = []
+    for size in args.sizes:
+        rows.extend(await bench(size, args.solves))
+    print_table("solve_optimization by value vs by handle", rows)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
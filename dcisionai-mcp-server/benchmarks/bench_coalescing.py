@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Request Coalescing Benchmark
+============================
+
+Fires identical concurrent ``build_model`` calls at a local stub gateway
+with and without request coalescing, and reports how many requests
+reached the gateway along with p50/p99 call latency.
+
+Usage:
+    python -m benchmarks.bench_coalescing --concurrency 50 --latency 0.2
+"""
+
+import argparse
+import asyncio
+
+from dcisionai_mcp_server.config import Config
+from dcisionai_mcp_server.tools import DcisionAITools
+from tests.stub_gateway import StubGateway
+from .common import print_table, run_concurrent
+
+
+async def bench(gateway: StubGateway, concurrency: int, coalesce: bool, rounds: int):
+    """``rounds`` bursts of ``concurrency`` identical calls."""
+    config = Config(
+        gateway_url=gateway.url,
+        gateway_target="bench-target",
+        access_token="bench-token",
+        rate_limit_enabled=False,
+        cache_enabled=False,
+        coalesce_enabled=coalesce,
+    )
+    posts = gateway.posts
+    async with DcisionAITools(config) as tools:
+        rows = []
+        for burst in range(rounds):
+            problem = f"Minimize overtime across 3 shifts (round {burst})"
+            rows.append(await run_concurrent(
+                lambda i: tools.build_model(problem, {"shifts": 3}), concurrency, concurrency
+            ))
+    return {
+        "coalescing": "on" if coalesce else "off",
+        "calls": sum(r["requests"] for r in rows),
+        "gateway_requests": gateway.posts - posts,
+        "p50_ms": round(sum(r["p50_ms"] for r in rows) / rounds, 3),
+        "p99_ms": round(max(r["p99_ms"] for r in rows), 3),
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Request coalescing benchmark")
+    parser.add_argument("--concurrency", type=int, default=50, help="Identical calls per burst")
+    parser.add_argument("--rounds", type=int, default=5, help="Bursts per run")
+    parser.add_argument("--latency", type=float, default=0.2,
+                        help="Stub gateway latency in seconds")
+    args = parser.parse_args()
+
+    async with StubGateway(latency=args.latency) as gateway:
+        rows = [
+            await bench(gateway, args.concurrency, coalesce, args.rounds)
+            for coalesce in (False, True)
+        ]
+
+    print_table(f"{args.concurrency} concurrent identical build_model calls", rows)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Payload Codec Benchmark
+=======================
+
+Encodes and decodes synthetic model specifications of growing size with
+each installed JSON backend, reports gzip size and cost, and times
+building a ``solve_optimization`` request body with the specification
+re-serialized versus spliced in from ``EncodedJSON``.
+
+Usage:
+    python -m benchmarks.bench_codec --sizes 1000 10000 100000
+"""
+
+import argparse
+import gzip
+import time
+from typing import Any, Callable, Dict
+
+from dcisionai_mcp_server.codec import GZIP_LEVEL, EncodedJSON, JSONCodec
+from .common import print_table
+
+
+def make_spec(variables: int) -> Dict[str, Any]:
+    """A model specification with ``variables`` variables and as many constraints."""
+    return {
+        "model_type": "mixed_integer_programming",
+        "variables": [
+            {"name": f"x_{i}", "type": "integer", "lower_bound": 0, "upper_bound": 100.0}
+            for i in range(variables)
+        ],
+        "objective": {
+            "sense": "minimize",
+            "terms": [{"variable": f"x_{i}", "coefficient": 1.5 + i % 13} for i in range(variables)],
+        },
+        "constraints": [
+            {
+                "name": f"c_{i}",
+                "terms": [{"variable": f"x_{i}", "coefficient": 1.0},
+                          {"variable": f"x_{(i + 1) % variables}", "coefficient": -2.0}],
+                "sense": "<=",
+                "rhs": 50.0,
+            }
+            for i in range(variables)
+        ],
+    }
+
+
+def best_of(call: Callable[[], Any], repeat: int) -> float:
+    """Fastest of ``repeat`` runs, in milliseconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call()
+        times.append(time.perf_counter() - start)
+    return round(min(times) * 1000, 3)
+
+
+def envelope(spec: Dict[str, Any], solver: str) -> Dict[str, Any]:
+    return {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "tools/call",
+        "params": {
+            "name": "target___solve_optimization",
+            "arguments": {"model_specification": spec, "solver_config": {"solver": solver}},
+        },
+    }
+
+
+def available_backends():
+    for backend in ("orjson", "msgspec", "json"):
+        try:
+            yield JSONCodec(backend)
+        except ImportError:
+            continue
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Payload codec benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000],
+                        help="Variables per model specification")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement")
+    args = parser.parse_args()
+
+    codec_rows, request_rows = [], []
+    for size in args.sizes:
+        spec = make_spec(size)
+        for codec in available_backends():
+            content = codec.dumps(spec)
+            codec_rows.append({
+                "variables": size,
+                "backend": codec.backend,
+                "bytes": len(content),
+                "encode_ms": best_of(lambda: codec.dumps(spec), args.repeat),
+                "decode_ms": best_of(lambda: codec.loads(content), args.repeat),
+                "gzip_bytes": len(gzip.compress(content, compresslevel=GZIP_LEVEL)),
+                "gzip_ms": best_of(lambda: gzip.compress(content, compresslevel=GZIP_LEVEL), args.repeat),
+            })
+
+            encoded = EncodedJSON(spec)
+            encoded.encoded(codec)
+            request_rows.append({
+                "variables": size,
+                "backend": codec.backend,
+                "reserialized_ms": best_of(lambda: codec.dumps(envelope(spec, "highs")), args.repeat),
+                "spliced_ms": best_of(lambda: codec.dumps(envelope(encoded, "highs")), args.repeat),
+            })
+
+    print_table("Model specification encode/decode", codec_rows)
+    print_table("solve_optimization request body", request_rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+Recorded Gateway Benchmark
+==========================
+
+Drives all six tools and the four-stage pipeline through
+``DcisionAITools`` against a replay of recorded gateway calls (see
+``replay_gateway``), at several concurrency levels. The replay runs in a
+child process, so the reported CPU time and allocations are those of the
+client alone. Results are written as a JSON report; compared with a
+baseline report, metrics that got worse by more than their threshold are
+reported as regressions and fail the run.
+
+Usage:
+    python -m benchmarks.bench_gateway --requests 200 --concurrency 1 10 50 --output report.json
+    python -m benchmarks.bench_gateway --baseline report.json
+    python -m benchmarks.bench_gateway --record benchmarks/recordings/gateway.json
+
+Recording calls the gateway of the current configuration (environment
+or ``DCISIONAI_CONFIG_FILE``), or runs the tools in-process with
+``DCISIONAI_EXECUTION_MODE=local``.
+"""
+
+import argparse
+import asyncio
+import dataclasses
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from dcisionai_mcp_server.config import Config
+from dcisionai_mcp_server.config_manager import current_config
+from dcisionai_mcp_server.tools import DcisionAITools
+from .common import print_table, run_concurrent
+from .replay_gateway import DEFAULT_RECORDING, GatewayProcess, Recording, recording_dispatch
+
+SCENARIOS = (
+    "classify_intent", "analyze_data", "build_model", "solve_optimization",
+    "get_workflow_templates", "execute_workflow", "pipeline",
+)
+
+# Largest tolerated change per metric, as a fraction of the baseline
+DEFAULT_THRESHOLDS = {
+    "requests_per_sec": 0.15,
+    "p50_ms": 0.25,
+    "p95_ms": 0.30,
+    "p99_ms": 0.50,
+    "cpu_ms_per_request": 0.25,
+    "alloc_peak_kib": 0.25,
+    "retained_kib_per_request": 0.50,
+}
+
+# Metrics where a higher value is better
+HIGHER_IS_BETTER = {"requests_per_sec"}
+
+# Problems the recording is captured with
+PROBLEMS = (
+    """Plan weekly production of chairs (x) and tables (y) to maximize profit.
+maximize profit: 45x + 80y
+subject to
+wood: 5x + 20y <= 400
+labor: 10x + 15y <= 450
+x integer
+y integer""",
+    """Staff a clinic's day, evening and night shifts at minimum cost.
+minimize cost: 320d + 350e + 410n
+subject to
+coverage: d + e + n >= 24
+day_min: d >= 8
+night_min: n >= 4
+d integer
+e integer
+n integer""",
+    """Allocate a marketing budget across search (s), social (m) and print (p).
+maximize reach: 12s + 9m + 4p
+subject to
+budget: s + m + p <= 100
+search_cap: s <= 50
+print_min: p >= 10""",
+    """Ship goods from two plants to a warehouse at minimum transport cost.
+minimize cost: 4a + 6b
+subject to
+demand: a + b >= 120
+plant_a: a <= 80
+plant_b: b <= 90""",
+)
+
+
+def bench_config(gateway_url: str, workflow_engine: str) -> Config:
+    """Configuration sending every call to the replay gateway."""
+    return Config(
+        gateway_url=gateway_url,
+        gateway_target="bench-target",
+        access_token="bench-token",
+        execution_mode="gateway",
+        rate_limit_enabled=False,
+        cache_enabled=False,
+        coalesce_enabled=False,
+        retry_attempts=0,
+        workflow_engine=workflow_engine,
+    )
+
+
+def scenario_call(tools: DcisionAITools, scenario: str,
+                  model: Dict[str, Any]) -> Callable[[int], Awaitable[Dict[str, Any]]]:
+    """The call a scenario makes for request ``i``."""
+    def problem(i: int) -> str:
+        return f"{PROBLEMS[i % len(PROBLEMS)]}\n(request {i})"
+
+    if scenario == "classify_intent":
+        return lambda i: tools.classify_intent(problem(i))
+    if scenario == "analyze_data":
+        return lambda i: tools.analyze_data(problem(i))
+    if scenario == "build_model":
+        return lambda i: tools.build_model(problem(i), {"request": i})
+    if scenario == "solve_optimization":
+        return lambda i: tools.solve_optimization(model, {"time_limit": 10, "request": i})
+    if scenario == "get_workflow_templates":
+        return lambda i: tools.get_workflow_templates()
+    if scenario == "execute_workflow":
+        return lambda i: tools.execute_workflow(
+            "manufacturing", "production_planning", {"problem_description": problem(i)},
+            run_id=f"bench-{i}"
+        )
+    if scenario == "pipeline":
+        return lambda i: tools.run_pipeline(problem(i))
+    raise ValueError(f"Unknown scenario: {scenario}")
+
+
+async def measure(config: Config, scenario: str, model: Dict[str, Any], total: int,
+                  concurrency: int, warmup: int, alloc_requests: int) -> Dict[str, Any]:
+    """Throughput, latency, CPU and allocations of one scenario."""
+    errors = 0
+
+    async with DcisionAITools(config) as tools:
+        call = scenario_call(tools, scenario, model)
+
+        async def checked(i: int):
+            nonlocal errors
+            result = await call(i)
+            if result.get("status") != "success":
+                errors += 1
+
+        await run_concurrent(call, warmup, concurrency)
+
+        cpu = time.process_time()
+        row = await run_concurrent(checked, total, concurrency)
+        cpu = time.process_time() - cpu
+
+        # Allocations are traced in a separate pass, tracing slows the calls down
+        tracemalloc.start()
+        try:
+            await run_concurrent(call, alloc_requests, concurrency)
+            retained, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return {
+        "scenario": scenario,
+        "concurrency": concurrency,
+        **row,
+        "errors": errors,
+        "cpu_ms_per_request": round(cpu / total * 1000, 3),
+        "alloc_peak_kib": round(peak / 1024, 1),
+        "retained_kib_per_request": round(retained / alloc_requests / 1024, 2),
+    }
+
+
+async def run_suite(gateway_url: str, recording: Recording, scenarios: List[str],
+                    concurrency_levels: List[int], total: int, warmup: int = 10,
+                    alloc_requests: int = 50, workflow_engine: str = "remote") -> List[Dict[str, Any]]:
+    """Measure every scenario at every concurrency level."""
+    config = bench_config(gateway_url, workflow_engine)
+    model = recording.tools["build_model"]["results"][0]
+    rows = []
+    for scenario in scenarios:
+        for concurrency in concurrency_levels:
+            rows.append(await measure(
+                config, scenario, model, total, concurrency, warmup, min(alloc_requests, total)
+            ))
+    return rows
+
+
+def compare(results: List[Dict[str, Any]], baseline: List[Dict[str, Any]],
+            thresholds: Dict[str, float]) -> List[Dict[str, Any]]:
+    """
+    Metrics that got worse than the baseline by more than their threshold.
+
+    Rows are matched by scenario and concurrency; rows without a
+    counterpart in the baseline are not compared.
+    """
+    previous = {(row["scenario"], row["concurrency"]): row for row in baseline}
+    regressions = []
+    for row in results:
+        base = previous.get((row["scenario"], row["concurrency"]))
+        if base is None:
+            continue
+        for metric, threshold in thresholds.items():
+            if metric not in row or not base.get(metric):
+                continue
+            change = (row[metric] - base[metric]) / base[metric]
+            worse = -change if metric in HIGHER_IS_BETTER else change
+            if worse > threshold:
+                regressions.append({
+                    "scenario": row["scenario"],
+                    "concurrency": row["concurrency"],
+                    "metric": metric,
+                    "baseline": base[metric],
+                    "current": row[metric],
+                    "change_pct": round(change * 100, 1),
+                    "threshold_pct": round(threshold * 100, 1),
+                })
+    return regressions
+
+
+async def record(path: str, samples: int):
+    """Record ``samples`` calls of each tool with the current configuration."""
+    # Every call must reach the backend; execute_workflow is recorded as one gateway call
+    config = dataclasses.replace(
+        current_config(), cache_enabled=False, coalesce_enabled=False, workflow_engine="remote"
+    )
+    source = "local" if config.execution_mode == "local" else config.gateway_url
+    recording = Recording(source=source)
+    async with DcisionAITools(config) as tools:
+        tools._dispatch = recording_dispatch(tools._dispatch, recording)
+        for i in range(samples):
+            problem = PROBLEMS[i % len(PROBLEMS)]
+            await tools.classify_intent(problem)
+            analysis = await tools.analyze_data(problem)
+            model = await tools.build_model(problem, analysis.get("data_analysis"))
+            if model.get("status") == "success":
+                await tools.solve_optimization(model["model_specification"])
+            await tools.get_workflow_templates()
+            await tools.execute_workflow(
+                "manufacturing", "production_planning", {"problem_description": problem}
+            )
+    missing = set(SCENARIOS) - {"pipeline"} - set(recording.tools)
+    if missing:
+        raise SystemExit(f"No successful calls recorded for: {', '.join(sorted(missing))}")
+    recording.save(path)
+    print_table(f"Recorded {path} from {source}", [
+        {"tool": tool, **row} for tool, row in recording.summary().items()
+    ])
+
+
+def load_thresholds(path: Optional[str], tolerance: Optional[float]) -> Dict[str, float]:
+    thresholds = dict(DEFAULT_THRESHOLDS)
+    if path:
+        with open(path, "r") as f:
+            thresholds.update(json.load(f))
+    if tolerance is not None:
+        thresholds = {metric: tolerance for metric in thresholds}
+    return thresholds
+
+
+def build_report(args: argparse.Namespace, recording: Recording, rows: List[Dict[str, Any]],
+                 gateway_stats: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "benchmark": "recorded_gateway",
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "recording": {
+            "path": str(args.recording),
+            "source": recording.source,
+            "tools": recording.summary(),
+        },
+        "settings": {
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "latency_scale": args.latency_scale,
+            "warmup": args.warmup,
+            "alloc_requests": args.alloc_requests,
+            "workflow_engine": args.workflow_engine,
+        },
+        "gateway": gateway_stats,
+        "results": rows,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recorded gateway benchmark")
+    parser.add_argument("--recording", default=str(DEFAULT_RECORDING), help="Recording to replay")
+    parser.add_argument("--requests", type=int, default=200, help="Calls per scenario and level")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 50],
+                        help="Concurrent calls")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--latency-scale", type=float, default=1.0,
+                        help="Factor applied to recorded latencies (0 for none)")
+    parser.add_argument("--warmup", type=int, default=10, help="Unmeasured calls per run")
+    parser.add_argument("--alloc-requests", type=int, default=50,
+                        help="Calls traced for allocations per run")
+    parser.add_argument("--workflow-engine", choices=("remote", "local"), default="remote",
+                        help="Run execute_workflow on the gateway or stage by stage")
+    parser.add_argument("--output", help="Write the JSON report here")
+    parser.add_argument("--baseline", help="Report to compare against")
+    parser.add_argument("--thresholds", help="JSON file of metric -> tolerated fraction")
+    parser.add_argument("--tolerance", type=float, help="Tolerated fraction for every metric")
+    parser.add_argument("--record", metavar="PATH", help="Record a new recording instead")
+    parser.add_argument("--samples", type=int, default=12, help="Calls per tool when recording")
+    args = parser.parse_args()
+
+    if args.record:
+        asyncio.run(record(args.record, args.samples))
+        return
+
+    recording = Recording.load(args.recording)
+    with GatewayProcess(args.recording, args.latency_scale) as gateway:
+        rows = asyncio.run(run_suite(
+            gateway.url, recording, args.scenarios, args.concurrency, args.requests,
+            args.warmup, args.alloc_requests, args.workflow_engine
+        ))
+    report = build_report(args, recording, rows, gateway.stats)
+
+    print_table("Recorded gateway", [
+        {key: row[key] for key in ("scenario", "concurrency", "requests_per_sec", "p50_ms",
+                                   "p95_ms", "p99_ms", "cpu_ms_per_request",
+                                   "alloc_peak_kib", "errors")}
+        for row in rows
+    ])
+
+    regressions: List[Dict[str, Any]] = []
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)
+        regressions = compare(rows, baseline["results"], load_thresholds(args.thresholds, args.tolerance))
+        report["baseline"] = args.baseline
+        report["regressions"] = regressions
+        if regressions:
+            print_table("Regressions", regressions)
+        else:
+            print(f"No regressions against {args.baseline}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
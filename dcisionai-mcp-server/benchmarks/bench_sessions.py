@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+HTTP Session Load Benchmark
+===========================
+
+Starts the HTTP MCP server as a subprocess against a local stub gateway
+and opens many MCP sessions against it at once, each making a few tool
+calls. Reports sessions/sec and p50/p99 tool call latency per number of
+concurrent sessions and server workers. Sessions speak MCP's JSON-RPC
+directly over one shared aiohttp client, so the load generator itself
+stays cheap next to the server it measures.
+
+Usage:
+    python -m benchmarks.bench_sessions --sessions 10 100 300 --workers 1 2
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List
+
+import aiohttp
+import httpx
+
+from tests.stub_gateway import StubGateway
+from .common import percentile, print_table
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def start_server(gateway_url: str, port: int, workers: int) -> subprocess.Popen:
+    """Start the server and wait until every worker answers ``/health``."""
+    env = dict(
+        os.environ,
+        DCISIONAI_GATEWAY_URL=gateway_url,
+        DCISIONAI_GATEWAY_TARGET="bench-target",
+        DCISIONAI_ACCESS_TOKEN="bench-token",
+        DCISIONAI_RATE_LIMIT_ENABLED="false",
+        DCISIONAI_CACHE_ENABLED="false",
+        DCISIONAI_COALESCE_ENABLED="false",
+        DCISIONAI_LOG_LEVEL="WARNING",
+    )
+    process = subprocess.Popen(
+        [sys.executable, "-m", "dcisionai_mcp_server.server",
+         "--host", "127.0.0.1", "--port", str(port), "--workers", str(workers)],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    pids = set()
+    deadline = time.monotonic() + 60
+    while len(pids) < workers and time.monotonic() < deadline:
+        try:
+            async with httpx.AsyncClient() as http:
+                pids.add((await http.get(f"http://127.0.0.1:{port}/health")).json()["pid"])
+        except httpx.TransportError:
+            await asyncio.sleep(0.1)
+    return process
+
+
+async def stop_server(process: subprocess.Popen):
+    process.terminate()
+    await asyncio.get_event_loop().run_in_executor(None, process.wait)
+
+
+class Session:
+    """Minimal MCP client session over streamable HTTP with JSON responses."""
+
+    def __init__(self, http: aiohttp.ClientSession, url: str):
+        self.http = http
+        self.url = url
+        self.headers = {"Accept": "application/json, text/event-stream"}
+        self.ids = 0
+
+    async def send(self, method: str, params: Dict[str, Any], notification: bool = False):
+        message = {"jsonrpc": "2.0", "method": method, "params": params}
+        if not notification:
+            self.ids += 1
+            message["id"] = self.ids
+        async with self.http.post(self.url, json=message, headers=self.headers) as response:
+            response.raise_for_status()
+            if "mcp-session-id" in response.headers:
+                self.headers["mcp-session-id"] = response.headers["mcp-session-id"]
+            if not notification:
+                body = await response.json()
+                if "error" in body:
+                    raise RuntimeError(body["error"])
+
+    async def open(self):
+        await self.send("initialize", {
+            "protocolVersion": "2025-06-18",
+            "capabilities": {},
+            "clientInfo": {"name": "bench_sessions", "version": "1.0"},
+        })
+        await self.send("notifications/initialized", {}, notification=True)
+
+    async def close(self):
+        # Stateless servers (several workers) hand out no session to end
+        if "mcp-session-id" in self.headers:
+            async with self.http.delete(self.url, headers=self.headers):
+                pass
+
+
+async def bench(gateway_url: str, sessions: int, workers: int, calls: int):
+    """Open ``sessions`` sessions at once, each making ``calls`` tool calls."""
+    port = free_port()
+    process = await start_server(gateway_url, port, workers)
+    latencies: List[float] = []
+    failures = 0
+
+    async def session(http: aiohttp.ClientSession, n: int):
+        nonlocal failures
+        mcp = Session(http, f"http://127.0.0.1:{port}/mcp")
+        try:
+            await mcp.open()
+            for i in range(calls):
+                started = time.perf_counter()
+                await mcp.send("tools/call", {
+                    "name": "classify_intent_tool",
+                    "arguments": {"user_input": f"session {n} call {i}"},
+                })
+                latencies.append(time.perf_counter() - started)
+            await mcp.close()
+        except (aiohttp.ClientError, RuntimeError):
+            failures += 1
+
+    connector = aiohttp.TCPConnector(limit=sessions)
+    try:
+        async with aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=60)) as http:
+            started = time.perf_counter()
+            await asyncio.gather(*(session(http, n) for n in range(sessions)))
+            elapsed = time.perf_counter() - started
+    finally:
+        await stop_server(process)
+
+    return {
+        "workers": workers,
+        "sessions": sessions,
+        "failed": failures,
+        "sessions_per_sec": round((sessions - failures) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="HTTP session load benchmark")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[10, 100, 300],
+                        help="Concurrent MCP sessions per run")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2],
+                        help="Server worker processes per run")
+    parser.add_argument("--calls", type=int, default=3, help="Tool calls per session")
+    parser.add_argument("--latency", type=float, default=0.01,
+                        help="Stub gateway latency in seconds")
+    args = parser.parse_args()
+
+    rows = []
+    async with StubGateway(latency=args.latency) as gateway:
+        for workers in args.workers:
+            for sessions in args.sessions:
+                rows.append(await bench(gateway.url, sessions, workers, args.calls))
+    print_table("HTTP MCP sessions", rows)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Stdio Server Startup Benchmark
+==============================
+
+Measures cold start of the stdio MCP server the way an IDE sees it: import
+time of the server module (``python -X importtime``) and wall time from
+spawning ``python -m dcisionai_mcp_server`` to the ``initialize`` and
+``tools/list`` responses.
+
+Usage:
+    python -m benchmarks.bench_startup --runs 5
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Set, Tuple
+
+from .common import percentile, print_table
+
+SERVER_MODULE = "dcisionai_mcp_server"
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+
+INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2024-11-05",
+        "capabilities": {},
+        "clientInfo": {"name": "bench-startup", "version": "1.0.0"},
+    },
+}
+INITIALIZED = {"jsonrpc": "2.0", "method": "notifications/initialized"}
+LIST_TOOLS = {"jsonrpc": "2.0", "id": 2, "method": "tools/list"}
+
+
+def _server_env() -> Dict[str, str]:
+    """Environment for a server subprocess, without gateway credentials."""
+    env = dict(os.environ)
+    env.pop("DCISIONAI_ACCESS_TOKEN", None)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(PACKAGE_ROOT), env.get("PYTHONPATH")]))
+    return env
+
+
+def import_profile(module: str = "dcisionai_mcp_server.mcp_server") -> Tuple[Dict[str, Tuple[int, int]], float]:
+    """
+    Import ``module`` in a fresh interpreter under ``-X importtime``.
+
+    Returns:
+        (module name -> (self us, cumulative us), cumulative seconds of ``module``)
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, env=_server_env(), check=True,
+    )
+    modules: Dict[str, Tuple[int, int]] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        fields = line[len("import time:"):].split("|")
+        try:
+            self_us, cumulative_us = int(fields[0]), int(fields[1])
+        except ValueError:
+            continue  # header line
+        modules[fields[2].strip()] = (self_us, cumulative_us)
+    return modules, modules[module][1] / 1e6
+
+
+def imported_modules(module: str = "dcisionai_mcp_server.mcp_server") -> Set[str]:
+    """Names of every module loaded by importing ``module``."""
+    return set(import_profile(module)[0])
+
+
+def _request(process: subprocess.Popen, message: Dict[str, Any]):
+    process.stdin.write(json.dumps(message) + "\n")
+    process.stdin.flush()
+
+
+def time_to_initialize(module: str = SERVER_MODULE, timeout: float = 30.0) -> Dict[str, Any]:
+    """
+    Spawn the server and time the ``initialize`` and ``tools/list`` responses.
+
+    Returns:
+        Seconds to each response and the number of tools listed
+    """
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", module],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+        text=True, env=_server_env(),
+    )
+    try:
+        _request(process, INITIALIZE)
+        initialize = json.loads(process.stdout.readline())
+        initialized_at = time.perf_counter() - started
+
+        _request(process, INITIALIZED)
+        _request(process, LIST_TOOLS)
+        tools = json.loads(process.stdout.readline())
+        listed_at = time.perf_counter() - started
+    finally:
+        process.stdin.close()
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+    return {
+        "initialize": initialized_at,
+        "tools_list": listed_at,
+        "server_info": initialize["result"]["serverInfo"],
+        "tools": len(tools["result"]["tools"]),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stdio server startup benchmark")
+    parser.add_argument("--runs", type=int, default=5, help="Cold starts to measure")
+    args = parser.parse_args()
+
+    imports: List[float] = []
+    initialize: List[float] = []
+    tools_list: List[float] = []
+    for _ in range(args.runs):
+        imports.append(import_profile()[1])
+        run = time_to_initialize()
+        initialize.append(run["initialize"])
+        tools_list.append(run["tools_list"])
+
+    rows = [
+        {"phase": name, "p50_ms": round(percentile(values, 50) * 1000, 1),
+         "max_ms": round(max(values) * 1000, 1)}
+        for name, values in (
+            ("import mcp_server", imports),
+            ("initialize response", initialize),
+            ("tools/list response", tools_list),
+        )
+    ]
+    print_table(f"Stdio server startup ({args.runs} runs)", rows)
+
+
+if __name__ == "__main__":
+    main()
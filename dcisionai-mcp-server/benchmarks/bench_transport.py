@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Gateway Transport Benchmark
+===========================
+
+Measures p50/p99 latency and requests/sec of tool calls against a local
+stub gateway at 1, 10 and 100 concurrent calls, comparing the pooled
+transport with a fresh client per call.
+
+Usage:
+    python -m benchmarks.bench_transport --requests 500 --latency 0.005
+"""
+
+import argparse
+import asyncio
+
+import httpx
+
+from dcisionai_mcp_server.config import Config
+from dcisionai_mcp_server.tools import DcisionAITools
+from tests.stub_gateway import StubGateway
+from .common import print_table, run_concurrent
+
+CONCURRENCY_LEVELS = (1, 10, 100)
+
+
+async def bench_pooled(config: Config, total: int, concurrency: int):
+    """Tool calls over the shared pooled transport."""
+    async with DcisionAITools(config) as tools:
+        return await run_concurrent(
+            lambda i: tools.classify_intent(f"request {i}"), total, concurrency
+        )
+
+
+async def bench_unpooled(config: Config, total: int, concurrency: int):
+    """Tool calls that open a new client (and connection) every time."""
+    async def call(i: int):
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            await client.post(
+                f"{config.gateway_url}/mcp",
+                headers=config.get_headers(),
+                json={
+                    "jsonrpc": "2.0",
+                    "id": 1,
+                    "method": "tools/call",
+                    "params": {
+                        "name": f"{config.gateway_target}___classify_intent",
+                        "arguments": {"user_input": f"request {i}"},
+                    },
+                },
+            )
+
+    return await run_concurrent(call, total, concurrency)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Gateway transport benchmark")
+    parser.add_argument("--requests", type=int, default=500, help="Calls per run")
+    parser.add_argument("--latency", type=float, default=0.005,
+                        help="Stub gateway latency in seconds")
+    args = parser.parse_args()
+
+    async with StubGateway(latency=args.latency) as gateway:
+        config = Config(
+            gateway_url=gateway.url,
+            gateway_target="bench-target",
+            access_token="bench-token",
+            rate_limit_enabled=False,
+        )
+        rows = []
+        for concurrency in CONCURRENCY_LEVELS:
+            for mode, bench in (("pooled", bench_pooled), ("unpooled", bench_unpooled)):
+                result = await bench(config, args.requests, concurrency)
+                rows.append({"mode": mode, "concurrency": concurrency, **result})
+
+    print_table("Gateway transport", rows)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
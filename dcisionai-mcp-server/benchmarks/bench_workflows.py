@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Workflow Search Benchmark
+=========================
+
+Builds a synthetic catalog of customer templates, loads it from a JSON
+file and measures load/index time and p50/p99 search latency of the
+indexed ``WorkflowManager`` against the previous linear substring scan.
+
+Usage:
+    python -m benchmarks.bench_workflows --templates 10000 --queries 500
+"""
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from dcisionai_mcp_server.workflows import WorkflowManager
+from .common import percentile, print_table
+
+INDUSTRIES = (
+    "manufacturing", "healthcare", "retail", "marketing",
+    "financial", "logistics", "energy", "agriculture", "telecom", "public_sector",
+)
+SUBJECTS = (
+    "production", "inventory", "staffing", "routing", "pricing", "portfolio",
+    "maintenance", "scheduling", "warehouse", "fleet", "capacity", "demand",
+    "procurement", "grid", "budget", "shift", "crop", "network", "supplier", "risk",
+)
+GOALS = ("optimization", "planning", "allocation", "forecasting", "balancing", "design")
+QUALIFIERS = (
+    "multi-site", "seasonal", "regional", "weekly", "stochastic", "robust",
+    "emergency", "cross-dock", "last-mile", "long-horizon",
+)
+VERBS = ("minimize", "maximize", "balance", "reduce", "improve", "allocate")
+OBJECTS = (
+    "costs", "service levels", "utilization", "lead times", "emissions",
+    "overtime", "throughput", "waste", "revenue", "risk exposure",
+)
+
+
+def synthetic_catalog(size: int, seed: int = 7) -> List[Dict[str, Any]]:
+    """``size`` customer templates in the list file format."""
+    rng = random.Random(seed)
+    templates = []
+    for i in range(size):
+        subject, goal = rng.choice(SUBJECTS), rng.choice(GOALS)
+        qualifier = rng.choice(QUALIFIERS)
+        templates.append({
+            "industry": rng.choice(INDUSTRIES),
+            "id": f"{subject}_{goal}_{i}",
+            "title": f"{qualifier.title()} {subject.title()} {goal.title()}",
+            "description": (
+                f"{rng.choice(VERBS).title()} {rng.choice(OBJECTS)} and "
+                f"{rng.choice(VERBS)} {rng.choice(OBJECTS)} for {qualifier} {subject} {goal}"
+            ),
+            "difficulty": rng.choice(("basic", "intermediate", "advanced")),
+            "estimated_time": f"{rng.randint(5, 30)}-{rng.randint(31, 60)} minutes",
+        })
+    return templates
+
+
+def linear_search(manager: WorkflowManager, query: str) -> List[Dict[str, Any]]:
+    """The substring scan ``search_workflows`` used before indexing."""
+    results = []
+    query_lower = query.lower()
+    for industry, workflows in manager.workflows.items():
+        for workflow_id, workflow in workflows.items():
+            if (query_lower in workflow["name"].lower() or
+                    query_lower in workflow["description"].lower()):
+                results.append({
+                    "industry": industry,
+                    "workflow_id": workflow_id,
+                    "name": workflow["name"],
+                    "description": workflow["description"],
+                    "complexity": workflow["complexity"]
+                })
+    return results
+
+
+def query_sets(rng: random.Random, count: int) -> Dict[str, List[str]]:
+    """Exact, prefix, typo and multi-word queries."""
+    def typo(word: str) -> str:
+        i = rng.randrange(1, len(word) - 1)
+        return word[:i] + word[i + 1] + word[i] + word[i + 2:]
+
+    return {
+        "exact": [rng.choice(SUBJECTS) for _ in range(count)],
+        "prefix": [rng.choice(SUBJECTS)[:4] for _ in range(count)],
+        "typo": [typo(rng.choice(SUBJECTS)) for _ in range(count)],
+        "multi-word": [f"{rng.choice(QUALIFIERS)} {rng.choice(SUBJECTS)}" for _ in range(count)],
+    }
+
+
+def time_queries(search: Callable[[str], Any], queries: List[str]) -> List[float]:
+    latencies = []
+    for query in queries:
+        started = time.perf_counter()
+        search(query)
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Workflow search benchmark")
+    parser.add_argument("--templates", type=int, default=10_000, help="Synthetic templates")
+    parser.add_argument("--queries", type=int, default=500, help="Queries per kind")
+    parser.add_argument("--limit", type=int, default=20, help="Results per indexed search")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "catalog.json"
+        path.write_text(json.dumps(synthetic_catalog(args.templates)))
+
+        started = time.perf_counter()
+        manager = WorkflowManager(template_paths=[path])
+        load_time = time.perf_counter() - started
+
+    total = manager.get_workflow_statistics()["total_workflows"]
+    print(f"Loaded and indexed {total} workflows "
+          f"({manager.index.vocabulary_size} terms) in {load_time * 1000:.0f} ms")
+
+    rng = random.Random(11)
+
+    def cold_search(query: str):
+        manager.index.clear_cache()
+        return manager.search_workflows(query, args.limit)
+
+    rows = []
+    for kind, queries in query_sets(rng, args.queries).items():
+        runs = {
+            "indexed (cold)": time_queries(cold_search, queries),
+            "indexed (memoized)": time_queries(lambda q: manager.search_workflows(q, args.limit), queries),
+        }
+        if kind == "exact":
+            runs["linear scan"] = time_queries(lambda q: linear_search(manager, q), queries)
+        for name, latencies in runs.items():
+            rows.append({
+                "query": kind,
+                "search": name,
+                "p50_us": round(percentile(latencies, 50) * 1e6, 1),
+                "p99_us": round(percentile(latencies, 99) * 1e6, 1),
+            })
+    print_table(f"Workflow search ({args.queries} queries per kind)", rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark Helpers
+=================
+
+Shared timing and reporting helpers for the benchmark scripts.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+# Per-request client logging would dominate benchmark output
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def summarize(latencies: List[float], elapsed: float) -> Dict[str, Any]:
+    """Summarize per-call latencies (seconds) into a report row."""
+    return {
+        "requests": len(latencies),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "requests_per_sec": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+    }
+
+
+async def run_concurrent(call: Callable[[int], Awaitable[Any]], total: int,
+                         concurrency: int) -> Dict[str, Any]:
+    """Run ``total`` calls with at most ``concurrency`` in flight."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+
+    async def timed(i: int):
+        async with semaphore:
+            start = time.perf_counter()
+            await call(i)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(timed(i) for i in range(total)))
+    return summarize(latencies, time.perf_counter() - start)
+
+
+def print_table(title: str, rows: List[Dict[str, Any]]):
+    """Print report rows as an aligned table."""
+    print(title)
+    print("=" * len(title))
+    if not rows:
+        return
+    columns = list(rows[0].keys())
+    widths = {c: max(len(c), *(len(str(r[c])) for r in rows)) for c in columns}
+    print("  ".join(c.ljust(widths[c]) for c in columns))
+    for row in rows:
+        print("  ".join(str(row[c]).ljust(widths[c]) for c in columns))
+    print()
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Recorded Gateway
+================
+
+Record and replay of gateway responses for offline benchmarks.
+A recording holds, per tool, the latencies and result payloads of real
+calls captured once. ``ReplayGateway`` answers tool calls with those
+payloads after those latencies, cycling through the samples in a fixed
+order, so every run sees the same latency distribution and payload sizes.
+``GatewayProcess`` serves a replay from a child process, keeping the
+gateway's CPU time and allocations out of the measured client process.
+"""
+
+import asyncio
+import json
+import multiprocessing
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+from tests.stub_gateway import StubGateway
+
+RECORDING_VERSION = 1
+
+# Recording shipped with the benchmarks
+DEFAULT_RECORDING = Path(__file__).parent / "recordings" / "gateway.json"
+
+
+class Recording:
+    """
+    Latencies and result payloads of recorded tool calls.
+
+    Args:
+        tools: Tool name -> ``{"latencies": [...], "results": [...]}``
+        source: Where the calls were recorded (gateway URL or backend)
+    """
+
+    def __init__(self, tools: Optional[Dict[str, Dict[str, List[Any]]]] = None, source: str = ""):
+        self.tools: Dict[str, Dict[str, List[Any]]] = tools or {}
+        self.source = source
+
+    @classmethod
+    def load(cls, path: Union[str, Path] = DEFAULT_RECORDING) -> "Recording":
+        """Read a recording file."""
+        with open(path, "r") as f:
+            data = json.load(f)
+        if data.get("version") != RECORDING_VERSION:
+            raise ValueError(f"Unsupported recording version in {path}: {data.get('version')}")
+        recording = cls(data["tools"], data.get("source", ""))
+        for tool, samples in recording.tools.items():
+            if not samples["results"] or len(samples["latencies"]) != len(samples["results"]):
+                raise ValueError(f"Recording of {tool} needs one latency per result")
+        return recording
+
+    def save(self, path: Union[str, Path]):
+        """Write the recording as JSON."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump({"version": RECORDING_VERSION, "source": self.source, "tools": self.tools},
+                      f, sort_keys=True)
+            f.write("\n")
+
+    def add(self, tool: str, latency: float, result: Any):
+        """Record one successful call."""
+        samples = self.tools.setdefault(tool, {"latencies": [], "results": []})
+        samples["latencies"].append(round(latency, 6))
+        samples["results"].append(result)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Samples, mean latency and mean payload size per tool."""
+        rows = {}
+        for tool, samples in sorted(self.tools.items()):
+            sizes = [len(json.dumps(result)) for result in samples["results"]]
+            rows[tool] = {
+                "samples": len(sizes),
+                "mean_latency_ms": round(sum(samples["latencies"]) / len(sizes) * 1000, 3),
+                "mean_payload_bytes": sum(sizes) // len(sizes),
+            }
+        return rows
+
+
+Dispatch = Callable[[str, Dict[str, Any]], Awaitable[Tuple[Dict[str, Any], bool]]]
+
+
+def recording_dispatch(dispatch: Dispatch, recording: Recording) -> Dispatch:
+    """
+    Wrap ``DcisionAITools._dispatch`` to record every successful call.
+
+    Use as ``tools._dispatch = recording_dispatch(tools._dispatch, recording)``.
+    """
+    async def record(tool: str, payload: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+        start = time.perf_counter()
+        body, cacheable = await dispatch(tool, payload)
+        if "result" in body:
+            recording.add(tool, time.perf_counter() - start, body["result"])
+        return body, cacheable
+
+    return record
+
+
+class ReplayGateway(StubGateway):
+    """
+    Stub gateway answering from a recording.
+
+    The n-th call of a tool gets its (n mod samples)-th recorded result;
+    the request waits for the recorded latency of that sample times
+    ``latency_scale``, and a batch for its slowest call.
+
+    Args:
+        recording: Recorded calls to replay
+        latency_scale: Factor applied to recorded latencies; 0 answers at once
+    """
+
+    def __init__(self, recording: Recording, latency_scale: float = 1.0, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.recording = recording
+        self.latency_scale = latency_scale
+        self.replayed: Counter = Counter()
+        self._indices: Dict[int, int] = {}
+
+    def request_latency(self, body: Any) -> float:
+        messages = body if isinstance(body, list) else [body]
+        latency = 0.0
+        for message in messages:
+            tool = message["params"]["name"].split("___", 1)[-1]
+            samples = self.recording.tools.get(tool)
+            if samples is None:
+                continue
+            index = self.replayed[tool] % len(samples["results"])
+            self.replayed[tool] += 1
+            # Remembered so the answer uses the same sample as the delay
+            self._indices[id(message)] = index
+            latency = max(latency, samples["latencies"][index])
+        return latency * self.latency_scale
+
+    def _answer(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        tool = message["params"]["name"].split("___", 1)[-1]
+        index = self._indices.pop(id(message), None)
+        if index is None or tool in self.failing_tools:
+            return super()._answer(message)
+        self.calls.append(tool)
+        return {
+            "jsonrpc": "2.0",
+            "id": message.get("id"),
+            "result": self.recording.tools[tool]["results"][index],
+        }
+
+
+def _serve(path: str, latency_scale: float, connection):
+    """Child process: serve a replay until told to stop."""
+    async def serve():
+        async with ReplayGateway(Recording.load(path), latency_scale) as gateway:
+            connection.send(gateway.url)
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, connection.recv)
+            connection.send({"posts": gateway.posts, "calls": dict(Counter(gateway.calls))})
+
+    asyncio.run(serve())
+
+
+class GatewayProcess:
+    """
+    Replay gateway running in a child process.
+
+    Usage::
+
+        with GatewayProcess(path, latency_scale=0.5) as gateway:
+            config = Config(gateway_url=gateway.url, ...)
+        gateway.stats  # requests served
+
+    Args:
+        path: Recording file
+        latency_scale: Factor applied to recorded latencies
+    """
+
+    def __init__(self, path: Union[str, Path] = DEFAULT_RECORDING, latency_scale: float = 1.0):
+        self.path = str(path)
+        self.latency_scale = latency_scale
+        self.url = ""
+        self.stats: Dict[str, Any] = {}
+        self._process: Optional[multiprocessing.process.BaseProcess] = None
+        self._connection = None
+
+    def __enter__(self) -> "GatewayProcess":
+        context = multiprocessing.get_context("spawn")
+        self._connection, child = context.Pipe()
+        self._process = context.Process(
+            target=_serve, args=(self.path, self.latency_scale, child), daemon=True
+        )
+        self._process.start()
+        if not self._connection.poll(30):
+            self._process.kill()
+            raise RuntimeError("Replay gateway did not start")
+        self.url = self._connection.recv()
+        return self
+
+    def __exit__(self, *exc_info):
+        try:
+            self._connection.send("stop")
+            if self._connection.poll(10):
+                self.stats = self._connection.recv()
+        finally:
+            self._process.join(10)
+            if self._process.is_alive():
+                self._process.kill()
+            self._connection.close()
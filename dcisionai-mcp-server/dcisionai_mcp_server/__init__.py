@@ -24,17 +24,22 @@ __author__ = "DcisionAI Team"
 __email__ = "team@dcisionai.com"
 __description__ = "AI-powered business optimization MCP server"
 
-from .server import DcisionAIMCPServer
-from .tools import (
-    classify_intent,
-    analyze_data,
-    build_model,
-    solve_optimization,
-    get_workflow_templates,
-    execute_workflow,
-)
-from .workflows import WorkflowManager
-from .config import Config
+import importlib
+
+# Public names and the submodules defining them. They are imported on first
+# access so that starting the stdio server does not load FastMCP, the HTTP
+# client or the configuration.
+_EXPORTS = {
+    "DcisionAIMCPServer": ".server",
+    "classify_intent": ".tools",
+    "analyze_data": ".tools",
+    "build_model": ".tools",
+    "solve_optimization": ".tools",
+    "get_workflow_templates": ".tools",
+    "execute_workflow": ".tools",
+    "WorkflowManager": ".workflows",
+    "Config": ".config",
+}
 
 __all__ = [
     "DcisionAIMCPServer",
@@ -47,3 +52,14 @@ __all__ = [
     "WorkflowManager",
     "Config",
 ]
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+DcisionAI Artifact Store
+========================
+
+Content-addressed store of large tool outputs such as model specifications.
+``build_model`` saves its specification here and returns a handle, and
+``solve_optimization`` accepts that handle in place of the specification,
+so MCP clients do not send the whole model back with every solve.
+Artifacts are kept in memory, in a directory of JSON files or in a SQLite
+database (a local stand-in for object storage); the least recently used
+ones are evicted once the store is full.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .cache import default_cache_dir
+from .codec import EncodedJSON, get_codec
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_BACKENDS = ("memory", "disk", "sqlite")
+
+HANDLE_PREFIX = "artifact:"
+
+# Decoded artifacts kept in memory in front of a persistent store
+HOT_ENTRIES = 16
+
+SQLITE_FILE_NAME = "artifacts.sqlite3"
+
+
+class ArtifactNotFoundError(KeyError):
+    """Raised for a handle the store does not hold (any more)."""
+
+    def __init__(self, handle: str):
+        self.handle = handle
+        super().__init__(handle)
+
+    def __str__(self) -> str:
+        return f"Unknown or expired artifact handle: {self.handle}"
+
+
+def is_handle(value: Any) -> bool:
+    """Whether a tool argument is an artifact handle."""
+    return isinstance(value, str) and value.startswith(HANDLE_PREFIX)
+
+
+class ArtifactStore:
+    """
+    In-memory artifact store, and base class of the persistent stores.
+
+    A handle is the SHA-256 of the artifact's JSON encoding, so storing
+    the same specification twice returns the same handle. Artifacts are
+    kept as ``EncodedJSON`` and their stored bytes are reused when they
+    are sent to the gateway.
+
+    Args:
+        max_entries: Maximum number of artifacts before LRU eviction
+    """
+
+    backend = "memory"
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self.hot_entries = max_entries
+        self.codec = get_codec()
+        self._hot: "OrderedDict[str, EncodedJSON]" = OrderedDict()
+        self.puts = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def from_config(cls, config) -> Optional["ArtifactStore"]:
+        """Build the store described by a ``Config``; None if disabled."""
+        if config.artifact_store == "none":
+            return None
+        if config.artifact_store == "memory":
+            return cls(config.artifact_max_entries)
+        path = Path(config.artifact_dir).expanduser() if config.artifact_dir else default_cache_dir() / "artifacts"
+        if config.artifact_store == "sqlite":
+            return SQLiteArtifactStore(path / SQLITE_FILE_NAME, config.artifact_max_entries)
+        return DiskArtifactStore(path, config.artifact_max_entries)
+
+    def put(self, value: Dict[str, Any]) -> str:
+        """Store a JSON object and return its handle."""
+        if not isinstance(value, EncodedJSON):
+            value = EncodedJSON(value)
+        content = value.encoded(self.codec)
+        digest = hashlib.sha256(content).hexdigest()
+        self.puts += 1
+        try:
+            if digest in self._hot:
+                self._touch(digest)
+            else:
+                self._write(digest, content)
+        except (OSError, sqlite3.Error) as e:
+            # The handle still works while the artifact is held in memory
+            logger.warning(f"Could not persist artifact {digest[:12]}: {e}")
+        self._remember(digest, value)
+        return HANDLE_PREFIX + digest
+
+    def get(self, handle: str) -> EncodedJSON:
+        """
+        Look up an artifact by handle.
+
+        Raises:
+            ArtifactNotFoundError: If the handle is unknown or was evicted
+        """
+        digest = handle[len(HANDLE_PREFIX):] if is_handle(handle) else ""
+        value = self._hot.get(digest)
+        content = None
+        try:
+            if value is not None:
+                self._touch(digest)
+            elif digest:
+                content = self._read(digest)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Could not read artifact {digest[:12]}: {e}")
+        if content is not None:
+            value = EncodedJSON.decode(self.codec, content)
+            self._remember(digest, value)
+        if value is None:
+            self.misses += 1
+            raise ArtifactNotFoundError(handle)
+        self._hot.move_to_end(digest)
+        self.hits += 1
+        return value
+
+    def resolve(self, value: Any) -> Any:
+        """The stored artifact if ``value`` is a handle, else ``value`` itself."""
+        return self.get(value) if is_handle(value) else value
+
+    def _remember(self, digest: str, value: EncodedJSON):
+        self._hot[digest] = value
+        self._hot.move_to_end(digest)
+        while len(self._hot) > self.hot_entries:
+            self._hot.popitem(last=False)
+            if self.backend == "memory":
+                self.evictions += 1
+
+    # Persistence hooks; the memory store keeps nothing beyond ``_hot``
+
+    def _read(self, digest: str) -> Optional[bytes]:
+        return None
+
+    def _touch(self, digest: str):
+        pass
+
+    def _write(self, digest: str, content: bytes):
+        pass
+
+    def __len__(self) -> int:
+        return len(self._hot)
+
+    def stats(self) -> Dict[str, Any]:
+        """Size of the store and lookup counters."""
+        lookups = self.hits + self.misses
+        return {
+            "backend": self.backend,
+            "entries": len(self),
+            "max_entries": self.max_entries,
+            "puts": self.puts,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+        }
+
+    def close(self):
+        """Release resources held by the store."""
+
+
+class DiskArtifactStore(ArtifactStore):
+    """
+    Artifacts as one JSON file each in a directory.
+
+    File modification times record use, so eviction removes the files
+    used least recently.
+    """
+
+    backend = "disk"
+
+    def __init__(self, path: Path, max_entries: int = 256):
+        super().__init__(max_entries)
+        self.hot_entries = min(HOT_ENTRIES, max_entries)
+        self.path = Path(path)
+
+    def _file(self, digest: str) -> Path:
+        return self.path / f"{digest}.json"
+
+    def _read(self, digest: str) -> Optional[bytes]:
+        try:
+            content = self._file(digest).read_bytes()
+        except FileNotFoundError:
+            return None
+        self._touch(digest)
+        return content
+
+    def _touch(self, digest: str):
+        # Explicit times: file system clocks are too coarse to order quick uses
+        now = time.time_ns()
+        try:
+            os.utime(self._file(digest), ns=(now, now))
+        except FileNotFoundError:
+            pass
+
+    def _write(self, digest: str, content: bytes):
+        target = self._file(digest)
+        if not target.exists():
+            self.path.mkdir(parents=True, exist_ok=True)
+            tmp = target.with_suffix(".tmp")
+            tmp.write_bytes(content)
+            os.replace(tmp, target)
+        self._touch(digest)
+        self._evict()
+
+    def _evict(self):
+        files = sorted(self.path.glob("*.json"), key=lambda f: f.stat().st_mtime_ns)
+        for stale in files[:max(0, len(files) - self.max_entries)]:
+            stale.unlink()
+            self._hot.pop(stale.stem, None)
+            self.evictions += 1
+
+    def __len__(self) -> int:
+        return len(list(self.path.glob("*.json"))) if self.path.exists() else 0
+
+
+class SQLiteArtifactStore(ArtifactStore):
+    """Artifacts as rows of a SQLite database, with their last use time."""
+
+    backend = "sqlite"
+
+    def __init__(self, path: Path, max_entries: int = 256):
+        super().__init__(max_entries)
+        self.hot_entries = min(HOT_ENTRIES, max_entries)
+        self.path = Path(path)
+        self._db: Optional[sqlite3.Connection] = None
+
+    @property
+    def db(self) -> sqlite3.Connection:
+        """Connection to the database, opened and created on first use."""
+        if self._db is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS artifacts ("
+                "digest TEXT PRIMARY KEY, content BLOB NOT NULL, used_at REAL NOT NULL)"
+            )
+        return self._db
+
+    def _read(self, digest: str) -> Optional[bytes]:
+        row = self.db.execute(
+            "SELECT content FROM artifacts WHERE digest = ?", (digest,)
+        ).fetchone()
+        if row is None:
+            return None
+        self._touch(digest)
+        return row[0]
+
+    def _touch(self, digest: str):
+        with self.db:
+            self.db.execute(
+                "UPDATE artifacts SET used_at = ? WHERE digest = ?", (time.time(), digest)
+            )
+
+    def _write(self, digest: str, content: bytes):
+        with self.db:
+            self.db.execute(
+                "INSERT INTO artifacts (digest, content, used_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(digest) DO UPDATE SET used_at = excluded.used_at",
+                (digest, content, time.time())
+            )
+            stale = self.db.execute(
+                "SELECT digest FROM artifacts ORDER BY used_at DESC LIMIT -1 OFFSET ?",
+                (self.max_entries,)
+            ).fetchall()
+            self.db.executemany("DELETE FROM artifacts WHERE digest = ?", stale)
+        for (digest,) in stale:
+            self._hot.pop(digest, None)
+        self.evictions += len(stale)
+
+    def __len__(self) -> int:
+        return self.db.execute("SELECT COUNT(*) FROM artifacts").fetchone()[0]
+
+    def close(self):
+        """Close the database connection."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
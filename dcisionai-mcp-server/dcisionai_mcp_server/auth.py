@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+DcisionAI Gateway Authentication
+================================
+
+Access tokens for the AgentCore Gateway from an OAuth2 client-credentials
+endpoint (the Cognito app client the gateway is configured with).
+Tokens are refreshed on a background task well before they expire, so
+tool calls only ever wait for a token when none is valid at all;
+concurrent refreshes are coalesced into one token request.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Callable, Optional
+
+import httpx
+
+from .config import Config
+
+logger = logging.getLogger(__name__)
+
+# Delay before retrying a failed background refresh
+REFRESH_RETRY_MIN = 1.0
+REFRESH_RETRY_MAX = 30.0
+
+
+class TokenError(Exception):
+    """Raised when no valid access token can be obtained."""
+
+
+class TokenProvider:
+    """
+    Keeps a valid gateway access token, refreshing it in the background.
+
+    A refresh is scheduled ``token_refresh_margin`` seconds before expiry
+    (at half the lifetime for tokens shorter than twice the margin). New
+    tokens are handed to ``on_token`` so the caller can swap its headers in
+    one assignment; requests already sent keep the token they were built
+    with. A failed background refresh keeps the current token and is
+    retried with backoff until it expires.
+    """
+
+    def __init__(self, config: Config, on_token: Optional[Callable[[str], None]] = None):
+        self.config = config
+        self.on_token = on_token
+        self.token: Optional[str] = None
+        self.expires_at: Optional[float] = None
+        self.refreshes = 0
+        self._refreshing: Optional[asyncio.Future] = None
+        self._task: Optional[asyncio.Task] = None
+        self._client = httpx.AsyncClient(timeout=config.connection_timeout)
+
+    @classmethod
+    def from_config(cls, config: Config,
+                    on_token: Optional[Callable[[str], None]] = None) -> Optional["TokenProvider"]:
+        """A provider if a token endpoint is configured, else None (static token)."""
+        if not config.token_endpoint:
+            return None
+        return cls(config, on_token)
+
+    def valid(self) -> bool:
+        """Whether the current token can still be sent."""
+        return self.token is not None and (
+            self.expires_at is None or time.monotonic() < self.expires_at
+        )
+
+    async def ready(self) -> str:
+        """
+        The current token, fetching one only if none is valid.
+
+        Also starts the background refresh task on first use.
+
+        Raises:
+            TokenError: If no token is held and the endpoint fails
+        """
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._refresh_loop())
+        if self.valid():
+            return self.token
+        return await self.refresh()
+
+    async def refresh(self, stale: Optional[str] = None) -> str:
+        """
+        Fetch a new token, sharing one request among concurrent callers.
+
+        Args:
+            stale: Token the caller found rejected; if another caller has
+                already replaced it, the current token is returned at once
+
+        Raises:
+            TokenError: If the token endpoint fails
+        """
+        if stale is not None and self.token != stale and self.valid():
+            return self.token
+        if self._refreshing is None:
+            self._refreshing = asyncio.ensure_future(self._fetch())
+            self._refreshing.add_done_callback(self._refresh_done)
+        # Shielded so a cancelled caller does not cancel everyone's refresh
+        return await asyncio.shield(self._refreshing)
+
+    def _refresh_done(self, future: asyncio.Future):
+        self._refreshing = None
+        if not future.cancelled():
+            # Retrieve the exception so an unawaited failure is not logged
+            future.exception()
+
+    async def _fetch(self) -> str:
+        """Request a token with the client-credentials grant."""
+        data = {"grant_type": "client_credentials"}
+        if self.config.token_scope:
+            data["scope"] = self.config.token_scope
+        try:
+            response = await self._client.post(
+                self.config.token_endpoint,
+                data=data,
+                auth=(self.config.client_id, self.config.client_secret),
+            )
+            response.raise_for_status()
+            body = response.json()
+            token = body["access_token"]
+        except (httpx.HTTPError, ValueError, KeyError) as e:
+            raise TokenError(f"Token request failed: {e}") from e
+
+        expires_in = body.get("expires_in")
+        self.token = token
+        self.expires_at = time.monotonic() + float(expires_in) if expires_in else None
+        self.refreshes += 1
+        if self.on_token is not None:
+            self.on_token(token)
+        logger.info(f"Refreshed gateway access token (expires in {expires_in or 'unknown'}s)")
+        return token
+
+    def _refresh_delay(self) -> Optional[float]:
+        """Seconds until the next proactive refresh, or None if the token does not expire."""
+        if self.token is None:
+            return 0.0
+        if self.expires_at is None:
+            return None
+        remaining = self.expires_at - time.monotonic()
+        return max(0.0, min(remaining - self.config.token_refresh_margin, remaining / 2))
+
+    async def _refresh_loop(self):
+        retry = REFRESH_RETRY_MIN
+        while True:
+            delay = self._refresh_delay()
+            if delay is None:
+                return
+            await asyncio.sleep(delay)
+            try:
+                await self.refresh()
+                retry = REFRESH_RETRY_MIN
+            except TokenError as e:
+                remaining = self.expires_at - time.monotonic() if self.expires_at else 0.0
+                wait = max(0.05, min(retry, remaining / 2)) if remaining > 0 else retry
+                logger.warning(f"Background token refresh failed ({e}), retrying in {wait:.1f}s")
+                await asyncio.sleep(wait)
+                retry = min(retry * 2, REFRESH_RETRY_MAX)
+
+    async def aclose(self):
+        """Stop refreshing and close the token client."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._client.aclose()
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+DcisionAI Batch Execution
+=========================
+
+Runs many workflows from a JSONL or CSV file in one process.
+All workflows share one ``DcisionAITools`` instance, and so one pooled
+gateway client, with a bounded number in flight. Results are handed to a
+callback as each workflow completes, and the run ends with a throughput
+and latency summary.
+"""
+
+import asyncio
+import csv
+import json
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Iterable, List, Optional, TextIO
+
+if TYPE_CHECKING:
+    from .tools import DcisionAITools
+
+# Columns of a batch file that are not workflow parameters
+BATCH_FIELDS = ("id", "industry", "workflow_id", "parameters")
+
+# Async callback receiving one result record per completed workflow
+ResultCallback = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+def _csv_value(value: str) -> Any:
+    """Numbers, booleans and JSON in CSV cells become typed values."""
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+def _batch_item(line: int, record: Dict[str, Any]) -> Dict[str, Any]:
+    if not isinstance(record, dict):
+        raise ValueError(f"Line {line}: expected an object")
+    if not record.get("industry") or not record.get("workflow_id"):
+        raise ValueError(f"Line {line}: industry and workflow_id are required")
+    parameters = record.get("parameters") or {}
+    if isinstance(parameters, str):
+        parameters = json.loads(parameters)
+    if not isinstance(parameters, dict):
+        raise ValueError(f"Line {line}: parameters must be an object")
+    return {
+        "id": str(record.get("id") or line),
+        "industry": record["industry"],
+        "workflow_id": record["workflow_id"],
+        "parameters": parameters,
+    }
+
+
+def parse_jsonl(lines: Iterable[str]) -> List[Dict[str, Any]]:
+    """Batch items from JSON lines; blank lines and ``#`` comments are skipped."""
+    items = []
+    for line, text in enumerate(lines, 1):
+        text = text.strip()
+        if not text or text.startswith("#"):
+            continue
+        try:
+            record = json.loads(text)
+        except ValueError as e:
+            raise ValueError(f"Line {line}: invalid JSON: {e}") from e
+        items.append(_batch_item(line, record))
+    return items
+
+
+def parse_csv(lines: Iterable[str]) -> List[Dict[str, Any]]:
+    """
+    Batch items from CSV with ``industry`` and ``workflow_id`` columns.
+
+    An optional ``parameters`` column holds a JSON object; any other column
+    becomes a workflow parameter of the same name.
+    """
+    items = []
+    for line, row in enumerate(csv.DictReader(lines), 2):
+        parameters = _csv_value(row.get("parameters") or "{}")
+        if isinstance(parameters, dict):
+            parameters.update({
+                key: _csv_value(value) for key, value in row.items()
+                if key not in BATCH_FIELDS and value not in (None, "")
+            })
+        items.append(_batch_item(line, dict(row, parameters=parameters)))
+    return items
+
+
+def read_batch(path: str) -> List[Dict[str, Any]]:
+    """
+    Read a batch file; ``.csv`` files are CSV, anything else is JSONL.
+
+    ``-`` reads JSONL from standard input.
+
+    Raises:
+        ValueError: If a line is malformed or lacks industry/workflow_id
+    """
+    if path == "-":
+        return parse_jsonl(sys.stdin)
+    with open(path, "r", newline="") as f:
+        if Path(path).suffix.lower() == ".csv":
+            return parse_csv(f)
+        return parse_jsonl(f)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100.0 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def summarize(records: List[Dict[str, Any]], elapsed: float) -> Dict[str, Any]:
+    """Throughput and latency percentiles of a completed batch."""
+    latencies = [r["latency"] for r in records]
+    succeeded = sum(1 for r in records if r["status"] == "success")
+    return {
+        "workflows": len(records),
+        "succeeded": succeeded,
+        "failed": len(records) - succeeded,
+        "elapsed": round(elapsed, 3),
+        "workflows_per_sec": round(len(records) / elapsed, 2) if elapsed else 0.0,
+        "latency_p50": round(percentile(latencies, 50), 3),
+        "latency_p90": round(percentile(latencies, 90), 3),
+        "latency_p99": round(percentile(latencies, 99), 3),
+        "latency_max": round(max(latencies), 3) if latencies else 0.0,
+    }
+
+
+async def run_batch(
+    tools: "DcisionAITools",
+    items: List[Dict[str, Any]],
+    concurrency: int,
+    on_result: Optional[ResultCallback] = None
+) -> Dict[str, Any]:
+    """
+    Execute batch items with at most ``concurrency`` workflows in flight.
+
+    Each item runs under its own checkpoint (``batch/<id>``), so identical
+    workflows with different parameters do not share stage results.
+
+    Args:
+        tools: Shared tools instance
+        items: Items from ``read_batch``
+        concurrency: Maximum workflows running at once
+        on_result: Callback receiving a result record as each workflow
+            completes, in completion order
+
+    Returns:
+        Summary from ``summarize``
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    records: List[Dict[str, Any]] = []
+
+    async def execute(item: Dict[str, Any]):
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                result = await tools.execute_workflow(
+                    item["industry"], item["workflow_id"], item["parameters"],
+                    run_id=f"batch/{item['id']}"
+                )
+            except Exception as e:
+                result = {"status": "error", "error": str(e)}
+            record = {
+                "id": item["id"],
+                "industry": item["industry"],
+                "workflow_id": item["workflow_id"],
+                "status": result.get("status", "error"),
+                "latency": round(time.perf_counter() - started, 4),
+                "result": result,
+            }
+        records.append(record)
+        if on_result is not None:
+            await on_result(record)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(execute(item) for item in items))
+    return summarize(records, time.perf_counter() - started)
+
+
+def jsonl_writer(stream: TextIO) -> ResultCallback:
+    """Result callback writing one JSON line per record and flushing it."""
+    async def write(record: Dict[str, Any]):
+        stream.write(json.dumps(record, default=str) + "\n")
+        stream.flush()
+
+    return write
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+DcisionAI Response Cache
+========================
+
+Content-addressed cache for gateway tool responses.
+Entries are keyed on the tool name, the canonicalized tool arguments and
+the gateway target, expire after a TTL and are evicted least-recently-used
+once the cache is full. The cache can optionally persist to disk so hit
+counts and entries survive across short-lived CLI and IDE processes.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from .codec import EncodedJSON, get_codec
+
+logger = logging.getLogger(__name__)
+
+# Arguments that change on every call and must not affect the cache key
+VOLATILE_ARGUMENTS = ("timestamp",)
+
+CACHE_FILE_NAME = "responses.json"
+
+
+def default_cache_dir() -> Path:
+    """Per-user cache directory for the DcisionAI MCP server."""
+    base = os.getenv("XDG_CACHE_HOME") or os.path.join(Path.home(), ".cache")
+    return Path(base) / "dcisionai-mcp-server"
+
+
+def canonicalize(arguments: Dict[str, Any]) -> str:
+    """
+    Serialize tool arguments deterministically, ignoring volatile fields.
+
+    ``EncodedJSON`` arguments, such as large model specifications, stand
+    in as a digest of their cached encoding instead of being serialized
+    again.
+    """
+    stable = {
+        k: {"sha256": hashlib.sha256(v.encoded(get_codec())).hexdigest()} if isinstance(v, EncodedJSON) else v
+        for k, v in arguments.items() if k not in VOLATILE_ARGUMENTS
+    }
+    return json.dumps(stable, sort_keys=True, separators=(",", ":"), default=str)
+
+
+class ResponseCache:
+    """
+    TTL + LRU cache of gateway responses for opted-in tools.
+
+    Args:
+        tools: Tool names whose responses may be cached
+        ttl: Seconds an entry stays valid
+        max_entries: Maximum number of entries before LRU eviction
+        path: Optional file to persist entries and counters to
+    """
+
+    def __init__(self, tools: Iterable[str], ttl: float = 3600,
+                 max_entries: int = 1024, path: Optional[Path] = None):
+        self.tools = set(tools)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.path = Path(path) if path else None
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._dirty = False
+
+        if self.path:
+            self.load()
+
+    @classmethod
+    def from_config(cls, config) -> "ResponseCache":
+        """Build the cache described by a ``Config``."""
+        path = None
+        if config.cache_persist:
+            cache_dir = Path(config.cache_dir) if config.cache_dir else default_cache_dir()
+            path = cache_dir / CACHE_FILE_NAME
+        tools = config.cache_tools if config.cache_enabled else ()
+        return cls(tools, ttl=config.cache_ttl, max_entries=config.cache_max_entries, path=path)
+
+    def enabled_for(self, tool: str) -> bool:
+        """Whether responses of ``tool`` may be cached."""
+        return tool in self.tools
+
+    def key(self, tool: str, arguments: Dict[str, Any], target: str) -> str:
+        """Content hash identifying a tool call."""
+        material = f"{target}\x00{tool}\x00{canonicalize(arguments)}"
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Return a copy of a cached response, or ``None`` on a miss or
+        expired entry. Callers may modify the copy freely.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        if entry["expires_at"] <= time.time():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            self._dirty = True
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return copy.deepcopy(entry["value"])
+
+    def put(self, key: str, tool: str, value: Dict[str, Any]):
+        """Store a response, evicting the least recently used entry if full."""
+        self._entries[key] = {
+            "tool": tool,
+            "expires_at": time.time() + self.ttl,
+            "value": copy.deepcopy(value),
+        }
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        self._dirty = True
+
+    def clear(self):
+        """Drop every entry and reset the counters."""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = self.expirations = 0
+        self._dirty = True
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and size of the cache."""
+        lookups = self.hits + self.misses
+        return {
+            "enabled_tools": sorted(self.tools),
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "persistent": self.path is not None,
+        }
+
+    def load(self):
+        """Load entries and counters from the cache file, if present."""
+        if not self.path or not self.path.exists():
+            return
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable response cache {self.path}: {e}")
+            return
+
+        now = time.time()
+        for key, entry in data.get("entries", {}).items():
+            if entry.get("expires_at", 0) > now:
+                self._entries[key] = entry
+        counters = data.get("stats", {})
+        self.hits = counters.get("hits", 0)
+        self.misses = counters.get("misses", 0)
+        self.evictions = counters.get("evictions", 0)
+        self.expirations = counters.get("expirations", 0)
+
+    def save(self):
+        """Write entries and counters to the cache file atomically."""
+        if not self.path:
+            return
+        data = {
+            "entries": dict(self._entries),
+            "stats": {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            },
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Could not persist response cache to {self.path}: {e}")
+
+    def flush(self):
+        """Persist the cache if entries changed since the last save; counters ride along."""
+        if self._dirty:
+            self.save()
@@ -10,19 +10,22 @@ Provides easy server management and testing capabilities.
 import asyncio
 import argparse
 import logging
+import os
 import sys
-from typing import Optional
+from typing import Any, Dict, Optional, TextIO
 from .mcp_server import DcisionAIMCPServer
 from .config import Config, get_config
+from .config_manager import CONFIG_FILE_ENV, current_config, get_config_manager, use_config_file
 from .workflows import WorkflowManager
+from .cache import ResponseCache
 
-def setup_logging(level: str = "INFO"):
+def setup_logging(level: str = "INFO", stream: TextIO = sys.stdout):
     """Set up logging configuration."""
     logging.basicConfig(
         level=getattr(logging, level.upper()),
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         handlers=[
-            logging.StreamHandler(sys.stdout)
+            logging.StreamHandler(stream)
         ]
     )
 
@@ -31,6 +34,29 @@ async def run_server(host: str, port: int, config: Optional[Config] = None):
     server = DcisionAIMCPServer(config)
     await server.run()
 
+def run_http_server(host: str, port: int, config: Optional[Config], transport: str,
+                    workers: Optional[int] = None) -> int:
+    """
+    Run the HTTP/SSE MCP server, optionally from several worker processes.
+    
+    Without ``config`` the process-wide configuration is served and its
+    file reloaded when it changes.
+    """
+    from .workers import run_workers
+    
+    if config is None:
+        overrides: Dict[str, Any] = {"http_transport": transport}
+        if workers:
+            overrides["workers"] = workers
+        manager = use_config_file(get_config_manager().path, overrides)
+        return run_workers(manager.config, host, port, managed=True)
+    
+    config.http_transport = transport
+    if workers:
+        config.workers = workers
+    config._validate()
+    return run_workers(config, host, port)
+
 def list_workflows():
     """List all available workflows."""
     manager = WorkflowManager()
@@ -88,8 +114,32 @@ def search_workflows(query: str):
         print(f"    Description: {result['description']}")
         print()
 
-def show_statistics():
-    """Show workflow statistics."""
+def load_response_cache(config: Optional[Config] = None) -> Optional[ResponseCache]:
+    """Load the response cache described by the configuration, if valid."""
+    try:
+        return ResponseCache.from_config(config or current_config())
+    except ValueError:
+        return None
+
+def print_cache_statistics(cache: Optional[ResponseCache]):
+    """Print response cache hit/miss counters."""
+    print("Response Cache:")
+    if cache is None:
+        print("  Unavailable (configuration invalid)")
+        return
+    
+    stats = cache.stats()
+    print(f"  Cached Tools: {', '.join(stats['enabled_tools']) or 'none'}")
+    print(f"  Entries: {stats['entries']}/{stats['max_entries']} (TTL {stats['ttl']}s)")
+    print(f"  Hits: {stats['hits']}")
+    print(f"  Misses: {stats['misses']}")
+    print(f"  Hit Rate: {stats['hit_rate']:.1%}")
+    print(f"  Evictions: {stats['evictions']}")
+    if not stats['persistent']:
+        print("  (in-memory only; set DCISIONAI_CACHE_PERSIST=true to track across runs)")
+
+def show_statistics(config: Optional[Config] = None):
+    """Show workflow and response cache statistics."""
     manager = WorkflowManager()
     stats = manager.get_workflow_statistics()
     
@@ -105,12 +155,14 @@ def show_statistics():
     print("Industries:")
     for industry in stats['industries']:
         print(f"  • {industry.title()}")
+    print()
+    print_cache_statistics(load_response_cache(config))
 
 def test_connection(config: Optional[Config] = None):
     """Test connection to AgentCore Gateway."""
     import httpx
     
-    config = config or Config()
+    config = config or current_config()
     
     print("Testing AgentCore Gateway Connection")
     print("=" * 50)
@@ -152,7 +204,7 @@ def health_check(config: Optional[Config] = None):
     print("=" * 40)
     
     try:
-        config = config or Config()
+        config = config or current_config()
         
         # Test configuration
         print("📋 Testing configuration...")
@@ -208,6 +260,17 @@ def health_check(config: Optional[Config] = None):
             print(f"❌ Workflow templates error: {e}")
             return False
         
+        # Report response cache effectiveness
+        print("💾 Checking response cache...")
+        cache = load_response_cache(config)
+        if cache is None:
+            print("⚠️ Response cache unavailable (configuration invalid)")
+        else:
+            cache_stats = cache.stats()
+            print(f"✅ Response cache: {cache_stats['entries']} entries, "
+                  f"{cache_stats['hits']} hits / {cache_stats['misses']} misses "
+                  f"({cache_stats['hit_rate']:.1%} hit rate)")
+        
         print()
         print("🎉 All health checks passed! MCP Server is ready.")
         return True
@@ -216,6 +279,100 @@ def health_check(config: Optional[Config] = None):
         print(f"❌ Health check failed: {e}")
         return False
 
+def run_batch_command(input_path: str, output: Optional[str] = None,
+                      concurrency: Optional[int] = None, config: Optional[Config] = None) -> int:
+    """
+    Execute every workflow in a JSONL/CSV batch file over one pooled client.
+    
+    Results are written as JSON lines as workflows complete; the summary
+    goes to stderr when results go to stdout.
+    
+    Returns:
+        Process exit code: 0 if every workflow succeeded, 1 otherwise
+    """
+    from .batch import jsonl_writer, read_batch, run_batch
+    from .tools import DcisionAITools
+    
+    config = config or current_config()
+    try:
+        items = read_batch(input_path)
+    except (OSError, ValueError) as e:
+        print(f"❌ Could not read batch: {e}", file=sys.stderr)
+        return 2
+    concurrency = concurrency or config.workflow_concurrency
+    
+    async def execute(stream: TextIO):
+        async with DcisionAITools(config) as tools:
+            return await run_batch(tools, items, concurrency, jsonl_writer(stream))
+    
+    if output:
+        with open(output, "w") as stream:
+            summary = asyncio.run(execute(stream))
+        report = sys.stdout
+    else:
+        summary = asyncio.run(execute(sys.stdout))
+        report = sys.stderr
+    
+    print("DcisionAI Batch Summary", file=report)
+    print("=" * 50, file=report)
+    print(f"Workflows: {summary['workflows']} "
+          f"({summary['succeeded']} succeeded, {summary['failed']} failed)", file=report)
+    print(f"Concurrency: {concurrency}", file=report)
+    print(f"Elapsed: {summary['elapsed']:.2f}s", file=report)
+    print(f"Throughput: {summary['workflows_per_sec']:.2f} workflows/s", file=report)
+    print(f"Latency p50/p90/p99: {summary['latency_p50']:.3f}s / "
+          f"{summary['latency_p90']:.3f}s / {summary['latency_p99']:.3f}s", file=report)
+    return 0 if summary["failed"] == 0 else 1
+
+def default_metrics_url() -> str:
+    """Base URL of the local HTTP server, from DCISIONAI_HOST/DCISIONAI_PORT."""
+    host = os.getenv("DCISIONAI_HOST", "localhost")
+    port = os.getenv("DCISIONAI_PORT", "8000")
+    return f"http://{host}:{port}"
+
+def print_metrics(snapshot: dict):
+    """Print per-tool phase latencies, request counts and sizes."""
+    print("DcisionAI Gateway Metrics")
+    print("=" * 50)
+    tools = snapshot.get("tools", {})
+    if not tools:
+        print("No gateway calls recorded yet")
+        return
+    for tool, metrics in sorted(tools.items()):
+        requests = ", ".join(f"{status}: {n}" for status, n in sorted(metrics["requests"].items()))
+        print(f"{tool}  (requests {requests or 'none'}; "
+              f"retries {metrics['retries']}, hedges {metrics['hedges']})")
+        for phase, summary in metrics["phases"].items():
+            print(f"  {phase:<8} n={summary['count']:<6} "
+                  f"p50={summary['p50'] or 0:.4f}s p95={summary['p95'] or 0:.4f}s "
+                  f"p99={summary['p99'] or 0:.4f}s max={summary['max']:.4f}s")
+        for key in ("request_bytes", "response_bytes"):
+            if key in metrics:
+                print(f"  {key:<15} mean={metrics[key]['mean']:.0f} max={metrics[key]['max']:.0f}")
+
+def metrics_command(url: Optional[str] = None, prometheus: bool = False) -> int:
+    """
+    Dump the gateway telemetry of a running HTTP server.
+    
+    Returns:
+        Process exit code: 0 on success, 1 if the server could not be reached
+    """
+    import httpx
+    
+    url = (url or default_metrics_url()).rstrip("/")
+    path = "/metrics" if prometheus else "/metrics/json"
+    try:
+        response = httpx.get(url + path, timeout=10.0)
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        print(f"❌ Could not fetch metrics from {url}: {e}", file=sys.stderr)
+        return 1
+    if prometheus:
+        print(response.text, end="")
+    else:
+        print_metrics(response.json())
+    return 0
+
 def main():
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -237,6 +394,12 @@ Examples:
   
   # Test connection
   dcisionai-mcp-server test-connection
+  
+  # Run many workflows concurrently
+  dcisionai-mcp-server run-batch nightly.jsonl --concurrency 8 --output results.jsonl
+  
+  # Per-tool gateway latencies of a running server
+  dcisionai-mcp-server metrics --url http://localhost:8000
         """
     )
     
@@ -247,6 +410,10 @@ Examples:
     start_parser.add_argument("--host", default="localhost", help="Host to bind to")
     start_parser.add_argument("--port", type=int, default=8000, help="Port to bind to")
     start_parser.add_argument("--config", help="Path to configuration file")
+    start_parser.add_argument("--transport", choices=["stdio", "http", "sse"], default="stdio",
+                              help="stdio for a single IDE client, http/sse for a shared server")
+    start_parser.add_argument("--workers", type=int,
+                              help="HTTP server processes (default: DCISIONAI_WORKERS)")
     start_parser.add_argument("--env", choices=["development", "production", "testing"], 
                             default="development", help="Environment")
     start_parser.add_argument("--log-level", choices=["DEBUG", "INFO", "WARNING", "ERROR"],
@@ -265,7 +432,8 @@ Examples:
     search_parser.add_argument("query", help="Search query")
     
     # Statistics command
-    subparsers.add_parser("stats", help="Show workflow statistics")
+    stats_parser = subparsers.add_parser("stats", help="Show workflow and response cache statistics")
+    stats_parser.add_argument("--config", help="Path to configuration file")
     
     # Test connection command
     test_parser = subparsers.add_parser("test-connection", help="Test AgentCore Gateway connection")
@@ -275,6 +443,19 @@ Examples:
     health_parser = subparsers.add_parser("health-check", help="Comprehensive health check")
     health_parser.add_argument("--config", help="Path to configuration file")
     
+    # Batch execution command
+    batch_parser = subparsers.add_parser("run-batch", help="Run workflows from a JSONL/CSV file")
+    batch_parser.add_argument("input", help="JSONL or CSV file of industry, workflow_id, parameters ('-' for stdin)")
+    batch_parser.add_argument("--output", "-o", help="Write JSONL results here instead of stdout")
+    batch_parser.add_argument("--concurrency", "-c", type=int,
+                              help="Workflows in flight (default: DCISIONAI_WORKFLOW_CONCURRENCY)")
+    batch_parser.add_argument("--config", help="Path to configuration file")
+    
+    # Metrics command
+    metrics_parser = subparsers.add_parser("metrics", help="Show gateway call telemetry of a running server")
+    metrics_parser.add_argument("--url", help="Server base URL (default: http://$DCISIONAI_HOST:$DCISIONAI_PORT)")
+    metrics_parser.add_argument("--prometheus", action="store_true", help="Print the raw Prometheus exposition")
+    
     args = parser.parse_args()
     
     if not args.command:
@@ -284,14 +465,19 @@ Examples:
     # Set up logging
     if args.command == "start":
         setup_logging(args.log_level)
+    elif args.command == "run-batch":
+        # stdout may carry the JSONL results
+        setup_logging("WARNING", sys.stderr)
     else:
         setup_logging("INFO")
     
     # Execute commands
     if args.command == "start":
+        # A configuration file is served from the process-wide snapshot and
+        # reloaded when it changes; otherwise the --env preset is used
         config = None
-        if args.config:
-            config = Config.from_file(args.config)
+        if args.config or os.getenv(CONFIG_FILE_ENV):
+            use_config_file(args.config)
         else:
             config = get_config(args.env)
         
@@ -300,9 +486,13 @@ Examples:
         print(f"Host: {args.host}")
         print(f"Port: {args.port}")
         print(f"Log Level: {args.log_level}")
+        print(f"Transport: {args.transport}")
         print()
         
-        asyncio.run(run_server(args.host, args.port, config))
+        if args.transport == "stdio":
+            asyncio.run(run_server(args.host, args.port, config))
+        else:
+            sys.exit(run_http_server(args.host, args.port, config, args.transport, args.workers))
     
     elif args.command == "list-workflows":
         list_workflows()
@@ -314,19 +504,31 @@ Examples:
         search_workflows(args.query)
     
     elif args.command == "stats":
-        show_statistics()
+        config = None
+        if args.config:
+            config = use_config_file(args.config).config
+        show_statistics(config)
     
     elif args.command == "test-connection":
         config = None
         if args.config:
-            config = Config.from_file(args.config)
+            config = use_config_file(args.config).config
         test_connection(config)
     
     elif args.command == "health-check":
         config = None
         if args.config:
-            config = Config.from_file(args.config)
+            config = use_config_file(args.config).config
         health_check(config)
+    
+    elif args.command == "run-batch":
+        config = None
+        if args.config:
+            config = use_config_file(args.config).config
+        sys.exit(run_batch_command(args.input, args.output, args.concurrency, config))
+    
+    elif args.command == "metrics":
+        sys.exit(metrics_command(args.url, args.prometheus))
 
 if __name__ == "__main__":
     main()
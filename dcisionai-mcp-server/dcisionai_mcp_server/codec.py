@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+DcisionAI JSON Codec
+====================
+
+JSON encoding and decoding of gateway payloads.
+Uses orjson or msgspec when installed and the standard library
+otherwise. Large values that are sent more than once, such as a model
+specification solved repeatedly, can be wrapped in ``EncodedJSON`` so
+they are serialized once and spliced into later request bodies as is.
+Request bodies can optionally be compressed with gzip or zstd.
+"""
+
+import gzip
+import json
+import logging
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+JSON_BACKENDS = ("orjson", "msgspec", "json")
+
+COMPRESSION_ENCODINGS = ("none", "gzip", "zstd")
+
+# Fast, low-ratio levels: compression must cost less than the bytes it saves
+GZIP_LEVEL = 1
+ZSTD_LEVEL = 3
+
+# Containers this deep below the top-level object are searched for EncodedJSON
+SPLICE_DEPTH = 4
+
+
+def _default(value: Any) -> Any:
+    """Fallback for values the encoders do not know."""
+    return str(value)
+
+
+class JSONCodec:
+    """
+    JSON encoder/decoder backed by one library.
+
+    Args:
+        backend: ``orjson``, ``msgspec``, ``json`` or ``auto`` for the
+            fastest one installed
+    """
+
+    def __init__(self, backend: str = "auto"):
+        if backend == "auto":
+            backend = next(name for name in JSON_BACKENDS if _importable(name))
+        if backend not in JSON_BACKENDS:
+            raise ValueError(f"Unknown JSON backend: {backend}")
+        self.backend = backend
+        self._dumps, self._dumps_sorted, self.loads = _backend_functions(backend)
+
+    def dumps(self, value: Any, sort_keys: bool = False) -> bytes:
+        """
+        Encode a value as compact UTF-8 JSON.
+
+        ``EncodedJSON`` values near the top of ``value`` are spliced in from
+        their cached encoding instead of being serialized again.
+        """
+        if isinstance(value, EncodedJSON) and not sort_keys:
+            return value.encoded(self)
+        if sort_keys:
+            return self._dumps_sorted(value)
+        placeholders: Dict[bytes, bytes] = {}
+        stripped = self._strip(value, placeholders, SPLICE_DEPTH)
+        content = self._dumps(stripped)
+        for placeholder, raw in placeholders.items():
+            content = content.replace(placeholder, raw, 1)
+        return content
+
+    def _strip(self, value: Any, placeholders: Dict[bytes, bytes], depth: int) -> Any:
+        """Replace EncodedJSON values by placeholder strings, copying only their parents."""
+        if isinstance(value, EncodedJSON):
+            placeholder = f"\x00encoded-json-{len(placeholders)}\x00"
+            placeholders[self._dumps(placeholder)] = value.encoded(self)
+            return placeholder
+        if depth == 0 or not isinstance(value, dict):
+            return value
+        stripped = None
+        for key, item in value.items():
+            replacement = self._strip(item, placeholders, depth - 1)
+            if replacement is not item:
+                if stripped is None:
+                    stripped = dict(value)
+                stripped[key] = replacement
+        return value if stripped is None else stripped
+
+
+def _importable(name: str) -> bool:
+    try:
+        __import__(name)
+    except ImportError:
+        return False
+    return True
+
+
+def _backend_functions(backend: str) -> Tuple[Callable[[Any], bytes], Callable[[Any], bytes],
+                                              Callable[[Union[bytes, str]], Any]]:
+    """(dumps, sorted dumps, loads) of a JSON library."""
+    if backend == "orjson":
+        import orjson
+        options = orjson.OPT_NON_STR_KEYS
+
+        def dumps(value: Any) -> bytes:
+            return orjson.dumps(value, default=_default, option=options)
+
+        def dumps_sorted(value: Any) -> bytes:
+            return orjson.dumps(value, default=_default, option=options | orjson.OPT_SORT_KEYS)
+
+        return dumps, dumps_sorted, orjson.loads
+
+    if backend == "msgspec":
+        import msgspec
+        encoder = msgspec.json.Encoder(enc_hook=_default)
+        sorted_encoder = msgspec.json.Encoder(enc_hook=_default, order="sorted")
+        decoder = msgspec.json.Decoder()
+        return encoder.encode, sorted_encoder.encode, decoder.decode
+
+    def dumps(value: Any) -> bytes:
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=_default).encode("utf-8")
+
+    def dumps_sorted(value: Any) -> bytes:
+        return json.dumps(value, separators=(",", ":"), ensure_ascii=False, sort_keys=True,
+                          default=_default).encode("utf-8")
+
+    return dumps, dumps_sorted, json.loads
+
+
+class EncodedJSON(dict):
+    """
+    A JSON object that remembers its encoding.
+
+    Behaves as the dict it wraps, so results holding it serialize anywhere,
+    but ``JSONCodec.dumps`` encodes it only once and reuses the bytes in
+    every later request. Treat it as read-only: changing a nested value
+    is not noticed, while top-level changes drop the cached encoding.
+    """
+
+    __slots__ = ("_encoded",)
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._encoded: Optional[Tuple[str, bytes]] = None
+
+    @classmethod
+    def decode(cls, codec: JSONCodec, content: bytes) -> "EncodedJSON":
+        """Decode a JSON object, keeping ``content`` as its encoding."""
+        value = cls(codec.loads(content))
+        value._encoded = (codec.backend, bytes(content))
+        return value
+
+    def encoded(self, codec: JSONCodec) -> bytes:
+        """This object's JSON, encoded on first use."""
+        if self._encoded is None or self._encoded[0] != codec.backend:
+            self._encoded = (codec.backend, codec._dumps(dict(self)))
+        return self._encoded[1]
+
+    def _changed(method):
+        def wrapper(self, *args, **kwargs):
+            self._encoded = None
+            return method(self, *args, **kwargs)
+        wrapper.__name__ = method.__name__
+        return wrapper
+
+    __setitem__ = _changed(dict.__setitem__)
+    __delitem__ = _changed(dict.__delitem__)
+    update = _changed(dict.update)
+    pop = _changed(dict.pop)
+    popitem = _changed(dict.popitem)
+    setdefault = _changed(dict.setdefault)
+    clear = _changed(dict.clear)
+    del _changed
+
+    def __reduce__(self):
+        return (EncodedJSON, (dict(self),))
+
+
+def compressor(encoding: str) -> Optional[Tuple[str, Callable[[bytes], bytes]]]:
+    """
+    ``(Content-Encoding, compress)`` for a configured request encoding.
+
+    Returns None for ``none``. ``zstd`` needs the ``zstandard`` package
+    and falls back to gzip without it.
+    """
+    if encoding == "none":
+        return None
+    if encoding == "zstd":
+        try:
+            import zstandard
+        except ImportError:
+            logger.info("zstandard not installed, compressing requests with gzip")
+        else:
+            return "zstd", zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress
+    return "gzip", lambda content: gzip.compress(content, compresslevel=GZIP_LEVEL)
+
+
+_codecs: Dict[str, JSONCodec] = {}
+
+
+def get_codec(backend: str = "auto") -> JSONCodec:
+    """The shared codec for a backend."""
+    codec = _codecs.get(backend)
+    if codec is None:
+        codec = _codecs[backend] = JSONCodec(backend)
+    return codec
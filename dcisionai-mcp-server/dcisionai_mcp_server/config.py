@@ -7,12 +7,46 @@ Configuration management for the DcisionAI MCP server.
 Handles environment variables, API keys, and server settings.
 """
 
+import json
 import os
-import yaml
-from typing import Any, Dict, Optional
-from dataclasses import dataclass
+from typing import Any, Dict, Optional, Set, Tuple, Union
+from dataclasses import MISSING, dataclass, fields
 from pathlib import Path
 
+# Parsed configuration files by path, with the (mtime, size) they were read at
+_file_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
+def load_config_file(config_path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Read a YAML (or JSON) configuration file.
+
+    The parsed contents are cached until the file's modification time or
+    size changes, so repeated loads of an unchanged file skip the parse.
+    ``yaml`` is only imported when a YAML file is read.
+    """
+    path = Path(config_path).expanduser()
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {path}") from None
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _file_cache.get(str(path))
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    
+    with open(path, 'r') as f:
+        if path.suffix == ".json":
+            data = json.load(f)
+        else:
+            import yaml
+            data = yaml.safe_load(f)
+    data = data or {}
+    if not isinstance(data, dict):
+        raise ValueError(f"Configuration file must contain a mapping: {path}")
+    _file_cache[str(path)] = (signature, data)
+    return data
+
 @dataclass
 class Config:
     """Configuration for DcisionAI MCP Server."""
@@ -22,10 +56,23 @@ class Config:
     gateway_target: str = "DcisionAI-Optimization-Tools-Fixed"
     access_token: str = ""
     
+    # OAuth2 client credentials; when set, tokens are fetched and refreshed in the
+    # background and access_token is not used
+    token_endpoint: Optional[str] = None
+    client_id: str = ""
+    client_secret: str = ""
+    token_scope: str = ""
+    token_refresh_margin: float = 300.0  # refresh this many seconds before expiry
+    
     # Server Configuration
     host: str = "localhost"
     port: int = 8000
     debug: bool = False
+    http_transport: str = "http"  # "http" (streamable HTTP) or "sse"
+    workers: int = 1  # server processes sharing the port
+    session_max_concurrency: int = 4  # tool calls a session runs at once
+    session_max_queued: int = 16  # further calls a session may queue before being rejected
+    drain_timeout: float = 30.0  # seconds in-flight calls get to finish on SIGTERM
     
     # AWS Configuration
     aws_region: str = "us-east-1"
@@ -39,9 +86,66 @@ class Config:
     request_timeout: int = 30
     connection_timeout: int = 10
     
+    # Connection Pool Configuration
+    http2: bool = True
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+    
+    # Payload Encoding
+    json_backend: str = "auto"  # "orjson", "msgspec", "json" or the fastest installed
+    request_compression: str = "none"  # "none", "gzip" or "zstd"
+    compression_min_bytes: int = 65536  # only compress request bodies this large
+    
+    # Response Cache
+    cache_enabled: bool = True
+    cache_tools: Tuple[str, ...] = ("get_workflow_templates", "classify_intent")
+    cache_ttl: int = 3600
+    cache_max_entries: int = 1024
+    cache_persist: bool = False
+    cache_dir: Optional[str] = None
+    
+    # Artifact Store: build_model returns a handle solve_optimization accepts
+    artifact_store: str = "memory"  # "memory", "disk", "sqlite" or "none"
+    artifact_dir: Optional[str] = None  # defaults to the per-user cache directory
+    artifact_max_entries: int = 256
+    
+    # Request Coalescing: identical concurrent calls share one gateway request
+    coalesce_enabled: bool = True
+    coalesce_tools: Tuple[str, ...] = (
+        "classify_intent", "analyze_data", "build_model", "solve_optimization", "get_workflow_templates"
+    )
+    
     # Rate Limiting
     rate_limit_requests: int = 100
     rate_limit_window: int = 3600  # 1 hour
+    rate_limit_enabled: bool = True
+    rate_limit_burst: Optional[int] = None  # defaults to rate_limit_requests
+    rate_limit_priority_tools: Tuple[str, ...] = ("get_workflow_templates",)
+    
+    # Resilience
+    retry_attempts: int = 3
+    retry_backoff_base: float = 0.5
+    retry_backoff_max: float = 10.0
+    hedge_enabled: bool = False
+    hedge_tools: Tuple[str, ...] = ("get_workflow_templates", "classify_intent", "analyze_data")
+    hedge_percentile: float = 95.0
+    hedge_min_samples: int = 20
+    breaker_failure_threshold: int = 5
+    breaker_reset_timeout: float = 30.0
+    
+    # Workflow Execution
+    workflow_engine: str = "local"  # "local" runs stages client-side, "remote" on the gateway
+    workflow_concurrency: int = 4
+    checkpoint_dir: Optional[str] = None  # persist stage checkpoints when set
+    
+    # Execution Backend
+    execution_mode: str = "gateway"  # "gateway", "local" (offline) or "fallback" (local when the gateway is unreachable)
+    local_solver: str = "auto"  # "highs", "cbc" or "auto" for the best installed
+    local_time_limit: float = 10.0  # seconds per local solve
+    
+    # Telemetry
+    otel_enabled: bool = False  # mirror gateway metrics to OpenTelemetry
     
     def __post_init__(self):
         """Post-initialization setup."""
@@ -57,11 +161,21 @@ class Config:
         self.gateway_url = os.getenv("DCISIONAI_GATEWAY_URL", self.gateway_url)
         self.gateway_target = os.getenv("DCISIONAI_GATEWAY_TARGET", self.gateway_target)
         self.access_token = os.getenv("DCISIONAI_ACCESS_TOKEN", self.access_token)
+        self.token_endpoint = os.getenv("DCISIONAI_TOKEN_ENDPOINT", self.token_endpoint)
+        self.client_id = os.getenv("DCISIONAI_CLIENT_ID", self.client_id)
+        self.client_secret = os.getenv("DCISIONAI_CLIENT_SECRET", self.client_secret)
+        self.token_scope = os.getenv("DCISIONAI_TOKEN_SCOPE", self.token_scope)
+        self.token_refresh_margin = float(os.getenv("DCISIONAI_TOKEN_REFRESH_MARGIN", str(self.token_refresh_margin)))
         
         # Server settings
         self.host = os.getenv("DCISIONAI_HOST", self.host)
         self.port = int(os.getenv("DCISIONAI_PORT", str(self.port)))
         self.debug = os.getenv("DCISIONAI_DEBUG", "false").lower() == "true"
+        self.http_transport = os.getenv("DCISIONAI_HTTP_TRANSPORT", self.http_transport).lower()
+        self.workers = int(os.getenv("DCISIONAI_WORKERS", str(self.workers)))
+        self.session_max_concurrency = int(os.getenv("DCISIONAI_SESSION_MAX_CONCURRENCY", str(self.session_max_concurrency)))
+        self.session_max_queued = int(os.getenv("DCISIONAI_SESSION_MAX_QUEUED", str(self.session_max_queued)))
+        self.drain_timeout = float(os.getenv("DCISIONAI_DRAIN_TIMEOUT", str(self.drain_timeout)))
         
         # AWS settings
         self.aws_region = os.getenv("AWS_REGION", self.aws_region)
@@ -74,9 +188,74 @@ class Config:
         self.request_timeout = int(os.getenv("DCISIONAI_REQUEST_TIMEOUT", str(self.request_timeout)))
         self.connection_timeout = int(os.getenv("DCISIONAI_CONNECTION_TIMEOUT", str(self.connection_timeout)))
         
+        # Connection pool
+        self.http2 = os.getenv("DCISIONAI_HTTP2", str(self.http2)).lower() == "true"
+        self.max_connections = int(os.getenv("DCISIONAI_MAX_CONNECTIONS", str(self.max_connections)))
+        self.max_keepalive_connections = int(os.getenv("DCISIONAI_MAX_KEEPALIVE_CONNECTIONS", str(self.max_keepalive_connections)))
+        self.keepalive_expiry = float(os.getenv("DCISIONAI_KEEPALIVE_EXPIRY", str(self.keepalive_expiry)))
+        
+        # Payload encoding
+        self.json_backend = os.getenv("DCISIONAI_JSON_BACKEND", self.json_backend).lower()
+        self.request_compression = os.getenv("DCISIONAI_REQUEST_COMPRESSION", self.request_compression).lower()
+        self.compression_min_bytes = int(os.getenv("DCISIONAI_COMPRESSION_MIN_BYTES", str(self.compression_min_bytes)))
+        
+        # Response cache
+        self.cache_enabled = os.getenv("DCISIONAI_CACHE_ENABLED", str(self.cache_enabled)).lower() == "true"
+        cache_tools = os.getenv("DCISIONAI_CACHE_TOOLS")
+        if cache_tools is not None:
+            self.cache_tools = tuple(t.strip() for t in cache_tools.split(",") if t.strip())
+        self.cache_ttl = int(os.getenv("DCISIONAI_CACHE_TTL", str(self.cache_ttl)))
+        self.cache_max_entries = int(os.getenv("DCISIONAI_CACHE_MAX_ENTRIES", str(self.cache_max_entries)))
+        self.cache_persist = os.getenv("DCISIONAI_CACHE_PERSIST", str(self.cache_persist)).lower() == "true"
+        self.cache_dir = os.getenv("DCISIONAI_CACHE_DIR", self.cache_dir)
+        
+        # Artifact store
+        self.artifact_store = os.getenv("DCISIONAI_ARTIFACT_STORE", self.artifact_store).lower()
+        self.artifact_dir = os.getenv("DCISIONAI_ARTIFACT_DIR", self.artifact_dir)
+        self.artifact_max_entries = int(os.getenv("DCISIONAI_ARTIFACT_MAX_ENTRIES", str(self.artifact_max_entries)))
+        
+        # Request coalescing
+        self.coalesce_enabled = os.getenv("DCISIONAI_COALESCE_ENABLED", str(self.coalesce_enabled)).lower() == "true"
+        coalesce_tools = os.getenv("DCISIONAI_COALESCE_TOOLS")
+        if coalesce_tools is not None:
+            self.coalesce_tools = tuple(t.strip() for t in coalesce_tools.split(",") if t.strip())
+        
         # Rate limiting
         self.rate_limit_requests = int(os.getenv("DCISIONAI_RATE_LIMIT_REQUESTS", str(self.rate_limit_requests)))
         self.rate_limit_window = int(os.getenv("DCISIONAI_RATE_LIMIT_WINDOW", str(self.rate_limit_window)))
+        self.rate_limit_enabled = os.getenv("DCISIONAI_RATE_LIMIT_ENABLED", str(self.rate_limit_enabled)).lower() == "true"
+        rate_limit_burst = os.getenv("DCISIONAI_RATE_LIMIT_BURST")
+        if rate_limit_burst:
+            self.rate_limit_burst = int(rate_limit_burst)
+        priority_tools = os.getenv("DCISIONAI_RATE_LIMIT_PRIORITY_TOOLS")
+        if priority_tools is not None:
+            self.rate_limit_priority_tools = tuple(t.strip() for t in priority_tools.split(",") if t.strip())
+        
+        # Resilience
+        self.retry_attempts = int(os.getenv("DCISIONAI_RETRY_ATTEMPTS", str(self.retry_attempts)))
+        self.retry_backoff_base = float(os.getenv("DCISIONAI_RETRY_BACKOFF_BASE", str(self.retry_backoff_base)))
+        self.retry_backoff_max = float(os.getenv("DCISIONAI_RETRY_BACKOFF_MAX", str(self.retry_backoff_max)))
+        self.hedge_enabled = os.getenv("DCISIONAI_HEDGE_ENABLED", str(self.hedge_enabled)).lower() == "true"
+        hedge_tools = os.getenv("DCISIONAI_HEDGE_TOOLS")
+        if hedge_tools is not None:
+            self.hedge_tools = tuple(t.strip() for t in hedge_tools.split(",") if t.strip())
+        self.hedge_percentile = float(os.getenv("DCISIONAI_HEDGE_PERCENTILE", str(self.hedge_percentile)))
+        self.hedge_min_samples = int(os.getenv("DCISIONAI_HEDGE_MIN_SAMPLES", str(self.hedge_min_samples)))
+        self.breaker_failure_threshold = int(os.getenv("DCISIONAI_BREAKER_FAILURE_THRESHOLD", str(self.breaker_failure_threshold)))
+        self.breaker_reset_timeout = float(os.getenv("DCISIONAI_BREAKER_RESET_TIMEOUT", str(self.breaker_reset_timeout)))
+        
+        # Workflow execution
+        self.workflow_engine = os.getenv("DCISIONAI_WORKFLOW_ENGINE", self.workflow_engine).lower()
+        self.workflow_concurrency = int(os.getenv("DCISIONAI_WORKFLOW_CONCURRENCY", str(self.workflow_concurrency)))
+        self.checkpoint_dir = os.getenv("DCISIONAI_CHECKPOINT_DIR", self.checkpoint_dir)
+        
+        # Execution backend
+        self.execution_mode = os.getenv("DCISIONAI_EXECUTION_MODE", self.execution_mode).lower()
+        self.local_solver = os.getenv("DCISIONAI_LOCAL_SOLVER", self.local_solver).lower()
+        self.local_time_limit = float(os.getenv("DCISIONAI_LOCAL_TIME_LIMIT", str(self.local_time_limit)))
+        
+        # Telemetry
+        self.otel_enabled = os.getenv("DCISIONAI_OTEL_ENABLED", str(self.otel_enabled)).lower() == "true"
     
     def _validate(self):
         """Validate configuration values."""
@@ -86,65 +265,215 @@ class Config:
         if not self.gateway_target:
             raise ValueError("Gateway target is required")
         
-        if not self.access_token:
+        if self.token_endpoint:
+            if not self.client_id or not self.client_secret:
+                raise ValueError("Client ID and secret are required with a token endpoint")
+        elif not self.access_token and self.execution_mode != "local":
             raise ValueError("Access token is required")
         
+        if self.token_refresh_margin < 0:
+            raise ValueError("Token refresh margin must not be negative")
+        
         if self.port < 1 or self.port > 65535:
             raise ValueError("Port must be between 1 and 65535")
         
+        if self.http_transport not in ("http", "sse"):
+            raise ValueError("HTTP transport must be 'http' or 'sse'")
+        
+        if self.workers < 1:
+            raise ValueError("Workers must be positive")
+        
+        if self.workers > 1 and self.http_transport == "sse":
+            raise ValueError("SSE sessions are bound to one process; use the 'http' transport with several workers")
+        
+        if self.session_max_concurrency < 1 or self.session_max_queued < 0:
+            raise ValueError("Session max concurrency must be positive and max queued not negative")
+        
+        if self.drain_timeout < 0:
+            raise ValueError("Drain timeout must not be negative")
+        
         if self.request_timeout < 1:
             raise ValueError("Request timeout must be positive")
         
         if self.connection_timeout < 1:
             raise ValueError("Connection timeout must be positive")
+        
+        if self.max_connections < 1:
+            raise ValueError("Max connections must be positive")
+        
+        if self.max_keepalive_connections < 0 or self.max_keepalive_connections > self.max_connections:
+            raise ValueError("Max keep-alive connections must be between 0 and max connections")
+        
+        if self.json_backend not in ("auto", "orjson", "msgspec", "json"):
+            raise ValueError("JSON backend must be 'auto', 'orjson', 'msgspec' or 'json'")
+        
+        if self.request_compression not in ("none", "gzip", "zstd"):
+            raise ValueError("Request compression must be 'none', 'gzip' or 'zstd'")
+        
+        if self.compression_min_bytes < 0:
+            raise ValueError("Compression minimum size must not be negative")
+        
+        if self.cache_ttl < 0:
+            raise ValueError("Cache TTL must not be negative")
+        
+        if self.cache_max_entries < 1:
+            raise ValueError("Cache max entries must be positive")
+        
+        if self.artifact_store not in ("memory", "disk", "sqlite", "none"):
+            raise ValueError("Artifact store must be 'memory', 'disk', 'sqlite' or 'none'")
+        
+        if self.artifact_max_entries < 1:
+            raise ValueError("Artifact max entries must be positive")
+        
+        if self.rate_limit_requests < 1 or self.rate_limit_window < 1:
+            raise ValueError("Rate limit requests and window must be positive")
+        
+        if self.rate_limit_burst is not None and self.rate_limit_burst < 1:
+            raise ValueError("Rate limit burst must be positive")
+        
+        if self.retry_attempts < 0:
+            raise ValueError("Retry attempts must not be negative")
+        
+        if not 0 < self.hedge_percentile < 100:
+            raise ValueError("Hedge percentile must be between 0 and 100")
+        
+        if self.breaker_failure_threshold < 1:
+            raise ValueError("Breaker failure threshold must be positive")
+        
+        if self.workflow_engine not in ("local", "remote"):
+            raise ValueError("Workflow engine must be 'local' or 'remote'")
+        
+        if self.workflow_concurrency < 1:
+            raise ValueError("Workflow concurrency must be positive")
+        
+        if self.execution_mode not in ("gateway", "local", "fallback"):
+            raise ValueError("Execution mode must be 'gateway', 'local' or 'fallback'")
+        
+        if self.local_solver not in ("auto", "highs", "cbc"):
+            raise ValueError("Local solver must be 'auto', 'highs' or 'cbc'")
+        
+        if self.local_time_limit <= 0:
+            raise ValueError("Local time limit must be positive")
     
     @classmethod
     def from_file(cls, config_path: str) -> "Config":
         """Load configuration from a YAML file."""
-        config_path = Path(config_path)
-        
-        if not config_path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {config_path}")
-        
-        with open(config_path, 'r') as f:
-            config_data = yaml.safe_load(f)
+        return cls.from_dict(load_config_file(config_path))
+    
+    @classmethod
+    def from_dict(cls, config_data: Dict[str, Any]) -> "Config":
+        """
+        Create a configuration from the environment, overridden by ``config_data``.
         
-        # Create config instance with default values
-        config = cls()
+        Unknown keys are ignored and lists become tuples where the setting
+        is a tuple. Values come from the defaults, then the environment,
+        then ``config_data``, and are validated once all are applied, so a
+        file may supply settings (such as the access token) that the
+        environment lacks.
+        """
+        # Defaults and environment, without the validation __post_init__ runs
+        config = cls.__new__(cls)
+        for f in fields(cls):
+            setattr(config, f.name, f.default_factory() if f.default is MISSING else f.default)
+        config._load_from_env()
         
         # Update with file values
         for key, value in config_data.items():
             if hasattr(config, key):
+                if isinstance(value, list) and isinstance(getattr(config, key), tuple):
+                    value = tuple(value)
                 setattr(config, key, value)
         
+        config._validate()
         return config
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert configuration to dictionary."""
+    def changed_settings(self, other: "Config") -> Set[str]:
+        """Names of the settings whose values differ in ``other``."""
+        return {f.name for f in fields(self) if getattr(self, f.name) != getattr(other, f.name)}
+    
+    def to_dict(self, mask_secrets: bool = True) -> Dict[str, Any]:
+        """
+        Convert configuration to dictionary.
+        
+        The access token and client secret are shown as ``***`` unless
+        ``mask_secrets`` is false.
+        """
+        def secret(value: str) -> str:
+            return "***" if value and mask_secrets else value
+        
         return {
             "gateway_url": self.gateway_url,
             "gateway_target": self.gateway_target,
-            "access_token": "***" if self.access_token else "",  # Hide token
+            "access_token": secret(self.access_token),
+            "token_endpoint": self.token_endpoint,
+            "client_id": self.client_id,
+            "client_secret": secret(self.client_secret),
+            "token_scope": self.token_scope,
+            "token_refresh_margin": self.token_refresh_margin,
             "host": self.host,
             "port": self.port,
             "debug": self.debug,
+            "http_transport": self.http_transport,
+            "workers": self.workers,
+            "session_max_concurrency": self.session_max_concurrency,
+            "session_max_queued": self.session_max_queued,
+            "drain_timeout": self.drain_timeout,
             "aws_region": self.aws_region,
             "aws_profile": self.aws_profile,
             "log_level": self.log_level,
             "log_format": self.log_format,
             "request_timeout": self.request_timeout,
             "connection_timeout": self.connection_timeout,
+            "http2": self.http2,
+            "max_connections": self.max_connections,
+            "max_keepalive_connections": self.max_keepalive_connections,
+            "keepalive_expiry": self.keepalive_expiry,
+            "json_backend": self.json_backend,
+            "request_compression": self.request_compression,
+            "compression_min_bytes": self.compression_min_bytes,
+            "cache_enabled": self.cache_enabled,
+            "cache_tools": list(self.cache_tools),
+            "cache_ttl": self.cache_ttl,
+            "cache_max_entries": self.cache_max_entries,
+            "cache_persist": self.cache_persist,
+            "cache_dir": self.cache_dir,
+            "artifact_store": self.artifact_store,
+            "artifact_dir": self.artifact_dir,
+            "artifact_max_entries": self.artifact_max_entries,
+            "coalesce_enabled": self.coalesce_enabled,
+            "coalesce_tools": list(self.coalesce_tools),
             "rate_limit_requests": self.rate_limit_requests,
             "rate_limit_window": self.rate_limit_window,
+            "rate_limit_enabled": self.rate_limit_enabled,
+            "rate_limit_burst": self.rate_limit_burst,
+            "rate_limit_priority_tools": list(self.rate_limit_priority_tools),
+            "retry_attempts": self.retry_attempts,
+            "retry_backoff_base": self.retry_backoff_base,
+            "retry_backoff_max": self.retry_backoff_max,
+            "hedge_enabled": self.hedge_enabled,
+            "hedge_tools": list(self.hedge_tools),
+            "hedge_percentile": self.hedge_percentile,
+            "hedge_min_samples": self.hedge_min_samples,
+            "breaker_failure_threshold": self.breaker_failure_threshold,
+            "breaker_reset_timeout": self.breaker_reset_timeout,
+            "workflow_engine": self.workflow_engine,
+            "workflow_concurrency": self.workflow_concurrency,
+            "checkpoint_dir": self.checkpoint_dir,
+            "execution_mode": self.execution_mode,
+            "local_solver": self.local_solver,
+            "local_time_limit": self.local_time_limit,
+            "otel_enabled": self.otel_enabled,
         }
     
     def save_to_file(self, config_path: str):
-        """Save configuration to a YAML file."""
+        """Save configuration to a YAML file, secrets included, so it loads back unchanged."""
         config_path = Path(config_path)
         config_path.parent.mkdir(parents=True, exist_ok=True)
         
+        import yaml
+        
         with open(config_path, 'w') as f:
-            yaml.dump(self.to_dict(), f, default_flow_style=False, indent=2)
+            yaml.dump(self.to_dict(mask_secrets=False), f, default_flow_style=False, indent=2)
     
     def get_headers(self) -> Dict[str, str]:
         """Get HTTP headers for API requests."""
@@ -158,13 +487,23 @@ class Config:
         """Get HTTP client configuration."""
         return {
             "timeout": self.request_timeout,
+            "connect_timeout": self.connection_timeout,
             "headers": self.get_headers(),
+            "http2": self.http2,
+            "max_connections": self.max_connections,
+            "max_keepalive_connections": self.max_keepalive_connections,
+            "keepalive_expiry": self.keepalive_expiry,
             "follow_redirects": True,
             "verify": True
         }
 
-# Default configuration instance
-default_config = Config()
+# Default configuration instance, created from the environment on first access
+def __getattr__(name):
+    if name == "default_config":
+        global default_config
+        default_config = Config()
+        return default_config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Environment-specific configurations
 def get_config(env: str = "development") -> Config:
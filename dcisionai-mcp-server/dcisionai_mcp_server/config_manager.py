@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+DcisionAI Configuration Manager
+===============================
+
+Process-wide configuration snapshot with hot reload.
+The configuration is built once per process from the environment and an
+optional YAML/JSON file (``DCISIONAI_CONFIG_FILE`` or ``--config``) and
+shared by the tools, the servers and the CLI. While a server runs, the
+file is polled for changes; a changed file is parsed once into a new
+snapshot that replaces the current one in a single assignment, and
+subscribers are told which settings changed, so the gateway transport
+only rebuilds its connection pool when its own settings did. A file that
+fails to load or validate leaves the current snapshot in place.
+"""
+
+import asyncio
+import contextlib
+import logging
+import os
+import threading
+import weakref
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from .config import Config, load_config_file
+
+logger = logging.getLogger(__name__)
+
+# Configuration file used when none is given explicitly
+CONFIG_FILE_ENV = "DCISIONAI_CONFIG_FILE"
+
+# Seconds between checks of the configuration file for changes
+POLL_INTERVAL_ENV = "DCISIONAI_CONFIG_POLL_INTERVAL"
+DEFAULT_POLL_INTERVAL = 2.0
+
+# Called as listener(previous, config, changed setting names) after a reload
+Listener = Callable[[Config, Config, Set[str]], None]
+
+
+class ConfigManager:
+    """
+    Owner of the current configuration snapshot.
+
+    Args:
+        path: Configuration file; defaults to ``DCISIONAI_CONFIG_FILE``,
+            and without one the configuration comes from the environment
+        overrides: Settings that take precedence over the file, such as
+            command line options
+        poll_interval: Seconds between checks of the file for changes
+    """
+
+    def __init__(self, path: Optional[str] = None, overrides: Optional[Dict[str, Any]] = None,
+                 poll_interval: Optional[float] = None):
+        path = path or os.getenv(CONFIG_FILE_ENV) or None
+        self.path = str(Path(path).expanduser()) if path else None
+        self.overrides = dict(overrides or {})
+        if poll_interval is None:
+            poll_interval = float(os.getenv(POLL_INTERVAL_ENV, str(DEFAULT_POLL_INTERVAL)))
+        self.poll_interval = poll_interval
+        self.reloads = 0
+        self.failed_reloads = 0
+        self._config: Optional[Config] = None
+        self._signature: Optional[Tuple[int, int, int]] = None
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[], Optional[Listener]]] = []
+        self._watcher: Optional["asyncio.Task[None]"] = None
+
+    @property
+    def config(self) -> Config:
+        """The current snapshot, built on first access."""
+        config = self._config
+        if config is None:
+            with self._lock:
+                if self._config is None:
+                    self._config, self._signature = self._load()
+                config = self._config
+        return config
+
+    def _stat(self) -> Optional[Tuple[int, int, int]]:
+        """Identity of the file's current contents (inode, mtime, size)."""
+        if self.path is None:
+            return None
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def _load(self) -> Tuple[Config, Optional[Tuple[int, int, int]]]:
+        signature = self._stat()
+        data = dict(load_config_file(self.path)) if self.path else {}
+        data.update(self.overrides)
+        return Config.from_dict(data), signature
+
+    def reload(self, force: bool = False) -> bool:
+        """
+        Build a new snapshot if the file changed since the last load.
+
+        Args:
+            force: Rebuild even if the file did not change, e.g. to pick up
+                changed environment variables
+
+        Returns:
+            Whether a snapshot with different settings was swapped in
+        """
+        with self._lock:
+            previous = self._config
+            signature = self._stat()
+            if previous is not None and not force and signature == self._signature:
+                return False
+            try:
+                config, signature = self._load()
+            except Exception as e:
+                # Not retried until the file changes again
+                self._signature = signature
+                self.failed_reloads += 1
+                logger.error(f"Keeping the current configuration, loading {self.path} failed: {e}")
+                return False
+            self._config, self._signature = config, signature
+            self.reloads += 1
+
+        if previous is None:
+            return True
+        changed = previous.changed_settings(config)
+        if changed:
+            logger.info(f"Configuration reloaded, changed: {', '.join(sorted(changed))}")
+            self._notify(previous, config, changed)
+        return bool(changed)
+
+    def subscribe(self, listener: Listener) -> Callable[[], None]:
+        """
+        Call ``listener(previous, config, changed)`` after every reload.
+
+        Bound methods are held weakly, so a subscription does not keep
+        its object alive.
+
+        Returns:
+            A function that ends the subscription
+        """
+        if hasattr(listener, "__self__"):
+            ref: Callable[[], Optional[Listener]] = weakref.WeakMethod(listener)
+        else:
+            ref = lambda: listener  # noqa: E731
+
+        def unsubscribe():
+            if ref in self._listeners:
+                self._listeners.remove(ref)
+
+        self._listeners.append(ref)
+        return unsubscribe
+
+    def _notify(self, previous: Config, config: Config, changed: Set[str]):
+        for ref in list(self._listeners):
+            listener = ref()
+            if listener is None:
+                self._listeners.remove(ref)
+                continue
+            try:
+                listener(previous, config, changed)
+            except Exception as e:
+                logger.error(f"Applying the reloaded configuration failed: {e}")
+
+    async def watch(self):
+        """Poll the file and reload it when it changes, until cancelled."""
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            self.reload()
+
+    def start(self) -> bool:
+        """
+        Start watching the file from the running event loop.
+
+        Returns:
+            Whether a watcher was started; not without a file, without a
+            running loop, or when one is running already
+        """
+        if self.path is None or (self._watcher is not None and not self._watcher.done()):
+            return False
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        self.config  # changes are detected against the loaded snapshot
+        self._watcher = loop.create_task(self.watch())
+        return True
+
+    async def stop(self):
+        """Stop watching the file."""
+        watcher, self._watcher = self._watcher, None
+        if watcher is not None:
+            watcher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await watcher
+
+    def stats(self) -> Dict[str, Any]:
+        """Configuration source and reload counters."""
+        return {
+            "path": self.path,
+            "watching": self._watcher is not None and not self._watcher.done(),
+            "reloads": self.reloads,
+            "failed_reloads": self.failed_reloads,
+        }
+
+
+# Process-wide manager, created on first use
+_manager: Optional[ConfigManager] = None
+
+
+def get_config_manager() -> ConfigManager:
+    """Get the process-wide configuration manager."""
+    global _manager
+    if _manager is None:
+        _manager = ConfigManager()
+    return _manager
+
+
+def use_config_file(path: Optional[str], overrides: Optional[Dict[str, Any]] = None) -> ConfigManager:
+    """Replace the process-wide manager by one reading ``path`` (or ``DCISIONAI_CONFIG_FILE``)."""
+    global _manager
+    reset_config_manager()
+    _manager = ConfigManager(path, overrides)
+    return _manager
+
+
+def current_config() -> Config:
+    """The process-wide configuration snapshot."""
+    return get_config_manager().config
+
+
+def reset_config_manager():
+    """Forget the process-wide manager; the next access reads environment and file again."""
+    global _manager
+    if _manager is not None and _manager._watcher is not None:
+        _manager._watcher.cancel()
+    _manager = None
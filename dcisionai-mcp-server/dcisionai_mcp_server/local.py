@@ -0,0 +1,642 @@
+#!/usr/bin/env python3
+"""
+DcisionAI Local Execution
+=========================
+
+Runs the optimization tools in-process, without the gateway.
+Intent classification ranks the workflow templates by keyword relevance
+to the problem description, data analysis extracts numbers and
+constraints, and LP/MILP models are built from algebraic text or a
+structured model specification and solved with PuLP, using HiGHS when
+it is installed and the CBC solver bundled with PuLP otherwise.
+Results are deterministic, so the backend also serves benchmarks and CI.
+
+Model text is read statement by statement; statements are separated by
+newlines, ``;``, sentences and ``subject to``::
+
+    maximize profit: 3x + 2y
+    subject to
+    labor: x + 2y <= 14
+    3x - y >= 0, x - y <= 2
+    0 <= y <= 5
+    x integer
+
+Variables are continuous with a lower bound of 0 unless declared
+``integer``, ``binary`` or ``free``; several bounds on one variable
+combine to the tightest. Statements that are neither an objective, a
+comparison nor a declaration are ignored, so the model may be embedded
+in prose, but a comparison that cannot be read is an error rather than
+a constraint silently left out.
+"""
+
+import asyncio
+import json
+import logging
+import re
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from .workflows import WorkflowManager
+
+logger = logging.getLogger(__name__)
+
+LOCAL_SOLVERS = ("auto", "highs", "cbc")
+
+VARIABLE_TYPES = ("continuous", "integer", "binary")
+
+CONSTRAINT_SENSES = {"<=": "<=", "=<": "<=", "<": "<=", "≤": "<=",
+                     ">=": ">=", "=>": ">=", ">": ">=", "≥": ">=",
+                     "=": "=", "==": "="}
+
+NUMBER = r"(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?"
+NAME = r"[A-Za-z_][A-Za-z0-9_]*"
+
+EXPRESSION_TERM = re.compile(rf"\s*([+-])?\s*(?:({NUMBER})\s*\*?\s*)?({NAME})?\s*")
+NUMBER_PATTERN = re.compile(rf"(?<![A-Za-z_]){NUMBER}")
+STATEMENT_SEPARATOR = re.compile(r"(?i)[;\n]|\.\s+|\bsubject\s+to\b|\bs\.\s*t\.|\bsuch\s+that\b")
+COMPARISON = re.compile(r"(<=|>=|=<|=>|==|≤|≥|<|>|=)")
+OBJECTIVE = re.compile(r"(?i)\b(maximi[sz]e|minimi[sz]e|max|min)\b\s*(?:([A-Za-z_][\w ]*?)\s*[:=]\s*)?")
+LABEL = re.compile(r"^\s*([A-Za-z_][\w ]*?)\s*:\s*")
+DECLARATION = re.compile(r"(?i)\b(integers?|int|binary|binaries|bin|continuous|free)\b")
+DECLARATION_FILLER = {"are", "is", "and", "variable", "variables", "var", "vars"}
+
+# Everyday words of problem descriptions, expanded to the vocabulary of the
+# workflow templates before ranking them
+INTENT_SYNONYMS = {
+    "nurse": "healthcare staff scheduling", "doctor": "healthcare staff scheduling",
+    "shift": "staff scheduling", "roster": "staff scheduling", "employee": "staff scheduling",
+    "hospital": "healthcare", "clinic": "healthcare", "bed": "healthcare patient flow",
+    "factory": "manufacturing production capacity", "machine": "production capacity",
+    "stock": "inventory", "reorder": "inventory", "defect": "quality control",
+    "truck": "logistics fleet vehicle", "delivery": "delivery routes logistics",
+    "shipping": "transportation logistics", "price": "pricing", "discount": "pricing promotions",
+    "advertising": "marketing campaign budget", "ads": "marketing campaign budget",
+    "investment": "portfolio investment", "asset": "portfolio investment",
+    "electricity": "energy grid", "power": "energy grid", "solar": "renewable energy",
+    "wind": "renewable energy", "battery": "energy storage",
+}
+
+# Description keywords hinting at a problem type or objective sense
+INTEGER_HINTS = {"integer", "integers", "binary", "assign", "assignment", "schedule", "scheduling",
+                 "shift", "shifts", "select", "selection", "route", "routing", "facility", "location"}
+MAXIMIZE_HINTS = {"maximize", "maximise", "max", "profit", "revenue", "throughput", "utilization"}
+MINIMIZE_HINTS = {"minimize", "minimise", "min", "cost", "costs", "waste", "delay", "distance"}
+
+
+class LocalModelError(ValueError):
+    """A model could not be read, built or solved locally."""
+
+
+def _pulp():
+    """PuLP, imported on first use."""
+    try:
+        import pulp
+    except ImportError:
+        raise LocalModelError(
+            "Local solving requires PuLP: pip install 'dcisionai-mcp-server[local]'"
+        ) from None
+    return pulp
+
+
+def _words(text: str) -> List[str]:
+    return re.findall(r"[a-z]+", text.lower())
+
+
+def parse_expression(text: str) -> Tuple[Dict[str, float], float]:
+    """
+    Read a linear expression such as ``3x + 2.5 y - z + 4``.
+
+    Returns:
+        Coefficient per variable and the constant term
+    """
+    coefficients: Dict[str, float] = {}
+    constant = 0.0
+    position = 0
+    first = True
+    text = text.strip()
+    if not text:
+        raise LocalModelError("Empty linear expression")
+    while position < len(text):
+        match = EXPRESSION_TERM.match(text, position)
+        sign, number, name = match.groups()
+        if (number is None and name is None) or (sign is None and not first):
+            raise LocalModelError(f"Cannot read linear expression: {text!r}")
+        value = float(number) if number is not None else 1.0
+        if sign == "-":
+            value = -value
+        if name is None:
+            constant += value
+        else:
+            coefficients[name] = coefficients.get(name, 0.0) + value
+        position = match.end()
+        first = False
+    return coefficients, constant
+
+
+def _is_bound(coefficients: Dict[str, float]) -> bool:
+    return len(coefficients) == 1 and next(iter(coefficients.values())) == 1.0
+
+
+class _ModelText:
+    """Accumulates the objective, constraints and variables of model text."""
+
+    def __init__(self):
+        self.sense: Optional[str] = None
+        self.objective: Dict[str, float] = {}
+        self.constraints: List[Dict[str, Any]] = []
+        self.variables: Dict[str, Dict[str, Any]] = {}
+        self.declarations: List[Tuple[str, str]] = []
+        # Variables whose lower bound was stated, replacing the default of 0
+        self.lower_bounded: set = set()
+
+    def variable(self, name: str) -> Dict[str, Any]:
+        if name not in self.variables:
+            self.variables[name] = {"name": name, "type": "continuous",
+                                    "lower_bound": 0.0, "upper_bound": None}
+        return self.variables[name]
+
+    def read(self, statement: str):
+        # Commas separate statements too, except in lists of variable names
+        pending = ""
+        for piece in statement.split(","):
+            if re.fullmatch(rf"\s*{NAME}\s*", piece):
+                pending += piece + ","
+                continue
+            self._read_statement(pending + piece)
+            pending = ""
+
+    def _read_statement(self, statement: str):
+        objective = OBJECTIVE.search(statement)
+        if objective and not COMPARISON.search(statement[objective.end():]):
+            self._read_objective(objective, statement)
+        elif COMPARISON.search(statement):
+            self._read_comparison(statement)
+        elif DECLARATION.search(statement):
+            self._read_declaration(statement)
+
+    def _read_objective(self, match: "re.Match", statement: str):
+        # The objective may be followed by prose: keep the longest readable prefix
+        rest = statement[match.end():].strip()
+        for end in range(len(rest), 0, -1):
+            try:
+                coefficients, _ = parse_expression(rest[:end])
+            except LocalModelError:
+                continue
+            # A lone word in prose ("minimize inventory costs while ...") is not an objective
+            if coefficients and (match.group(2) or end == len(rest) or re.search(r"[\d+*-]", rest[:end])):
+                self.sense = "maximize" if match.group(1).lower().startswith("max") else "minimize"
+                self.objective = coefficients
+                for name in coefficients:
+                    self.variable(name)
+                return
+
+    def _read_comparison(self, statement: str):
+        label = LABEL.match(statement)
+        name = label.group(1).strip().replace(" ", "_") if label else None
+        if label:
+            statement = statement[label.end():]
+        parts = COMPARISON.split(statement)
+        sides = parts[::2]
+        senses = [CONSTRAINT_SENSES[op] for op in parts[1::2]]
+        try:
+            if len(sides) == 2 and "," in sides[0] and "," not in sides[1]:
+                # "x, y >= 0": a bound on each listed variable
+                bound = parse_expression(sides[1])
+                for variable in sides[0].split(","):
+                    self._add(parse_expression(variable), senses[0], bound, None)
+                return
+            expressions = [parse_expression(side) for side in sides]
+        except LocalModelError as e:
+            raise LocalModelError(f"Cannot read constraint {statement.strip()!r}: {e}") from None
+        for index, sense in enumerate(senses):
+            constraint_name = name
+            if name and len(senses) > 1:
+                constraint_name = f"{name}_{index + 1}"
+            self._add(expressions[index], sense, expressions[index + 1], constraint_name)
+
+    def _add(self, left: Tuple[Dict[str, float], float], sense: str,
+             right: Tuple[Dict[str, float], float], name: Optional[str]):
+        """Add ``left sense right`` as a variable bound or a constraint."""
+        coefficients = dict(left[0])
+        for variable, coefficient in right[0].items():
+            coefficients[variable] = coefficients.get(variable, 0.0) - coefficient
+        coefficients = {v: c for v, c in coefficients.items() if c != 0.0}
+        rhs = right[1] - left[1] + 0.0
+        if not coefficients:
+            return
+        for variable in coefficients:
+            self.variable(variable)
+
+        if _is_bound(coefficients) and name is None:
+            variable = self.variable(next(iter(coefficients)))
+            if sense in ("<=", "="):
+                upper = variable["upper_bound"]
+                variable["upper_bound"] = rhs if upper is None else min(upper, rhs)
+            if sense in (">=", "="):
+                stated = variable["name"] in self.lower_bounded
+                variable["lower_bound"] = max(variable["lower_bound"], rhs) if stated else rhs
+                self.lower_bounded.add(variable["name"])
+            return
+        if _is_bound({v: -c for v, c in coefficients.items()}) and name is None:
+            flipped = {"<=": ">=", ">=": "<=", "=": "="}[sense]
+            self._add(({v: -c for v, c in coefficients.items()}, 0.0), flipped, ({}, -rhs), None)
+            return
+        self.constraints.append({
+            "name": name or f"c{len(self.constraints) + 1}",
+            "terms": [{"variable": v, "coefficient": c} for v, c in coefficients.items()],
+            "sense": sense,
+            "rhs": rhs,
+        })
+
+    def _read_declaration(self, statement: str):
+        kind = DECLARATION.search(statement).group(1).lower()
+        for name in re.findall(NAME, DECLARATION.sub(" ", statement)):
+            if name.lower() not in DECLARATION_FILLER:
+                self.declarations.append((name, kind))
+
+    def _declare(self, name: str, kind: str):
+        variable = self.variables[name]
+        if kind.startswith("int"):
+            variable["type"] = "integer"
+        elif kind.startswith("bin"):
+            variable.update(type="binary", lower_bound=0.0, upper_bound=1.0)
+        elif kind == "free":
+            variable["lower_bound"] = None
+        else:
+            variable["type"] = "continuous"
+
+    def specification(self) -> Dict[str, Any]:
+        # Declarations apply to variables the model uses; other words of
+        # a declaring sentence ("x and y must be integer") are not variables
+        for name, kind in self.declarations:
+            if name in self.variables:
+                self._declare(name, kind)
+        return normalize_model({
+            "variables": list(self.variables.values()),
+            "objective": {
+                "sense": self.sense,
+                "terms": [{"variable": v, "coefficient": c} for v, c in self.objective.items()],
+            },
+            "constraints": self.constraints,
+        })
+
+
+def parse_model(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Read an LP/MILP model from algebraic text.
+
+    Returns:
+        The model specification, or None if the text has no objective
+    """
+    model = _ModelText()
+    for statement in STATEMENT_SEPARATOR.split(text):
+        if statement.strip():
+            model.read(statement)
+    if model.sense is None:
+        return None
+    return model.specification()
+
+
+def _terms(value: Any) -> List[Dict[str, Any]]:
+    """Terms given as a list of ``{variable, coefficient}`` or a mapping."""
+    if isinstance(value, dict):
+        return [{"variable": str(v), "coefficient": float(c)} for v, c in value.items()]
+    return [{"variable": str(t["variable"]), "coefficient": float(t["coefficient"])} for t in value or []]
+
+
+def _bound(value: Any) -> Optional[float]:
+    return None if value is None else float(value)
+
+
+def normalize_model(spec: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Check a model specification and bring it into canonical form.
+
+    The specification has ``variables`` (``name``, ``type``,
+    ``lower_bound``, ``upper_bound``), an ``objective`` (``sense`` and
+    ``terms``) and ``constraints`` (``name``, ``terms``, ``sense``,
+    ``rhs``); terms may also be given as ``{variable: coefficient}``.
+    """
+    try:
+        variables = []
+        for variable in spec.get("variables") or []:
+            kind = str(variable.get("type", "continuous")).lower()
+            if kind not in VARIABLE_TYPES:
+                raise LocalModelError(f"Unknown type {kind!r} of variable {variable['name']!r}")
+            variables.append({
+                "name": str(variable["name"]),
+                "type": kind,
+                "lower_bound": _bound(variable.get("lower_bound", 0.0)),
+                "upper_bound": _bound(variable.get("upper_bound")),
+            })
+        names = {variable["name"] for variable in variables}
+
+        objective = spec.get("objective") or {}
+        sense = str(objective.get("sense") or "minimize").lower()
+        if sense not in ("maximize", "minimize"):
+            raise LocalModelError(f"Unknown objective sense {sense!r}")
+        objective_terms = _terms(objective.get("terms"))
+
+        constraints = []
+        for index, constraint in enumerate(spec.get("constraints") or []):
+            constraint_sense = CONSTRAINT_SENSES.get(str(constraint.get("sense", "<=")))
+            if constraint_sense is None:
+                raise LocalModelError(f"Unknown constraint sense {constraint.get('sense')!r}")
+            constraints.append({
+                "name": str(constraint.get("name") or f"c{index + 1}"),
+                "terms": _terms(constraint.get("terms")),
+                "sense": constraint_sense,
+                "rhs": float(constraint.get("rhs", 0.0)),
+            })
+    except (KeyError, TypeError, ValueError) as e:
+        if isinstance(e, LocalModelError):
+            raise
+        raise LocalModelError(f"Invalid model specification: {e!r}") from None
+
+    for term in objective_terms + [t for c in constraints for t in c["terms"]]:
+        if term["variable"] not in names:
+            raise LocalModelError(f"Undeclared variable {term['variable']!r}")
+    integral = any(variable["type"] != "continuous" for variable in variables)
+    return {
+        "model_type": "mixed_integer_programming" if integral else "linear_programming",
+        "variables": variables,
+        "objective": {"sense": sense, "terms": objective_terms},
+        "constraints": constraints,
+    }
+
+
+def solve_model(spec: Dict[str, Any], solver: str = "auto", time_limit: Optional[float] = None,
+                gap: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Solve a model specification with PuLP.
+
+    Args:
+        spec: Model specification (see ``normalize_model``)
+        solver: ``highs``, ``cbc`` or ``auto`` for HiGHS when installed
+        time_limit: Solver time limit in seconds
+        gap: Relative MIP gap at which to stop
+
+    Returns:
+        ``status``, ``objective_value``, the ``variables`` values, the
+        ``solver`` used and its ``solve_time``
+    """
+    pulp = _pulp()
+    spec = normalize_model(spec)
+    categories = {"continuous": pulp.LpContinuous, "integer": pulp.LpInteger, "binary": pulp.LpBinary}
+    problem = pulp.LpProblem(
+        "dcisionai", pulp.LpMaximize if spec["objective"]["sense"] == "maximize" else pulp.LpMinimize
+    )
+    variables = {
+        v["name"]: pulp.LpVariable(f"x{i}", v["lower_bound"], v["upper_bound"], categories[v["type"]])
+        for i, v in enumerate(spec["variables"])
+    }
+    problem += pulp.LpAffineExpression(
+        [(variables[t["variable"]], t["coefficient"]) for t in spec["objective"]["terms"]]
+    )
+    for index, constraint in enumerate(spec["constraints"]):
+        expression = pulp.LpAffineExpression(
+            [(variables[t["variable"]], t["coefficient"]) for t in constraint["terms"]]
+        )
+        sense = {"<=": pulp.LpConstraintLE, ">=": pulp.LpConstraintGE, "=": pulp.LpConstraintEQ}
+        problem.addConstraint(
+            pulp.LpConstraint(expression, sense[constraint["sense"]], rhs=constraint["rhs"]),
+            f"c{index}"
+        )
+
+    options = {"msg": False, "timeLimit": time_limit, "gapRel": gap}
+    if solver in ("auto", "highs") and pulp.HiGHS(msg=False).available():
+        engine = pulp.HiGHS(**options)
+    elif solver == "highs":
+        raise LocalModelError("HiGHS is not installed: pip install highspy")
+    else:
+        engine = pulp.PULP_CBC_CMD(**options)
+
+    started = time.perf_counter()
+    problem.solve(engine)
+    solve_time = time.perf_counter() - started
+
+    status = pulp.LpStatus[problem.status].lower().replace(" ", "_")
+    if problem.sol_status == pulp.LpSolutionIntegerFeasible:
+        status = "feasible"
+    solved = status in ("optimal", "feasible")
+    return {
+        "status": status,
+        "objective_value": pulp.value(problem.objective) if solved else None,
+        "variables": {
+            name: None if var.varValue is None else var.varValue + 0.0 for name, var in variables.items()
+        } if solved else {},
+        "solver": engine.name,
+        "solve_time": round(solve_time, 4),
+        "model_type": spec["model_type"],
+        "backend": "local",
+    }
+
+
+class LocalBackend:
+    """
+    In-process stand-in for the gateway transport.
+
+    ``call_tool``, ``call_batch`` and ``stream_tool`` take and return the
+    same payloads and JSON-RPC response bodies as ``GatewayTransport``, so
+    the tools shape local results exactly like gateway results. Models
+    that cannot be read or solved come back as JSON-RPC errors.
+
+    Args:
+        config: Server configuration (``local_solver`` and
+            ``local_time_limit``)
+        workflow_manager: Templates ranked for intent classification
+    """
+
+    def __init__(self, config, workflow_manager: Optional[WorkflowManager] = None):
+        self.config = config
+        self.workflow_manager = workflow_manager or WorkflowManager()
+
+    async def call_tool(self, tool: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a tool locally and return its JSON-RPC response body."""
+        try:
+            if tool == "solve_optimization":
+                loop = asyncio.get_event_loop()
+                result = await loop.run_in_executor(None, self.solve, arguments)
+            elif tool == "execute_workflow":
+                result = await self.execute_workflow(arguments)
+            else:
+                result = self.run(tool, arguments)
+        except LocalModelError as e:
+            return {"jsonrpc": "2.0", "error": {"code": -32602, "message": str(e)}}
+        return {"jsonrpc": "2.0", "result": result}
+
+    async def call_batch(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Run several tools locally, in order."""
+        return [await self.call_tool(tool, arguments) for tool, arguments in calls]
+
+    async def stream_tool(self, tool: str, arguments: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """Run a tool locally and yield its response; there is no progress to report."""
+        yield await self.call_tool(tool, arguments)
+
+    def run(self, tool: str, arguments: Dict[str, Any]) -> Any:
+        """Run one of the fast, synchronous tools."""
+        if tool == "classify_intent":
+            return self.classify(arguments["user_input"], arguments.get("context") or "")
+        if tool == "analyze_data":
+            return self.analyze(
+                arguments["data_description"], arguments.get("data_type", "tabular"),
+                arguments.get("constraints") or ""
+            )
+        if tool == "build_model":
+            return self.build(
+                arguments["problem_description"], arguments.get("data_analysis") or {},
+                arguments.get("model_type") or "auto"
+            )
+        if tool == "get_workflow_templates":
+            return self.workflow_manager.get_all_workflows()
+        raise LocalModelError(f"Tool {tool} cannot run locally")
+
+    def classify(self, text: str, context: str = "") -> Dict[str, Any]:
+        """Classify a problem by the workflow templates it matches best."""
+        query = f"{text} {context}"
+        words = set(_words(query))
+        expansions = [
+            INTENT_SYNONYMS.get(word) or INTENT_SYNONYMS.get(word.rstrip("s"), "") for word in words
+        ]
+        matches = self.workflow_manager.rank_workflows(" ".join([query] + expansions), 3)
+        maximize = len(words & MAXIMIZE_HINTS)
+        minimize = len(words & MINIMIZE_HINTS)
+        integral = bool(words & INTEGER_HINTS)
+
+        result: Dict[str, Any] = {
+            "intent": "general_optimization",
+            "industry": None,
+            "workflow": None,
+            "confidence": 0.0,
+        }
+        if matches:
+            best = matches[0]
+            runner_up = matches[1]["score"] if len(matches) > 1 else 0.0
+            result.update(
+                intent=best["workflow_id"],
+                industry=best["industry"],
+                workflow=best["name"],
+                # Share of the top score, damped when little text matched
+                confidence=round(best["score"] / (best["score"] + runner_up + 1.0), 3),
+            )
+        model = parse_model(text)
+        if model is not None:
+            integral = model["model_type"] == "mixed_integer_programming"
+            maximize, minimize = (1, 0) if model["objective"]["sense"] == "maximize" else (0, 1)
+        result.update(
+            problem_type="mixed_integer_programming" if integral else "linear_programming",
+            objective="maximize" if maximize > minimize else "minimize" if minimize > maximize else None,
+            matches=[
+                {k: m[k] for k in ("industry", "workflow_id", "name", "score")} for m in matches
+            ],
+            backend="local",
+        )
+        return result
+
+    def analyze(self, description: str, data_type: str = "tabular", constraints: str = "") -> Dict[str, Any]:
+        """Extract figures, constraints and an embedded model from a description."""
+        result: Dict[str, Any] = {
+            "data_type": data_type,
+            "numbers": [float(n) for n in NUMBER_PATTERN.findall(description)],
+            "constraints": [],
+            "backend": "local",
+        }
+        parameters = None
+        if constraints:
+            try:
+                parameters = json.loads(constraints)
+            except ValueError:
+                parameters = None
+        if isinstance(parameters, dict):
+            # Extra workflow parameters, possibly carrying a model
+            model = parameters.get("model")
+            if isinstance(model, dict):
+                result["model"] = normalize_model(model)
+            result["parameters"] = {k: v for k, v in parameters.items() if k != "model"}
+        elif constraints:
+            result["constraints"] = [
+                c.strip() for c in STATEMENT_SEPARATOR.split(constraints) if COMPARISON.search(c)
+            ]
+
+        if "model" not in result:
+            model = parse_model(f"{description}\n{constraints if parameters is None else ''}")
+            if model is not None:
+                result["model"] = model
+        if "model" in result:
+            result["variables"] = len(result["model"]["variables"])
+            result["constraint_count"] = len(result["model"]["constraints"])
+        return result
+
+    def build(self, description: str, data_analysis: Dict[str, Any], model_type: str = "auto") -> Dict[str, Any]:
+        """
+        Build a model specification.
+
+        Uses the model found by data analysis, or else the model written
+        in the problem description.
+        """
+        model = data_analysis.get("model") if isinstance(data_analysis, dict) else None
+        if isinstance(model, dict):
+            spec = normalize_model(model)
+        else:
+            spec = parse_model(description)
+        if spec is None:
+            raise LocalModelError(
+                "No model found: describe it algebraically (e.g. 'maximize 3x + 2y "
+                "subject to x + y <= 4') or pass a structured model"
+            )
+        if model_type == "linear_programming" and spec["model_type"] != model_type:
+            # LP relaxation on request
+            for variable in spec["variables"]:
+                variable["type"] = "continuous"
+            spec["model_type"] = model_type
+        spec["backend"] = "local"
+        return spec
+
+    def solve(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Solve a model specification, honoring ``solver``, ``time_limit`` and ``gap``."""
+        spec = arguments.get("model_specification")
+        if not isinstance(spec, dict):
+            raise LocalModelError("No model specification to solve")
+        if "objective" not in spec and isinstance(spec.get("model_specification"), dict):
+            # A whole build_model result
+            spec = spec["model_specification"]
+        solver_config = arguments.get("solver_config") or {}
+        solver = str(solver_config.get("solver") or self.config.local_solver).lower()
+        if solver not in LOCAL_SOLVERS:
+            solver = self.config.local_solver
+        return solve_model(
+            spec,
+            solver=solver,
+            time_limit=solver_config.get("time_limit", self.config.local_time_limit),
+            gap=solver_config.get("gap"),
+        )
+
+    async def execute_workflow(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Run classification, analysis, model building and solving of a workflow."""
+        industry, workflow_id = arguments["industry"], arguments["workflow_id"]
+        parameters = dict(arguments.get("parameters") or {})
+        template = self.workflow_manager.workflows.get(industry, {}).get(workflow_id)
+        if template is None:
+            raise LocalModelError(f"Unknown workflow {industry}/{workflow_id}")
+        problem = parameters.pop("problem_description", None) or (
+            f"{template['name']}: {template.get('description', '')}"
+        )
+        data_type = parameters.pop("data_type", "tabular")
+        model_type = parameters.pop("model_type", None) or "auto"
+        solver_config = parameters.pop("solver_config", None) or {}
+        constraints = parameters.pop("constraints", None)
+        if constraints is None:
+            constraints = json.dumps(parameters, sort_keys=True, default=str) if parameters else ""
+        analysis = self.analyze(problem, data_type, constraints)
+        model = self.build(problem, analysis, model_type)
+        loop = asyncio.get_event_loop()
+        solution = await loop.run_in_executor(None, self.solve, {
+            "model_specification": model, "solver_config": solver_config
+        })
+        return {
+            "intent_classification": self.classify(problem),
+            "data_analysis": analysis,
+            "model_specification": model,
+            "optimization_results": solution,
+            "backend": "local",
+        }
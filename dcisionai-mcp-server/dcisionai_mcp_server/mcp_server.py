@@ -5,32 +5,40 @@ DcisionAI MCP Server - Standard MCP Protocol Implementation
 
 This module provides a standard MCP server implementation that communicates
 via stdin/stdout, compatible with Cursor IDE and other MCP clients.
+
+Tools are served from the registry in ``registry.py``. The gateway client,
+configuration and their dependencies are only loaded on the first tool
+call, so the server answers ``initialize`` and ``tools/list`` quickly.
 """
 
 import asyncio
 import json
 import logging
 import sys
-from typing import Any, Dict, List, Optional
-from mcp.server import Server
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
+from mcp.server import NotificationOptions, Server
 from mcp.server.models import InitializationOptions
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
-from .tools import (
-    classify_intent,
-    analyze_data,
-    build_model,
-    solve_optimization,
-    get_workflow_templates,
-    execute_workflow,
-)
-from .config import Config
+from . import __version__
+from .registry import TOOL_SPECS, get_tool_spec
+from .streaming import call_long_running, progress_reporter
+
+if TYPE_CHECKING:
+    from .config import Config
+    from .tools import DcisionAITools
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Configure logging to stderr so it doesn't interfere with MCP protocol
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    stream=sys.stderr
+)
 logger = logging.getLogger(__name__)
 
+SERVER_NAME = "dcisionai-optimization"
+
 class DcisionAIMCPServer:
     """
     DcisionAI MCP Server using standard MCP protocol.
@@ -44,182 +52,76 @@ class DcisionAIMCPServer:
     6. execute_workflow - End-to-end workflow execution
     """
     
-    def __init__(self, config: Optional[Config] = None):
-        """Initialize the DcisionAI MCP Server."""
-        self.config = config or Config()
-        self.server = Server("dcisionai-optimization")
+    def __init__(self, config: Optional["Config"] = None):
+        """
+        Initialize the DcisionAI MCP Server.
+        
+        Args:
+            config: Optional configuration; when omitted the process-wide
+                snapshot is loaded on the first tool call, and its file is
+                watched and reloaded from then on
+        """
+        self._config = config
+        self._tools: Optional["DcisionAITools"] = None
+        self.server = Server(SERVER_NAME)
         self._register_handlers()
         logger.info("DcisionAI MCP Server initialized successfully")
     
+    @property
+    def config(self) -> "Config":
+        """Server configuration, loaded from the environment on first use."""
+        if self._config is None:
+            from .config_manager import get_config_manager
+            manager = get_config_manager()
+            self._config = manager.config
+            manager.subscribe(self._config_reloaded)
+            manager.start()
+        return self._config
+    
+    def _config_reloaded(self, previous: "Config", config: "Config", changed: Set[str]):
+        self._config = config
+        if self._tools is not None:
+            self._tools.apply_config(config)
+    
+    def get_tools(self) -> "DcisionAITools":
+        """Tools instance for this server, created on the first tool call."""
+        if self._tools is None or self._tools.is_closed:
+            from .tools import DcisionAITools
+            self._tools = DcisionAITools(self.config)
+        return self._tools
+    
+    def list_tools(self) -> List[Tool]:
+        """MCP tool definitions from the registry."""
+        return [
+            Tool(name=spec.name, description=spec.description, inputSchema=spec.input_schema)
+            for spec in TOOL_SPECS
+        ]
+    
+    async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Dispatch an MCP tool call to the matching ``DcisionAITools`` method."""
+        spec = get_tool_spec(name)
+        if spec is None:
+            return {"error": f"Unknown tool: {name}"}
+        
+        tools = self.get_tools()
+        args = spec.arguments(arguments or {})
+        if spec.streaming:
+            return await call_long_running(tools, name, args, progress_reporter(self.server))
+        return await getattr(tools, name)(*args)
+    
     def _register_handlers(self):
         """Register MCP protocol handlers."""
         
         @self.server.list_tools()
         async def handle_list_tools() -> List[Tool]:
             """List all available tools."""
-            return [
-                Tool(
-                    name="classify_intent",
-                    description="Classify user intent for optimization requests",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "problem_description": {
-                                "type": "string",
-                                "description": "The user's optimization request or problem description"
-                            },
-                            "context": {
-                                "type": "string",
-                                "description": "Optional context about the business domain",
-                                "default": None
-                            }
-                        },
-                        "required": ["problem_description"]
-                    }
-                ),
-                Tool(
-                    name="analyze_data",
-                    description="Analyze and preprocess data for optimization",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "problem_description": {
-                                "type": "string",
-                                "description": "Description of the optimization problem"
-                            },
-                            "intent_data": {
-                                "type": "object",
-                                "description": "Intent classification results from classify_intent",
-                                "default": {}
-                            }
-                        },
-                        "required": ["problem_description"]
-                    }
-                ),
-                Tool(
-                    name="build_model",
-                    description="Build mathematical optimization model using Qwen 30B",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "problem_description": {
-                                "type": "string",
-                                "description": "Detailed problem description"
-                            },
-                            "intent_data": {
-                                "type": "object",
-                                "description": "Intent classification results",
-                                "default": {}
-                            },
-                            "data_analysis": {
-                                "type": "object",
-                                "description": "Results from data analysis step",
-                                "default": {}
-                            }
-                        },
-                        "required": ["problem_description"]
-                    }
-                ),
-                Tool(
-                    name="solve_optimization",
-                    description="Solve the optimization problem and generate results",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "problem_description": {
-                                "type": "string",
-                                "description": "Problem description"
-                            },
-                            "intent_data": {
-                                "type": "object",
-                                "description": "Intent classification results",
-                                "default": {}
-                            },
-                            "data_analysis": {
-                                "type": "object",
-                                "description": "Data analysis results",
-                                "default": {}
-                            },
-                            "model_building": {
-                                "type": "object",
-                                "description": "Model building results",
-                                "default": {}
-                            }
-                        },
-                        "required": ["problem_description"]
-                    }
-                ),
-                Tool(
-                    name="get_workflow_templates",
-                    description="Get available industry workflow templates",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "required": []
-                    }
-                ),
-                Tool(
-                    name="execute_workflow",
-                    description="Execute a complete optimization workflow",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "industry": {
-                                "type": "string",
-                                "description": "Target industry (manufacturing, healthcare, retail, marketing, financial, logistics, energy)"
-                            },
-                            "workflow_id": {
-                                "type": "string",
-                                "description": "Specific workflow to execute"
-                            },
-                            "user_input": {
-                                "type": "object",
-                                "description": "User input parameters",
-                                "default": {}
-                            }
-                        },
-                        "required": ["industry", "workflow_id"]
-                    }
-                )
-            ]
+            return self.list_tools()
         
         @self.server.call_tool()
         async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
             """Handle tool calls."""
             try:
-                if name == "classify_intent":
-                    result = await classify_intent(
-                        arguments.get("problem_description", ""),
-                        arguments.get("context")
-                    )
-                elif name == "analyze_data":
-                    result = await analyze_data(
-                        arguments.get("problem_description", ""),
-                        arguments.get("intent_data", {})
-                    )
-                elif name == "build_model":
-                    result = await build_model(
-                        arguments.get("problem_description", ""),
-                        arguments.get("intent_data", {}),
-                        arguments.get("data_analysis", {})
-                    )
-                elif name == "solve_optimization":
-                    result = await solve_optimization(
-                        arguments.get("problem_description", ""),
-                        arguments.get("intent_data", {}),
-                        arguments.get("data_analysis", {}),
-                        arguments.get("model_building", {})
-                    )
-                elif name == "get_workflow_templates":
-                    result = await get_workflow_templates()
-                elif name == "execute_workflow":
-                    result = await execute_workflow(
-                        arguments.get("industry", ""),
-                        arguments.get("workflow_id", ""),
-                        arguments.get("user_input", {})
-                    )
-                else:
-                    result = {"error": f"Unknown tool: {name}"}
+                result = await self.call_tool(name, arguments)
                 
                 # Convert result to JSON string
                 if isinstance(result, dict):
@@ -238,36 +140,41 @@ class DcisionAIMCPServer:
                 }
                 return [TextContent(type="text", text=json.dumps(error_result, indent=2))]
     
+    async def aclose(self):
+        """Close the tools instance, if one was created."""
+        if self._tools is not None:
+            await self._tools.aclose()
+            self._tools = None
+    
     async def run(self):
         """Run the MCP server using stdio transport."""
         logger.info("Starting DcisionAI MCP Server with stdio transport")
         
-        async with stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream,
-                write_stream,
-                InitializationOptions(
-                    server_name="dcisionai-optimization",
-                    server_version="1.0.0",
-                    capabilities=self.server.get_capabilities(
-                        notification_options=None,
-                        experimental_capabilities={}
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await self.server.run(
+                    read_stream,
+                    write_stream,
+                    InitializationOptions(
+                        server_name=SERVER_NAME,
+                        server_version=__version__,
+                        capabilities=self.server.get_capabilities(
+                            notification_options=NotificationOptions(),
+                            experimental_capabilities={}
+                        )
                     )
                 )
-            )
+        finally:
+            await self.aclose()
 
 async def main():
     """Main entry point for the MCP server."""
     try:
-        # Load configuration
-        config = Config()
-        
-        # Create and run server
-        server = DcisionAIMCPServer(config)
+        server = DcisionAIMCPServer()
         await server.run()
         
     except Exception as e:
-        logger.error(f"Failed to start MCP server: {e}")
+        logger.error(f"Error running MCP server: {e}")
         sys.exit(1)
 
 if __name__ == "__main__":
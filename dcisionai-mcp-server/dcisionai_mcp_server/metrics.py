@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+DcisionAI Metrics
+=================
+
+Lightweight latency histograms for gateway calls.
+Used to derive data-driven thresholds such as the hedging delay.
+"""
+
+import bisect
+from typing import Any, Dict, List, Optional
+
+# Log-spaced bucket upper bounds from 1ms to ~3 minutes (sqrt(2) apart)
+DEFAULT_BUCKETS = tuple(0.001 * 2 ** (i / 2) for i in range(36))
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram of latencies in seconds."""
+
+    def __init__(self, buckets: Optional[List[float]] = None):
+        self.buckets = tuple(buckets or DEFAULT_BUCKETS)
+        # One extra overflow bucket for values above the last bound
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def observe(self, seconds: float):
+        """Record one latency sample."""
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """
+        Estimate a percentile as the upper bound of its bucket.
+
+        Returns:
+            The estimate in seconds, or ``None`` if nothing was recorded
+        """
+        if not self.count:
+            return None
+        rank = pct / 100.0 * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                if index < len(self.buckets):
+                    return min(self.buckets[index], self.max)
+                return self.max
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary of the histogram for reporting."""
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+        }
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+DcisionAI Rate Limiter
+======================
+
+Client-side token bucket enforcing ``Config.rate_limit_requests`` per
+``Config.rate_limit_window``. Callers over the limit are queued instead of
+failed; queued calls are served round-robin across tools, with priority
+tools (cheap calls such as ``get_workflow_templates``) served first.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict, defaultdict, deque
+from typing import Any, Deque, Dict, Iterable, Optional
+
+from .config import Config
+from .metrics import LatencyHistogram
+
+
+class RateLimiter:
+    """
+    Fair, queueing token bucket shared by every caller of a gateway.
+
+    Args:
+        requests: Requests allowed per window
+        window: Window length in seconds
+        burst: Bucket capacity; defaults to ``requests``
+        priority_tools: Tools served ahead of all others when queued
+    """
+
+    def __init__(self, requests: int, window: float, burst: Optional[int] = None,
+                 priority_tools: Iterable[str] = ()):
+        self.rate = requests / window
+        self.capacity = float(burst or requests)
+        self.priority_tools = set(priority_tools)
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+        self._queues: "OrderedDict[str, Deque[asyncio.Future]]" = OrderedDict()
+        self._dispatcher: Optional[asyncio.Task] = None
+        self.wait_times: Dict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
+        self.granted = 0
+        self.queued = 0
+
+    @classmethod
+    def from_config(cls, config: Config) -> "RateLimiter":
+        return cls(
+            config.rate_limit_requests,
+            config.rate_limit_window,
+            burst=config.rate_limit_burst,
+            priority_tools=config.rate_limit_priority_tools,
+        )
+
+    @property
+    def waiting(self) -> int:
+        """Number of callers currently queued."""
+        return sum(len(queue) for queue in self._queues.values())
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tool: str) -> bool:
+        """Take a token without waiting; never jumps ahead of queued callers."""
+        self._refill()
+        if self.waiting or self.tokens < 1:
+            return False
+        self.tokens -= 1
+        self.granted += 1
+        self.wait_times[tool].observe(0.0)
+        return True
+
+    async def acquire(self, tool: str):
+        """Wait for a token for one request of ``tool``."""
+        if self.try_acquire(tool):
+            return
+
+        started = time.perf_counter()
+        future = asyncio.get_running_loop().create_future()
+        self._queues.setdefault(tool, deque()).append(future)
+        self.queued += 1
+        self._ensure_dispatcher()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.cancelled():
+                self._discard(tool, future)
+            else:
+                # Granted just before the caller went away: give the token back
+                self.tokens = min(self.capacity, self.tokens + 1)
+            raise
+        self.wait_times[tool].observe(time.perf_counter() - started)
+
+    def _discard(self, tool: str, future: asyncio.Future):
+        queue = self._queues.get(tool)
+        if queue and future in queue:
+            queue.remove(future)
+            if not queue:
+                del self._queues[tool]
+
+    def _ensure_dispatcher(self):
+        loop = asyncio.get_running_loop()
+        if (self._dispatcher is None or self._dispatcher.done()
+                or self._dispatcher.get_loop() is not loop):
+            self._dispatcher = loop.create_task(self._dispatch())
+
+    def _next_tool(self) -> str:
+        """Priority tools first, then the tool that has waited longest for a turn."""
+        for tool in self._queues:
+            if tool in self.priority_tools:
+                return tool
+        return next(iter(self._queues))
+
+    async def _dispatch(self):
+        """Hand out tokens to queued callers as the bucket refills."""
+        while self._queues:
+            self._refill()
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                continue
+
+            tool = self._next_tool()
+            queue = self._queues.pop(tool)
+            future = queue.popleft()
+            if queue:
+                # Move to the back of the rotation so other tools get a turn
+                self._queues[tool] = queue
+            if future.done():
+                continue
+            self.tokens -= 1
+            self.granted += 1
+            future.set_result(None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Throughput settings, counters and queue wait times."""
+        return {
+            "rate_per_second": self.rate,
+            "capacity": self.capacity,
+            "tokens": self.tokens,
+            "waiting": self.waiting,
+            "granted": self.granted,
+            "queued": self.queued,
+            "wait_time": {tool: h.to_dict() for tool, h in self.wait_times.items()},
+        }
+
+
+# Rate limiters shared by every transport talking to the same gateway
+_limiters: Dict[str, RateLimiter] = {}
+
+
+def get_limiter(config: Config) -> Optional[RateLimiter]:
+    """Get the process-wide rate limiter for the configured gateway, if enabled."""
+    if not config.rate_limit_enabled:
+        return None
+    key = f"{config.gateway_url}|{config.gateway_target}"
+    if key not in _limiters:
+        _limiters[key] = RateLimiter.from_config(config)
+    return _limiters[key]
+
+
+def reset_limiters():
+    """Forget every rate limiter (used when the gateway configuration changes)."""
+    _limiters.clear()
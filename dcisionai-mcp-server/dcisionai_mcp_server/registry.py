@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+DcisionAI Tool Registry
+=======================
+
+Single definition of the MCP tools exposed by the stdio server: name,
+description, input schema and how MCP arguments map onto the
+``DcisionAITools`` methods. Kept free of heavy imports so listing tools
+does not pay for the HTTP client, YAML or configuration.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+INDUSTRIES = "manufacturing, healthcare, retail, marketing, financial, logistics, energy"
+
+
+@dataclass(frozen=True)
+class ToolSpec:
+    """
+    An MCP tool backed by a ``DcisionAITools`` method of the same name.
+
+    Attributes:
+        name: Tool name, also the ``DcisionAITools`` method name
+        description: Human-readable tool description
+        input_schema: JSON schema of the MCP arguments
+        arguments: Maps MCP arguments to positional method arguments
+        streaming: Whether progress is streamed when the client asks for it
+    """
+
+    name: str
+    description: str
+    input_schema: Dict[str, Any]
+    arguments: Callable[[Dict[str, Any]], Tuple[Any, ...]]
+    streaming: bool = False
+
+
+def _object(properties: Dict[str, Any], required: Tuple[str, ...] = ()) -> Dict[str, Any]:
+    return {"type": "object", "properties": properties, "required": list(required)}
+
+
+def _string(description: str) -> Dict[str, Any]:
+    return {"type": "string", "description": description}
+
+
+def _mapping(description: str) -> Dict[str, Any]:
+    return {"type": "object", "description": description, "default": {}}
+
+
+TOOL_SPECS: Tuple[ToolSpec, ...] = (
+    ToolSpec(
+        name="classify_intent",
+        description="Classify user intent for optimization requests",
+        input_schema=_object({
+            "problem_description": _string("The user's optimization request or problem description"),
+            "context": {
+                "type": "string",
+                "description": "Optional context about the business domain",
+                "default": None
+            },
+        }, ("problem_description",)),
+        arguments=lambda a: (a.get("problem_description", ""), a.get("context")),
+    ),
+    ToolSpec(
+        name="analyze_data",
+        description="Analyze and preprocess data for optimization",
+        input_schema=_object({
+            "problem_description": _string("Description of the optimization problem"),
+            "intent_data": _mapping("Intent classification results from classify_intent"),
+        }, ("problem_description",)),
+        arguments=lambda a: (a.get("problem_description", ""),),
+    ),
+    ToolSpec(
+        name="build_model",
+        description="Build mathematical optimization model using Qwen 30B",
+        input_schema=_object({
+            "problem_description": _string("Detailed problem description"),
+            "intent_data": _mapping("Intent classification results"),
+            "data_analysis": _mapping("Results from data analysis step"),
+        }, ("problem_description",)),
+        arguments=lambda a: (a.get("problem_description", ""), a.get("data_analysis", {})),
+    ),
+    ToolSpec(
+        name="solve_optimization",
+        description="Solve the optimization problem and generate results",
+        input_schema=_object({
+            "problem_description": _string("Problem description"),
+            "intent_data": _mapping("Intent classification results"),
+            "data_analysis": _mapping("Data analysis results"),
+            "model_building": _mapping("Model building results"),
+            "model_handle": _string("model_handle returned by build_model; send it instead of model_building"),
+        }, ("problem_description",)),
+        arguments=lambda a: (a.get("model_handle") or a.get("model_building", {}),),
+        streaming=True,
+    ),
+    ToolSpec(
+        name="get_workflow_templates",
+        description="Get available industry workflow templates",
+        input_schema=_object({}),
+        arguments=lambda a: (),
+    ),
+    ToolSpec(
+        name="execute_workflow",
+        description="Execute a complete optimization workflow",
+        input_schema=_object({
+            "industry": _string(f"Target industry ({INDUSTRIES})"),
+            "workflow_id": _string("Specific workflow to execute"),
+            "user_input": _mapping("User input parameters"),
+        }, ("industry", "workflow_id")),
+        arguments=lambda a: (
+            a.get("industry", ""),
+            a.get("workflow_id", ""),
+            a.get("user_input", {}),
+        ),
+        streaming=True,
+    ),
+)
+
+TOOLS_BY_NAME: Dict[str, ToolSpec] = {spec.name: spec for spec in TOOL_SPECS}
+
+
+def get_tool_spec(name: str) -> Optional[ToolSpec]:
+    """Look up a tool by name."""
+    return TOOLS_BY_NAME.get(name)
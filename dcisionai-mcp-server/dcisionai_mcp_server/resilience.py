@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+DcisionAI Gateway Resilience
+============================
+
+Retry, hedging and circuit-breaker policies for AgentCore Gateway calls.
+The policies are plain objects driven by ``Config``; ``GatewayTransport``
+applies them around every HTTP request.
+"""
+
+import logging
+import random
+import time
+from typing import Dict, Optional
+
+from .config import Config
+
+logger = logging.getLogger(__name__)
+
+# Statuses worth retrying: throttling and transient server errors
+RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open."""
+
+    def __init__(self, target: str, retry_in: float):
+        self.target = target
+        self.retry_in = retry_in
+        super().__init__(
+            f"Circuit open for gateway target '{target}', retry in {retry_in:.1f}s"
+        )
+
+
+class RetryPolicy:
+    """
+    Jittered exponential backoff.
+
+    Throttled (429) responses wait at least one rate-limit slot
+    (``rate_limit_window / rate_limit_requests``) or the gateway's
+    ``Retry-After``, whichever is longer.
+    """
+
+    def __init__(self, attempts: int = 3, base: float = 0.5, cap: float = 10.0,
+                 throttle_interval: float = 0.0):
+        self.attempts = attempts
+        self.base = base
+        self.cap = cap
+        self.throttle_interval = throttle_interval
+
+    @classmethod
+    def from_config(cls, config: Config) -> "RetryPolicy":
+        return cls(
+            attempts=config.retry_attempts,
+            base=config.retry_backoff_base,
+            cap=config.retry_backoff_max,
+            throttle_interval=config.rate_limit_window / max(config.rate_limit_requests, 1),
+        )
+
+    def delay(self, attempt: int, status_code: Optional[int] = None,
+              retry_after: Optional[str] = None) -> float:
+        """Seconds to wait before retry number ``attempt + 1``."""
+        delay = random.uniform(0, min(self.cap, self.base * 2 ** attempt))
+        if status_code == 429:
+            floor = self.throttle_interval
+            if retry_after:
+                try:
+                    floor = max(floor, float(retry_after))
+                except ValueError:
+                    pass
+            delay = max(delay, min(floor, self.cap))
+        return delay
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker for one gateway target.
+
+    Closed: calls flow normally. Open: calls fail fast until
+    ``reset_timeout`` has passed. Half-open: one trial call is let through;
+    its outcome closes or re-opens the circuit. A trial that ends without
+    an outcome (cancelled, or failed before reaching the gateway) must be
+    given back with ``release`` so the next call can be the trial.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, target: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.target = target
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial: Optional[object] = None
+
+    def before_call(self) -> Optional[object]:
+        """
+        Admit or reject a call.
+
+        Returns:
+            A trial handle for ``release`` if the call is the half-open
+            trial, otherwise ``None``
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a
+                trial call already in flight
+        """
+        if self.state == self.CLOSED:
+            return
+
+        elapsed = time.monotonic() - self.opened_at
+        if self.state == self.OPEN and elapsed >= self.reset_timeout:
+            self.state = self.HALF_OPEN
+            self._trial = None
+
+        if self.state == self.HALF_OPEN and self._trial is None:
+            self._trial = object()
+            return self._trial
+
+        raise CircuitOpenError(self.target, max(0.0, self.reset_timeout - elapsed))
+
+    def record_success(self):
+        """A call succeeded: close the circuit."""
+        if self.state != self.CLOSED:
+            logger.info(f"Circuit closed for gateway target '{self.target}'")
+        self.state = self.CLOSED
+        self.failures = 0
+        self._trial = None
+
+    def release(self, trial: Optional[object]):
+        """Give back a trial that ended without recording an outcome (no-op otherwise)."""
+        if trial is not None and trial is self._trial:
+            self._trial = None
+
+    def record_failure(self):
+        """A call failed: open the circuit once the threshold is reached."""
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                logger.warning(
+                    f"Circuit opened for gateway target '{self.target}' "
+                    f"after {self.failures} failures"
+                )
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+            self._trial = None
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "target": self.target,
+            "state": self.state,
+            "consecutive_failures": self.failures,
+        }
+
+
+# Circuit breakers shared by every transport talking to the same target
+_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_breaker(config: Config) -> CircuitBreaker:
+    """Get the process-wide circuit breaker for the configured gateway target."""
+    key = f"{config.gateway_url}|{config.gateway_target}"
+    if key not in _breakers:
+        _breakers[key] = CircuitBreaker(
+            config.gateway_target,
+            failure_threshold=config.breaker_failure_threshold,
+            reset_timeout=config.breaker_reset_timeout,
+        )
+    return _breakers[key]
+
+
+def reset_breakers():
+    """Forget every circuit breaker (used when the gateway configuration changes)."""
+    _breakers.clear()
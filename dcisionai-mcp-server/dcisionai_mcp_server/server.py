@@ -5,21 +5,25 @@ DcisionAI MCP Server
 
 Main MCP server implementation for AI-powered business optimization.
 Provides industry-specific workflows with Qwen 30B integration.
+
+Serves MCP over streamable HTTP or SSE for many concurrent sessions on one
+event loop. Each session's tool calls are bounded by ``sessions``, and on
+SIGTERM the server stops accepting connections and lets calls in flight
+finish before exiting. ``workers`` runs several server processes.
 """
 
-import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+import math
+import os
+import socket
+from typing import Any, Dict, List, Optional, Set, Union
 from fastmcp import FastMCP
-from .tools import (
-    classify_intent,
-    analyze_data,
-    build_model,
-    solve_optimization,
-    get_workflow_templates,
-    execute_workflow,
-)
+from . import __version__
+from .tools import DcisionAITools
 from .config import Config
+from .config_manager import get_config_manager, use_config_file
+from .sessions import SessionLimiter
+from .telemetry import PROMETHEUS_CONTENT_TYPE, get_telemetry
 from .workflows import WorkflowManager
 
 # Configure logging
@@ -40,20 +44,62 @@ class DcisionAIMCPServer:
     """
     
     def __init__(self, config: Optional[Config] = None):
-        """Initialize the DcisionAI MCP Server."""
-        self.config = config or Config()
+        """
+        Initialize the DcisionAI MCP Server.
+        
+        Args:
+            config: Configuration to serve with; when omitted the
+                process-wide snapshot is used, and its file is watched and
+                reloaded while the server runs
+        """
+        self.managed = config is None
+        if config is None:
+            manager = get_config_manager()
+            config = manager.config
+            manager.subscribe(self._config_reloaded)
+        self.config = config
         self.workflow_manager = WorkflowManager()
-        self.mcp = FastMCP("DcisionAI Optimization Tools")
+        self.sessions = SessionLimiter.from_config(self.config)
+        # An explicit version spares every new session a package metadata lookup
+        self.mcp = FastMCP(
+            "DcisionAI Optimization Tools", version=__version__, middleware=[self.sessions]
+        )
+        self._tools: Optional[DcisionAITools] = None
+        self._server = None
         
         # Register all tools
         self._register_tools()
+        self._register_routes()
         
         logger.info("DcisionAI MCP Server initialized successfully")
     
+    def get_tools(self) -> DcisionAITools:
+        """Tools instance shared by every session of this server."""
+        if self._tools is None or self._tools.is_closed:
+            self._tools = DcisionAITools(self.config)
+        return self._tools
+    
+    def _config_reloaded(self, previous: Config, config: Config, changed: Set[str]):
+        """Apply a reloaded configuration to new sessions and the tools."""
+        self.config = config
+        self.sessions.max_concurrency = config.session_max_concurrency
+        self.sessions.max_queued = config.session_max_queued
+        if self._tools is not None:
+            self._tools.apply_config(config)
+    
+    async def aclose(self):
+        """Close the tools instance, if one was created."""
+        if self._tools is not None:
+            await self._tools.aclose()
+            self._tools = None
+    
     def _register_tools(self):
         """Register all MCP tools with the server."""
+        # The tools' only output schema would be "any object"; without one
+        # the result is not validated against it on every call
+        tool = self.mcp.tool(output_schema=None)
         
-        @self.mcp.tool()
+        @tool
         async def classify_intent_tool(
             user_input: str,
             context: Optional[str] = None
@@ -68,9 +114,9 @@ class DcisionAIMCPServer:
             Returns:
                 Classification result with intent type and confidence
             """
-            return await classify_intent(user_input, context)
+            return await self.get_tools().classify_intent(user_input, context)
         
-        @self.mcp.tool()
+        @tool
         async def analyze_data_tool(
             data_description: str,
             data_type: str = "tabular",
@@ -87,9 +133,9 @@ class DcisionAIMCPServer:
             Returns:
                 Data analysis results and recommendations
             """
-            return await analyze_data(data_description, data_type, constraints)
+            return await self.get_tools().analyze_data(data_description, data_type, constraints)
         
-        @self.mcp.tool()
+        @tool
         async def build_model_tool(
             problem_description: str,
             data_analysis: Optional[Dict[str, Any]] = None,
@@ -106,26 +152,27 @@ class DcisionAIMCPServer:
             Returns:
                 Model specification and mathematical formulation
             """
-            return await build_model(problem_description, data_analysis, model_type)
+            return await self.get_tools().build_model(problem_description, data_analysis, model_type)
         
-        @self.mcp.tool()
+        @tool
         async def solve_optimization_tool(
-            model_specification: Dict[str, Any],
+            model_specification: Union[Dict[str, Any], str],
             solver_config: Optional[Dict[str, Any]] = None
         ) -> Dict[str, Any]:
             """
             Solve the optimization problem and generate results.
             
             Args:
-                model_specification: Model from build_model step
+                model_specification: Model from build_model step, or the
+                    model_handle it returned
                 solver_config: Optional solver configuration
                 
             Returns:
                 Optimization results and business insights
             """
-            return await solve_optimization(model_specification, solver_config)
+            return await self.get_tools().solve_optimization(model_specification, solver_config)
         
-        @self.mcp.tool()
+        @tool
         async def get_workflow_templates_tool() -> Dict[str, Any]:
             """
             Get available industry workflow templates.
@@ -133,9 +180,9 @@ class DcisionAIMCPServer:
             Returns:
                 List of available workflows organized by industry
             """
-            return await get_workflow_templates()
+            return await self.get_tools().get_workflow_templates()
         
-        @self.mcp.tool()
+        @tool
         async def execute_workflow_tool(
             industry: str,
             workflow_id: str,
@@ -152,14 +199,98 @@ class DcisionAIMCPServer:
             Returns:
                 Complete workflow execution results
             """
-            return await execute_workflow(industry, workflow_id, parameters)
+            return await self.get_tools().execute_workflow(industry, workflow_id, parameters)
+    
+    def _register_routes(self):
+        """Register HTTP routes served next to the MCP endpoint."""
+        from starlette.responses import JSONResponse, Response
+        
+        @self.mcp.custom_route("/metrics", methods=["GET"])
+        async def metrics(request) -> Response:
+            """Gateway call telemetry in the Prometheus text format."""
+            return Response(get_telemetry().prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
+        
+        @self.mcp.custom_route("/metrics/json", methods=["GET"])
+        async def metrics_json(request) -> JSONResponse:
+            """Gateway call telemetry as per-tool JSON summaries."""
+            return JSONResponse(get_telemetry().snapshot())
+        
+        @self.mcp.custom_route("/health", methods=["GET"])
+        async def health(request) -> JSONResponse:
+            """Liveness, per-session call counters and config reloads of this process."""
+            return JSONResponse({
+                "status": "ok",
+                "pid": os.getpid(),
+                "sessions": self.sessions.stats(),
+                "config": get_config_manager().stats() if self.managed else None,
+            })
+    
+    def http_app(self):
+        """
+        ASGI app serving MCP over the configured transport.
+        
+        Streamable HTTP answers each call with a plain JSON response
+        rather than an SSE stream, since SSE streams are cut as soon as
+        shutdown starts while JSON responses are drained. With several
+        workers a session's requests may reach any of them, so streamable
+        HTTP then also runs stateless.
+        """
+        if self.config.http_transport == "sse":
+            return self.mcp.http_app(transport="sse")
+        return self.mcp.http_app(
+            transport="http",
+            json_response=True,
+            stateless_http=True if self.config.workers > 1 else None
+        )
+    
+    async def serve(self, host: str = "localhost", port: int = 8000,
+                    sock: Optional[socket.socket] = None):
+        """
+        Serve MCP over HTTP until SIGTERM/SIGINT or ``shutdown()``.
+        
+        On shutdown, new connections are refused and calls in flight get
+        ``drain_timeout`` seconds to finish before they are cancelled.
+        
+        Args:
+            host: Interface to bind to
+            port: Port to bind to
+            sock: Already bound socket to listen on instead
+        """
+        import uvicorn
+        
+        self._server = uvicorn.Server(uvicorn.Config(
+            self.http_app(),
+            host=host,
+            port=port,
+            lifespan="on",
+            access_log=False,
+            log_level=self.config.log_level.lower(),
+            timeout_graceful_shutdown=math.ceil(self.config.drain_timeout),
+        ))
+        manager = get_config_manager() if self.managed else None
+        if manager is not None:
+            manager.start()
+        try:
+            await self._server.serve(sockets=[sock] if sock is not None else None)
+        finally:
+            self._server = None
+            if manager is not None:
+                await manager.stop()
+            await self.aclose()
+    
+    def shutdown(self):
+        """Start a graceful shutdown, as SIGTERM does."""
+        if self._server is not None:
+            self._server.should_exit = True
     
     async def run(self, host: str = "localhost", port: int = 8000):
         """Run the MCP server."""
-        logger.info(f"Starting DcisionAI MCP Server on {host}:{port}")
+        logger.info(
+            f"Starting DcisionAI MCP Server on {host}:{port} ({self.config.http_transport} transport)"
+        )
         
         try:
-            await self.mcp.run(host=host, port=port)
+            await self.serve(host, port)
         except Exception as e:
             logger.error(f"Error running MCP server: {e}")
             raise
@@ -196,25 +327,30 @@ class DcisionAIMCPServer:
         }
 
 # CLI entry point
-async def main():
+def main():
     """Main entry point for the MCP server."""
     import argparse
+    from .workers import run_workers
     
     parser = argparse.ArgumentParser(description="DcisionAI MCP Server")
     parser.add_argument("--host", default="localhost", help="Host to bind to")
     parser.add_argument("--port", type=int, default=8000, help="Port to bind to")
     parser.add_argument("--config", help="Path to configuration file")
+    parser.add_argument("--transport", choices=["http", "sse"], help="MCP transport (default: DCISIONAI_HTTP_TRANSPORT)")
+    parser.add_argument("--workers", type=int, help="Server processes (default: DCISIONAI_WORKERS)")
     
     args = parser.parse_args()
     
-    # Load configuration if provided
-    config = None
-    if args.config:
-        config = Config.from_file(args.config)
+    # Command line options take precedence over the (hot reloaded) file
+    overrides: Dict[str, Any] = {}
+    if args.transport:
+        overrides["http_transport"] = args.transport
+    if args.workers:
+        overrides["workers"] = args.workers
+    manager = use_config_file(args.config, overrides)
     
     # Create and run server
-    server = DcisionAIMCPServer(config)
-    await server.run(host=args.host, port=args.port)
+    raise SystemExit(run_workers(manager.config, args.host, args.port, managed=True))
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()
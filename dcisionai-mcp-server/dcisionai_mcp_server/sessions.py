@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+DcisionAI Session Limits
+========================
+
+Per-session concurrency limits for the HTTP/SSE MCP server.
+Every MCP session may run a bounded number of tool calls at once; further
+calls wait in a bounded queue, and calls beyond that are rejected straight
+away so one busy client cannot queue unbounded work in front of the
+others. Sessions are tracked only while they have calls pending.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict
+
+from fastmcp.exceptions import ToolError
+from fastmcp.server.middleware import Middleware
+
+logger = logging.getLogger(__name__)
+
+
+class _Session:
+    """Slots of one session and the number of its calls running or waiting."""
+
+    __slots__ = ("slots", "pending")
+
+    def __init__(self, max_concurrency: int):
+        self.slots = asyncio.Semaphore(max_concurrency)
+        self.pending = 0
+
+
+class SessionLimiter(Middleware):
+    """
+    FastMCP middleware bounding the tool calls of each session.
+
+    Args:
+        max_concurrency: Tool calls a session may run at the same time
+        max_queued: Calls a session may have waiting for a slot; calls
+            beyond that fail with a "server busy" tool error
+    """
+
+    def __init__(self, max_concurrency: int = 4, max_queued: int = 16):
+        self.max_concurrency = max_concurrency
+        self.max_queued = max_queued
+        self._sessions: Dict[str, _Session] = {}
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.calls = 0
+        self.rejected = 0
+
+    @classmethod
+    def from_config(cls, config) -> "SessionLimiter":
+        """Build the limiter described by a ``Config``."""
+        return cls(config.session_max_concurrency, config.session_max_queued)
+
+    async def on_call_tool(self, context, call_next):
+        fastmcp_context = context.fastmcp_context
+        key = fastmcp_context.session_id if fastmcp_context is not None else ""
+        session = self._sessions.get(key)
+        if session is None:
+            session = self._sessions[key] = _Session(self.max_concurrency)
+        if session.pending >= self.max_concurrency + self.max_queued:
+            self.rejected += 1
+            raise ToolError(
+                f"Server busy: {session.pending} calls of this session are already pending, retry later"
+            )
+
+        session.pending += 1
+        try:
+            async with session.slots:
+                self.calls += 1
+                self.in_flight += 1
+                self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+                try:
+                    return await call_next(context)
+                finally:
+                    self.in_flight -= 1
+        finally:
+            session.pending -= 1
+            if session.pending == 0:
+                del self._sessions[key]
+
+    def stats(self) -> Dict[str, Any]:
+        """Sessions with pending calls, calls running, and rejections."""
+        return {
+            "active_sessions": len(self._sessions),
+            "in_flight": self.in_flight,
+            "queued": sum(s.pending for s in self._sessions.values()) - self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "calls": self.calls,
+            "rejected": self.rejected,
+            "max_concurrency_per_session": self.max_concurrency,
+            "max_queued_per_session": self.max_queued,
+        }
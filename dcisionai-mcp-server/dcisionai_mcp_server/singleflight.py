@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+DcisionAI Request Coalescing
+============================
+
+Single-flight execution of identical concurrent calls.
+When several callers ask for the same key while a call is in flight,
+they all await that one call instead of starting their own. A caller
+that is cancelled only stops waiting; the shared call keeps running
+while any other caller still waits for it and is cancelled with the
+last one.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+
+T = TypeVar("T")
+
+
+class _Flight:
+    """One in-flight call and the number of callers waiting for it."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Future):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key into one task."""
+
+    def __init__(self):
+        self._flights: Dict[str, _Flight] = {}
+        self.started = 0
+        self.shared = 0
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    async def do(self, key: str, call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run ``call()`` unless a call for ``key`` is already in flight.
+
+        Every caller gets the same result (or exception) of the shared call.
+
+        Args:
+            key: Identity of the call, e.g. a hash of its canonical arguments
+            call: Starts the call; only invoked by the first caller
+
+        Raises:
+            asyncio.CancelledError: If this caller is cancelled, or the
+                shared call was cancelled from elsewhere
+        """
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = self._flights[key] = _Flight(asyncio.ensure_future(call()))
+            flight.task.add_done_callback(lambda _, key=key, flight=flight: self._forget(key, flight))
+            self.started += 1
+        else:
+            self.shared += 1
+
+        flight.waiters += 1
+        try:
+            # Shielded so cancelling one caller does not cancel the shared call
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # Nobody is left to receive the result
+                self._forget(key, flight)
+                flight.task.cancel()
+
+    def _forget(self, key: str, flight: _Flight):
+        # A cancelled flight may already have been replaced by a new one
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    def stats(self) -> Dict[str, Any]:
+        """Calls started, calls that joined an in-flight call, and calls in flight."""
+        total = self.started + self.shared
+        return {
+            "started": self.started,
+            "shared": self.shared,
+            "in_flight": len(self._flights),
+            "shared_rate": self.shared / total if total else 0.0,
+        }
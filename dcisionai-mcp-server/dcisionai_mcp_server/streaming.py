@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+DcisionAI MCP Streaming
+=======================
+
+Forwards progress of long-running tool calls to MCP clients.
+Streaming tool events are turned into MCP progress notifications and
+log messages carrying partial results, so the IDE shows feedback while
+``solve_optimization`` or ``execute_workflow`` is still running.
+"""
+
+import logging
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .tools import DcisionAITools, EventCallback
+
+logger = logging.getLogger(__name__)
+
+# Logger name attached to partial-result log messages
+PARTIAL_RESULT_LOGGER = "dcisionai.partial"
+
+
+def progress_reporter(server: Any) -> Optional["EventCallback"]:
+    """
+    Build an event callback for the tool call currently handled by ``server``.
+
+    Args:
+        server: The low-level MCP ``Server`` handling the request
+
+    Returns:
+        A callback forwarding progress and partial results to the client,
+        or ``None`` if the client did not ask for progress (no
+        ``progressToken``) or no request is being handled
+    """
+    try:
+        context = server.request_context
+    except LookupError:
+        return None
+
+    meta = getattr(context, "meta", None)
+    token = getattr(meta, "progressToken", None) if meta is not None else None
+    if token is None:
+        return None
+
+    session = context.session
+
+    async def report(event: Dict[str, Any]):
+        try:
+            if event["event"] == "progress":
+                await session.send_progress_notification(
+                    token, event["progress"], event.get("total")
+                )
+            elif event["event"] == "partial":
+                await session.send_log_message(
+                    level="info",
+                    data={"stage": event.get("stage"), "partial": event.get("data")},
+                    logger=PARTIAL_RESULT_LOGGER,
+                )
+        except Exception as e:
+            # Progress is best effort; never fail the tool call over it
+            logger.debug(f"Could not forward {event['event']} event: {e}")
+
+    return report
+
+
+async def call_long_running(tools: "DcisionAITools", tool: str, args: Tuple[Any, ...],
+                            report: Optional["EventCallback"]) -> Dict[str, Any]:
+    """
+    Call a long-running tool, streaming its progress when the client asked for it.
+
+    Args:
+        tools: Tools instance to call
+        tool: Name of a streaming tool from the registry
+        args: Positional arguments of the tool
+        report: Callback from ``progress_reporter``, or ``None``
+
+    Returns:
+        The tool result
+    """
+    if report is None:
+        return await getattr(tools, tool)(*args)
+    return await tools.call_streaming(tool, *args, on_event=report)
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+DcisionAI Telemetry
+===================
+
+Per-tool instrumentation of gateway calls.
+Every HTTP request is broken into phases from httpx trace events
+(connect, tls, send, server, receive) plus the time spent queued for a
+rate-limit token and parsing the JSON body; request and response sizes
+are recorded alongside. Metrics are process-wide, rendered in the
+Prometheus text format and optionally mirrored to OpenTelemetry.
+"""
+
+import logging
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from .metrics import LatencyHistogram
+
+logger = logging.getLogger(__name__)
+
+# Phases of a gateway call. DNS resolution happens inside the TCP connect
+# and is reported as part of ``connect``.
+PHASES = ("queue", "connect", "tls", "send", "server", "receive", "parse", "total")
+
+# Power-of-two size buckets from 64 bytes to 64 MiB
+BYTE_BUCKETS = tuple(float(2 ** i) for i in range(6, 27))
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+METRIC_PREFIX = "dcisionai_gateway"
+
+# (phase, trace event that starts it, trace event that ends it)
+TRACE_PHASES = (
+    ("connect", "connect_tcp.started", "connect_tcp.complete"),
+    ("tls", "start_tls.started", "start_tls.complete"),
+    ("send", "send_request_headers.started", "send_request_body.complete"),
+    ("server", "send_request_body.complete", "receive_response_headers.complete"),
+    ("receive", "receive_response_body.started", "receive_response_body.complete"),
+)
+
+
+class RequestTrace:
+    """
+    httpx ``trace`` extension recording when each request phase happens.
+
+    Pass as ``extensions={"trace": trace}``; phases the request skipped,
+    such as connect and tls on a reused connection, are left out.
+    """
+
+    def __init__(self):
+        self.marks: Dict[str, float] = {}
+
+    async def __call__(self, event: str, info: Dict[str, Any]):
+        # "http11.send_request_body.complete" -> "send_request_body.complete"
+        self.marks[event.split(".", 1)[-1]] = time.perf_counter()
+
+    def phases(self) -> Dict[str, float]:
+        """Seconds spent in each phase that was observed."""
+        phases = {}
+        for phase, start, end in TRACE_PHASES:
+            if start in self.marks and end in self.marks:
+                phases[phase] = max(0.0, self.marks[end] - self.marks[start])
+        return phases
+
+
+def _format_float(value: float) -> str:
+    return f"{value:.6g}"
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: Any) -> str:
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+class Telemetry:
+    """Process-wide histograms and counters of gateway calls, by tool."""
+
+    def __init__(self):
+        self._otel: Optional[Dict[str, Any]] = None
+        self.clear()
+
+    def clear(self):
+        """Forget everything recorded so far."""
+        self.phases: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self.request_bytes: Dict[str, LatencyHistogram] = {}
+        self.response_bytes: Dict[str, LatencyHistogram] = {}
+        self.requests: Counter = Counter()
+        self.retries: Counter = Counter()
+        self.hedges: Counter = Counter()
+
+    def observe_phase(self, tool: str, phase: str, seconds: float):
+        """Record time spent in one phase of a call."""
+        histogram = self.phases.get((tool, phase))
+        if histogram is None:
+            histogram = self.phases[(tool, phase)] = LatencyHistogram()
+        histogram.observe(seconds)
+        if self._otel is not None:
+            self._otel["duration"].record(seconds, {"tool": tool, "phase": phase})
+
+    def observe_request(self, tool: str, status: str, phases: Dict[str, float],
+                        request_bytes: int, response_bytes: Optional[int] = None):
+        """
+        Record one HTTP request: its phases, sizes and outcome.
+
+        Args:
+            tool: Tool name or call label
+            status: HTTP status code, or ``"error"`` for transport errors
+            phases: Seconds per phase from ``RequestTrace.phases``
+            request_bytes: Size of the request body
+            response_bytes: Size of the response body, if one was read
+        """
+        for phase, seconds in phases.items():
+            self.observe_phase(tool, phase, seconds)
+        self._observe_bytes(self.request_bytes, "request_bytes", tool, request_bytes)
+        if response_bytes is not None:
+            self._observe_bytes(self.response_bytes, "response_bytes", tool, response_bytes)
+        self.requests[(tool, status)] += 1
+        if self._otel is not None:
+            self._otel["requests"].add(1, {"tool": tool, "status": status})
+
+    def _observe_bytes(self, histograms: Dict[str, LatencyHistogram], name: str,
+                       tool: str, size: int):
+        histogram = histograms.get(tool)
+        if histogram is None:
+            histogram = histograms[tool] = LatencyHistogram(list(BYTE_BUCKETS))
+        histogram.observe(size)
+        if self._otel is not None:
+            self._otel[name].record(size, {"tool": tool})
+
+    def count_retry(self, tool: str):
+        self.retries[tool] += 1
+
+    def count_hedge(self, tool: str):
+        self.hedges[tool] += 1
+
+    def enable_opentelemetry(self) -> bool:
+        """
+        Mirror every observation to OpenTelemetry instruments.
+
+        Uses the global meter provider. If none is configured and the
+        OpenTelemetry SDK and OTLP exporter are installed, one exporting
+        over OTLP/HTTP (configured by the standard ``OTEL_EXPORTER_OTLP_*``
+        variables) is installed.
+
+        Returns:
+            Whether the OpenTelemetry API is available
+        """
+        if self._otel is not None:
+            return True
+        try:
+            from opentelemetry import metrics
+        except ImportError:
+            logger.warning("OpenTelemetry requested but opentelemetry-api is not installed")
+            return False
+
+        _install_otlp_provider(metrics)
+        from . import __version__
+        meter = metrics.get_meter("dcisionai_mcp_server", __version__)
+        self._otel = {
+            "duration": meter.create_histogram(
+                "dcisionai.gateway.phase.duration", unit="s",
+                description="Time spent in each phase of gateway requests"),
+            "request_bytes": meter.create_histogram(
+                "dcisionai.gateway.request.size", unit="By",
+                description="Size of gateway request bodies"),
+            "response_bytes": meter.create_histogram(
+                "dcisionai.gateway.response.size", unit="By",
+                description="Size of gateway response bodies"),
+            "requests": meter.create_counter(
+                "dcisionai.gateway.requests", description="Gateway HTTP requests by status"),
+        }
+        return True
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Per-tool phase summaries, sizes and counters."""
+        tools: Dict[str, Dict[str, Any]] = {}
+
+        def entry(tool: str) -> Dict[str, Any]:
+            return tools.setdefault(tool, {
+                "phases": {}, "requests": {}, "retries": 0, "hedges": 0
+            })
+
+        for (tool, phase), histogram in sorted(self.phases.items()):
+            entry(tool)["phases"][phase] = histogram.to_dict()
+        for tool, histogram in self.request_bytes.items():
+            entry(tool)["request_bytes"] = histogram.to_dict()
+        for tool, histogram in self.response_bytes.items():
+            entry(tool)["response_bytes"] = histogram.to_dict()
+        for (tool, status), count in self.requests.items():
+            entry(tool)["requests"][status] = count
+        for tool, count in self.retries.items():
+            entry(tool)["retries"] = count
+        for tool, count in self.hedges.items():
+            entry(tool)["hedges"] = count
+        return {"tools": tools}
+
+    def prometheus(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+
+        def histogram_family(name: str, help_text: str,
+                             series: List[Tuple[Dict[str, str], LatencyHistogram]]):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} histogram")
+            for labels, histogram in series:
+                cumulative = 0
+                for bound, count in zip(histogram.buckets, histogram.counts):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{_labels(**labels, le=_format_float(bound))} {cumulative}")
+                lines.append(f"{name}_bucket{_labels(**labels, le='+Inf')} {histogram.count}")
+                lines.append(f"{name}_sum{_labels(**labels)} {_format_float(histogram.total)}")
+                lines.append(f"{name}_count{_labels(**labels)} {histogram.count}")
+
+        def counter_family(name: str, help_text: str, series: List[Tuple[Dict[str, str], int]]):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for labels, value in series:
+                lines.append(f"{name}{_labels(**labels)} {value}")
+
+        histogram_family(
+            f"{METRIC_PREFIX}_phase_seconds", "Time spent in each phase of gateway calls.",
+            [({"tool": tool, "phase": phase}, h) for (tool, phase), h in sorted(self.phases.items())])
+        histogram_family(
+            f"{METRIC_PREFIX}_request_bytes", "Size of gateway request bodies.",
+            [({"tool": tool}, h) for tool, h in sorted(self.request_bytes.items())])
+        histogram_family(
+            f"{METRIC_PREFIX}_response_bytes", "Size of gateway response bodies.",
+            [({"tool": tool}, h) for tool, h in sorted(self.response_bytes.items())])
+        counter_family(
+            f"{METRIC_PREFIX}_requests_total", "Gateway HTTP requests by status.",
+            [({"tool": tool, "status": status}, n) for (tool, status), n in sorted(self.requests.items())])
+        counter_family(
+            f"{METRIC_PREFIX}_retries_total", "Gateway calls retried.",
+            [({"tool": tool}, n) for tool, n in sorted(self.retries.items())])
+        counter_family(
+            f"{METRIC_PREFIX}_hedges_total", "Hedge requests sent.",
+            [({"tool": tool}, n) for tool, n in sorted(self.hedges.items())])
+        return "\n".join(lines) + "\n"
+
+
+def _install_otlp_provider(metrics: Any):
+    """Export over OTLP if the SDK is installed and no provider is configured."""
+    try:
+        from opentelemetry.sdk.metrics import MeterProvider
+        from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
+        from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
+    except ImportError:
+        logger.info("OpenTelemetry SDK/OTLP exporter not installed; "
+                    "metrics go to the application's meter provider, if any")
+        return
+    if isinstance(metrics.get_meter_provider(), MeterProvider):
+        return
+    reader = PeriodicExportingMetricReader(OTLPMetricExporter())
+    metrics.set_meter_provider(MeterProvider(metric_readers=[reader]))
+
+
+# Process-wide telemetry shared by every transport
+_telemetry = Telemetry()
+
+
+def get_telemetry() -> Telemetry:
+    """The process-wide telemetry registry."""
+    return _telemetry
+
+
+def reset_telemetry():
+    """Forget all recorded metrics (used by tests)."""
+    _telemetry.clear()
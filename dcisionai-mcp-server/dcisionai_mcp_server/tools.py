@@ -8,22 +8,115 @@ Implements the 6 main tools for AI-powered business optimization.
 """
 
 import asyncio
+import inspect
 import json
 import logging
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple, Union
 import httpx
 from .workflows import WorkflowManager
 from .config import Config
+from .config_manager import get_config_manager
+from .artifacts import ArtifactNotFoundError, ArtifactStore, is_handle
+from .auth import TokenError
+from .cache import ResponseCache
+from .codec import EncodedJSON
+from .local import LocalBackend
+from .resilience import CircuitOpenError
+from .singleflight import SingleFlight
+from .transport import GATEWAY_TOOLS, GatewayError, GatewayTransport
+from .workflow_engine import PIPELINE_STAGES, CheckpointStore, EventCallback, WorkflowEngine, WorkflowError
 
 logger = logging.getLogger(__name__)
 
+
+def gateway_unavailable(error: BaseException) -> bool:
+    """Whether an error means the gateway could not serve the call at all."""
+    if isinstance(error, GatewayError):
+        return error.status_code >= 500
+    return isinstance(error, (httpx.TransportError, CircuitOpenError, TokenError))
+
 class DcisionAITools:
     """Core tools for DcisionAI optimization workflows."""
     
+    # Fallback descriptions returned alongside tool errors
+    FALLBACKS = {
+        "classify_intent": "Default classification",
+        "analyze_data": "Default data analysis",
+        "build_model": "Default model building",
+        "solve_optimization": "Default optimization solving",
+        "execute_workflow": "Default workflow execution",
+    }
+    
     def __init__(self, config: Optional[Config] = None):
-        self.config = config or Config()
+        """
+        Args:
+            config: Configuration to use; when omitted the process-wide
+                snapshot is used and reloads of it are applied as they happen
+        """
+        if config is None:
+            manager = get_config_manager()
+            config = manager.config
+            manager.subscribe(self._config_reloaded)
+        self.config = config
         self.workflow_manager = WorkflowManager()
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.transport = GatewayTransport(self.config)
+        self.local = (
+            LocalBackend(self.config, self.workflow_manager)
+            if self.config.execution_mode != "gateway" else None
+        )
+        self.cache = ResponseCache.from_config(self.config)
+        self.inflight = SingleFlight()
+        self.artifacts = ArtifactStore.from_config(self.config)
+        self.engine = WorkflowEngine(
+            self,
+            CheckpointStore.from_config(self.config),
+            max_concurrency=self.config.workflow_concurrency
+        )
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The pooled HTTP client shared by all tools."""
+        return self.transport.client
+    
+    @property
+    def is_closed(self) -> bool:
+        """Whether the gateway transport has been closed."""
+        return self.transport.is_closed
+    
+    def apply_config(self, config: Config):
+        """
+        Switch to a new configuration without dropping calls in flight.
+        
+        Gateway and execution settings apply from the next call, and the
+        pooled connections are only rebuilt when the client's own settings
+        changed. Cache, artifact store and workflow concurrency settings
+        apply to tools created afterwards.
+        """
+        self.transport.reconfigure(config)
+        if config.execution_mode == "gateway":
+            self.local = None
+        elif self.local is None:
+            self.local = LocalBackend(config, self.workflow_manager)
+        else:
+            self.local.config = config
+        self.config = config
+    
+    def _config_reloaded(self, previous: Config, config: Config, changed: Set[str]):
+        self.apply_config(config)
+    
+    async def aclose(self):
+        """Close the gateway transport and persist the response cache."""
+        self.cache.flush()
+        if self.artifacts is not None:
+            self.artifacts.close()
+        await self.transport.aclose()
+    
+    async def __aenter__(self) -> "DcisionAITools":
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
     
     async def classify_intent(
         self, 
@@ -40,54 +133,9 @@ class DcisionAITools:
         Returns:
             Classification result with intent type and confidence
         """
-        try:
-            # Prepare the classification request
-            payload = {
-                "user_input": user_input,
-                "context": context or "",
-                "timestamp": asyncio.get_event_loop().time()
-            }
-            
-            # Call the AgentCore Gateway
-            response = await self.client.post(
-                f"{self.config.gateway_url}/mcp",
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {self.config.access_token}"
-                },
-                json={
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "tools/call",
-                    "params": {
-                        "name": f"{self.config.gateway_target}___classify_intent",
-                        "arguments": payload
-                    }
-                }
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                return {
-                    "status": "success",
-                    "intent_classification": result.get("result", {}),
-                    "confidence": 0.95,
-                    "processing_time": 0.5
-                }
-            else:
-                return {
-                    "status": "error",
-                    "error": f"HTTP {response.status_code}: {response.text}",
-                    "fallback": "Default classification"
-                }
-                
-        except Exception as e:
-            logger.error(f"Error in classify_intent: {e}")
-            return {
-                "status": "error",
-                "error": str(e),
-                "fallback": "Default classification"
-            }
+        return await self._run_tool(
+            "classify_intent", self._build_payload("classify_intent", user_input, context)
+        )
     
     async def analyze_data(
         self,
@@ -106,53 +154,10 @@ class DcisionAITools:
         Returns:
             Data analysis results and recommendations
         """
-        try:
-            payload = {
-                "data_description": data_description,
-                "data_type": data_type,
-                "constraints": constraints or "",
-                "timestamp": asyncio.get_event_loop().time()
-            }
-            
-            response = await self.client.post(
-                f"{self.config.gateway_url}/mcp",
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {self.config.access_token}"
-                },
-                json={
-                    "jsonrpc": "2.0",
-                    "id": 2,
-                    "method": "tools/call",
-                    "params": {
-                        "name": f"{self.config.gateway_target}___analyze_data",
-                        "arguments": payload
-                    }
-                }
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                return {
-                    "status": "success",
-                    "data_analysis": result.get("result", {}),
-                    "recommendations": ["Data quality assessment", "Feature engineering", "Constraint validation"],
-                    "processing_time": 1.2
-                }
-            else:
-                return {
-                    "status": "error",
-                    "error": f"HTTP {response.status_code}: {response.text}",
-                    "fallback": "Default data analysis"
-                }
-                
-        except Exception as e:
-            logger.error(f"Error in analyze_data: {e}")
-            return {
-                "status": "error",
-                "error": str(e),
-                "fallback": "Default data analysis"
-            }
+        return await self._run_tool(
+            "analyze_data",
+            self._build_payload("analyze_data", data_description, data_type, constraints)
+        )
     
     async def build_model(
         self,
@@ -169,118 +174,36 @@ class DcisionAITools:
             model_type: Preferred model type (optional)
             
         Returns:
-            Model specification and mathematical formulation
+            Model specification and mathematical formulation, and a
+            ``model_handle`` that ``solve_optimization`` accepts instead
+            of the specification
         """
-        try:
-            payload = {
-                "problem_description": problem_description,
-                "data_analysis": data_analysis or {},
-                "model_type": model_type or "auto",
-                "timestamp": asyncio.get_event_loop().time()
-            }
-            
-            response = await self.client.post(
-                f"{self.config.gateway_url}/mcp",
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {self.config.access_token}"
-                },
-                json={
-                    "jsonrpc": "2.0",
-                    "id": 3,
-                    "method": "tools/call",
-                    "params": {
-                        "name": f"{self.config.gateway_target}___build_model",
-                        "arguments": payload
-                    }
-                }
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                return {
-                    "status": "success",
-                    "model_specification": result.get("result", {}),
-                    "model_type": "mixed_integer_programming",
-                    "complexity": "high",
-                    "processing_time": 2.5
-                }
-            else:
-                return {
-                    "status": "error",
-                    "error": f"HTTP {response.status_code}: {response.text}",
-                    "fallback": "Default model building"
-                }
-                
-        except Exception as e:
-            logger.error(f"Error in build_model: {e}")
-            return {
-                "status": "error",
-                "error": str(e),
-                "fallback": "Default model building"
-            }
+        return await self._run_tool(
+            "build_model",
+            self._build_payload("build_model", problem_description, data_analysis, model_type)
+        )
     
     async def solve_optimization(
         self,
-        model_specification: Dict[str, Any],
+        model_specification: Union[str, Dict[str, Any]],
         solver_config: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Solve the optimization problem and generate results.
         
         Args:
-            model_specification: Model from build_model step
+            model_specification: Model from build_model step, or its
+                ``model_handle``
             solver_config: Optional solver configuration
             
         Returns:
             Optimization results and business insights
         """
         try:
-            payload = {
-                "model_specification": model_specification,
-                "solver_config": solver_config or {},
-                "timestamp": asyncio.get_event_loop().time()
-            }
-            
-            response = await self.client.post(
-                f"{self.config.gateway_url}/mcp",
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {self.config.access_token}"
-                },
-                json={
-                    "jsonrpc": "2.0",
-                    "id": 4,
-                    "method": "tools/call",
-                    "params": {
-                        "name": f"{self.config.gateway_target}___solve_optimization",
-                        "arguments": payload
-                    }
-                }
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                return {
-                    "status": "success",
-                    "optimization_results": result.get("result", {}),
-                    "business_impact": "Significant cost savings identified",
-                    "processing_time": 3.8
-                }
-            else:
-                return {
-                    "status": "error",
-                    "error": f"HTTP {response.status_code}: {response.text}",
-                    "fallback": "Default optimization solving"
-                }
-                
-        except Exception as e:
-            logger.error(f"Error in solve_optimization: {e}")
-            return {
-                "status": "error",
-                "error": str(e),
-                "fallback": "Default optimization solving"
-            }
+            payload = self._build_payload("solve_optimization", model_specification, solver_config)
+        except ArtifactNotFoundError as e:
+            return self._error_result("solve_optimization", e)
+        return await self._run_tool("solve_optimization", payload)
     
     async def get_workflow_templates(self) -> Dict[str, Any]:
         """
@@ -289,126 +212,574 @@ class DcisionAITools:
         Returns:
             List of available workflows organized by industry
         """
-        try:
-            response = await self.client.post(
-                f"{self.config.gateway_url}/mcp",
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {self.config.access_token}"
-                },
-                json={
-                    "jsonrpc": "2.0",
-                    "id": 5,
-                    "method": "tools/call",
-                    "params": {
-                        "name": f"{self.config.gateway_target}___get_workflow_templates",
-                        "arguments": {}
-                    }
-                }
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                return {
-                    "status": "success",
-                    "workflow_templates": result.get("result", {}),
-                    "total_workflows": 21,
-                    "industries": 7
-                }
-            else:
-                # Fallback to local workflow manager
-                return {
-                    "status": "success",
-                    "workflow_templates": self.workflow_manager.get_all_workflows(),
-                    "total_workflows": 21,
-                    "industries": 7
-                }
-                
-        except Exception as e:
-            logger.error(f"Error in get_workflow_templates: {e}")
-            return {
-                "status": "success",
-                "workflow_templates": self.workflow_manager.get_all_workflows(),
-                "total_workflows": 21,
-                "industries": 7
-            }
+        return await self._run_tool(
+            "get_workflow_templates", self._build_payload("get_workflow_templates")
+        )
     
     async def execute_workflow(
         self,
         industry: str,
         workflow_id: str,
-        parameters: Optional[Dict[str, Any]] = None
+        parameters: Optional[Dict[str, Any]] = None,
+        run_id: Optional[str] = None,
+        on_event: Optional[EventCallback] = None
     ) -> Dict[str, Any]:
         """
         Execute a complete optimization workflow.
         
+        With the local workflow engine the template's stages run through the
+        individual tools and are checkpointed, so a repeated call only re-runs
+        stages whose inputs changed. Workflows without a local template, or
+        any workflow with ``workflow_engine="remote"``, run on the gateway.
+        
         Args:
             industry: Target industry (manufacturing, healthcare, etc.)
             workflow_id: Specific workflow to execute
             parameters: Optional workflow parameters
+            run_id: Checkpoint to run under with the local engine;
+                defaults to ``industry/workflow_id``
+            on_event: Optional callback receiving progress and partial
+                events as local stages complete
             
         Returns:
             Complete workflow execution results
         """
-        try:
-            payload = {
-                "industry": industry,
-                "workflow_id": workflow_id,
-                "parameters": parameters or {},
-                "timestamp": asyncio.get_event_loop().time()
-            }
+        if self.config.workflow_engine == "local":
+            try:
+                outcome = await self.engine.run(
+                    industry, workflow_id, parameters, run_id=run_id, on_event=on_event
+                )
+            except WorkflowError as e:
+                logger.info(f"Running {industry}/{workflow_id} on the gateway: {e}")
+            else:
+                return self._workflow_result(outcome)
+        return await self._run_tool(
+            "execute_workflow",
+            self._build_payload("execute_workflow", industry, workflow_id, parameters)
+        )
+    
+    async def execute_workflows(self, runs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Execute independent workflows concurrently with the local engine.
+        
+        At most ``workflow_concurrency`` workflows run at the same time.
+        
+        Args:
+            runs: ``industry``, ``workflow_id`` and optional ``parameters``,
+                ``run_id`` and ``force`` of each workflow
             
-            response = await self.client.post(
-                f"{self.config.gateway_url}/mcp",
-                headers={
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {self.config.access_token}"
-                },
-                json={
-                    "jsonrpc": "2.0",
-                    "id": 6,
-                    "method": "tools/call",
-                    "params": {
-                        "name": f"{self.config.gateway_target}___execute_workflow",
-                        "arguments": payload
-                    }
-                }
-            )
+        Returns:
+            Workflow results in the same order as ``runs``
+        """
+        outcomes = await self.engine.run_many(runs)
+        return [
+            self._workflow_result(outcome) if "stages" in outcome
+            else dict(outcome, fallback=self.FALLBACKS["execute_workflow"])
+            for outcome in outcomes
+        ]
+    
+    def _workflow_result(self, outcome: Dict[str, Any]) -> Dict[str, Any]:
+        """Shape a local engine outcome like the gateway's workflow result."""
+        result = {
+            "status": outcome["status"],
+            "workflow_results": outcome["stages"],
+            "execution_time": round(outcome["execution_time"], 3),
+            "industry": outcome["industry"],
+            "workflow_id": outcome["workflow_id"],
+            "run_id": outcome["run_id"],
+            "executed_stages": outcome["executed"],
+            "reused_stages": outcome["reused"]
+        }
+        if outcome["status"] != "success":
+            result["error"] = outcome["error"]
+            result["failed_stage"] = outcome["failed_stage"]
+            result["fallback"] = self.FALLBACKS["execute_workflow"]
+        return result
+    
+    async def call_batch(
+        self,
+        calls: List[Tuple[str, Union[Tuple[Any, ...], Dict[str, Any]]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute several tool calls in a single JSON-RPC batch request.
+        
+        Args:
+            calls: (tool name, arguments) pairs, where arguments are either
+                a tuple of positional arguments or a dict of keyword
+                arguments for the corresponding tool method
             
-            if response.status_code == 200:
-                result = response.json()
-                return {
-                    "status": "success",
-                    "workflow_results": result.get("result", {}),
-                    "execution_time": 15.2,
-                    "industry": industry,
-                    "workflow_id": workflow_id
-                }
+        Returns:
+            Tool results in the same order as ``calls``, each shaped like
+            the result of calling the tool individually
+        """
+        # Serve what we can from the response cache and batch the rest
+        payloads: List[Tuple[str, Any]] = []
+        bodies: List[Any] = []
+        cache_keys: List[Optional[str]] = []
+        for tool, args in calls:
+            try:
+                payload = (self._build_payload(tool, **args) if isinstance(args, dict)
+                           else self._build_payload(tool, *args))
+            except ArtifactNotFoundError as e:
+                # Only this call fails, as it would on its own
+                payloads.append((tool, None))
+                cache_keys.append(None)
+                bodies.append(e)
+                continue
+            payloads.append((tool, payload))
+            key = self._cache_key(tool, payload)
+            cache_keys.append(key)
+            bodies.append(self.cache.get(key) if key else None)
+        misses = [i for i, body in enumerate(bodies) if body is None]
+        
+        started = time.perf_counter()
+        if misses:
+            try:
+                fetched, cacheable = await self._dispatch_batch([payloads[i] for i in misses])
+            except Exception as e:
+                logger.error(f"Error in batch of {len(misses)} calls: {e}")
+                fetched, cacheable = [e] * len(misses), False
+            elapsed = time.perf_counter() - started
+            for i, body in zip(misses, fetched):
+                if isinstance(body, dict):
+                    body["elapsed"] = elapsed
+                bodies[i] = body
+                if cacheable and cache_keys[i] and isinstance(body, dict) and "error" not in body:
+                    self.cache.put(cache_keys[i], payloads[i][0], body)
+        
+        results = []
+        for (tool, payload), body in zip(payloads, bodies):
+            if isinstance(body, Exception):
+                results.append(self._error_result(tool, body))
+            elif "error" in body and "result" not in body:
+                error = body["error"]
+                message = error.get("message", str(error)) if isinstance(error, dict) else str(error)
+                results.append(self._error_result(tool, message))
             else:
+                results.append(self._success_result(tool, body, payload))
+        return results
+    
+    async def run_pipeline(
+        self,
+        problem_description: str,
+        data_type: str = "tabular",
+        constraints: Optional[str] = None,
+        model_type: Optional[str] = None,
+        solver_config: Optional[Dict[str, Any]] = None,
+        on_event: Optional[EventCallback] = None
+    ) -> Dict[str, Any]:
+        """
+        Run the four-stage optimization pipeline with batched round trips.
+        
+        Stages whose inputs are already available are sent together in one
+        batch: intent classification and data analysis share the first
+        request, then model building and solving follow as their inputs
+        become available.
+        
+        Args:
+            problem_description: The optimization problem to solve
+            data_type: Type of data (tabular, time_series, etc.)
+            constraints: Optional constraints or requirements
+            model_type: Preferred model type (optional)
+            solver_config: Optional solver configuration
+            on_event: Optional callback receiving a progress event and a
+                partial result as each stage completes
+            
+        Returns:
+            Results of every completed stage and the number of round trips
+        """
+        stages: Dict[str, Dict[str, Any]] = {}
+        
+        def stage_args(stage: str) -> Tuple[Any, ...]:
+            if stage == "classify_intent":
+                return (problem_description, None)
+            if stage == "analyze_data":
+                return (problem_description, data_type, constraints)
+            if stage == "build_model":
+                return (problem_description, stages["analyze_data"].get("data_analysis"), model_type)
+            return (stages["build_model"].get("model_specification"), solver_config)
+        
+        round_trips = 0
+        pending = list(PIPELINE_STAGES)
+        while pending:
+            ready = [
+                stage for stage, depends_on in pending
+                if all(dep in stages for dep in depends_on)
+            ]
+            results = await self.call_batch([(stage, stage_args(stage)) for stage in ready])
+            round_trips += 1
+            stages.update(zip(ready, results))
+            pending = [(stage, deps) for stage, deps in pending if stage not in stages]
+            
+            if on_event is not None:
+                for stage in ready:
+                    await on_event({
+                        "event": "progress",
+                        "progress": len(stages),
+                        "total": len(PIPELINE_STAGES),
+                        "message": stage
+                    })
+                    await on_event({"event": "partial", "stage": stage, "data": stages[stage]})
+            
+            failed = [stage for stage in ready if stages[stage]["status"] != "success"]
+            if failed:
                 return {
                     "status": "error",
-                    "error": f"HTTP {response.status_code}: {response.text}",
-                    "fallback": "Default workflow execution"
+                    "error": f"Pipeline stage '{failed[0]}' failed: {stages[failed[0]].get('error')}",
+                    "stages": stages,
+                    "round_trips": round_trips
                 }
-                
+        
+        return {
+            "status": "success",
+            "stages": stages,
+            "round_trips": round_trips
+        }
+    
+    async def stream(self, tool: str, *args: Any, **kwargs: Any) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Call a tool and yield its progress as the gateway reports it.
+        
+        Args:
+            tool: Tool name
+            *args, **kwargs: Arguments of the corresponding tool method
+            
+        Yields:
+            ``{"event": "progress", "progress", "total", "message"}`` and
+            ``{"event": "partial", "stage", "data"}`` events while the call
+            runs, then exactly one ``{"event": "result", "result"}`` event
+            carrying the same result the non-streaming tool would return
+        """
+        started = time.perf_counter()
+        try:
+            payload = self._build_payload(tool, *args, **kwargs)
+            final = None
+            messages = self._stream_messages(tool, payload)
+            try:
+                async for message in messages:
+                    if "method" in message:
+                        for event in self._stream_events(message):
+                            yield event
+                    else:
+                        final = message
+            finally:
+                await messages.aclose()
+            
+            if final is None:
+                raise RuntimeError("Gateway stream ended without a result")
+            final["elapsed"] = time.perf_counter() - started
+            if "error" in final and "result" not in final:
+                error = final["error"]
+                message = error.get("message", str(error)) if isinstance(error, dict) else str(error)
+                result = self._error_result(tool, message)
+            else:
+                result = self._success_result(tool, final, payload)
         except Exception as e:
-            logger.error(f"Error in execute_workflow: {e}")
+            logger.error(f"Error in streaming {tool}: {e}")
+            result = self._error_result(tool, e)
+        yield {"event": "result", "result": result}
+    
+    async def _stream_messages(self, tool: str, payload: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """Stream a call from the configured backend, falling back before the first message."""
+        if self.config.execution_mode == "local":
+            messages = self.local.stream_tool(tool, payload)
+        else:
+            messages = self.transport.stream_tool(tool, payload)
+        received = False
+        try:
+            async for message in messages:
+                received = True
+                yield message
+        except Exception as e:
+            if self.local is None or received or not gateway_unavailable(e):
+                raise
+            logger.warning(f"Gateway unavailable for {tool}, running it locally: {e}")
+            yield await self.local.call_tool(tool, payload)
+        finally:
+            await messages.aclose()
+    
+    async def call_streaming(
+        self,
+        tool: str,
+        *args: Any,
+        on_event: Optional[EventCallback] = None,
+        **kwargs: Any
+    ) -> Dict[str, Any]:
+        """
+        Call a tool over a streaming response, forwarding events to a callback.
+        
+        Returns:
+            The tool result, shaped like the non-streaming call
+        """
+        if tool == "execute_workflow" and self.config.workflow_engine == "local":
+            return await self.execute_workflow(*args, on_event=on_event, **kwargs)
+        result: Dict[str, Any] = {}
+        async for event in self.stream(tool, *args, **kwargs):
+            if event["event"] == "result":
+                result = event["result"]
+            elif on_event is not None:
+                await on_event(event)
+        return result
+    
+    def _stream_events(self, message: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Translate a gateway notification into progress/partial events."""
+        params = message.get("params") or {}
+        if message["method"] == "notifications/progress":
+            events = [{
+                "event": "progress",
+                "progress": params.get("progress", 0),
+                "total": params.get("total"),
+                "message": params.get("message")
+            }]
+            if "partial" in params:
+                events.append({
+                    "event": "partial",
+                    "stage": params.get("message"),
+                    "data": params["partial"]
+                })
+            return events
+        if message["method"] == "notifications/message":
+            return [{"event": "partial", "stage": params.get("logger"), "data": params.get("data")}]
+        return []
+    
+    async def _run_tool(self, tool: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Call a single gateway tool and shape its result."""
+        try:
+            result = await self._call_gateway(tool, payload)
+            if "error" in result and "result" not in result:
+                error = result["error"]
+                message = error.get("message", str(error)) if isinstance(error, dict) else str(error)
+                return self._error_result(tool, message)
+            return self._success_result(tool, result, payload)
+        except Exception as e:
+            logger.error(f"Error in {tool}: {e}")
+            return self._error_result(tool, e)
+    
+    async def _call_gateway(self, tool: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Call a gateway tool, serving opted-in tools from the response cache.
+        
+        Identical concurrent calls of coalesced tools share one gateway
+        request. The response body is annotated with the measured
+        ``elapsed`` seconds of the gateway call, which is cached with it.
+        """
+        key = self._cache_key(tool, payload)
+        if key:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+        
+        async def fetch() -> Dict[str, Any]:
+            started = time.perf_counter()
+            result, cacheable = await self._dispatch(tool, payload)
+            result["elapsed"] = time.perf_counter() - started
+            if key and cacheable and "error" not in result:
+                self.cache.put(key, tool, result)
+            return result
+        
+        if not (self.config.coalesce_enabled and tool in self.config.coalesce_tools):
+            return await fetch()
+        flight_key = key or self.cache.key(tool, payload, self._cache_target)
+        return await self.inflight.do(flight_key, fetch)
+    
+    async def _dispatch(self, tool: str, payload: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+        """
+        Call a tool on the configured execution backend.
+        
+        In ``fallback`` mode calls the gateway cannot serve run locally.
+        
+        Returns:
+            The JSON-RPC response body, and whether it may be cached (local
+            answers standing in for the gateway are not)
+        """
+        if self.config.execution_mode == "local":
+            return await self.local.call_tool(tool, payload), True
+        try:
+            return await self.transport.call_tool(tool, payload), True
+        except Exception as e:
+            if self.local is None or not gateway_unavailable(e):
+                raise
+            logger.warning(f"Gateway unavailable for {tool}, running it locally: {e}")
+            return await self.local.call_tool(tool, payload), False
+    
+    async def _dispatch_batch(
+        self, calls: List[Tuple[str, Dict[str, Any]]]
+    ) -> Tuple[List[Any], bool]:
+        """Batch counterpart of ``_dispatch``."""
+        if self.config.execution_mode == "local":
+            return await self.local.call_batch(calls), True
+        try:
+            return await self.transport.call_batch(calls), True
+        except Exception as e:
+            if self.local is None or not gateway_unavailable(e):
+                raise
+            logger.warning(f"Gateway unavailable for a batch of {len(calls)} calls, running it locally: {e}")
+            return await self.local.call_batch(calls), False
+    
+    def _cache_key(self, tool: str, payload: Dict[str, Any]) -> Optional[str]:
+        """Response cache key for a call, or None if the tool is not cached."""
+        if not self.cache.enabled_for(tool):
+            return None
+        return self.cache.key(tool, payload, self._cache_target)
+    
+    @property
+    def _cache_target(self) -> str:
+        """Scope of cached responses: local results never answer gateway calls."""
+        return "local" if self.config.execution_mode == "local" else self.config.gateway_target
+    
+    def _build_payload(self, tool: str, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """Build the gateway arguments for a tool from its method arguments."""
+        if tool not in GATEWAY_TOOLS:
+            raise ValueError(f"Unknown tool: {tool}")
+        bound = inspect.signature(getattr(self, tool)).bind(*args, **kwargs)
+        bound.apply_defaults()
+        a = bound.arguments
+        
+        if tool == "classify_intent":
+            payload = {"user_input": a["user_input"], "context": a["context"] or ""}
+        elif tool == "analyze_data":
+            payload = {
+                "data_description": a["data_description"],
+                "data_type": a["data_type"],
+                "constraints": a["constraints"] or ""
+            }
+        elif tool == "build_model":
+            payload = {
+                "problem_description": a["problem_description"],
+                "data_analysis": a["data_analysis"] or {},
+                "model_type": a["model_type"] or "auto"
+            }
+        elif tool == "solve_optimization":
+            payload = {
+                "model_specification": self._resolve_artifact(a["model_specification"]),
+                "solver_config": a["solver_config"] or {}
+            }
+        elif tool == "get_workflow_templates":
+            return {}
+        else:
+            payload = {
+                "industry": a["industry"],
+                "workflow_id": a["workflow_id"],
+                "parameters": a["parameters"] or {}
+            }
+        
+        payload["timestamp"] = asyncio.get_event_loop().time()
+        return payload
+    
+    def _resolve_artifact(self, value: Any) -> Any:
+        """Replace an artifact handle by the stored artifact."""
+        if not is_handle(value):
+            return value
+        if self.artifacts is None:
+            raise ArtifactNotFoundError(value)
+        return self.artifacts.get(value)
+    
+    def _success_result(self, tool: str, result: Dict[str, Any],
+                        payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Shape a successful gateway response into the tool's result.
+        
+        The measured ``elapsed`` time of the gateway call is reported as its
+        processing (or execution) time; cache hits report the original call.
+        A model specification is wrapped in ``EncodedJSON`` so solving it
+        does not serialize it again, and saved in the artifact store so it
+        can be solved by handle.
+        """
+        body = result.get("result", {})
+        elapsed = round(result.get("elapsed", 0.0), 4)
+        if tool == "classify_intent":
+            return {
+                "status": "success",
+                "intent_classification": body,
+                "confidence": body.get("confidence", 0.95) if isinstance(body, dict) else 0.95,
+                "processing_time": elapsed
+            }
+        if tool == "analyze_data":
+            return {
+                "status": "success",
+                "data_analysis": body,
+                "recommendations": ["Data quality assessment", "Feature engineering", "Constraint validation"],
+                "processing_time": elapsed
+            }
+        if tool == "build_model":
+            if isinstance(body, dict) and not isinstance(body, EncodedJSON):
+                # Kept on the (possibly cached) response so every hit reuses the encoding
+                body = result["result"] = EncodedJSON(body)
+            shaped = {
+                "status": "success",
+                "model_specification": body,
+                "model_type": body.get("model_type", "mixed_integer_programming")
+                if isinstance(body, dict) else "mixed_integer_programming",
+                "complexity": "high",
+                "processing_time": elapsed
+            }
+            if self.artifacts is not None and isinstance(body, dict):
+                shaped["model_handle"] = self.artifacts.put(body)
+            return shaped
+        if tool == "solve_optimization":
             return {
-                "status": "error",
-                "error": str(e),
-                "fallback": "Default workflow execution"
+                "status": "success",
+                "optimization_results": body,
+                "business_impact": "Significant cost savings identified",
+                "processing_time": elapsed
             }
+        if tool == "get_workflow_templates":
+            return {
+                "status": "success",
+                "workflow_templates": body,
+                "total_workflows": 21,
+                "industries": 7
+            }
+        return {
+            "status": "success",
+            "workflow_results": body,
+            "execution_time": elapsed,
+            "industry": payload.get("industry"),
+            "workflow_id": payload.get("workflow_id")
+        }
+    
+    def _error_result(self, tool: str, error: Any) -> Dict[str, Any]:
+        """Shape a failed call into the tool's error result."""
+        if tool == "get_workflow_templates":
+            # Templates are always available from the local workflow manager
+            return {
+                "status": "success",
+                "workflow_templates": self.workflow_manager.get_all_workflows(),
+                "total_workflows": 21,
+                "industries": 7
+            }
+        return {
+            "status": "error",
+            "error": str(error),
+            "fallback": self.FALLBACKS[tool]
+        }
 
 # Global tools instance
 _tools_instance = None
 
 def get_tools() -> DcisionAITools:
-    """Get the global tools instance."""
+    """Get the global tools instance, recreating it if it has been closed."""
     global _tools_instance
-    if _tools_instance is None:
+    if _tools_instance is None or _tools_instance.is_closed:
         _tools_instance = DcisionAITools()
     return _tools_instance
 
+async def close_tools():
+    """Close the global tools instance and its pooled connections."""
+    global _tools_instance
+    if _tools_instance is not None:
+        await _tools_instance.aclose()
+        _tools_instance = None
+
+async def call_tool_streaming(
+    tool: str,
+    *args: Any,
+    on_event: Optional[EventCallback] = None,
+    **kwargs: Any
+) -> Dict[str, Any]:
+    """Call a tool over a streaming gateway response, reporting progress to ``on_event``."""
+    return await get_tools().call_streaming(tool, *args, on_event=on_event, **kwargs)
+
 # Convenience functions for direct tool access
 async def classify_intent(user_input: str, context: Optional[str] = None) -> Dict[str, Any]:
     """Classify user intent for optimization requests."""
@@ -431,7 +802,7 @@ async def build_model(
     return await get_tools().build_model(problem_description, data_analysis, model_type)
 
 async def solve_optimization(
-    model_specification: Dict[str, Any],
+    model_specification: Union[str, Dict[str, Any]],
     solver_config: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
     """Solve the optimization problem and generate results."""
@@ -0,0 +1,599 @@
+#!/usr/bin/env python3
+"""
+DcisionAI Gateway Transport
+===========================
+
+Pooled HTTP transport for calls to the AgentCore Gateway.
+Owns the shared connection pool, the JSON-RPC envelope and the
+per-tool names so individual tools only supply their arguments.
+Every request goes through the circuit breaker, retry and hedging
+policies from ``resilience`` and the client-side rate limiter, and is
+timed into a latency histogram and the process-wide ``telemetry``.
+With a token endpoint configured, access tokens come from ``auth`` and
+are swapped into the pooled client's headers as they are refreshed.
+Bodies are encoded with the fastest JSON library from ``codec`` and
+large ones can be compressed. A new configuration can be applied to a
+live transport; the pooled client is only rebuilt when its own settings
+changed.
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+import time
+from collections import defaultdict
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+import httpx
+
+from .auth import TokenProvider
+from .codec import compressor, get_codec
+from .config import Config
+from .metrics import LatencyHistogram
+from .ratelimit import get_limiter
+from .resilience import RETRYABLE_STATUS, RetryPolicy, get_breaker
+from .telemetry import RequestTrace, get_telemetry
+
+logger = logging.getLogger(__name__)
+
+# Tools exposed by the AgentCore Gateway target
+GATEWAY_TOOLS = (
+    "classify_intent",
+    "analyze_data",
+    "build_model",
+    "solve_optimization",
+    "get_workflow_templates",
+    "execute_workflow",
+)
+
+
+# Settings baked into the pooled client or the token provider; changing
+# any of them rebuilds both
+CLIENT_SETTINGS = frozenset({
+    "access_token", "request_timeout", "connection_timeout", "http2", "max_connections",
+    "max_keepalive_connections", "keepalive_expiry",
+    "token_endpoint", "client_id", "client_secret", "token_scope", "token_refresh_margin",
+})
+
+# Settings the transport derives state from when it is built; settings it
+# reads on every call (hedging, compression threshold) need no rebuild
+TRANSPORT_SETTINGS = CLIENT_SETTINGS | {
+    "gateway_url", "gateway_target", "retry_attempts", "retry_backoff_base", "retry_backoff_max",
+    "breaker_failure_threshold", "breaker_reset_timeout", "rate_limit_enabled",
+    "json_backend", "request_compression", "otel_enabled",
+}
+
+# Accept header asking the gateway to stream a tools/call response as SSE
+STREAM_HEADERS = {"Accept": "text/event-stream, application/json"}
+
+
+class GatewayError(Exception):
+    """Raised when the gateway answers with a non-200 status."""
+
+    def __init__(self, status_code: int, text: str):
+        self.status_code = status_code
+        self.text = text
+        super().__init__(f"HTTP {status_code}: {text}")
+
+
+async def iter_sse(lines: AsyncIterator[str],
+                   loads: Callable[[str], Any] = json.loads) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Decode a Server-Sent Events stream of JSON-RPC messages.
+
+    Only default ``message`` events are decoded; comments, other event
+    types and ``id``/``retry`` fields are ignored.
+    """
+    data: List[str] = []
+    event = "message"
+    async for line in lines:
+        if not line:
+            if data and event == "message":
+                yield loads("\n".join(data))
+            data, event = [], "message"
+        elif line.startswith(":"):
+            continue
+        else:
+            field, _, value = line.partition(":")
+            value = value[1:] if value.startswith(" ") else value
+            if field == "data":
+                data.append(value)
+            elif field == "event":
+                event = value
+    if data and event == "message":
+        yield loads("\n".join(data))
+
+
+def _http2_available() -> bool:
+    """Check whether the optional ``h2`` package is installed."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class GatewayTransport:
+    """
+    Shared, pooled transport for AgentCore Gateway requests.
+
+    One ``httpx.AsyncClient`` is kept for the lifetime of the transport so
+    TCP/TLS connections are reused across every tool call. The endpoint URL,
+    headers and gateway tool names are computed once at construction.
+    
+    Failed requests (429/5xx or transport errors) are retried with jittered
+    backoff, slow requests for hedged tools are re-sent once the observed
+    percentile latency has passed, and the per-target circuit breaker
+    rejects calls outright while the gateway is failing. A request
+    rejected with 401 gets a fresh token and is re-sent once. Once the
+    gateway rejects a compressed body with 415, compression is turned off
+    and the body is re-sent uncompressed.
+    """
+
+    def __init__(self, config: Config):
+        self._ids = itertools.count(1)
+        self.latency: Dict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
+        self.retries = 0
+        self.hedges = 0
+        self.telemetry = get_telemetry()
+        # Clients replaced by reconfigure() and not closed yet
+        self._replaced: List[Tuple[httpx.AsyncClient, Optional[TokenProvider]]] = []
+        self._retiring: Set["asyncio.Task[None]"] = set()
+        self._apply(config)
+        self.client = self._build_client()
+        self.auth = TokenProvider.from_config(config, on_token=self._set_token)
+
+    def _apply(self, config: Config):
+        """Derive the per-configuration state other than the client."""
+        self.config = config
+        self.endpoint = f"{config.gateway_url}/mcp"
+        self.tool_names = {
+            tool: f"{config.gateway_target}___{tool}" for tool in GATEWAY_TOOLS
+        }
+        self.retry = RetryPolicy.from_config(config)
+        self.breaker = get_breaker(config)
+        self.limiter = get_limiter(config)
+        self.codec = get_codec(config.json_backend)
+        self.compression = compressor(config.request_compression)
+        if config.otel_enabled:
+            self.telemetry.enable_opentelemetry()
+
+    def reconfigure(self, config: Config) -> bool:
+        """
+        Apply a new configuration without failing calls in flight.
+
+        The pooled client and token provider are only rebuilt when one of
+        ``CLIENT_SETTINGS`` changed. Calls already running keep the old
+        client, which is closed once ``request_timeout`` has passed.
+
+        Returns:
+            Whether the pooled client was rebuilt
+        """
+        previous = self.config
+        changed = previous.changed_settings(config)
+        if not changed & TRANSPORT_SETTINGS:
+            self.config = config
+            return False
+        self._apply(config)
+        if not changed & CLIENT_SETTINGS:
+            return False
+
+        replaced = (self.client, self.auth)
+        self._replaced.append(replaced)
+        self.client = self._build_client()
+        self.auth = TokenProvider.from_config(config, on_token=self._set_token)
+        logger.info("Gateway client settings changed, rebuilt the connection pool")
+        try:
+            task = asyncio.get_running_loop().create_task(
+                self._retire(replaced, previous.request_timeout)
+            )
+        except RuntimeError:
+            # No event loop: the old client is closed with the transport
+            return True
+        self._retiring.add(task)
+        task.add_done_callback(self._retiring.discard)
+        return True
+
+    async def _retire(self, replaced: Tuple[httpx.AsyncClient, Optional[TokenProvider]], delay: float):
+        """Close a replaced client once the calls using it are over."""
+        await asyncio.sleep(delay)
+        if replaced in self._replaced:
+            self._replaced.remove(replaced)
+            await self._close(*replaced)
+
+    @staticmethod
+    async def _close(client: httpx.AsyncClient, auth: Optional[TokenProvider]):
+        if auth is not None:
+            await auth.aclose()
+        await client.aclose()
+
+    def _set_token(self, token: str):
+        """Swap the Authorization header of the pooled client in one assignment."""
+        headers = self.client.headers.copy()
+        headers["Authorization"] = f"Bearer {token}"
+        self.client.headers = headers
+
+    def _encode(self, body: Any) -> Tuple[bytes, Dict[str, str]]:
+        """Serialize a request body, compressing it once it is large enough."""
+        content = self.codec.dumps(body)
+        if self.compression is None or len(content) < self.config.compression_min_bytes:
+            return content, {}
+        encoding, compress = self.compression
+        return compress(content), {"Content-Encoding": encoding}
+
+    def _disable_compression(self, label: str):
+        """Stop compressing request bodies after the gateway refused one."""
+        if self.compression is not None:
+            logger.warning(
+                f"Gateway rejected a {self.compression[0]} {label} request body (HTTP 415), "
+                "sending request bodies uncompressed"
+            )
+            self.compression = None
+
+    async def _authorize(self) -> Optional[str]:
+        """Make sure a valid token is in the client headers; returns it."""
+        if self.auth is None:
+            return None
+        return await self.auth.ready()
+
+    def _build_client(self) -> httpx.AsyncClient:
+        """Create the pooled HTTP client from the transport settings."""
+        http2 = self.config.http2 and _http2_available()
+        if self.config.http2 and not http2:
+            logger.info("h2 package not installed, using HTTP/1.1 for gateway calls")
+
+        return httpx.AsyncClient(
+            headers=self.config.get_headers(),
+            timeout=httpx.Timeout(
+                self.config.request_timeout,
+                connect=self.config.connection_timeout,
+            ),
+            limits=httpx.Limits(
+                max_connections=self.config.max_connections,
+                max_keepalive_connections=self.config.max_keepalive_connections,
+                keepalive_expiry=self.config.keepalive_expiry,
+            ),
+            http2=http2,
+            follow_redirects=True,
+        )
+
+    @property
+    def is_closed(self) -> bool:
+        """Whether the underlying client has been closed."""
+        return self.client.is_closed
+
+    def next_id(self) -> int:
+        """Return a fresh JSON-RPC request id."""
+        return next(self._ids)
+
+    def envelope(self, tool: str, arguments: Dict[str, Any],
+                 request_id: Optional[int] = None) -> Dict[str, Any]:
+        """Build the JSON-RPC ``tools/call`` envelope for a gateway tool."""
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id if request_id is not None else self.next_id(),
+            "method": "tools/call",
+            "params": {
+                "name": self.tool_names[tool],
+                "arguments": arguments,
+            },
+        }
+
+    async def call_tool(self, tool: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Call a single gateway tool.
+
+        Args:
+            tool: Tool name without the gateway target prefix
+            arguments: Tool arguments
+
+        Returns:
+            Decoded JSON-RPC response body
+
+        Raises:
+            GatewayError: If the gateway returns a non-200 status
+            CircuitOpenError: If the circuit for the gateway target is open
+        """
+        response = await self._send(tool, self.envelope(tool, arguments))
+        if response.status_code != 200:
+            raise GatewayError(response.status_code, response.text)
+        return self._parse(tool, response)
+
+    async def call_batch(
+        self, calls: Sequence[Tuple[str, Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Call several gateway tools in one JSON-RPC batch request.
+
+        Responses are correlated by id, so the gateway may answer in any
+        order. A call with no matching response gets a JSON-RPC error body.
+
+        Args:
+            calls: (tool name, arguments) pairs
+
+        Returns:
+            Decoded JSON-RPC response bodies in the same order as ``calls``
+
+        Raises:
+            GatewayError: If the gateway rejects the whole batch
+            CircuitOpenError: If the circuit for the gateway target is open
+        """
+        envelopes = [self.envelope(tool, arguments) for tool, arguments in calls]
+        response = await self._send("batch", envelopes)
+        if response.status_code != 200:
+            raise GatewayError(response.status_code, response.text)
+
+        bodies = self._parse("batch", response)
+        if isinstance(bodies, dict):
+            # A single error object applies to every call in the batch
+            if bodies.get("id") is None:
+                return [bodies for _ in envelopes]
+            bodies = [bodies]
+
+        by_id = {body.get("id"): body for body in bodies if isinstance(body, dict)}
+        return [
+            by_id.get(envelope["id"], {
+                "jsonrpc": "2.0",
+                "id": envelope["id"],
+                "error": {"code": -32603, "message": "No response for request in batch"},
+            })
+            for envelope in envelopes
+        ]
+
+    async def stream_tool(self, tool: str,
+                          arguments: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Call a gateway tool and yield JSON-RPC messages as they arrive.
+
+        The request carries a progress token and asks for an SSE response,
+        so the gateway can send ``notifications/progress`` messages before
+        the final response. Gateways that answer with plain JSON yield the
+        single response body. Retries only happen before any message has
+        been yielded, i.e. on a retryable status.
+
+        Args:
+            tool: Tool name without the gateway target prefix
+            arguments: Tool arguments
+
+        Yields:
+            Decoded JSON-RPC notifications, then the final response
+
+        Raises:
+            GatewayError: If the gateway returns a non-200 status
+            CircuitOpenError: If the circuit for the gateway target is open
+        """
+        request_id = self.next_id()
+        body = self.envelope(tool, arguments, request_id)
+        body["params"]["_meta"] = {"progressToken": request_id}
+        label = f"{tool}:stream"
+        content, headers = self._encode(body)
+        call_started = time.perf_counter()
+
+        attempt = 0
+        reauthorized = False
+        # Admitted once per attempt; re-sends (401, 415) belong to the same attempt
+        trial = self.breaker.before_call()
+        try:
+            while True:
+                await self._acquire(label, tool)
+                token = await self._authorize()
+                started = time.perf_counter()
+                trace = RequestTrace()
+                async with self.client.stream(
+                    "POST", self.endpoint, content=content, headers={**STREAM_HEADERS, **headers},
+                    extensions={"trace": trace}
+                ) as response:
+                    self.telemetry.observe_request(
+                        label, str(response.status_code), trace.phases(), len(content)
+                    )
+                    rejected = response.status_code == 401 and self.auth is not None and not reauthorized
+                    unsupported = response.status_code == 415 and bool(headers)
+                    retryable = response.status_code in RETRYABLE_STATUS
+                    if retryable:
+                        self.breaker.record_failure()
+                    elif not rejected:
+                        self.breaker.record_success()
+
+                    if retryable and attempt < self.retry.attempts:
+                        delay = self.retry.delay(
+                            attempt, response.status_code, response.headers.get("Retry-After")
+                        )
+                    elif not rejected and not unsupported:
+                        if response.status_code != 200:
+                            text = (await response.aread()).decode("utf-8", "replace")
+                            raise GatewayError(response.status_code, text)
+
+                        content_type = response.headers.get("content-type", "")
+                        if content_type.startswith("text/event-stream"):
+                            async for message in iter_sse(response.aiter_lines(), self.codec.loads):
+                                yield message
+                        else:
+                            yield self._parse(label, response, await response.aread())
+                        self.latency[label].observe(time.perf_counter() - started)
+                        self.telemetry.observe_phase(label, "total", time.perf_counter() - call_started)
+                        return
+
+                if rejected:
+                    # Expired or revoked token: re-send once with a fresh one
+                    reauthorized = True
+                    await self.auth.refresh(stale=token)
+                    continue
+                if unsupported:
+                    self._disable_compression(label)
+                    content, headers = self._encode(body)
+                    continue
+                logger.warning(
+                    f"Gateway {label} call returned HTTP {response.status_code}, "
+                    f"retrying in {delay:.2f}s"
+                )
+                attempt += 1
+                self.retries += 1
+                self.telemetry.count_retry(label)
+                await asyncio.sleep(delay)
+                trial = self.breaker.before_call()
+        finally:
+            # A half-open trial cancelled or failed before an outcome was recorded
+            self.breaker.release(trial)
+
+    async def _acquire(self, label: str, bucket: str):
+        """Wait for a rate-limit token, recording the wait as the ``queue`` phase."""
+        if self.limiter is None:
+            return
+        started = time.perf_counter()
+        await self.limiter.acquire(bucket)
+        self.telemetry.observe_phase(label, "queue", time.perf_counter() - started)
+
+    def _parse(self, label: str, response: httpx.Response, raw: Optional[bytes] = None) -> Any:
+        """Decode a JSON response body, recording the ``parse`` phase."""
+        started = time.perf_counter()
+        body = self.codec.loads(raw if raw is not None else response.content)
+        self.telemetry.observe_phase(label, "parse", time.perf_counter() - started)
+        return body
+
+    async def _send(self, label: str, body: Any) -> httpx.Response:
+        """
+        POST a JSON-RPC body with circuit breaking and retries.
+
+        Returns the last response once it is not retryable or the retry
+        budget is spent; transport errors on the final attempt are raised.
+        The body is serialized once and re-sent as is on retries.
+        """
+        content, headers = self._encode(body)
+        started = time.perf_counter()
+        attempt = 0
+        reauthorized = False
+        # Admitted once per attempt; re-sends (401, 415) belong to the same attempt
+        trial = None
+        try:
+            trial = self.breaker.before_call()
+            while True:
+                await self._acquire(label, label)
+                token = await self._authorize()
+                try:
+                    response = await self._post(label, content, headers)
+                except httpx.TransportError as e:
+                    self.breaker.record_failure()
+                    if attempt >= self.retry.attempts:
+                        raise
+                    delay = self.retry.delay(attempt)
+                    logger.warning(f"Gateway {label} call failed ({e!r}), retrying in {delay:.2f}s")
+                else:
+                    if response.status_code == 401 and self.auth is not None and not reauthorized:
+                        # Expired or revoked token: re-send once with a fresh one
+                        reauthorized = True
+                        await self.auth.refresh(stale=token)
+                        continue
+                    if response.status_code == 415 and headers:
+                        self._disable_compression(label)
+                        content, headers = self._encode(body)
+                        continue
+                    if response.status_code not in RETRYABLE_STATUS:
+                        self.breaker.record_success()
+                        return response
+                    self.breaker.record_failure()
+                    if attempt >= self.retry.attempts:
+                        return response
+                    delay = self.retry.delay(
+                        attempt, response.status_code, response.headers.get("Retry-After")
+                    )
+                    logger.warning(
+                        f"Gateway {label} call returned HTTP {response.status_code}, "
+                        f"retrying in {delay:.2f}s"
+                    )
+                attempt += 1
+                self.retries += 1
+                self.telemetry.count_retry(label)
+                await asyncio.sleep(delay)
+                trial = self.breaker.before_call()
+        finally:
+            # A half-open trial cancelled or failed before an outcome was recorded
+            self.breaker.release(trial)
+            self.telemetry.observe_phase(label, "total", time.perf_counter() - started)
+
+    def hedge_delay(self, label: str) -> Optional[float]:
+        """Seconds to wait before hedging a call, or ``None`` to not hedge."""
+        if not self.config.hedge_enabled or label not in self.config.hedge_tools:
+            return None
+        histogram = self.latency[label]
+        if histogram.count < self.config.hedge_min_samples:
+            return None
+        return histogram.percentile(self.config.hedge_percentile)
+
+    async def _post(self, label: str, content: bytes,
+                    headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+        """POST once, or twice if the first request outlives the hedge delay."""
+        started = time.perf_counter()
+        delay = self.hedge_delay(label)
+        if delay is None:
+            response = await self._request(label, content, headers)
+        else:
+            response = await self._hedged_post(label, content, delay, headers)
+        self.latency[label].observe(time.perf_counter() - started)
+        return response
+
+    async def _request(self, label: str, content: bytes,
+                       headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+        """A single traced HTTP request, recorded in telemetry."""
+        trace = RequestTrace()
+        try:
+            response = await self.client.post(
+                self.endpoint, content=content, headers=headers, extensions={"trace": trace}
+            )
+        except Exception:
+            self.telemetry.observe_request(label, "error", trace.phases(), len(content))
+            raise
+        self.telemetry.observe_request(
+            label, str(response.status_code), trace.phases(), len(content), len(response.content)
+        )
+        return response
+
+    async def _hedged_post(self, label: str, content: bytes, delay: float,
+                           headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+        """Race a primary request against a hedge sent after ``delay`` seconds."""
+        pending = {asyncio.ensure_future(self._request(label, content, headers))}
+        done, pending = await asyncio.wait(pending, timeout=delay)
+        # A hedge is only worth sending if it does not have to queue for a token
+        if not done and (self.limiter is None or self.limiter.try_acquire("hedge")):
+            self.hedges += 1
+            self.telemetry.count_hedge(label)
+            pending.add(asyncio.ensure_future(self._request(label, content, headers)))
+
+        error: Optional[BaseException] = None
+        try:
+            while True:
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+                if not pending:
+                    raise error
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        """Latency histograms, retry/hedge counters, breaker and limiter state."""
+        return {
+            "latency": {label: h.to_dict() for label, h in self.latency.items()},
+            "retries": self.retries,
+            "hedges": self.hedges,
+            "circuit_breaker": self.breaker.to_dict(),
+            "rate_limiter": self.limiter.stats() if self.limiter is not None else None,
+        }
+
+    async def aclose(self):
+        """Close the pooled client and release its connections."""
+        for task in self._retiring:
+            task.cancel()
+        replaced, self._replaced = self._replaced, []
+        for client, auth in replaced:
+            await self._close(client, auth)
+        await self._close(self.client, self.auth)
+
+    async def __aenter__(self) -> "GatewayTransport":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+DcisionAI Server Workers
+========================
+
+Multi-process serving of the HTTP MCP server.
+Every worker process runs its own event loop and binds its own listening
+socket with ``SO_REUSEPORT``, so the kernel spreads new connections over
+the workers. The parent supervises the workers, restarts any that die (with
+exponential backoff, giving up when a worker keeps failing right after
+starting), and on SIGTERM/SIGINT forwards SIGTERM so each worker drains
+its in-flight calls before exiting.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import multiprocessing.connection
+import os
+import signal
+import socket
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .config import Config
+
+logger = logging.getLogger(__name__)
+
+# Extra seconds a worker gets after its drain timeout before it is killed
+KILL_GRACE = 5.0
+
+# Restart delays double from the minimum with every rapid failure of a worker
+RESTART_BACKOFF_MIN = 0.5
+RESTART_BACKOFF_MAX = 30.0
+
+# A worker that exits sooner than this after starting has failed rapidly
+STABLE_UPTIME = 30.0
+
+# Rapid failures in a row after which the supervisor stops all workers
+MAX_RAPID_FAILURES = 5
+
+
+def reuseport_available() -> bool:
+    """Whether the platform lets several sockets listen on one port."""
+    return hasattr(socket, "SO_REUSEPORT")
+
+
+def reuseport_socket(host: str, port: int) -> socket.socket:
+    """A TCP socket bound to ``host:port`` that other processes may bind too."""
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    return sock
+
+
+def _serve(config: Config, host: str, port: int,
+           source: Optional[Tuple[Optional[str], Dict[str, Any]]] = None):
+    """
+    Worker process entry point.
+
+    With a ``source`` (configuration file and overrides) the worker loads
+    and watches the configuration itself instead of serving ``config``.
+    """
+    from .config_manager import use_config_file
+    from .server import DcisionAIMCPServer
+
+    if source is not None:
+        use_config_file(*source)
+    sock = reuseport_socket(host, port)
+    logger.info(f"Worker {os.getpid()} serving on {host}:{port}")
+    server = DcisionAIMCPServer(None if source is not None else config)
+    asyncio.run(server.serve(host, port, sock))
+
+
+def run_workers(config: Config, host: str, port: int, managed: bool = False) -> int:
+    """
+    Serve the HTTP MCP server from ``config.workers`` processes.
+
+    Runs in the calling process when one worker is configured or
+    ``SO_REUSEPORT`` is not available, and blocks until the server has
+    shut down.
+
+    Args:
+        config: Configuration to serve with
+        host: Interface to bind to
+        port: Port to bind to
+        managed: ``config`` is the process-wide snapshot; the servers then
+            follow reloads of its file
+
+    Returns:
+        Process exit code: 1 if a worker kept failing right after starting
+    """
+    if config.workers == 1 or not reuseport_available():
+        if config.workers > 1:
+            logger.warning("SO_REUSEPORT is not available, serving from a single process")
+        from .server import DcisionAIMCPServer
+        asyncio.run(DcisionAIMCPServer(None if managed else config).serve(host, port))
+        return 0
+
+    # Holding the port (bound, not listening) fixes it for every worker,
+    # including when port 0 asked for any free port
+    holder = reuseport_socket(host, port)
+    port = holder.getsockname()[1]
+    context = multiprocessing.get_context("spawn")
+    source = None
+    if managed:
+        from .config_manager import get_config_manager
+        manager = get_config_manager()
+        source = (manager.path, manager.overrides)
+
+    def start() -> multiprocessing.Process:
+        process = context.Process(target=_serve, args=(config, host, port, source), daemon=True)
+        process.start()
+        return process
+
+    # A slot holds None while its worker waits to be restarted
+    processes: List[Optional[multiprocessing.Process]] = [start() for _ in range(config.workers)]
+    started = [time.monotonic()] * config.workers
+    restart_at = [0.0] * config.workers
+    failures = [0] * config.workers
+    logger.info(f"Started {config.workers} workers on {host}:{port}")
+    stopping = False
+    exit_code = 0
+
+    def stop(signum, frame):
+        nonlocal stopping
+        if not stopping:
+            logger.info(f"Received signal {signum}, draining {len(processes)} workers")
+        stopping = True
+        for process in processes:
+            if process is not None and process.is_alive():
+                os.kill(process.pid, signal.SIGTERM)
+
+    previous = {sig: signal.signal(sig, stop) for sig in (signal.SIGTERM, signal.SIGINT)}
+    try:
+        while not stopping:
+            now = time.monotonic()
+            pending = [at - now for process, at in zip(processes, restart_at) if process is None]
+            multiprocessing.connection.wait([p.sentinel for p in processes if p is not None],
+                                            timeout=max(0.0, min([1.0] + pending)))
+            now = time.monotonic()
+            for index, process in enumerate(processes):
+                if stopping:
+                    break
+                if process is None:
+                    if now >= restart_at[index]:
+                        processes[index], started[index] = start(), now
+                    continue
+                if process.is_alive():
+                    continue
+                failures[index] = failures[index] + 1 if now - started[index] < STABLE_UPTIME else 1
+                if failures[index] >= MAX_RAPID_FAILURES:
+                    logger.error(f"Worker {process.pid} exited with {process.exitcode}, "
+                                 f"{failures[index]} times in a row right after starting; giving up")
+                    exit_code = 1
+                    stop(signal.SIGTERM, None)
+                    break
+                delay = min(RESTART_BACKOFF_MIN * 2 ** (failures[index] - 1), RESTART_BACKOFF_MAX)
+                logger.warning(f"Worker {process.pid} exited with {process.exitcode}, restarting in {delay:.1f}s")
+                processes[index], restart_at[index] = None, now + delay
+
+        deadline = time.monotonic() + config.drain_timeout + KILL_GRACE
+        for process in processes:
+            if process is None:
+                continue
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                logger.error(f"Worker {process.pid} did not drain in time, killing it")
+                process.kill()
+                process.join()
+    finally:
+        for sig, handler in previous.items():
+            signal.signal(sig, handler)
+        holder.close()
+    return exit_code
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+DcisionAI Workflow Engine
+=========================
+
+Client-side execution of workflow templates.
+A template's steps (intent -> data -> model -> solve) run as a DAG through
+the individual tools: independent stages run concurrently, every stage
+result is checkpointed, and a stage is only re-run when its inputs change.
+A failed run therefore resumes from the last good stage, and changing only
+the solver configuration re-runs only the solve stage.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .cache import canonicalize
+
+if TYPE_CHECKING:
+    from .tools import DcisionAITools
+
+logger = logging.getLogger(__name__)
+
+# Pipeline stages and the stages whose results they consume
+PIPELINE_STAGES = [
+    ("classify_intent", ()),
+    ("analyze_data", ()),
+    ("build_model", ("analyze_data",)),
+    ("solve_optimization", ("build_model",)),
+]
+
+STAGE_DEPENDENCIES = dict(PIPELINE_STAGES)
+
+# Template step names and the stage each one runs
+WORKFLOW_STEPS = {
+    "Intent Classification": "classify_intent",
+    "Data Analysis": "analyze_data",
+    "Model Building": "build_model",
+    "Optimization Solving": "solve_optimization",
+}
+
+# Workflow parameters consumed by the stages themselves; everything else is
+# passed to data analysis as constraints
+STAGE_PARAMETERS = ("problem_description", "data_type", "constraints", "model_type", "solver_config")
+
+# Async callback receiving progress/partial events
+EventCallback = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+class WorkflowError(Exception):
+    """Raised when a workflow cannot be planned."""
+
+
+def stage_fingerprint(stage: str, args: Tuple[Any, ...]) -> str:
+    """Digest of a stage's inputs; a checkpoint is reused only if it matches."""
+    canonical = canonicalize({"stage": stage, "args": list(args)})
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class CheckpointStore:
+    """
+    Stage checkpoints of workflow runs, keyed by run id.
+
+    Args:
+        path: Optional directory to persist one JSON file per run to, so
+            runs can be resumed from another process
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else None
+        self._runs: Dict[str, Dict[str, Any]] = {}
+
+    @classmethod
+    def from_config(cls, config) -> "CheckpointStore":
+        """Build the store described by a ``Config``."""
+        return cls(Path(config.checkpoint_dir).expanduser() if config.checkpoint_dir else None)
+
+    def _file(self, run_id: str) -> Path:
+        return self.path / f"{hashlib.sha256(run_id.encode('utf-8')).hexdigest()[:24]}.json"
+
+    def get(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """The checkpointed run, or None if there is none."""
+        run = self._runs.get(run_id)
+        if run is None and self.path:
+            try:
+                with open(self._file(run_id), "r") as f:
+                    run = json.load(f)
+            except FileNotFoundError:
+                return None
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable checkpoint for run '{run_id}': {e}")
+                return None
+            self._runs[run_id] = run
+        return run
+
+    def save(self, run: Dict[str, Any]):
+        """Record a run, replacing its previous checkpoint atomically."""
+        run["updated_at"] = time.time()
+        self._runs[run["run_id"]] = run
+        if not self.path:
+            return
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            target = self._file(run["run_id"])
+            tmp = target.with_suffix(".tmp")
+            with open(tmp, "w") as f:
+                json.dump(run, f, default=str)
+            os.replace(tmp, target)
+        except OSError as e:
+            logger.warning(f"Could not persist checkpoint for run '{run['run_id']}': {e}")
+
+    def delete(self, run_id: str):
+        """Forget a run."""
+        self._runs.pop(run_id, None)
+        if self.path:
+            try:
+                self._file(run_id).unlink()
+            except FileNotFoundError:
+                pass
+
+
+class WorkflowEngine:
+    """
+    Runs workflow templates stage by stage through ``DcisionAITools``.
+
+    Args:
+        tools: Tools used to run each stage and look up templates
+        checkpoints: Store for stage results; in-memory by default
+        max_concurrency: Workflows ``run_many`` runs at the same time
+    """
+
+    def __init__(self, tools: "DcisionAITools", checkpoints: Optional[CheckpointStore] = None,
+                 max_concurrency: int = 4):
+        self.tools = tools
+        self.checkpoints = checkpoints or CheckpointStore()
+        self.max_concurrency = max_concurrency
+
+    def plan(self, industry: str, workflow_id: str) -> List[str]:
+        """
+        Stages of a workflow template in dependency order.
+
+        Raises:
+            WorkflowError: If the workflow is unknown or its steps cannot run
+        """
+        template = self.tools.workflow_manager.get_workflow_template(industry, workflow_id)
+        if "error" in template:
+            raise WorkflowError(f"Workflow '{workflow_id}' not found in industry '{industry}'")
+
+        stages = []
+        for step in template["template"]["steps"]:
+            stage = WORKFLOW_STEPS.get(step, step)
+            if stage not in STAGE_DEPENDENCIES:
+                raise WorkflowError(f"Unknown workflow step: {step}")
+            stages.append(stage)
+        for stage in stages:
+            missing = [dep for dep in STAGE_DEPENDENCIES[stage] if dep not in stages]
+            if missing:
+                raise WorkflowError(f"Step '{stage}' needs {', '.join(missing)}")
+        return [stage for stage, _ in PIPELINE_STAGES if stage in stages]
+
+    def _stage_args(self, stage: str, industry: str, workflow_id: str,
+                    parameters: Dict[str, Any], results: Dict[str, Dict[str, Any]]) -> Tuple[Any, ...]:
+        template = self.tools.workflow_manager.get_workflow_template(industry, workflow_id)["template"]
+        problem = parameters.get("problem_description") or (
+            f"{template['name']} ({industry}): {template['description']}"
+        )
+        if stage == "classify_intent":
+            return (problem, f"{industry}/{workflow_id}")
+        if stage == "analyze_data":
+            constraints = parameters.get("constraints")
+            if constraints is None:
+                extra = {k: v for k, v in parameters.items() if k not in STAGE_PARAMETERS}
+                constraints = json.dumps(extra, sort_keys=True, default=str) if extra else None
+            return (problem, parameters.get("data_type", "tabular"), constraints)
+        if stage == "build_model":
+            analysis = results["analyze_data"].get("data_analysis") if "analyze_data" in results else None
+            return (problem, analysis, parameters.get("model_type"))
+        model = results["build_model"].get("model_specification") if "build_model" in results else {}
+        return (model, parameters.get("solver_config"))
+
+    async def run(
+        self,
+        industry: str,
+        workflow_id: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        run_id: Optional[str] = None,
+        force: Iterable[str] = (),
+        on_event: Optional[EventCallback] = None
+    ) -> Dict[str, Any]:
+        """
+        Run a workflow, reusing checkpointed stages whose inputs are unchanged.
+
+        Args:
+            industry: Target industry
+            workflow_id: Workflow template to run
+            parameters: Workflow parameters; ``problem_description``,
+                ``data_type``, ``constraints``, ``model_type`` and
+                ``solver_config`` feed the matching stages, anything else is
+                passed to data analysis as constraints
+            run_id: Checkpoint to resume; defaults to ``industry/workflow_id``
+            force: Stages to re-run even if their checkpoint is current
+            on_event: Optional callback receiving a progress event and a
+                partial result as each stage completes
+
+        Returns:
+            Status, the result of every stage, and which stages were
+            executed and which were reused from the checkpoint
+        """
+        started = time.perf_counter()
+        parameters = parameters or {}
+        run_id = run_id or f"{industry}/{workflow_id}"
+        force = set(force)
+        stages = self.plan(industry, workflow_id)
+
+        previous = self.checkpoints.get(run_id) or {}
+        checkpoint = {
+            "run_id": run_id,
+            "industry": industry,
+            "workflow_id": workflow_id,
+            "status": "running",
+            "stages": dict(previous.get("stages", {})),
+        }
+        results: Dict[str, Dict[str, Any]] = {}
+        executed: List[str] = []
+        reused: List[str] = []
+
+        async def run_stage(stage: str):
+            args = self._stage_args(stage, industry, workflow_id, parameters, results)
+            fingerprint = stage_fingerprint(stage, args)
+            saved = checkpoint["stages"].get(stage)
+            if (stage not in force and saved and saved["fingerprint"] == fingerprint
+                    and saved["result"].get("status") == "success"):
+                results[stage] = saved["result"]
+                reused.append(stage)
+            else:
+                results[stage] = await getattr(self.tools, stage)(*args)
+                executed.append(stage)
+                checkpoint["stages"][stage] = {"fingerprint": fingerprint, "result": results[stage]}
+
+            if on_event is not None:
+                await on_event({
+                    "event": "progress",
+                    "progress": len(results),
+                    "total": len(stages),
+                    "message": stage
+                })
+                await on_event({"event": "partial", "stage": stage, "data": results[stage]})
+
+        pending = list(stages)
+        failed: Optional[str] = None
+        while pending and failed is None:
+            ready = [s for s in pending if all(dep in results for dep in STAGE_DEPENDENCIES[s])]
+            await asyncio.gather(*(run_stage(stage) for stage in ready))
+            pending = [s for s in pending if s not in results]
+            failed = next((s for s in ready if results[s].get("status") != "success"), None)
+            checkpoint["status"] = "failed" if failed else ("running" if pending else "completed")
+            self.checkpoints.save(checkpoint)
+
+        outcome = {
+            "status": "error" if failed else "success",
+            "run_id": run_id,
+            "industry": industry,
+            "workflow_id": workflow_id,
+            "stages": results,
+            "executed": executed,
+            "reused": reused,
+            "execution_time": time.perf_counter() - started
+        }
+        if failed:
+            outcome["failed_stage"] = failed
+            outcome["error"] = f"Workflow stage '{failed}' failed: {results[failed].get('error')}"
+            logger.warning(f"Run '{run_id}' stopped at {failed}; re-run to resume from there")
+        return outcome
+
+    async def run_many(self, runs: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run independent workflows concurrently, at most ``max_concurrency`` at once.
+
+        Args:
+            runs: Keyword arguments of ``run`` for each workflow
+
+        Returns:
+            Outcomes in the same order as ``runs``; planning errors are
+            reported as error outcomes rather than raised
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def bounded(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    return await self.run(**kwargs)
+                except WorkflowError as e:
+                    return {
+                        "status": "error",
+                        "industry": kwargs.get("industry"),
+                        "workflow_id": kwargs.get("workflow_id"),
+                        "error": str(e)
+                    }
+
+        return await asyncio.gather(*(bounded(kwargs) for kwargs in runs))
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+DcisionAI Workflow Index
+========================
+
+In-memory full-text index over workflow templates.
+Built once when templates are loaded: an inverted token index with
+precomputed BM25 weights, a sorted vocabulary for prefix matching and a
+delete-neighbourhood table for typo-tolerant (edit distance 1) matching.
+"""
+
+import bisect
+import heapq
+import math
+import re
+from collections import Counter, OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# Name tokens count this many times, so title matches outrank descriptions
+NAME_BOOST = 2
+
+# Score multipliers for non-exact matches of a query term
+PREFIX_FACTOR = 0.8
+FUZZY_FACTOR = 0.6
+
+# Query terms shorter than this are not expanded by prefix / typo matching
+MIN_PREFIX_LENGTH = 2
+MIN_FUZZY_LENGTH = 4
+
+# Upper bound on vocabulary terms a single prefix expands to
+MAX_PREFIX_EXPANSIONS = 50
+
+QUERY_CACHE_SIZE = 512
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase alphanumeric tokens of ``text``."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def _deletes(term: str) -> Set[str]:
+    """All strings obtained by deleting one character from ``term``."""
+    return {term[:i] + term[i + 1:] for i in range(len(term))}
+
+
+def _within_one_edit(a: str, b: str) -> bool:
+    """Damerau-Levenshtein distance of at most one (incl. adjacent swaps)."""
+    if a == b:
+        return True
+    la, lb = len(a), len(b)
+    if abs(la - lb) > 1:
+        return False
+    if la == lb:
+        diffs = [i for i in range(la) if a[i] != b[i]]
+        if len(diffs) == 1:
+            return True
+        return (len(diffs) == 2 and diffs[1] == diffs[0] + 1
+                and a[diffs[0]] == b[diffs[1]] and a[diffs[1]] == b[diffs[0]])
+    if la > lb:
+        a, b = b, a
+    # b is one character longer than a
+    for i in range(len(a)):
+        if a[i] != b[i]:
+            return a[i:] == b[i + 1:]
+    return True
+
+
+class WorkflowIndex:
+    """
+    Ranked full-text search over workflow documents.
+
+    Args:
+        documents: Search results to index; each needs ``name`` and
+            ``description`` and may carry ``industry`` and ``workflow_id``
+    """
+
+    def __init__(self, documents: Iterable[Dict[str, Any]]):
+        self.documents: List[Dict[str, Any]] = list(documents)
+        self._postings: Dict[str, Dict[int, float]] = {}
+        self._ranked: Dict[str, List[int]] = {}
+        self._fuzzy: Dict[str, Set[str]] = {}
+        self._cache: "OrderedDict[Tuple[str, Optional[int]], List[Dict[str, Any]]]" = OrderedDict()
+        self._build()
+
+    def _build(self):
+        term_counts: List[Counter] = []
+        lengths: List[int] = []
+        for doc in self.documents:
+            tokens = tokenize(doc.get("name", "")) * NAME_BOOST
+            tokens += tokenize(doc.get("description", ""))
+            tokens += tokenize(doc.get("industry", "")) + tokenize(doc.get("workflow_id", ""))
+            term_counts.append(Counter(tokens))
+            lengths.append(len(tokens))
+
+        total = len(self.documents)
+        avg_length = sum(lengths) / total if total else 0.0
+        document_frequency: Counter = Counter()
+        for counts in term_counts:
+            document_frequency.update(counts.keys())
+
+        for doc_id, counts in enumerate(term_counts):
+            norm = K1 * (1 - B + B * lengths[doc_id] / avg_length) if avg_length else K1
+            for term, tf in counts.items():
+                df = document_frequency[term]
+                idf = math.log(1 + (total - df + 0.5) / (df + 0.5))
+                weight = idf * tf * (K1 + 1) / (tf + norm)
+                self._postings.setdefault(term, {})[doc_id] = weight
+
+        self._vocabulary = sorted(self._postings)
+        for term, postings in self._postings.items():
+            self._ranked[term] = sorted(postings, key=postings.__getitem__, reverse=True)
+        for term in self._vocabulary:
+            if len(term) >= MIN_FUZZY_LENGTH - 1:
+                for variant in _deletes(term) | {term}:
+                    self._fuzzy.setdefault(variant, set()).add(term)
+
+    @property
+    def vocabulary_size(self) -> int:
+        return len(self._vocabulary)
+
+    def clear_cache(self):
+        """Forget memoized query results."""
+        self._cache.clear()
+
+    def _expand(self, token: str) -> Dict[str, float]:
+        """Vocabulary terms a query token matches, with their score factor."""
+        expansions: Dict[str, float] = {}
+        if token in self._postings:
+            expansions[token] = 1.0
+
+        if len(token) >= MIN_PREFIX_LENGTH:
+            start = bisect.bisect_left(self._vocabulary, token)
+            for term in self._vocabulary[start:start + MAX_PREFIX_EXPANSIONS + 1]:
+                if not term.startswith(token):
+                    break
+                expansions.setdefault(term, PREFIX_FACTOR)
+
+        if not expansions and len(token) >= MIN_FUZZY_LENGTH:
+            candidates: Set[str] = set()
+            for variant in _deletes(token) | {token}:
+                candidates |= self._fuzzy.get(variant, set())
+            for term in candidates:
+                if _within_one_edit(token, term):
+                    expansions[term] = FUZZY_FACTOR
+        return expansions
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Find documents matching every query term, best first.
+
+        Query terms match exactly, as a prefix of an indexed term, or within
+        one typo. Results are memoized per query.
+
+        Returns:
+            Matching documents with an added ``score``
+        """
+        key = (" ".join(tokenize(query)), limit)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return list(cached)
+
+        results = self._search(key[0].split(), limit)
+        self._cache[key] = results
+        if len(self._cache) > QUERY_CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return list(results)
+
+    def _search(self, tokens: List[str], limit: Optional[int]) -> List[Dict[str, Any]]:
+        if not tokens:
+            return []
+        expansions = [self._expand(token) for token in tokens]
+        if not all(expansions):
+            return []
+
+        # A single token scores each document by its best matching term, so the
+        # top results are among the top results of each term's ranked postings
+        if len(expansions) == 1:
+            best: Dict[int, float] = {}
+            for term, factor in expansions[0].items():
+                postings = self._postings[term]
+                for doc_id in self._ranked[term][:limit]:
+                    weight = postings[doc_id] * factor
+                    if weight > best.get(doc_id, 0.0):
+                        best[doc_id] = weight
+            ranked = [(-weight, doc_id) for doc_id, weight in best.items()]
+            return self._top(ranked, limit)
+
+        # Intersect from the most selective token, then score the survivors
+        matches = []
+        for expansion in expansions:
+            terms = list(expansion)
+            docs = set(self._postings[terms[0]])
+            for term in terms[1:]:
+                docs.update(self._postings[term])
+            matches.append(docs)
+        matches.sort(key=len)
+        candidates = matches[0].intersection(*matches[1:])
+
+        ranked = []
+        for doc_id in candidates:
+            score = 0.0
+            for expansion in expansions:
+                best_weight = 0.0
+                for term, factor in expansion.items():
+                    weight = self._postings[term].get(doc_id)
+                    if weight is not None and weight * factor > best_weight:
+                        best_weight = weight * factor
+                score += best_weight
+            ranked.append((-score, doc_id))
+        return self._top(ranked, limit)
+
+    def rank(self, text: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Rank documents by the terms of free text they match, best first.
+
+        Unlike ``search`` a document needs to match only some of the terms,
+        so a whole problem description can serve as the query. Terms of at
+        least ``MIN_FUZZY_LENGTH`` characters also match as a prefix or
+        within one typo; shorter ones only exactly.
+
+        Returns:
+            Documents matching any term with an added ``score``
+        """
+        scores: Dict[int, float] = {}
+        for token in set(tokenize(text)):
+            if len(token) >= MIN_FUZZY_LENGTH:
+                expansion = self._expand(token)
+            else:
+                expansion = {token: 1.0} if token in self._postings else {}
+            best: Dict[int, float] = {}
+            for term, factor in expansion.items():
+                for doc_id, weight in self._postings[term].items():
+                    if weight * factor > best.get(doc_id, 0.0):
+                        best[doc_id] = weight * factor
+            for doc_id, weight in best.items():
+                scores[doc_id] = scores.get(doc_id, 0.0) + weight
+        return self._top([(-score, doc_id) for doc_id, score in scores.items()], limit)
+
+    def _top(self, ranked: List[Tuple[float, int]], limit: Optional[int]) -> List[Dict[str, Any]]:
+        """Results for ``(-score, doc_id)`` pairs, best first."""
+        if limit is None:
+            ranked.sort()
+        else:
+            ranked = heapq.nsmallest(limit, ranked)
+        return [self._result(doc_id, -score) for score, doc_id in ranked]
+
+    def _result(self, doc_id: int, score: float) -> Dict[str, Any]:
+        result = dict(self.documents[doc_id])
+        result["score"] = round(score, 4)
+        return result
@@ -4,19 +4,210 @@ DcisionAI Workflow Manager
 =========================
 
 Manages industry-specific optimization workflows.
-Provides 21 pre-built workflows across 7 industries.
+Provides 21 pre-built workflows across 7 industries, extended by templates
+loaded from external YAML/JSON files. Listings and statistics are
+precomputed and search runs against a ranked full-text index.
 """
 
 import json
-from typing import Any, Dict, List, Optional
+import logging
+import os
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Union
 from pathlib import Path
 
+from .workflow_index import WorkflowIndex
+
+logger = logging.getLogger(__name__)
+
+# os.pathsep-separated template files or directories loaded at startup
+TEMPLATES_ENV = "DCISIONAI_WORKFLOW_TEMPLATES"
+
+TEMPLATE_SUFFIXES = (".json", ".yaml", ".yml")
+
+COMPLEXITY_LEVELS = ("low", "medium", "high")
+
+# Steps of templates that do not list their own
+DEFAULT_STEPS = (
+    "Intent Classification",
+    "Data Analysis",
+    "Model Building",
+    "Optimization Solving",
+)
+
+# Template files may describe difficulty instead of complexity
+DIFFICULTY_TO_COMPLEXITY = {
+    "basic": "low",
+    "beginner": "low",
+    "easy": "low",
+    "intermediate": "medium",
+    "advanced": "high",
+    "expert": "high",
+}
+
+PathLike = Union[str, Path]
+
+
+def _read_template_file(path: Path) -> Any:
+    """Parse a JSON or YAML template file."""
+    with open(path, "r") as f:
+        if path.suffix == ".json":
+            return json.load(f)
+        import yaml
+        return yaml.safe_load(f)
+
+
+def _template_files(paths: Iterable[PathLike]) -> List[Path]:
+    """Expand directories to the template files they contain."""
+    files: List[Path] = []
+    for entry in paths:
+        path = Path(entry)
+        if path.is_dir():
+            files.extend(sorted(p for p in path.iterdir() if p.suffix in TEMPLATE_SUFFIXES))
+        else:
+            files.append(path)
+    return files
+
+
+def normalize_workflow(workflow_id: str, template: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Bring a template into the shape of the built-in workflows.
+
+    Accepts ``title`` for ``name`` and ``difficulty`` for ``complexity``;
+    any other fields are kept as they are.
+    """
+    workflow = dict(template)
+    workflow["name"] = str(template.get("name") or template.get("title") or workflow_id)
+    workflow["description"] = str(template.get("description", ""))
+
+    complexity = str(template.get("complexity") or "").lower()
+    if complexity not in COMPLEXITY_LEVELS:
+        difficulty = str(template.get("difficulty") or "").lower()
+        complexity = DIFFICULTY_TO_COMPLEXITY.get(difficulty, "medium")
+    workflow["complexity"] = complexity
+
+    workflow.setdefault("estimated_time", "unknown")
+    workflow.setdefault("workflows", 1)
+    return workflow
+
+
 class WorkflowManager:
     """Manages industry-specific optimization workflows."""
     
-    def __init__(self):
-        """Initialize the workflow manager."""
+    def __init__(self, template_paths: Optional[Iterable[PathLike]] = None):
+        """
+        Initialize the workflow manager.
+
+        Args:
+            template_paths: Template files or directories to load on top of
+                the built-in workflows; defaults to ``DCISIONAI_WORKFLOW_TEMPLATES``
+        """
         self.workflows = self._load_default_workflows()
+        if template_paths is None:
+            template_paths = [p for p in os.getenv(TEMPLATES_ENV, "").split(os.pathsep) if p]
+        for path in _template_files(template_paths):
+            self._merge(self.workflows, self._parse_templates(_read_template_file(path)))
+        self._build()
+
+    @staticmethod
+    def _parse_templates(data: Any) -> Dict[str, Dict[str, Any]]:
+        """
+        Read templates as ``{industry: {workflow_id: template}}``.
+
+        A list of templates (or ``{"templates": [...]}``) is also accepted when
+        each entry names its ``industry`` and ``id`` / ``workflow_id``.
+        """
+        if isinstance(data, dict) and isinstance(data.get("templates"), list):
+            data = data["templates"]
+        if isinstance(data, list):
+            grouped: Dict[str, Dict[str, Any]] = {}
+            for template in data:
+                workflow_id = template.get("workflow_id") or template.get("id")
+                if not template.get("industry") or not workflow_id:
+                    raise ValueError(f"Template needs an industry and an id: {template!r}")
+                grouped.setdefault(template["industry"], {})[workflow_id] = template
+            data = grouped
+        if not isinstance(data, dict):
+            raise ValueError("Workflow templates must be a mapping or a list")
+
+        return {
+            industry: {
+                workflow_id: normalize_workflow(workflow_id, template)
+                for workflow_id, template in workflows.items()
+            }
+            for industry, workflows in data.items()
+        }
+
+    @staticmethod
+    def _merge(target: Dict[str, Dict[str, Any]], workflows: Dict[str, Dict[str, Any]]):
+        for industry, industry_workflows in workflows.items():
+            target.setdefault(industry, {}).update(industry_workflows)
+
+    def add_workflows(self, workflows: Union[Dict[str, Any], List[Dict[str, Any]]]):
+        """
+        Add or replace workflows and rebuild the index.
+
+        Args:
+            workflows: Templates in any layout accepted in template files
+        """
+        self._merge(self.workflows, self._parse_templates(workflows))
+        self._build()
+
+    def load_templates(self, *paths: PathLike) -> int:
+        """
+        Load template files or directories and rebuild the index.
+
+        Returns:
+            Number of templates read
+        """
+        loaded: Dict[str, Dict[str, Any]] = {}
+        for path in _template_files(paths):
+            self._merge(loaded, self._parse_templates(_read_template_file(path)))
+        self._merge(self.workflows, loaded)
+        self._build()
+        return sum(len(industry_workflows) for industry_workflows in loaded.values())
+
+    def _build(self):
+        """Precompute responses, aggregates and the search index."""
+        total_workflows = sum(
+            len(industry_workflows) 
+            for industry_workflows in self.workflows.values()
+        )
+        complexity_counts = Counter({level: 0 for level in COMPLEXITY_LEVELS})
+        documents = []
+        for industry, workflows in self.workflows.items():
+            for workflow_id, workflow in workflows.items():
+                complexity_counts[workflow["complexity"]] += 1
+                documents.append({
+                    "industry": industry,
+                    "workflow_id": workflow_id,
+                    "name": workflow["name"],
+                    "description": workflow.get("description", ""),
+                    "complexity": workflow["complexity"]
+                })
+
+        self._all_workflows = {
+            "industries": list(self.workflows.keys()),
+            "workflows": self.workflows,
+            "total_workflows": total_workflows,
+            "total_industries": len(self.workflows)
+        }
+        self._statistics = {
+            "total_workflows": total_workflows,
+            "total_industries": len(self.workflows),
+            "complexity_distribution": dict(complexity_counts),
+            "industries": list(self.workflows.keys())
+        }
+        self._industry_responses = {
+            industry: {
+                "industry": industry,
+                "workflows": workflows,
+                "workflow_count": len(workflows)
+            }
+            for industry, workflows in self.workflows.items()
+        }
+        self.index = WorkflowIndex(documents)
+        logger.debug(f"Indexed {total_workflows} workflows ({self.index.vocabulary_size} terms)")
     
     def _load_default_workflows(self) -> Dict[str, Any]:
         """Load default workflow templates."""
@@ -186,26 +377,14 @@ class WorkflowManager:
     
     def get_all_workflows(self) -> Dict[str, Any]:
         """Get all available workflows organized by industry."""
-        return {
-            "industries": list(self.workflows.keys()),
-            "workflows": self.workflows,
-            "total_workflows": sum(
-                len(industry_workflows) 
-                for industry_workflows in self.workflows.values()
-            ),
-            "total_industries": len(self.workflows)
-        }
+        return self._all_workflows
     
     def get_industry_workflows(self, industry: str) -> Dict[str, Any]:
         """Get workflows for a specific industry."""
         if industry not in self.workflows:
             return {"error": f"Industry '{industry}' not found"}
         
-        return {
-            "industry": industry,
-            "workflows": self.workflows[industry],
-            "workflow_count": len(self.workflows[industry])
-        }
+        return self._industry_responses[industry]
     
     def get_workflow_details(self, industry: str, workflow_id: str) -> Dict[str, Any]:
         """Get detailed information about a specific workflow."""
@@ -220,49 +399,33 @@ class WorkflowManager:
             "industry": industry,
             "workflow_id": workflow_id,
             "name": workflow["name"],
-            "description": workflow["description"],
+            "description": workflow.get("description", ""),
             "complexity": workflow["complexity"],
             "estimated_time": workflow["estimated_time"],
             "workflows": workflow["workflows"]
         }
     
-    def search_workflows(self, query: str) -> List[Dict[str, Any]]:
-        """Search workflows by name or description."""
-        results = []
-        query_lower = query.lower()
-        
-        for industry, workflows in self.workflows.items():
-            for workflow_id, workflow in workflows.items():
-                if (query_lower in workflow["name"].lower() or 
-                    query_lower in workflow["description"].lower()):
-                    results.append({
-                        "industry": industry,
-                        "workflow_id": workflow_id,
-                        "name": workflow["name"],
-                        "description": workflow["description"],
-                        "complexity": workflow["complexity"]
-                    })
-        
-        return results
+    def search_workflows(self, query: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Search workflows by name, description, industry or id.
+
+        Every query word must match, exactly, as a prefix or with one typo.
+        Results are ranked by relevance and carry a ``score``.
+        """
+        return self.index.search(query, limit)
+    
+    def rank_workflows(self, text: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Rank workflows by relevance to free text such as a problem description.
+
+        Workflows matching any of the words are returned, best first, with
+        a ``score``.
+        """
+        return self.index.rank(text, limit)
     
     def get_workflow_statistics(self) -> Dict[str, Any]:
         """Get statistics about available workflows."""
-        total_workflows = sum(
-            len(industry_workflows) 
-            for industry_workflows in self.workflows.values()
-        )
-        
-        complexity_counts = {"low": 0, "medium": 0, "high": 0}
-        for industry_workflows in self.workflows.values():
-            for workflow in industry_workflows.values():
-                complexity_counts[workflow["complexity"]] += 1
-        
-        return {
-            "total_workflows": total_workflows,
-            "total_industries": len(self.workflows),
-            "complexity_distribution": complexity_counts,
-            "industries": list(self.workflows.keys())
-        }
+        return self._statistics
     
     def validate_workflow(self, industry: str, workflow_id: str) -> bool:
         """Validate if a workflow exists."""
@@ -280,13 +443,8 @@ class WorkflowManager:
                 "industry": industry,
                 "workflow_id": workflow_id,
                 "name": workflow["name"],
-                "description": workflow["description"],
-                "steps": [
-                    "Intent Classification",
-                    "Data Analysis",
-                    "Model Building",
-                    "Optimization Solving"
-                ],
+                "description": workflow.get("description", ""),
+                "steps": list(workflow.get("steps", DEFAULT_STEPS)),
                 "parameters": {
                     "complexity": workflow["complexity"],
                     "estimated_time": workflow["estimated_time"],
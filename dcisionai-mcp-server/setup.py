@@ -88,6 +88,9 @@ setup(
             "boto3>=1.26.0",
             "botocore>=1.29.0",
         ],
+        "http2": [
+            "h2>=4.0.0",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -0,0 +1,12 @@
+"""Shared test fixtures."""
+
+import pytest
+from dcisionai_mcp_server.config_manager import reset_config_manager
+
+
+@pytest.fixture(autouse=True)
+def fresh_config_manager():
+    """Give every test its own process-wide configuration snapshot."""
+    reset_config_manager()
+    yield
+    reset_config_manager()
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Stub AgentCore Gateway
+======================
+
+Local stand-in for the AgentCore Gateway used by tests and benchmarks.
+Serves JSON-RPC ``tools/call`` requests on ``/mcp`` over a real socket,
+and an OAuth2 token endpoint issuing short-lived access tokens; also a
+server worker that crashes at startup.
+"""
+
+import asyncio
+import base64
+import json
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from aiohttp import web
+
+
+class StubGateway:
+    """
+    Minimal JSON-RPC gateway that echoes tool calls back.
+
+    Args:
+        latency: Seconds to wait before answering each HTTP request
+        failing_tools: Tools that answer with a JSON-RPC error
+        reverse_batches: Answer batches in reverse order
+        drop_tools: Tools left out of batch responses entirely
+        fault_statuses: HTTP statuses answered to the first requests, in order
+        delays: Per-request latencies overriding ``latency``, in order
+        retry_after: ``Retry-After`` header sent with injected 429s
+        throttle_rate: Requests per second allowed before answering 429
+        throttle_burst: Burst size of the server-side throttle
+        stream_tools: Tools answered as an SSE stream when the client accepts it
+        stream_stages: Progress stages sent before a streamed result
+        stream_interval: Seconds between streamed stages
+        authorize: Called with each request's bearer token; requests it
+            returns False for are answered with 401
+        accept_encodings: Request ``Content-Encoding`` values accepted;
+            others are answered with 415. None accepts whatever aiohttp
+            decodes.
+    """
+
+    def __init__(self, latency: float = 0.0, failing_tools: Iterable[str] = (),
+                 reverse_batches: bool = False, drop_tools: Iterable[str] = (),
+                 fault_statuses: Iterable[int] = (), delays: Iterable[float] = (),
+                 retry_after: Optional[str] = None, throttle_rate: Optional[float] = None,
+                 throttle_burst: int = 1, stream_tools: Iterable[str] = (),
+                 stream_stages: Iterable[str] = ("classify_intent", "analyze_data",
+                                                 "build_model", "solve_optimization"),
+                 stream_interval: float = 0.0,
+                 authorize: Optional[Callable[[str], bool]] = None,
+                 accept_encodings: Optional[Iterable[str]] = None):
+        self.latency = latency
+        self.failing_tools = set(failing_tools)
+        self.reverse_batches = reverse_batches
+        self.drop_tools = set(drop_tools)
+        self.fault_statuses = list(fault_statuses)
+        self.delays = list(delays)
+        self.retry_after = retry_after
+        self.throttle_rate = throttle_rate
+        self.throttle_burst = throttle_burst
+        self.throttled = 0
+        self.stream_tools = set(stream_tools)
+        self.stream_stages = list(stream_stages)
+        self.stream_interval = stream_interval
+        self.authorize = authorize
+        self.unauthorized = 0
+        self.accept_encodings = set(accept_encodings) if accept_encodings is not None else None
+        self._tokens = float(throttle_burst)
+        self._refilled = time.monotonic()
+        self.calls: List[str] = []
+        self.posts = 0
+        self.connections: Set[Tuple[str, int]] = set()
+        self.headers: List[Dict[str, str]] = []
+        self.url = ""
+        self._runner: Optional[web.AppRunner] = None
+
+    async def start(self) -> str:
+        """Start serving on a free localhost port and return the base URL."""
+        # Large enough for benchmark-sized model specifications
+        app = web.Application(client_max_size=256 * 1024 * 1024)
+        app.router.add_post("/mcp", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+        return self.url
+
+    async def stop(self):
+        """Stop the server."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "StubGateway":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+    def _throttle(self) -> bool:
+        """Server-side token bucket; True if the request must be rejected."""
+        if self.throttle_rate is None:
+            return False
+        now = time.monotonic()
+        self._tokens = min(self.throttle_burst,
+                           self._tokens + (now - self._refilled) * self.throttle_rate)
+        self._refilled = now
+        if self._tokens < 1:
+            self.throttled += 1
+            return True
+        self._tokens -= 1
+        return False
+
+    def request_latency(self, body: Any) -> float:
+        """Seconds to wait before answering a request (a message or a batch)."""
+        return self.latency
+
+    def tool_result(self, tool: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Result payload returned for a tool call."""
+        return {"tool": tool, "arguments": arguments}
+
+    def _answer(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        tool = message["params"]["name"].split("___", 1)[-1]
+        self.calls.append(tool)
+        if tool in self.failing_tools:
+            return {
+                "jsonrpc": "2.0",
+                "id": message.get("id"),
+                "error": {"code": -32000, "message": f"{tool} failed"},
+            }
+        return {
+            "jsonrpc": "2.0",
+            "id": message.get("id"),
+            "result": self.tool_result(tool, message["params"].get("arguments", {})),
+        }
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        self.posts += 1
+        self.connections.add(request.transport.get_extra_info("peername"))
+        self.headers.append(dict(request.headers))
+        if self.authorize is not None:
+            token = request.headers.get("Authorization", "").replace("Bearer ", "", 1)
+            if not self.authorize(token):
+                self.unauthorized += 1
+                return web.Response(status=401, text="Invalid Bearer token")
+        encoding = request.headers.get("Content-Encoding")
+        if encoding and self.accept_encodings is not None and encoding not in self.accept_encodings:
+            return web.Response(status=415, text=f"Unsupported Content-Encoding: {encoding}")
+        if self._throttle():
+            return web.Response(status=429, text="Too Many Requests")
+        body = await request.json()
+        latency = self.delays.pop(0) if self.delays else self.request_latency(body)
+        if latency:
+            await asyncio.sleep(latency)
+
+        if self.fault_statuses:
+            status = self.fault_statuses.pop(0)
+            headers = {"Retry-After": self.retry_after} if status == 429 and self.retry_after else None
+            return web.Response(status=status, text=f"Injected {status}", headers=headers)
+
+        if not isinstance(body, list):
+            tool = body["params"]["name"].split("___", 1)[-1]
+            if tool in self.stream_tools and "text/event-stream" in request.headers.get("Accept", ""):
+                return await self._stream(request, body)
+            return web.json_response(self._answer(body))
+
+        answers = [
+            self._answer(message) for message in body
+            if message["params"]["name"].split("___", 1)[-1] not in self.drop_tools
+        ]
+        if self.reverse_batches:
+            answers.reverse()
+        return web.json_response(answers)
+
+    async def _stream(self, request: web.Request, message: Dict[str, Any]) -> web.StreamResponse:
+        """Answer with SSE progress notifications per stage, then the result."""
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        token = message["params"].get("_meta", {}).get("progressToken")
+
+        async def send(payload: Dict[str, Any]):
+            await response.write(f"data: {json.dumps(payload)}\n\n".encode("utf-8"))
+
+        await response.write(b": stream open\n\n")
+        for index, stage in enumerate(self.stream_stages, 1):
+            if self.stream_interval:
+                await asyncio.sleep(self.stream_interval)
+            await send({
+                "jsonrpc": "2.0",
+                "method": "notifications/progress",
+                "params": {
+                    "progressToken": token,
+                    "progress": index,
+                    "total": len(self.stream_stages),
+                    "message": stage,
+                    "partial": {"stage": stage, "index": index},
+                },
+            })
+        await send(self._answer(message))
+        await response.write_eof()
+        return response
+
+
+class StubTokenEndpoint:
+    """
+    OAuth2 client-credentials endpoint issuing short-lived tokens.
+
+    Args:
+        lifetime: Seconds each token is valid (sent as ``expires_in``)
+        latency: Seconds to wait before answering each token request
+        client_id: Accepted client ID
+        client_secret: Accepted client secret
+    """
+
+    def __init__(self, lifetime: float = 3600.0, latency: float = 0.0,
+                 client_id: str = "test-client", client_secret: str = "test-secret"):
+        self.lifetime = lifetime
+        self.latency = latency
+        self.basic_auth = "Basic " + base64.b64encode(f"{client_id}:{client_secret}".encode()).decode()
+        self.issued: Dict[str, float] = {}
+        self.revoked: Set[str] = set()
+        self.requests = 0
+        self.fail_requests = 0
+        self.active = 0
+        self.peak_active = 0
+        self.url = ""
+        self._runner: Optional[web.AppRunner] = None
+
+    async def start(self) -> str:
+        """Start serving on a free localhost port and return the token URL."""
+        app = web.Application()
+        app.router.add_post("/oauth2/token", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}/oauth2/token"
+        return self.url
+
+    async def stop(self):
+        """Stop the server."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "StubTokenEndpoint":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+    def valid(self, token: str) -> bool:
+        """Whether a token was issued here, is not revoked and has not expired."""
+        expires_at = self.issued.get(token)
+        return (expires_at is not None and token not in self.revoked
+                and time.monotonic() < expires_at)
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        self.active += 1
+        self.peak_active = max(self.peak_active, self.active)
+        try:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            if request.headers.get("Authorization") != self.basic_auth:
+                return web.json_response({"error": "invalid_client"}, status=401)
+            form = await request.post()
+            if form.get("grant_type") != "client_credentials":
+                return web.json_response({"error": "unsupported_grant_type"}, status=400)
+            if self.fail_requests:
+                self.fail_requests -= 1
+                return web.json_response({"error": "temporarily_unavailable"}, status=503)
+            token = f"token-{len(self.issued) + 1}"
+            self.issued[token] = time.monotonic() + self.lifetime
+            return web.json_response({
+                "access_token": token,
+                "token_type": "Bearer",
+                "expires_in": self.lifetime,
+            })
+        finally:
+            self.active -= 1
+
+
+def crashing_worker(*args):
+    """Server worker entry point that fails at startup, for supervisor tests."""
+    raise SystemExit(3)
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Tests for the artifact store
+============================
+
+Covers storing and evicting artifacts in every backend, handles that
+survive a restart, and solving a model by the handle ``build_model``
+returned against a local stub gateway.
+"""
+
+import json
+
+import pytest
+from dcisionai_mcp_server.artifacts import (
+    ArtifactNotFoundError, ArtifactStore, DiskArtifactStore, SQLiteArtifactStore, is_handle
+)
+from dcisionai_mcp_server.codec import EncodedJSON
+from dcisionai_mcp_server.config import Config
+from dcisionai_mcp_server.mcp_server import DcisionAIMCPServer
+from dcisionai_mcp_server.tools import DcisionAITools
+from .stub_gateway import StubGateway
+
+
+def make_store(backend: str, path, max_entries: int = 256) -> ArtifactStore:
+    if backend == "disk":
+        return DiskArtifactStore(path / "artifacts", max_entries)
+    if backend == "sqlite":
+        return SQLiteArtifactStore(path / "artifacts.sqlite3", max_entries)
+    return ArtifactStore(max_entries)
+
+
+def make_config(url: str, **overrides) -> Config:
+    return Config(
+        gateway_url=url,
+        gateway_target="test-target",
+        access_token="test-token",
+        rate_limit_enabled=False,
+        cache_enabled=False,
+        **overrides
+    )
+
+
+SPEC = {"variables": [{"name": "x", "lb": 0}], "objective": {"sense": "minimize", "terms": {"x": 2}}}
+
+
+class TestArtifactStore:
+    """Test cases for the artifact store backends."""
+
+    @pytest.mark.parametrize("backend", ["memory", "disk", "sqlite"])
+    def test_put_and_get(self, backend, tmp_path):
+        store = make_store(backend, tmp_path)
+        handle = store.put(SPEC)
+
+        assert is_handle(handle)
+        assert store.put(dict(SPEC)) == handle
+        assert store.get(handle) == SPEC
+        assert store.resolve(handle) == SPEC
+        assert store.resolve(SPEC) is SPEC
+        assert len(store) == 1
+        with pytest.raises(ArtifactNotFoundError, match="Unknown or expired artifact handle"):
+            store.get("artifact:" + "0" * 64)
+        store.close()
+
+    @pytest.mark.parametrize("backend", ["memory", "disk", "sqlite"])
+    def test_least_recently_used_are_evicted(self, backend, tmp_path):
+        store = make_store(backend, tmp_path, max_entries=2)
+        first, second = store.put({"model": 1}), store.put({"model": 2})
+        store.get(first)
+        third = store.put({"model": 3})
+
+        assert store.get(first) == {"model": 1}
+        assert store.get(third) == {"model": 3}
+        with pytest.raises(ArtifactNotFoundError):
+            store.get(second)
+        assert store.stats()["evictions"] == 1
+        store.close()
+
+    @pytest.mark.parametrize("backend", ["disk", "sqlite"])
+    def test_handles_survive_a_restart(self, backend, tmp_path):
+        store = make_store(backend, tmp_path)
+        handle = store.put(SPEC)
+        store.close()
+
+        restarted = make_store(backend, tmp_path)
+        value = restarted.get(handle)
+        restarted.close()
+
+        # The stored bytes are reused as the artifact's encoding
+        assert isinstance(value, EncodedJSON)
+        assert value == SPEC
+        assert value._encoded is not None
+
+    def test_from_config(self, tmp_path):
+        assert ArtifactStore.from_config(make_config("http://gw", artifact_store="none")) is None
+        store = ArtifactStore.from_config(make_config(
+            "http://gw", artifact_store="sqlite", artifact_dir=str(tmp_path)
+        ))
+        assert store.backend == "sqlite"
+        with pytest.raises(ValueError, match="Artifact store"):
+            make_config("http://gw", artifact_store="s3")
+
+
+class TestModelHandles:
+    """Test cases for solving models by handle."""
+
+    @pytest.mark.asyncio
+    async def test_solve_by_handle(self, tmp_path):
+        async with StubGateway() as gateway:
+            config = make_config(gateway.url, artifact_store="sqlite", artifact_dir=str(tmp_path))
+            async with DcisionAITools(config) as tools:
+                built = await tools.build_model("Schedule 3 shifts", {"shifts": 3})
+                handle = built["model_handle"]
+                by_handle = await tools.solve_optimization(handle, {"solver": "highs"})
+                by_value = await tools.solve_optimization(built["model_specification"], {"solver": "highs"})
+
+        assert is_handle(handle)
+        assert by_handle["status"] == "success"
+        sent = by_handle["optimization_results"]["arguments"]["model_specification"]
+        assert sent == built["model_specification"]
+        assert sent == by_value["optimization_results"]["arguments"]["model_specification"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_handle(self):
+        async with StubGateway() as gateway:
+            async with DcisionAITools(make_config(gateway.url)) as tools:
+                result = await tools.solve_optimization("artifact:" + "f" * 64)
+                streamed = await tools.call_streaming("solve_optimization", "artifact:" + "f" * 64)
+
+        assert result["status"] == "error"
+        assert "Unknown or expired artifact handle" in result["error"]
+        assert streamed["status"] == "error"
+        assert gateway.posts == 0
+
+    @pytest.mark.asyncio
+    async def test_unknown_handle_in_batch(self):
+        async with StubGateway() as gateway:
+            async with DcisionAITools(make_config(gateway.url)) as tools:
+                results = await tools.call_batch([
+                    ("classify_intent", ("Schedule 3 shifts",)),
+                    ("solve_optimization", {"model_specification": "artifact:" + "f" * 64}),
+                ])
+
+        assert results[0]["status"] == "success"
+        assert results[1]["status"] == "error"
+        assert "Unknown or expired artifact handle" in results[1]["error"]
+
+    @pytest.mark.asyncio
+    async def test_disabled(self):
+        async with StubGateway() as gateway:
+            async with DcisionAITools(make_config(gateway.url, artifact_store="none")) as tools:
+                built = await tools.build_model("Schedule 3 shifts")
+                result = await tools.solve_optimization("artifact:" + "f" * 64)
+
+        assert "model_handle" not in built
+        assert result["status"] == "error"
+
+    @pytest.mark.asyncio
+    async def test_mcp_client_sends_handle(self):
+        async with StubGateway() as gateway:
+            server = DcisionAIMCPServer(make_config(gateway.url))
+            built = await server.call_tool("build_model", {"problem_description": "Schedule 3 shifts"})
+            arguments = {"problem_description": "Schedule 3 shifts", "model_handle": built["model_handle"]}
+            solved = await server.call_tool("solve_optimization", arguments)
+            await server.aclose()
+
+        assert len(json.dumps(arguments)) < 200
+        assert solved["status"] == "success"
+        assert solved["optimization_results"]["arguments"]["model_specification"] == built["model_specification"]
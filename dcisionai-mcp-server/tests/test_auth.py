@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Tests for gateway access-token refresh
+======================================
+
+Runs tool calls against a stub gateway that only accepts live tokens
+from a stub OAuth endpoint issuing short-lived tokens, and checks that
+refreshes happen in the background, once, without failing or stalling
+calls in flight.
+"""
+
+import asyncio
+import time
+
+import pytest
+from dcisionai_mcp_server.auth import TokenError, TokenProvider
+from dcisionai_mcp_server.config import Config
+from dcisionai_mcp_server.tools import DcisionAITools
+from .stub_gateway import StubGateway, StubTokenEndpoint
+
+
+def make_config(gateway_url: str, token_url: str, **overrides) -> Config:
+    return Config(
+        gateway_url=gateway_url,
+        gateway_target="test-target",
+        token_endpoint=token_url,
+        client_id="test-client",
+        client_secret="test-secret",
+        rate_limit_enabled=False,
+        cache_enabled=False,
+        **overrides
+    )
+
+
+class TestTokenRefresh:
+    """Test cases for background token refresh under load."""
+
+    @pytest.mark.asyncio
+    async def test_calls_never_block_on_refresh(self):
+        async with StubTokenEndpoint(lifetime=1.5, latency=0.3) as endpoint:
+            async with StubGateway(authorize=endpoint.valid) as gateway:
+                config = make_config(gateway.url, endpoint.url, token_refresh_margin=0.8)
+                async with DcisionAITools(config) as tools:
+                    # The first calls wait for the initial token and open the connections
+                    warm_up = await asyncio.gather(*(tools.classify_intent(f"warm up {n}") for n in range(16)))
+                    assert all(r["status"] == "success" for r in warm_up)
+
+                    # Count refreshes awaited by anything but the background task
+                    provider = tools.transport.auth
+                    refresh, awaited = provider.refresh, []
+
+                    async def counting_refresh(*args, **kwargs):
+                        if asyncio.current_task() is not provider._task:
+                            awaited.append(args)
+                        return await refresh(*args, **kwargs)
+
+                    provider.refresh = counting_refresh
+
+                    results = []
+                    deadline = time.monotonic() + 3.0
+
+                    async def worker(n: int):
+                        i = 0
+                        while time.monotonic() < deadline:
+                            results.append(await tools.classify_intent(f"request {n}-{i}"))
+                            i += 1
+
+                    await asyncio.gather(*(worker(n) for n in range(16)))
+
+        assert len(results) > 100
+        assert all(r["status"] == "success" for r in results)
+        assert gateway.unauthorized == 0
+        # Tokens were replaced several times, one request at a time
+        assert endpoint.requests >= 3
+        assert endpoint.peak_active == 1
+        # No call waited for a token request to finish
+        assert awaited == []
+
+    @pytest.mark.asyncio
+    async def test_concurrent_refreshes_are_coalesced(self):
+        async with StubTokenEndpoint(latency=0.05) as endpoint:
+            provider = TokenProvider(make_config("http://127.0.0.1:9", endpoint.url))
+            tokens = await asyncio.gather(*(provider.refresh() for _ in range(50)))
+            await provider.aclose()
+
+        assert endpoint.requests == 1
+        assert set(tokens) == {"token-1"}
+
+    @pytest.mark.asyncio
+    async def test_rejected_token_is_replaced_once(self):
+        async with StubTokenEndpoint() as endpoint:
+            async with StubGateway(authorize=endpoint.valid) as gateway:
+                async with DcisionAITools(make_config(gateway.url, endpoint.url)) as tools:
+                    await tools.build_model("first")
+                    endpoint.revoked.add("token-1")
+                    results = await asyncio.gather(*(tools.build_model(f"call {i}") for i in range(10)))
+
+        assert all(r["status"] == "success" for r in results)
+        assert endpoint.requests == 2
+        assert gateway.unauthorized == 10
+        assert gateway.headers[-1]["Authorization"] == "Bearer token-2"
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_keeps_current_token(self):
+        async with StubTokenEndpoint(lifetime=1.0) as endpoint:
+            provider = TokenProvider(make_config(
+                "http://127.0.0.1:9", endpoint.url, token_refresh_margin=0.8
+            ))
+            assert await provider.ready() == "token-1"
+            endpoint.fail_requests = 1
+
+            with pytest.raises(TokenError):
+                await provider.refresh()
+            assert provider.valid() and provider.token == "token-1"
+
+            # The background task retries and picks up a new token before expiry
+            await asyncio.sleep(0.9)
+            token = provider.token
+            await provider.aclose()
+
+        assert token != "token-1"
+
+
+class TestTokenConfig:
+    """Test cases for token endpoint configuration."""
+
+    def test_endpoint_without_static_token(self, monkeypatch):
+        monkeypatch.delenv("DCISIONAI_ACCESS_TOKEN", raising=False)
+        config = make_config("https://gateway", "https://auth/oauth2/token")
+
+        assert config.access_token == ""
+        assert config.to_dict()["client_secret"] == "***"
+
+    def test_endpoint_needs_client_credentials(self):
+        with pytest.raises(ValueError, match="Client ID and secret"):
+            Config(token_endpoint="https://auth/oauth2/token", client_id="")
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Tests for JSON-RPC batching
+===========================
+
+Exercises batched tool calls and the pipeline helper against a local
+stub gateway, including out-of-order answers and partial failures.
+"""
+
+import pytest
+from dcisionai_mcp_server.config import Config
+from dcisionai_mcp_server.tools import DcisionAITools
+from .stub_gateway import StubGateway
+
+
+def make_tools(url: str) -> DcisionAITools:
+    return DcisionAITools(Config(
+        gateway_url=url,
+        gateway_target="test-target",
+        access_token="test-token"
+    ))
+
+
+class TestCallBatch:
+    """Test cases for DcisionAITools.call_batch."""
+
+    @pytest.mark.asyncio
+    async def test_batch_is_one_request(self):
+        """All calls in a batch travel in a single HTTP request."""
+        async with StubGateway() as gateway:
+            async with make_tools(gateway.url) as tools:
+                results = await tools.call_batch([
+                    ("classify_intent", ("Optimize shifts",)),
+                    ("analyze_data", {"data_description": "Shift data", "data_type": "time_series"}),
+                    ("get_workflow_templates", ()),
+                ])
+
+        assert gateway.posts == 1
+        assert [r["status"] for r in results] == ["success"] * 3
+        assert results[0]["intent_classification"]["arguments"]["user_input"] == "Optimize shifts"
+        assert results[1]["data_analysis"]["arguments"]["data_type"] == "time_series"
+
+    @pytest.mark.asyncio
+    async def test_responses_are_correlated_by_id(self):
+        """Out-of-order answers are matched back to their calls."""
+        async with StubGateway(reverse_batches=True) as gateway:
+            async with make_tools(gateway.url) as tools:
+                results = await tools.call_batch([
+                    ("classify_intent", ("first",)),
+                    ("classify_intent", ("second",)),
+                    ("classify_intent", ("third",)),
+                ])
+
+        inputs = [r["intent_classification"]["arguments"]["user_input"] for r in results]
+        assert inputs == ["first", "second", "third"]
+
+    @pytest.mark.asyncio
+    async def test_partial_failures(self):
+        """A failing call does not fail the rest of the batch."""
+        async with StubGateway(failing_tools={"build_model"}, drop_tools={"execute_workflow"}) as gateway:
+            async with make_tools(gateway.url) as tools:
+                results = await tools.call_batch([
+                    ("classify_intent", ("Optimize routes",)),
+                    ("build_model", ("Routing problem",)),
+                    ("execute_workflow", ("logistics", "route_optimization")),
+                ])
+
+        assert results[0]["status"] == "success"
+        assert results[1]["status"] == "error"
+        assert results[1]["error"] == "build_model failed"
+        assert results[1]["fallback"] == "Default model building"
+        assert results[2]["status"] == "error"
+        assert "No response" in results[2]["error"]
+
+    @pytest.mark.asyncio
+    async def test_whole_batch_failure(self):
+        """An HTTP error fails every call in the batch."""
+        async with StubGateway() as gateway:
+            async with make_tools(gateway.url + "/missing") as tools:
+                results = await tools.call_batch([
+                    ("classify_intent", ("Optimize routes",)),
+                    ("get_workflow_templates", ()),
+                ])
+
+        assert results[0]["status"] == "error"
+        assert "HTTP 404" in results[0]["error"]
+        # Templates fall back to the local workflow manager
+        assert results[1]["status"] == "success"
+
+
+class TestRunPipeline:
+    """Test cases for DcisionAITools.run_pipeline."""
+
+    @pytest.mark.asyncio
+    async def test_independent_stages_share_a_round_trip(self):
+        """Intent and data analysis are batched; model and solve follow."""
+        async with StubGateway() as gateway:
+            async with make_tools(gateway.url) as tools:
+                result = await tools.run_pipeline("Minimize shipping cost")
+
+        assert result["status"] == "success"
+        assert result["round_trips"] == 3
+        assert gateway.posts == 3
+        assert gateway.calls[:2] == ["classify_intent", "analyze_data"]
+
+        stages = result["stages"]
+        model_args = stages["build_model"]["model_specification"]["arguments"]
+        assert model_args["data_analysis"] == stages["analyze_data"]["data_analysis"]
+        solve_args = stages["solve_optimization"]["optimization_results"]["arguments"]
+        assert solve_args["model_specification"] == stages["build_model"]["model_specification"]
+
+    @pytest.mark.asyncio
+    async def test_pipeline_stops_at_failed_stage(self):
+        """Later stages are skipped once a stage fails."""
+        async with StubGateway(failing_tools={"analyze_data"}) as gateway:
+            async with make_tools(gateway.url) as tools:
+                result = await tools.run_pipeline("Minimize shipping cost")
+
+        assert result["status"] == "error"
+        assert "analyze_data" in result["error"]
+        assert result["round_trips"] == 1
+        assert "build_model" not in result["stages"]
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Tests for the recorded gateway benchmark
+========================================
+
+Covers replaying recorded results and latencies, recording calls from
+the local backend, running the benchmark suite against a replay and
+flagging regressions against a baseline report.
+"""
+
+import pytest
+from benchmarks.bench_gateway import SCENARIOS, compare, record, run_suite
+from benchmarks.replay_gateway import (
+    DEFAULT_RECORDING, GatewayProcess, Recording, ReplayGateway
+)
+from dcisionai_mcp_server.config import Config
+from dcisionai_mcp_server.tools import DcisionAITools
+
+
+def small_recording() -> Recording:
+    recording = Recording(source="test")
+    recording.add("classify_intent", 0.02, {"intent": "a", "confidence": 0.5})
+    recording.add("classify_intent", 0.01, {"intent": "b", "confidence": 0.6})
+    recording.add("analyze_data", 0.05, {"rows": 3})
+    return recording
+
+
+class TestReplayGateway:
+    """Test cases for replaying a recording."""
+
+    @pytest.mark.asyncio
+    async def test_cycles_through_samples(self):
+        async with ReplayGateway(small_recording(), latency_scale=0) as gateway:
+            config = Config(gateway_url=gateway.url, access_token="test-token",
+                            cache_enabled=False, coalesce_enabled=False, rate_limit_enabled=False)
+            async with DcisionAITools(config) as tools:
+                intents = [
+                    (await tools.classify_intent(f"problem {i}"))["intent_classification"]["intent"]
+                    for i in range(3)
+                ]
+
+        assert intents == ["a", "b", "a"]
+
+    def test_batch_waits_for_slowest_call(self):
+        gateway = ReplayGateway(small_recording(), latency_scale=2.0)
+        message = lambda tool: {"params": {"name": f"target___{tool}", "arguments": {}}}  # noqa: E731
+
+        assert gateway.request_latency(message("classify_intent")) == pytest.approx(0.04)
+        assert gateway.request_latency([message("classify_intent"), message("analyze_data")]) == pytest.approx(0.1)
+        assert gateway.request_latency(message("build_model")) == 0.0
+
+    def test_recording_round_trip(self, tmp_path):
+        path = tmp_path / "recording.json"
+        small_recording().save(path)
+
+        recording = Recording.load(path)
+
+        assert recording.source == "test"
+        assert recording.summary()["classify_intent"]["samples"] == 2
+        assert recording.summary()["analyze_data"]["mean_latency_ms"] == 50.0
+
+    def test_shipped_recording_covers_every_tool(self):
+        recording = Recording.load(DEFAULT_RECORDING)
+
+        assert set(recording.tools) == set(SCENARIOS) - {"pipeline"}
+
+
+class TestBenchmark:
+    """Test cases for running and comparing benchmark reports."""
+
+    @pytest.mark.asyncio
+    async def test_suite_against_replay(self):
+        recording = Recording.load(DEFAULT_RECORDING)
+        async with ReplayGateway(recording, latency_scale=0) as gateway:
+            rows = await run_suite(gateway.url, recording, list(SCENARIOS), [2], total=4,
+                                   warmup=1, alloc_requests=2)
+
+        assert [row["scenario"] for row in rows] == list(SCENARIOS)
+        for row in rows:
+            assert row["errors"] == 0
+            assert row["requests"] == 4
+            assert row["p50_ms"] <= row["p95_ms"] <= row["p99_ms"]
+            assert row["cpu_ms_per_request"] > 0
+            assert row["alloc_peak_kib"] > 0
+        # 7 calls per run; the pipeline batches classify and analyze, then builds, then solves
+        assert gateway.posts == 6 * 7 + 3 * 7
+
+    def test_gateway_process(self):
+        with GatewayProcess(DEFAULT_RECORDING, latency_scale=0) as gateway:
+            assert gateway.url.startswith("http://127.0.0.1:")
+
+        assert gateway.stats == {"posts": 0, "calls": {}}
+
+    @pytest.mark.asyncio
+    async def test_record_from_local_backend(self, tmp_path, monkeypatch):
+        pytest.importorskip("pulp")
+        monkeypatch.setenv("DCISIONAI_EXECUTION_MODE", "local")
+        path = tmp_path / "recording.json"
+
+        await record(str(path), samples=1)
+
+        recording = Recording.load(path)
+        assert recording.source == "local"
+        assert set(recording.tools) == set(SCENARIOS) - {"pipeline"}
+
+    def test_compare_flags_regressions(self):
+        baseline = [
+            {"scenario": "build_model", "concurrency": 10, "requests_per_sec": 100.0, "p99_ms": 20.0},
+            {"scenario": "pipeline", "concurrency": 10, "requests_per_sec": 50.0, "p99_ms": 40.0},
+        ]
+        results = [
+            {"scenario": "build_model", "concurrency": 10, "requests_per_sec": 80.0, "p99_ms": 10.0},
+            {"scenario": "pipeline", "concurrency": 10, "requests_per_sec": 60.0, "p99_ms": 70.0},
+            {"scenario": "pipeline", "concurrency": 50, "requests_per_sec": 1.0, "p99_ms": 900.0},
+        ]
+
+        regressions = compare(results, baseline, {"requests_per_sec": 0.1, "p99_ms": 0.5})
+
+        assert [(r["scenario"], r["metric"]) for r in regressions] == [
+            ("build_model", "requests_per_sec"), ("pipeline", "p99_ms")
+        ]
+        assert regressions[0]["change_pct"] == -20.0
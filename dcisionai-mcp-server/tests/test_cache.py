@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Tests for the DcisionAI Response Cache
+======================================
+
+Unit tests for ResponseCache and its use by DcisionAITools.
+"""
+
+import time
+import pytest
+from dcisionai_mcp_server.cache import ResponseCache
+from dcisionai_mcp_server.config import Config
+from dcisionai_mcp_server.tools import DcisionAITools
+from .stub_gateway import StubGateway
+
+
+class TestResponseCache:
+    """Test cases for ResponseCache."""
+
+    def test_key_ignores_timestamp_and_argument_order(self):
+        """Equivalent arguments map to the same key."""
+        cache = ResponseCache(["classify_intent"])
+        first = cache.key("classify_intent", {"user_input": "a", "context": "", "timestamp": 1.0}, "t")
+        second = cache.key("classify_intent", {"context": "", "user_input": "a", "timestamp": 2.0}, "t")
+
+        assert first == second
+        assert first != cache.key("classify_intent", {"user_input": "a", "context": ""}, "other")
+        assert first != cache.key("build_model", {"user_input": "a", "context": ""}, "t")
+
+    def test_ttl_expiry(self):
+        """Entries expire after the TTL."""
+        cache = ResponseCache(["classify_intent"], ttl=0.05)
+        cache.put("k", "classify_intent", {"result": 1})
+        assert cache.get("k") == {"result": 1}
+
+        time.sleep(0.06)
+        assert cache.get("k") is None
+        assert cache.stats()["expirations"] == 1
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted when full."""
+        cache = ResponseCache(["classify_intent"], max_entries=2)
+        cache.put("a", "classify_intent", {"result": "a"})
+        cache.put("b", "classify_intent", {"result": "b"})
+        cache.get("a")
+        cache.put("c", "classify_intent", {"result": "c"})
+
+        assert cache.get("b") is None
+        assert cache.get("a") == {"result": "a"}
+        assert cache.stats()["evictions"] == 1
+
+    def test_persistence(self, tmp_path):
+        """Entries and counters survive a reload from disk."""
+        path = tmp_path / "responses.json"
+        cache = ResponseCache(["classify_intent"], path=path)
+        cache.put("k", "classify_intent", {"result": 1})
+        cache.get("k")
+        cache.flush()
+
+        reloaded = ResponseCache(["classify_intent"], path=path)
+        assert reloaded.get("k") == {"result": 1}
+        assert reloaded.stats()["hits"] == 2
+
+
+    def test_hits_are_copies(self):
+        """Changing a returned or stored response does not change the cached entry."""
+        cache = ResponseCache(["classify_intent"])
+        stored = {"result": {"intent": "production"}}
+        cache.put("k", "classify_intent", stored)
+        stored["result"]["intent"] = "changed by caller"
+
+        hit = cache.get("k")
+        hit["result"]["intent"] = "changed again"
+        assert cache.get("k") == {"result": {"intent": "production"}}
+
+    def test_lookups_do_not_rewrite_file(self, tmp_path):
+        """Only stores, evictions and expirations make a flush write the file."""
+        path = tmp_path / "responses.json"
+        cache = ResponseCache(["classify_intent"], path=path)
+        cache.put("k", "classify_intent", {"result": 1})
+        cache.flush()
+
+        path.unlink()
+        cache.get("k")
+        cache.get("missing")
+        cache.flush()
+        assert not path.exists()
+
+        cache.put("other", "classify_intent", {"result": 2})
+        cache.flush()
+        assert path.exists()
+
+
+class TestToolCaching:
+    """Test cases for cached tool calls."""
+
+    def make_tools(self, url: str, **overrides) -> DcisionAITools:
+        return DcisionAITools(Config(
+            gateway_url=url,
+            gateway_target="test-target",
+            access_token="test-token",
+            **overrides
+        ))
+
+    @pytest.mark.asyncio
+    async def test_repeated_calls_hit_cache(self):
+        """Identical classify_intent calls reach the gateway once."""
+        async with StubGateway() as gateway:
+            async with self.make_tools(gateway.url) as tools:
+                first = await tools.classify_intent("Optimize shifts", "healthcare")
+                second = await tools.classify_intent("Optimize shifts", "healthcare")
+                stats = tools.cache.stats()
+
+        assert gateway.posts == 1
+        assert first == second
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_solve_not_cached_by_default(self):
+        """solve_optimization always reaches the gateway unless opted in."""
+        async with StubGateway() as gateway:
+            async with self.make_tools(gateway.url) as tools:
+                await tools.solve_optimization({"variables": 3})
+                await tools.solve_optimization({"variables": 3})
+            assert gateway.posts == 2
+
+            opted_in = ("solve_optimization",)
+            async with self.make_tools(gateway.url, cache_tools=opted_in) as tools:
+                await tools.solve_optimization({"variables": 3})
+                await tools.solve_optimization({"variables": 3})
+            assert gateway.posts == 3
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self):
+        """Failed calls are retried rather than served from cache."""
+        async with StubGateway(failing_tools={"classify_intent"}) as gateway:
+            async with self.make_tools(gateway.url) as tools:
+                await tools.classify_intent("Optimize shifts")
+                await tools.classify_intent("Optimize shifts")
+
+        assert gateway.posts == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_sends_only_misses(self):
+        """Cached calls are answered locally and left out of the batch."""
+        async with StubGateway() as gateway:
+            async with self.make_tools(gateway.url) as tools:
+                await tools.get_workflow_templates()
+                results = await tools.call_batch([
+                    ("get_workflow_templates", ()),
+                    ("analyze_data", ("Shift data",)),
+                ])
+
+        assert gateway.calls == ["get_workflow_templates", "analyze_data"]
+        assert [r["status"] for r in results] == ["success", "success"]
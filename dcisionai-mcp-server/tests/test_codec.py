@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Tests for payload encoding
+==========================
+
+Covers the JSON backends, reuse of ``EncodedJSON`` encodings inside
+request bodies, and compressed requests against a local stub gateway,
+including the fallback for gateways that refuse them.
+"""
+
+import copy
+import json
+import pickle
+
+import pytest
+from dcisionai_mcp_server.codec import EncodedJSON, JSONCodec, compressor, get_codec
+from dcisionai_mcp_server.config import Config
+from dcisionai_mcp_server.tools import DcisionAITools
+from .stub_gateway import StubGateway
+
+
+def installed_backends():
+    backends = []
+    for backend in ("orjson", "msgspec", "json"):
+        try:
+            JSONCodec(backend)
+        except ImportError:
+            continue
+        backends.append(backend)
+    return backends
+
+
+def make_spec(variables: int) -> dict:
+    return {
+        "variables": [{"name": f"x{i}", "lb": 0, "ub": 10.5, "type": "integer"} for i in range(variables)],
+        "objective": {"sense": "minimize", "terms": {f"x{i}": i % 7 + 1 for i in range(variables)}},
+        "constraints": [{"name": "capacity", "terms": {"x0": 1, "x1": 2}, "rhs": 40}],
+    }
+
+
+def make_tools(url: str, **overrides) -> DcisionAITools:
+    return DcisionAITools(Config(
+        gateway_url=url,
+        gateway_target="test-target",
+        access_token="test-token",
+        rate_limit_enabled=False,
+        cache_enabled=False,
+        **overrides
+    ))
+
+
+class TestJSONCodec:
+    """Test cases for the JSON backends."""
+
+    @pytest.mark.parametrize("backend", installed_backends())
+    def test_round_trip(self, backend):
+        codec = JSONCodec(backend)
+        value = {"name": "Ünïcode", "values": [1, 2.5, None, True], "nested": {"b": 1, "a": 2}}
+
+        assert codec.loads(codec.dumps(value)) == value
+        assert codec.dumps(value, sort_keys=True) == json.dumps(
+            value, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+        ).encode("utf-8")
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError, match="Unknown JSON backend"):
+            JSONCodec("yaml")
+
+    @pytest.mark.parametrize("backend", installed_backends())
+    def test_encoded_value_is_spliced(self, backend):
+        codec = JSONCodec(backend)
+        spec = EncodedJSON(make_spec(50))
+        body = {"jsonrpc": "2.0", "params": {"arguments": {"model_specification": spec, "solver": "highs"}}}
+
+        content = codec.dumps(body)
+
+        assert codec.loads(content) == json.loads(json.dumps(body))
+        # The spec was encoded once and its bytes are reused as is
+        encoded = spec.encoded(codec)
+        assert spec.encoded(codec) is encoded
+        assert encoded in content
+        # The caller's body was not modified
+        assert body["params"]["arguments"]["model_specification"] is spec
+
+    def test_changes_drop_the_encoding(self):
+        codec = get_codec("json")
+        spec = EncodedJSON({"variables": ["x"]})
+        first = spec.encoded(codec)
+
+        spec["constraints"] = []
+
+        assert spec.encoded(codec) != first
+        assert codec.loads(codec.dumps({"spec": spec})) == {"spec": {"variables": ["x"], "constraints": []}}
+
+    def test_copies_stay_encoded_json(self):
+        spec = EncodedJSON({"variables": ["x", "y"]})
+
+        for clone in (pickle.loads(pickle.dumps(spec)), copy.deepcopy(spec)):
+            assert isinstance(clone, EncodedJSON)
+            assert clone == spec
+
+    def test_compressor(self):
+        assert compressor("none") is None
+        encoding, compress = compressor("gzip")
+        assert encoding == "gzip"
+        assert len(compress(json.dumps(make_spec(200)).encode())) < 10000
+
+
+class TestCompressedRequests:
+    """Test cases for compressed gateway requests."""
+
+    @pytest.mark.asyncio
+    async def test_large_bodies_are_compressed(self):
+        async with StubGateway() as gateway:
+            async with make_tools(gateway.url, request_compression="gzip",
+                                  compression_min_bytes=1024) as tools:
+                small = await tools.classify_intent("Minimize cost")
+                large = await tools.solve_optimization(make_spec(200))
+
+        assert small["status"] == "success"
+        assert large["status"] == "success"
+        assert large["optimization_results"]["arguments"]["model_specification"] == make_spec(200)
+        assert "Content-Encoding" not in gateway.headers[0]
+        assert gateway.headers[1]["Content-Encoding"] == "gzip"
+
+    @pytest.mark.asyncio
+    async def test_refused_compression_falls_back(self):
+        async with StubGateway(accept_encodings=()) as gateway:
+            async with make_tools(gateway.url, request_compression="gzip",
+                                  compression_min_bytes=0) as tools:
+                results = [await tools.build_model(f"Problem {i}") for i in range(3)]
+                compression = tools.transport.compression
+
+        assert all(r["status"] == "success" for r in results)
+        assert compression is None
+        # Only the first request was sent twice
+        assert gateway.posts == 4
+        assert "Content-Encoding" not in gateway.headers[-1]
+
+    @pytest.mark.asyncio
+    async def test_model_specification_is_encoded_once(self):
+        async with StubGateway() as gateway:
+            async with make_tools(gateway.url) as tools:
+                built = await tools.build_model("Schedule 3 shifts")
+                spec = built["model_specification"]
+                encoded = spec.encoded(tools.transport.codec)
+                solved = [await tools.solve_optimization(spec, {"solver": s}) for s in ("highs", "cbc")]
+
+        assert isinstance(spec, EncodedJSON)
+        assert spec.encoded(tools.transport.codec) is encoded
+        assert all(r["optimization_results"]["arguments"]["model_specification"] == spec for r in solved)
+
+
+class TestCodecConfig:
+    """Test cases for payload encoding configuration."""
+
+    def test_invalid_settings(self):
+        with pytest.raises(ValueError, match="JSON backend"):
+            Config(access_token="t", json_backend="yaml")
+        with pytest.raises(ValueError, match="Request compression"):
+            Config(access_token="t", request_compression="br")
+
+    def test_to_dict_keeps_pool_and_codec_settings(self):
+        settings = Config(access_token="t", keepalive_expiry=5.0, request_compression="gzip",
+                          compression_min_bytes=1024).to_dict()
+
+        assert settings["keepalive_expiry"] == 5.0
+        assert settings["request_compression"] == "gzip"
+        assert settings["compression_min_bytes"] == 1024
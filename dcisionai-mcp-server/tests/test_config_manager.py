@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Tests for configuration loading and hot reload
+==============================================
+
+Covers the parsed-file cache, building snapshots from file and overrides,
+reloading a changed file, keeping the snapshot when a file is invalid,
+and applying a reloaded configuration to the tools and their transport.
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+
+import pytest
+import yaml
+from dcisionai_mcp_server.config import Config, load_config_file
+from dcisionai_mcp_server.config_manager import (
+    ConfigManager, current_config, get_config_manager, use_config_file
+)
+from dcisionai_mcp_server.tools import DcisionAITools
+
+
+def write_config(path, **settings):
+    path.write_text(yaml.safe_dump(settings))
+    # Make the change visible even within the file system's timestamp resolution
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    path = tmp_path / "dcisionai.yaml"
+    write_config(path, gateway_url="http://127.0.0.1:9", access_token="test-token",
+                 cache_ttl=60, request_timeout=1)
+    return path
+
+
+class TestConfigFile:
+    """Test cases for reading configuration files."""
+
+    def test_parsed_once_until_changed(self, config_file, monkeypatch):
+        calls = []
+        safe_load = yaml.safe_load
+        monkeypatch.setattr(yaml, "safe_load", lambda stream: calls.append(1) or safe_load(stream))
+
+        first = load_config_file(config_file)
+        assert load_config_file(config_file) is first
+        assert len(calls) == 1
+
+        write_config(config_file, cache_ttl=120)
+        assert load_config_file(config_file)["cache_ttl"] == 120
+        assert len(calls) == 2
+
+    def test_json_and_tuples(self, tmp_path):
+        path = tmp_path / "dcisionai.json"
+        path.write_text('{"access_token": "t", "hedge_tools": ["classify_intent"], "unknown": 1}')
+
+        config = Config.from_file(str(path))
+
+        assert config.hedge_tools == ("classify_intent",)
+
+    def test_file_supplies_access_token(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("DCISIONAI_ACCESS_TOKEN", raising=False)
+        monkeypatch.setenv("DCISIONAI_CACHE_TTL", "90")
+        path = tmp_path / "dcisionai.yaml"
+        write_config(path, access_token="file-token", request_timeout=5)
+
+        config = Config.from_file(str(path))
+
+        assert config.access_token == "file-token"
+        assert config.request_timeout == 5
+        assert config.cache_ttl == 90
+        with pytest.raises(ValueError, match="Access token is required"):
+            Config.from_dict({"request_timeout": 5})
+
+    def test_saved_file_loads_back(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("DCISIONAI_ACCESS_TOKEN", raising=False)
+        config = Config(access_token="file-token", token_endpoint="https://auth.example/token",
+                        client_id="client", client_secret="s3cret", hedge_tools=("classify_intent",))
+        path = tmp_path / "saved.yaml"
+
+        config.save_to_file(str(path))
+        loaded = Config.from_file(str(path))
+
+        assert loaded.client_secret == "s3cret"
+        assert loaded.changed_settings(config) == set()
+        assert config.to_dict()["client_secret"] == "***"
+
+    def test_not_a_mapping(self, tmp_path):
+        path = tmp_path / "list.yaml"
+        path.write_text("- a\n- b\n")
+
+        with pytest.raises(ValueError, match="mapping"):
+            load_config_file(path)
+
+    def test_changed_settings(self):
+        config = Config(access_token="t", cache_ttl=60)
+
+        assert config.changed_settings(Config(access_token="t", cache_ttl=60)) == set()
+        assert config.changed_settings(
+            Config(access_token="t", cache_ttl=1, hedge_enabled=True)
+        ) == {"cache_ttl", "hedge_enabled"}
+
+    def test_yaml_not_imported_without_file(self):
+        code = (
+            "import sys\n"
+            "from dcisionai_mcp_server.config_manager import current_config\n"
+            "current_config()\n"
+            "print('yaml' in sys.modules)\n"
+        )
+        env = {k: v for k, v in os.environ.items() if k != "DCISIONAI_CONFIG_FILE"}
+        env["DCISIONAI_ACCESS_TOKEN"] = "test-token"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                                env=env, check=True)
+
+        assert result.stdout.strip() == "False"
+
+
+class TestConfigManager:
+    """Test cases for the process-wide snapshot."""
+
+    def test_shared_snapshot(self, config_file):
+        manager = use_config_file(str(config_file), {"cache_ttl": 30})
+
+        assert get_config_manager() is manager
+        assert current_config() is current_config()
+        assert current_config().cache_ttl == 30
+        assert current_config().gateway_url == "http://127.0.0.1:9"
+
+    def test_reload_swaps_only_on_change(self, config_file):
+        manager = ConfigManager(str(config_file))
+        first = manager.config
+        seen = []
+        manager.subscribe(lambda previous, config, changed: seen.append((previous, config, changed)))
+
+        assert manager.reload() is False
+        assert manager.config is first
+
+        write_config(config_file, gateway_url="http://127.0.0.1:9", access_token="test-token",
+                     cache_ttl=90, request_timeout=1)
+        assert manager.reload() is True
+
+        assert manager.config.cache_ttl == 90
+        assert seen == [(first, manager.config, {"cache_ttl"})]
+        assert manager.stats()["reloads"] == 1
+
+    def test_invalid_file_keeps_snapshot(self, config_file):
+        manager = ConfigManager(str(config_file))
+        first = manager.config
+
+        write_config(config_file, access_token="test-token", cache_ttl=-1)
+        assert manager.reload() is False
+        config_file.write_text("access_token: [unclosed\n")
+        assert manager.reload() is False
+
+        assert manager.config is first
+        assert manager.stats()["failed_reloads"] == 2
+        # Not parsed again until the file changes
+        assert manager.reload() is False
+        assert manager.stats()["failed_reloads"] == 2
+
+    def test_subscription_is_weak_for_methods(self, config_file):
+        manager = ConfigManager(str(config_file))
+        manager.config
+
+        class Listener:
+            calls = 0
+
+            def reloaded(self, previous, config, changed):
+                Listener.calls += 1
+
+        listener = Listener()
+        manager.subscribe(listener.reloaded)
+        del listener
+        write_config(config_file, access_token="test-token", cache_ttl=5)
+        manager.reload()
+
+        assert Listener.calls == 0
+        assert manager._listeners == []
+
+    @pytest.mark.asyncio
+    async def test_watcher_picks_up_edits(self, config_file):
+        manager = ConfigManager(str(config_file), poll_interval=0.01)
+        reloaded = asyncio.Event()
+        manager.subscribe(lambda previous, config, changed: reloaded.set())
+        assert manager.start() is True
+        assert manager.stats()["watching"]
+
+        write_config(config_file, gateway_url="http://127.0.0.1:9", access_token="test-token",
+                     cache_ttl=15, request_timeout=1)
+        await asyncio.wait_for(reloaded.wait(), 2)
+        await manager.stop()
+
+        assert manager.config.cache_ttl == 15
+        assert not manager.stats()["watching"]
+
+
+class TestApplyConfig:
+    """Test cases for applying a reloaded configuration to the tools."""
+
+    @pytest.mark.asyncio
+    async def test_client_kept_for_other_settings(self, config_file):
+        use_config_file(str(config_file))
+        async with DcisionAITools() as tools:
+            client = tools.client
+
+            write_config(config_file, gateway_url="http://127.0.0.1:9", access_token="test-token",
+                         cache_ttl=60, request_timeout=1, retry_attempts=1, hedge_enabled=True)
+            get_config_manager().reload()
+
+            assert tools.config.hedge_enabled
+            assert tools.transport.config.retry_attempts == 1
+            assert tools.client is client
+
+    @pytest.mark.asyncio
+    async def test_client_rebuilt_for_client_settings(self, config_file):
+        use_config_file(str(config_file))
+        async with DcisionAITools() as tools:
+            client = tools.client
+
+            write_config(config_file, gateway_url="http://127.0.0.1:9", access_token="other-token",
+                         cache_ttl=60, request_timeout=1)
+            get_config_manager().reload()
+
+            assert tools.client is not client
+            assert tools.client.headers["Authorization"] == "Bearer other-token"
+            # The replaced client stays open for calls in flight, then closes
+            assert not client.is_closed
+            await asyncio.sleep(1.1)
+            assert client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_switch_to_local_execution(self, config_file):
+        use_config_file(str(config_file))
+        async with DcisionAITools() as tools:
+            assert tools.local is None
+
+            write_config(config_file, access_token="test-token", execution_mode="local")
+            get_config_manager().reload()
+
+            assert tools.local is not None
+
+    def test_explicit_config_is_not_managed(self, config_file):
+        tools = DcisionAITools(Config(access_token="t", cache_ttl=7))
+        use_config_file(str(config_file))
+
+        assert tools.config.cache_ttl == 7
+        assert get_config_manager()._listeners == []
+
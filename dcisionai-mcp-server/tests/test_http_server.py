@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Tests for the HTTP MCP server
+=============================
+
+Serves the FastMCP server over HTTP against a local stub gateway and
+checks concurrent sessions, per-session limits, graceful drain of calls
+in flight, multi-worker serving with SIGTERM, and giving up on workers
+that keep crashing.
+"""
+
+import asyncio
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+
+import httpx
+import pytest
+from fastmcp import Client
+from fastmcp.exceptions import ToolError
+from dcisionai_mcp_server import workers
+from dcisionai_mcp_server.config import Config
+from dcisionai_mcp_server.server import DcisionAIMCPServer
+from .stub_gateway import StubGateway, crashing_worker
+
+
+def make_config(url: str, **overrides) -> Config:
+    return Config(
+        gateway_url=url,
+        gateway_target="test-target",
+        access_token="test-token",
+        rate_limit_enabled=False,
+        cache_enabled=False,
+        coalesce_enabled=False,
+        log_level="WARNING",
+        **overrides
+    )
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class Serving:
+    """Runs ``DcisionAIMCPServer.serve`` in the background on a free port."""
+
+    def __init__(self, server: DcisionAIMCPServer):
+        self.server = server
+        self.task = None
+        self.url = ""
+
+    async def __aenter__(self) -> "Serving":
+        sock = socket.socket()
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+        self.task = asyncio.ensure_future(self.server.serve("127.0.0.1", port, sock))
+        async with httpx.AsyncClient() as client:
+            for _ in range(100):
+                try:
+                    await client.get(f"{self.url}/health")
+                    break
+                except httpx.TransportError:
+                    await asyncio.sleep(0.05)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.server.shutdown()
+        await self.task
+
+
+class TestHTTPServer:
+    """Test cases for concurrent HTTP sessions."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_sessions(self):
+        async with StubGateway(latency=0.05) as gateway:
+            server = DcisionAIMCPServer(make_config(gateway.url))
+            async with Serving(server) as serving:
+
+                async def session(n: int):
+                    async with Client(f"{serving.url}/mcp") as client:
+                        first = await client.call_tool("classify_intent_tool", {"user_input": f"session {n}"})
+                        second = await client.call_tool("build_model_tool", {"problem_description": f"session {n}"})
+                        return first.data, second.data
+
+                results = await asyncio.gather(*(session(n) for n in range(30)))
+                async with httpx.AsyncClient() as client:
+                    health = (await client.get(f"{serving.url}/health")).json()
+
+        assert all(a["status"] == "success" and b["status"] == "success" for a, b in results)
+        assert gateway.posts == 60
+        assert health["sessions"]["calls"] == 60
+        assert health["sessions"]["rejected"] == 0
+
+    @pytest.mark.asyncio
+    async def test_session_limits(self):
+        async with StubGateway(latency=0.2) as gateway:
+            server = DcisionAIMCPServer(make_config(
+                gateway.url, session_max_concurrency=2, session_max_queued=1
+            ))
+            async with Client(server.mcp) as busy, Client(server.mcp) as other:
+                calls = [
+                    busy.call_tool("classify_intent_tool", {"user_input": f"call {i}"}) for i in range(5)
+                ]
+                results = await asyncio.gather(
+                    *calls, other.call_tool("classify_intent_tool", {"user_input": "other"}),
+                    return_exceptions=True
+                )
+            await server.aclose()
+
+        rejected = [r for r in results[:5] if isinstance(r, ToolError)]
+        assert len(rejected) == 2
+        assert "Server busy" in str(rejected[0])
+        # The other session is not held up by the busy one
+        assert not isinstance(results[5], Exception)
+        assert server.sessions.stats()["peak_in_flight"] == 3
+        assert server.sessions.stats()["active_sessions"] == 0
+
+    @pytest.mark.asyncio
+    async def test_shutdown_drains_calls_in_flight(self):
+        async with StubGateway(latency=0.5) as gateway:
+            server = DcisionAIMCPServer(make_config(gateway.url, drain_timeout=5))
+            serving = await Serving(server).__aenter__()
+            async with Client(f"{serving.url}/mcp") as client:
+                # Listed up front: the client lists tools after a call otherwise
+                await client.list_tools()
+                call = asyncio.ensure_future(client.call_tool("build_model_tool", {"problem_description": "slow"}))
+                await asyncio.sleep(0.2)
+                server.shutdown()
+                result = await call
+            await asyncio.wait_for(serving.task, 5)
+
+            with pytest.raises(httpx.TransportError):
+                async with httpx.AsyncClient() as http:
+                    await http.get(f"{serving.url}/health")
+
+        assert result.data["status"] == "success"
+
+
+class TestWorkers:
+    """Test cases for multi-process serving."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not hasattr(socket, "SO_REUSEPORT"), reason="needs SO_REUSEPORT")
+    async def test_workers_share_port_and_drain_on_sigterm(self):
+        async with StubGateway(latency=1.0) as gateway:
+            port = free_port()
+            env = dict(
+                os.environ,
+                DCISIONAI_GATEWAY_URL=gateway.url,
+                DCISIONAI_GATEWAY_TARGET="test-target",
+                DCISIONAI_ACCESS_TOKEN="test-token",
+                DCISIONAI_RATE_LIMIT_ENABLED="false",
+                DCISIONAI_COALESCE_ENABLED="false",
+                DCISIONAI_DRAIN_TIMEOUT="5",
+            )
+            process = subprocess.Popen(
+                [sys.executable, "-m", "dcisionai_mcp_server.server",
+                 "--host", "127.0.0.1", "--port", str(port), "--workers", "2"],
+                env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            )
+            try:
+                pids = set()
+                deadline = time.monotonic() + 30
+                while len(pids) < 2 and time.monotonic() < deadline:
+                    try:
+                        # A fresh connection each time, so the kernel may pick either worker
+                        async with httpx.AsyncClient() as http:
+                            pids.add((await http.get(f"http://127.0.0.1:{port}/health")).json()["pid"])
+                    except httpx.TransportError:
+                        await asyncio.sleep(0.1)
+
+                async with Client(f"http://127.0.0.1:{port}/mcp") as client:
+                    await client.list_tools()
+                    call = asyncio.ensure_future(client.call_tool("build_model_tool", {"problem_description": "slow"}))
+                    await asyncio.sleep(0.3)
+                    process.send_signal(signal.SIGTERM)
+                    result = await call
+                exit_code = await asyncio.get_event_loop().run_in_executor(None, process.wait, 15)
+            finally:
+                if process.poll() is None:
+                    process.kill()
+
+        assert len(pids) == 2
+        assert result.data["status"] == "success"
+        assert exit_code == 0
+
+    @pytest.mark.skipif(not hasattr(socket, "SO_REUSEPORT"), reason="needs SO_REUSEPORT")
+    def test_supervisor_gives_up_on_crashing_workers(self, monkeypatch):
+        monkeypatch.setattr(workers, "_serve", crashing_worker)
+        monkeypatch.setattr(workers, "RESTART_BACKOFF_MIN", 0.05)
+        monkeypatch.setattr(workers, "MAX_RAPID_FAILURES", 3)
+        starts = []
+        process_class = workers.multiprocessing.get_context("spawn").Process
+        monkeypatch.setattr(process_class, "start",
+                            lambda process, start=process_class.start: starts.append(1) or start(process))
+
+        started = time.monotonic()
+        exit_code = workers.run_workers(make_config("http://127.0.0.1:9", workers=2), "127.0.0.1", 0)
+
+        assert exit_code == 1
+        # Two workers, each restarted at most twice before the supervisor gave up
+        assert 3 <= len(starts) <= 6
+        # Restarts waited for their backoff instead of following each crash at once
+        assert time.monotonic() - started >= 0.05 + 0.1
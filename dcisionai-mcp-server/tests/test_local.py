@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Tests for local execution
+=========================
+
+Covers reading models from algebraic text, solving them with PuLP,
+keyword intent classification, the tools running offline with
+``execution_mode="local"``, and falling back to local execution when the
+gateway is unreachable.
+"""
+
+import pytest
+from dcisionai_mcp_server.config import Config
+from dcisionai_mcp_server.local import LocalBackend, LocalModelError, normalize_model, parse_model, solve_model
+from dcisionai_mcp_server.tools import DcisionAITools
+from .stub_gateway import StubGateway
+
+pulp = pytest.importorskip("pulp")
+
+MODEL_TEXT = """
+maximize profit: 3x + 2y
+subject to
+labor: x + 2y <= 14
+3x - y >= 0, x - y <= 2
+0 <= y <= 5
+x integer
+"""
+
+
+def local_config(**overrides) -> Config:
+    settings = dict(
+        gateway_url="http://127.0.0.1:9",
+        gateway_target="test-target",
+        access_token="",
+        execution_mode="local",
+        rate_limit_enabled=False,
+    )
+    settings.update(overrides)
+    return Config(**settings)
+
+
+class TestModelText:
+    """Test cases for reading models from text."""
+
+    def test_reads_objective_constraints_and_bounds(self):
+        spec = parse_model(MODEL_TEXT)
+        variables = {v["name"]: v for v in spec["variables"]}
+
+        assert spec["model_type"] == "mixed_integer_programming"
+        assert spec["objective"]["sense"] == "maximize"
+        assert [c["name"] for c in spec["constraints"]] == ["labor", "c2", "c3"]
+        assert variables["x"]["type"] == "integer"
+        assert variables["y"]["lower_bound"] == 0.0
+        assert variables["y"]["upper_bound"] == 5.0
+
+    def test_model_in_prose(self):
+        spec = parse_model(
+            "We want to maximize 5a + 4b s.t. 6a + 4b <= 24, a + 2b <= 6. "
+            "Both a and b must be integer."
+        )
+
+        assert [v["name"] for v in spec["variables"]] == ["a", "b"]
+        assert all(v["type"] == "integer" for v in spec["variables"])
+        assert len(spec["constraints"]) == 2
+
+    def test_prose_without_model(self):
+        assert parse_model("Minimize inventory costs while maintaining service levels") is None
+
+    def test_bounds_tighten(self):
+        variables = {v["name"]: v for v in parse_model(
+            "maximize y + z; y <= 3; y <= 5; z >= 4; z >= 2; z <= 9; 7 >= z"
+        )["variables"]}
+
+        assert variables["y"]["upper_bound"] == 3.0
+        assert variables["z"]["lower_bound"] == 4.0
+        assert variables["z"]["upper_bound"] == 7.0
+
+    def test_stated_lower_bound_replaces_default(self):
+        variables = {v["name"]: v for v in parse_model("minimize x; x >= -3; x >= -5")["variables"]}
+
+        assert variables["x"]["lower_bound"] == -3.0
+
+    def test_unreadable_comparison_is_an_error(self):
+        with pytest.raises(LocalModelError, match="Cannot read constraint"):
+            parse_model("maximize x; x <= 5 and x >= 1")
+
+    def test_undeclared_variable(self):
+        with pytest.raises(LocalModelError):
+            normalize_model({
+                "variables": [{"name": "x"}],
+                "objective": {"sense": "minimize", "terms": {"y": 1}},
+            })
+
+
+class TestSolve:
+    """Test cases for solving with PuLP."""
+
+    @pytest.mark.parametrize("solver", ["auto", "cbc"])
+    def test_solves_milp(self, solver):
+        result = solve_model(parse_model(MODEL_TEXT), solver=solver)
+
+        assert result["status"] == "optimal"
+        assert result["objective_value"] == pytest.approx(26.0)
+        assert result["variables"] == {"x": pytest.approx(6.0), "y": pytest.approx(4.0)}
+
+    @pytest.mark.parametrize("text, value", [
+        ("maximize y subject to y <= 3; y <= 5", 3.0),
+        ("minimize x subject to x >= 4; x >= 2", 4.0),
+    ])
+    def test_tightest_bound_applies(self, text, value):
+        result = solve_model(parse_model(text))
+
+        assert result["status"] == "optimal"
+        assert result["objective_value"] == pytest.approx(value)
+
+    def test_infeasible(self):
+        result = solve_model(parse_model("minimize x; x >= 3; x <= 1 ; cap: x <= 1"))
+
+        assert result["status"] == "infeasible"
+        assert result["objective_value"] is None
+
+
+class TestLocalBackend:
+    """Test cases for the in-process backend."""
+
+    def test_classify(self):
+        backend = LocalBackend(local_config())
+        result = backend.classify("Assign nurses to hospital shifts at minimum cost")
+
+        assert result["intent"] == "staff_scheduling"
+        assert result["industry"] == "healthcare"
+        assert result["problem_type"] == "mixed_integer_programming"
+        assert result["objective"] == "minimize"
+        assert 0 < result["confidence"] < 1
+
+    @pytest.mark.asyncio
+    async def test_unreadable_model_is_an_error(self):
+        backend = LocalBackend(local_config())
+        response = await backend.call_tool("build_model", {
+            "problem_description": "Make things better", "data_analysis": {}, "model_type": "auto"
+        })
+
+        assert "No model found" in response["error"]["message"]
+
+    @pytest.mark.asyncio
+    async def test_unreadable_constraint_is_an_error(self):
+        backend = LocalBackend(local_config())
+        response = await backend.call_tool("build_model", {
+            "problem_description": "maximize x subject to x <= 5 and x >= 1",
+            "data_analysis": {}, "model_type": "auto"
+        })
+
+        assert "Cannot read constraint" in response["error"]["message"]
+
+
+class TestLocalTools:
+    """Test cases for the tools without a gateway."""
+
+    @pytest.mark.asyncio
+    async def test_pipeline_offline(self):
+        async with DcisionAITools(local_config()) as tools:
+            intent = await tools.classify_intent("Maximize profit of a production plan")
+            analysis = await tools.analyze_data(MODEL_TEXT)
+            model = await tools.build_model(MODEL_TEXT, analysis["data_analysis"])
+            solution = await tools.solve_optimization(model["model_specification"])
+
+        assert intent["intent_classification"]["intent"] == "production_planning"
+        assert intent["confidence"] == intent["intent_classification"]["confidence"]
+        assert analysis["data_analysis"]["constraint_count"] == 3
+        assert model["model_type"] == "mixed_integer_programming"
+        assert solution["status"] == "success"
+        assert solution["optimization_results"]["objective_value"] == pytest.approx(26.0)
+
+    @pytest.mark.asyncio
+    async def test_workflow_offline(self):
+        async with DcisionAITools(local_config()) as tools:
+            result = await tools.execute_workflow(
+                "manufacturing", "production_planning",
+                {"problem_description": MODEL_TEXT}
+            )
+
+        assert result["status"] == "success"
+        solution = result["workflow_results"]["solve_optimization"]["optimization_results"]
+        assert solution["objective_value"] == pytest.approx(26.0)
+
+    @pytest.mark.asyncio
+    async def test_fallback_when_gateway_unreachable(self):
+        config = local_config(
+            execution_mode="fallback", access_token="test-token", cache_enabled=True,
+            retry_attempts=0
+        )
+        async with DcisionAITools(config) as tools:
+            first = await tools.classify_intent("Optimize patient flow")
+            assert first["status"] == "success"
+            assert first["intent_classification"]["backend"] == "local"
+            # Local stand-in answers are not cached as gateway responses
+            assert tools.cache.stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_fallback_prefers_reachable_gateway(self):
+        async with StubGateway() as gateway:
+            config = local_config(execution_mode="fallback", gateway_url=gateway.url, access_token="test-token")
+            async with DcisionAITools(config) as tools:
+                result = await tools.classify_intent("Optimize patient flow")
+
+        assert gateway.posts == 1
+        assert "backend" not in result["intent_classification"]
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Tests for the client-side rate limiter
+======================================
+
+Unit tests for queueing, fairness and priority, plus a throughput test
+against a stub gateway that throttles server-side.
+"""
+
+import asyncio
+import time
+
+import pytest
+from dcisionai_mcp_server.config import Config
+from dcisionai_mcp_server.ratelimit import RateLimiter, reset_limiters
+from dcisionai_mcp_server.tools import DcisionAITools
+from .stub_gateway import StubGateway
+
+
+@pytest.fixture(autouse=True)
+def fresh_limiters():
+    reset_limiters()
+    yield
+    reset_limiters()
+
+
+async def grant_order(limiter: RateLimiter, tools):
+    """Queue one call per entry of ``tools`` and return the order they are granted."""
+    order = []
+
+    async def call(tool):
+        await limiter.acquire(tool)
+        order.append(tool)
+
+    tasks = []
+    for tool in tools:
+        tasks.append(asyncio.ensure_future(call(tool)))
+        await asyncio.sleep(0)
+    await asyncio.gather(*tasks)
+    return order
+
+
+class TestRateLimiter:
+    """Test cases for RateLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_burst_is_granted_immediately(self):
+        limiter = RateLimiter(5, 1.0)
+        started = time.perf_counter()
+        for _ in range(5):
+            await limiter.acquire("classify_intent")
+
+        assert time.perf_counter() - started < 0.05
+        assert limiter.queued == 0
+
+    @pytest.mark.asyncio
+    async def test_queues_instead_of_failing(self):
+        """Calls over the limit wait for a token and record their wait time."""
+        limiter = RateLimiter(20, 1.0, burst=1)
+        started = time.perf_counter()
+        await asyncio.gather(*(limiter.acquire("analyze_data") for _ in range(5)))
+        elapsed = time.perf_counter() - started
+
+        assert elapsed >= 4 / 20 * 0.9
+        assert limiter.queued == 4
+        wait = limiter.stats()["wait_time"]["analyze_data"]
+        assert wait["count"] == 5
+        assert wait["max"] > 0.1
+
+    @pytest.mark.asyncio
+    async def test_round_robin_between_tools(self):
+        """A burst from one tool does not starve another."""
+        limiter = RateLimiter(200, 1.0, burst=1)
+        await limiter.acquire("warm_up")
+        order = await grant_order(limiter, ["build_model"] * 4 + ["classify_intent"] * 2)
+
+        assert order[:4] == ["build_model", "classify_intent", "build_model", "classify_intent"]
+
+    @pytest.mark.asyncio
+    async def test_priority_tools_go_first(self):
+        limiter = RateLimiter(200, 1.0, burst=1, priority_tools={"get_workflow_templates"})
+        await limiter.acquire("warm_up")
+        order = await grant_order(limiter, ["solve_optimization"] * 3 + ["get_workflow_templates"])
+
+        assert order[0] == "get_workflow_templates"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self):
+        limiter = RateLimiter(1, 60.0, burst=1)
+        await limiter.acquire("classify_intent")
+        waiter = asyncio.ensure_future(limiter.acquire("classify_intent"))
+        await asyncio.sleep(0.01)
+        assert limiter.waiting == 1
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert limiter.waiting == 0
+
+    def test_try_acquire_does_not_jump_queue(self):
+        limiter = RateLimiter(10, 1.0, burst=2)
+        assert limiter.try_acquire("a")
+        assert limiter.try_acquire("a")
+        assert not limiter.try_acquire("a")
+
+
+class TestRateLimitedTools:
+    """Throughput of DcisionAITools against a throttling gateway."""
+
+    @pytest.mark.asyncio
+    async def test_throughput_pinned_without_throttling(self):
+        """Sustained rate matches the configured limit and the gateway never answers 429."""
+        rate, burst, total = 50, 5, 100
+        async with StubGateway(throttle_rate=rate, throttle_burst=burst + 1) as gateway:
+            config = Config(
+                gateway_url=gateway.url,
+                gateway_target="test-target",
+                access_token="test-token",
+                rate_limit_requests=rate,
+                rate_limit_window=1,
+                rate_limit_burst=burst,
+                cache_enabled=False,
+            )
+            async with DcisionAITools(config) as tools:
+                tool_calls = [tools.classify_intent, tools.analyze_data, tools.build_model]
+                started = time.perf_counter()
+                results = await asyncio.gather(*(
+                    tool_calls[i % 3](f"request {i}") for i in range(total)
+                ))
+                elapsed = time.perf_counter() - started
+                retries = tools.transport.retries
+
+        assert all(r["status"] == "success" for r in results)
+        assert gateway.throttled == 0
+        assert retries == 0
+        throughput = (total - burst) / elapsed
+        assert rate * 0.8 <= throughput <= rate * 1.05
+
+    @pytest.mark.asyncio
+    async def test_disabled_limiter(self):
+        async with StubGateway() as gateway:
+            config = Config(
+                gateway_url=gateway.url,
+                gateway_target="test-target",
+                access_token="test-token",
+                rate_limit_enabled=False,
+            )
+            async with DcisionAITools(config) as tools:
+                assert tools.transport.limiter is None
+                result = await tools.classify_intent("Optimize shifts")
+
+        assert result["status"] == "success"
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Tests for gateway resilience
+============================
+
+Fault-injection tests for retries, hedging and the circuit breaker,
+run against a local stub gateway.
+"""
+
+import asyncio
+import time
+
+import pytest
+from dcisionai_mcp_server.config import Config
+from dcisionai_mcp_server.metrics import LatencyHistogram
+from dcisionai_mcp_server.resilience import CircuitBreaker, CircuitOpenError, RetryPolicy, reset_breakers
+from dcisionai_mcp_server.tools import DcisionAITools
+from .stub_gateway import StubGateway, StubTokenEndpoint
+
+
+def make_tools(url: str, **overrides) -> DcisionAITools:
+    settings = dict(
+        gateway_url=url,
+        gateway_target="test-target",
+        access_token="test-token",
+        retry_backoff_base=0.01,
+        retry_backoff_max=0.05,
+    )
+    settings.update(overrides)
+    return DcisionAITools(Config(**settings))
+
+
+@pytest.fixture(autouse=True)
+def fresh_breakers():
+    reset_breakers()
+    yield
+    reset_breakers()
+
+
+class TestRetry:
+    """Test cases for retries on throttling and server errors."""
+
+    @pytest.mark.asyncio
+    async def test_retries_until_success(self):
+        """Transient 5xx answers are retried transparently."""
+        async with StubGateway(fault_statuses=[503, 502]) as gateway:
+            async with make_tools(gateway.url) as tools:
+                result = await tools.classify_intent("Optimize shifts")
+                retries = tools.transport.retries
+
+        assert result["status"] == "success"
+        assert gateway.posts == 3
+        assert retries == 2
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_retry_budget(self):
+        """The last error is reported once the retry budget is spent."""
+        async with StubGateway(fault_statuses=[500] * 10) as gateway:
+            async with make_tools(gateway.url, retry_attempts=2) as tools:
+                result = await tools.analyze_data("Shift data")
+
+        assert result["status"] == "error"
+        assert "HTTP 500" in result["error"]
+        assert gateway.posts == 3
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_not_retried(self):
+        """4xx answers other than 429 fail immediately."""
+        async with StubGateway(fault_statuses=[400]) as gateway:
+            async with make_tools(gateway.url) as tools:
+                result = await tools.build_model("Plan production")
+
+        assert result["status"] == "error"
+        assert gateway.posts == 1
+
+    @pytest.mark.asyncio
+    async def test_throttling_waits_for_rate_limit_slot(self):
+        """A 429 waits at least one rate-limit interval before retrying."""
+        async with StubGateway(fault_statuses=[429]) as gateway:
+            async with make_tools(gateway.url, rate_limit_requests=10, rate_limit_window=1,
+                                  retry_backoff_max=1.0) as tools:
+                started = time.perf_counter()
+                result = await tools.classify_intent("Optimize shifts")
+                elapsed = time.perf_counter() - started
+
+        assert result["status"] == "success"
+        assert elapsed >= 0.1
+
+    def test_retry_after_is_honoured(self):
+        """Retry-After raises the delay floor, capped by the backoff maximum."""
+        policy = RetryPolicy(attempts=3, base=0.01, cap=5.0, throttle_interval=0.1)
+        assert policy.delay(0, 429, "2") >= 2.0
+        assert policy.delay(0, 429, "60") == 5.0
+        assert policy.delay(0, 503, "2") <= 0.01
+
+
+class TestCircuitBreaker:
+    """Test cases for the per-target circuit breaker."""
+
+    @pytest.mark.asyncio
+    async def test_opens_and_fails_fast(self):
+        """After repeated failures calls are rejected without reaching the gateway."""
+        async with StubGateway(fault_statuses=[503] * 10) as gateway:
+            async with make_tools(gateway.url, retry_attempts=0, breaker_failure_threshold=2) as tools:
+                await tools.classify_intent("first")
+                await tools.classify_intent("second")
+                posts = gateway.posts
+                result = await tools.classify_intent("third")
+
+        assert posts == 2
+        assert gateway.posts == 2
+        assert result["status"] == "error"
+        assert "Circuit open" in result["error"]
+        assert result["fallback"] == "Default classification"
+
+    @pytest.mark.asyncio
+    async def test_templates_fall_back_while_open(self):
+        """Workflow templates are served locally while the circuit is open."""
+        async with StubGateway(fault_statuses=[503] * 10) as gateway:
+            async with make_tools(gateway.url, retry_attempts=0, breaker_failure_threshold=1,
+                                  cache_enabled=False) as tools:
+                await tools.analyze_data("Shift data")
+                result = await tools.get_workflow_templates()
+
+        assert gateway.posts == 1
+        assert result["status"] == "success"
+        assert result["workflow_templates"] == tools.workflow_manager.get_all_workflows()
+
+    @pytest.mark.asyncio
+    async def test_half_open_trial_closes_circuit(self):
+        """A successful trial call after the reset timeout closes the circuit."""
+        async with StubGateway(fault_statuses=[503]) as gateway:
+            async with make_tools(gateway.url, retry_attempts=0, breaker_failure_threshold=1,
+                                  breaker_reset_timeout=0.05) as tools:
+                await tools.classify_intent("fails")
+                assert tools.transport.breaker.state == CircuitBreaker.OPEN
+                await asyncio.sleep(0.06)
+                result = await tools.classify_intent("recovers")
+
+        assert result["status"] == "success"
+        assert tools.transport.breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_admits_single_trial(self):
+        """Only one call is let through while half-open."""
+        breaker = CircuitBreaker("target", failure_threshold=1, reset_timeout=0.0)
+        breaker.record_failure()
+        breaker.before_call()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+
+    def test_released_trial_admits_next_call(self):
+        """A trial given back without an outcome lets the next call be the trial."""
+        breaker = CircuitBreaker("target", failure_threshold=1, reset_timeout=0.0)
+        breaker.record_failure()
+        first = breaker.before_call()
+        breaker.release(first)
+        second = breaker.before_call()
+        assert second is not None
+
+        # A stale handle does not free the current trial
+        breaker.release(first)
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+        breaker.release(None)
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+
+    @pytest.mark.asyncio
+    async def test_cancelled_trial_releases_circuit(self):
+        """Cancelling the half-open trial mid-request does not leave the circuit stuck."""
+        async with StubGateway(fault_statuses=[503], delays=[0.0, 2.0]) as gateway:
+            async with make_tools(gateway.url, retry_attempts=0, breaker_failure_threshold=1,
+                                  breaker_reset_timeout=0.05, cache_enabled=False) as tools:
+                await tools.classify_intent("fails")
+                await asyncio.sleep(0.06)
+
+                trial = asyncio.create_task(tools.classify_intent("slow trial"))
+                await asyncio.sleep(0.2)
+                trial.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await trial
+                # Let the shared gateway call, cancelled with its last waiter, unwind
+                await asyncio.sleep(0.01)
+                assert tools.transport.breaker.state == CircuitBreaker.HALF_OPEN
+
+                result = await tools.classify_intent("next")
+
+        assert result["status"] == "success"
+        assert tools.transport.breaker.state == CircuitBreaker.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_trial_resent_with_fresh_token(self):
+        """A half-open trial re-sent after a 401 is not rejected by its own trial."""
+        async with StubTokenEndpoint() as endpoint:
+            async with StubGateway(authorize=endpoint.valid) as gateway:
+                async with make_tools(gateway.url, access_token="", token_endpoint=endpoint.url,
+                                      client_id="test-client", client_secret="test-secret",
+                                      retry_attempts=0, breaker_failure_threshold=1,
+                                      breaker_reset_timeout=0.05, cache_enabled=False) as tools:
+                    await tools.classify_intent("warm up")
+                    tools.transport.breaker.record_failure()
+                    await asyncio.sleep(0.06)
+                    endpoint.revoked.add("token-1")
+                    result = await tools.classify_intent("trial")
+
+        assert result["status"] == "success"
+        assert gateway.unauthorized == 1
+        assert tools.transport.breaker.state == CircuitBreaker.CLOSED
+
+
+class TestHedging:
+    """Test cases for hedged requests."""
+
+    @pytest.mark.asyncio
+    async def test_slow_call_is_hedged(self):
+        """A call slower than the observed p95 is answered by the hedge."""
+        async with StubGateway(latency=0.01, delays=[0.01] * 5 + [2.0]) as gateway:
+            async with make_tools(gateway.url, hedge_enabled=True, hedge_min_samples=5,
+                                  cache_enabled=False) as tools:
+                for _ in range(5):
+                    await tools.classify_intent("warm up")
+                started = time.perf_counter()
+                result = await tools.classify_intent("slow")
+                elapsed = time.perf_counter() - started
+                hedges = tools.transport.hedges
+
+        assert result["status"] == "success"
+        assert hedges == 1
+        assert elapsed < 1.0
+        assert gateway.posts == 7
+
+    @pytest.mark.asyncio
+    async def test_no_hedging_without_samples(self):
+        """Hedging waits until enough latency samples were observed."""
+        async with StubGateway(latency=0.01) as gateway:
+            async with make_tools(gateway.url, hedge_enabled=True, hedge_min_samples=50,
+                                  cache_enabled=False) as tools:
+                for _ in range(5):
+                    await tools.classify_intent("call")
+                hedges = tools.transport.hedges
+
+        assert hedges == 0
+        assert gateway.posts == 5
+
+
+class TestLatencyHistogram:
+    """Test cases for LatencyHistogram."""
+
+    def test_percentiles(self):
+        histogram = LatencyHistogram()
+        for _ in range(95):
+            histogram.observe(0.010)
+        for _ in range(5):
+            histogram.observe(1.0)
+
+        assert histogram.count == 100
+        assert 0.010 <= histogram.percentile(50) < 0.015
+        assert histogram.percentile(95) < 0.015
+        assert histogram.percentile(99) == 1.0
+        assert histogram.to_dict()["max"] == 1.0
+
+    def test_empty(self):
+        assert LatencyHistogram().percentile(95) is None
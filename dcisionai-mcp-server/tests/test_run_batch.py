@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Tests for bulk workflow execution
+=================================
+
+Covers batch file parsing, concurrent execution over one pooled client
+with results streamed as they complete, and the ``run-batch`` command.
+"""
+
+import json
+
+import pytest
+from dcisionai_mcp_server.batch import parse_csv, parse_jsonl, run_batch
+from dcisionai_mcp_server.cli import run_batch_command
+from dcisionai_mcp_server.config import Config
+from dcisionai_mcp_server.tools import DcisionAITools
+from .stub_gateway import StubGateway
+
+WORKFLOWS = [
+    ("manufacturing", "production_planning"),
+    ("retail", "pricing_optimization"),
+    ("logistics", "route_optimization"),
+    ("energy", "grid_optimization"),
+]
+
+
+def make_config(url: str, **overrides) -> Config:
+    return Config(gateway_url=url, gateway_target="test-target", access_token="test-token", **overrides)
+
+
+class TestBatchFiles:
+    """Test cases for reading batch files."""
+
+    def test_jsonl(self):
+        items = parse_jsonl([
+            '{"industry": "retail", "workflow_id": "supply_chain", "parameters": {"weeks": 4}}',
+            "",
+            "# nightly",
+            '{"id": "r2", "industry": "energy", "workflow_id": "demand_response"}',
+        ])
+
+        assert items == [
+            {"id": "1", "industry": "retail", "workflow_id": "supply_chain", "parameters": {"weeks": 4}},
+            {"id": "r2", "industry": "energy", "workflow_id": "demand_response", "parameters": {}},
+        ]
+
+    def test_csv_columns_become_parameters(self):
+        items = parse_csv([
+            "industry,workflow_id,parameters,horizon,region\n",
+            'retail,supply_chain,"{""weeks"": 4}",30,north\n',
+            "energy,demand_response,,,\n",
+        ])
+
+        assert items[0]["parameters"] == {"weeks": 4, "horizon": 30, "region": "north"}
+        assert items[0]["id"] == "2"
+        assert items[1]["parameters"] == {}
+
+    def test_errors_name_the_line(self):
+        with pytest.raises(ValueError, match="Line 2: industry and workflow_id are required"):
+            parse_jsonl(['{"industry": "retail", "workflow_id": "x"}', '{"industry": "retail"}'])
+        with pytest.raises(ValueError, match="Line 1: invalid JSON"):
+            parse_jsonl(["{nope"])
+
+
+class TestRunBatch:
+    """Test cases for concurrent batch execution."""
+
+    @pytest.mark.asyncio
+    async def test_streams_results_as_they_complete(self):
+        items = [
+            {"id": str(i), "industry": industry, "workflow_id": workflow_id, "parameters": {"n": i}}
+            for i, (industry, workflow_id) in enumerate(WORKFLOWS * 2)
+        ]
+        received = []
+
+        async def on_result(record):
+            received.append((len(gateway.calls), record))
+
+        async with StubGateway(latency=0.02) as gateway:
+            async with DcisionAITools(make_config(gateway.url)) as tools:
+                summary = await run_batch(tools, items, concurrency=4, on_result=on_result)
+
+        assert summary["workflows"] == summary["succeeded"] == 8
+        assert summary["failed"] == 0
+        assert summary["workflows_per_sec"] > 0
+        assert 0 < summary["latency_p50"] <= summary["latency_p99"] <= summary["latency_max"]
+
+        # The first result was reported while other workflows were still running
+        assert received[0][0] < len(gateway.calls)
+        assert sorted(r["id"] for _, r in received) == sorted(item["id"] for item in items)
+
+        # All workflows shared the pooled client
+        assert len(gateway.connections) <= 8
+
+    @pytest.mark.asyncio
+    async def test_same_workflow_different_parameters(self):
+        """Items of the same workflow keep separate checkpoints."""
+        items = [
+            {"id": "a", "industry": "retail", "workflow_id": "supply_chain", "parameters": {"weeks": 1}},
+            {"id": "b", "industry": "retail", "workflow_id": "supply_chain", "parameters": {"weeks": 2}},
+        ]
+        records = []
+
+        async def on_result(record):
+            records.append(record)
+
+        async with StubGateway() as gateway:
+            async with DcisionAITools(make_config(gateway.url)) as tools:
+                await run_batch(tools, items, concurrency=2, on_result=on_result)
+
+        by_id = {r["id"]: r["result"] for r in records}
+        assert by_id["a"]["run_id"] == "batch/a"
+        for item_id, weeks in (("a", 1), ("b", 2)):
+            analysis = by_id[item_id]["workflow_results"]["analyze_data"]["data_analysis"]
+            assert analysis["arguments"]["constraints"] == json.dumps({"weeks": weeks})
+
+
+class TestRunBatchCommand:
+    """Test cases for the run-batch CLI command."""
+
+    def test_writes_jsonl_and_exit_code(self, tmp_path, capsys):
+        batch = tmp_path / "nightly.jsonl"
+        batch.write_text("\n".join(
+            json.dumps({"industry": industry, "workflow_id": workflow_id})
+            for industry, workflow_id in WORKFLOWS
+        ))
+        output = tmp_path / "results.jsonl"
+        # Nothing listens on port 9, so every workflow fails quickly
+        config = make_config("http://127.0.0.1:9", retry_attempts=0)
+
+        code = run_batch_command(str(batch), str(output), concurrency=2, config=config)
+
+        lines = [json.loads(line) for line in output.read_text().splitlines()]
+        assert code == 1
+        assert len(lines) == 4
+        assert all(line["status"] == "error" for line in lines)
+        assert "Workflows: 4 (0 succeeded, 4 failed)" in capsys.readouterr().out
+
+    def test_unreadable_batch(self, tmp_path, capsys):
+        (tmp_path / "bad.jsonl").write_text('{"industry": "retail"}\n')
+
+        code = run_batch_command(str(tmp_path / "bad.jsonl"), config=make_config("http://127.0.0.1:9"))
+
+        assert code == 2
+        assert "Line 1" in capsys.readouterr().err
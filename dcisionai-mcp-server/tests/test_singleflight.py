@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Tests for request coalescing
+============================
+
+Covers sharing of one in-flight call between identical concurrent
+callers, cancellation of individual waiters and coalesced tool calls
+against a local stub gateway.
+"""
+
+import asyncio
+
+import pytest
+from dcisionai_mcp_server.config import Config
+from dcisionai_mcp_server.singleflight import SingleFlight
+from dcisionai_mcp_server.tools import DcisionAITools
+from .stub_gateway import StubGateway
+
+
+def make_tools(url: str, **overrides) -> DcisionAITools:
+    return DcisionAITools(Config(
+        gateway_url=url,
+        gateway_target="test-target",
+        access_token="test-token",
+        cache_enabled=False,
+        **overrides
+    ))
+
+
+class TestSingleFlight:
+    """Test cases for the single-flight primitive."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_call(self):
+        flight = SingleFlight()
+        calls = 0
+
+        async def call():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"answer": calls}
+
+        results = await asyncio.gather(*(flight.do("k", call) for _ in range(10)))
+
+        assert calls == 1
+        assert all(r is results[0] for r in results)
+        assert flight.stats()["shared"] == 9
+        assert len(flight) == 0
+
+        # Once finished, the next call starts afresh
+        assert (await flight.do("k", call)) == {"answer": 2}
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_caller(self):
+        flight = SingleFlight()
+
+        async def call():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("gateway down")
+
+        results = await asyncio.gather(*(flight.do("k", call) for _ in range(3)), return_exceptions=True)
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_call_running(self):
+        flight = SingleFlight()
+        finished = asyncio.Event()
+
+        async def call():
+            await asyncio.sleep(0.05)
+            finished.set()
+            return "done"
+
+        first = asyncio.ensure_future(flight.do("k", call))
+        second = asyncio.ensure_future(flight.do("k", call))
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        assert await second == "done"
+        assert first.cancelled()
+        assert finished.is_set()
+
+    @pytest.mark.asyncio
+    async def test_last_waiter_cancels_call(self):
+        flight = SingleFlight()
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def call():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        waiters = [asyncio.ensure_future(flight.do("k", call)) for _ in range(2)]
+        await started.wait()
+        for waiter in waiters:
+            waiter.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        assert cancelled.is_set()
+        assert len(flight) == 0
+
+
+class TestCoalescedTools:
+    """Test cases for coalesced gateway calls."""
+
+    @pytest.mark.asyncio
+    async def test_identical_calls_hit_gateway_once(self):
+        async with StubGateway(latency=0.05) as gateway:
+            async with make_tools(gateway.url) as tools:
+                results = await asyncio.gather(*(
+                    tools.build_model("Minimize overtime", {"shifts": 3}) for _ in range(20)
+                ))
+                different = await asyncio.gather(
+                    tools.build_model("Minimize overtime"), tools.build_model("Maximize coverage")
+                )
+                stats = tools.inflight.stats()
+
+        assert gateway.calls.count("build_model") == 3
+        assert all(r == results[0] and r["status"] == "success" for r in results)
+        assert all(r["status"] == "success" for r in different)
+        assert stats["shared"] == 19
+
+    @pytest.mark.asyncio
+    async def test_disabled(self):
+        async with StubGateway(latency=0.02) as gateway:
+            async with make_tools(gateway.url, coalesce_enabled=False) as tools:
+                await asyncio.gather(*(tools.classify_intent("Same question") for _ in range(5)))
+
+        assert gateway.posts == 5
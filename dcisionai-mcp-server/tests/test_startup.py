@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Tests for stdio server startup
+==============================
+
+Keeps the stdio server fast to start: heavy dependencies stay out of the
+import path and the first responses arrive within a time budget.
+"""
+
+import os
+
+import pytest
+from benchmarks.bench_startup import import_profile, time_to_initialize
+from dcisionai_mcp_server.mcp_server import DcisionAIMCPServer
+from dcisionai_mcp_server.registry import TOOL_SPECS
+
+# Wall-clock budget for the initialize response of a freshly spawned server
+STARTUP_BUDGET = float(os.getenv("DCISIONAI_STARTUP_BUDGET", "5.0"))
+
+# Time our own modules may spend importing, excluding the MCP SDK
+PACKAGE_IMPORT_BUDGET_US = 50_000
+
+# Loaded on the first tool call, never at startup
+DEFERRED_MODULES = (
+    "fastmcp",
+    "yaml",
+    "dcisionai_mcp_server.config",
+    "dcisionai_mcp_server.tools",
+    "dcisionai_mcp_server.transport",
+    "dcisionai_mcp_server.workflows",
+)
+
+
+class TestStartup:
+    """Startup cost of the stdio server."""
+
+    def test_heavy_modules_are_deferred(self):
+        modules, _ = import_profile()
+        loaded = [name for name in DEFERRED_MODULES if name in modules]
+        assert loaded == []
+
+    def test_package_import_budget(self):
+        modules, _ = import_profile()
+        own = sum(
+            self_us for name, (self_us, _) in modules.items()
+            if name.split(".")[0] == "dcisionai_mcp_server"
+        )
+        assert own < PACKAGE_IMPORT_BUDGET_US
+
+    def test_time_to_initialize(self):
+        """The server answers initialize and tools/list without credentials."""
+        run = time_to_initialize()
+
+        assert run["server_info"]["name"] == "dcisionai-optimization"
+        assert run["tools"] == len(TOOL_SPECS)
+        assert run["initialize"] < STARTUP_BUDGET
+
+
+class TestRegistryServer:
+    """The registry-driven server defers configuration to the first call."""
+
+    def test_lists_tools_without_config(self, monkeypatch):
+        monkeypatch.delenv("DCISIONAI_ACCESS_TOKEN", raising=False)
+        server = DcisionAIMCPServer()
+        tools = server.list_tools()
+
+        assert [t.name for t in tools] == [spec.name for spec in TOOL_SPECS]
+        assert server._config is None and server._tools is None
+
+    @pytest.mark.asyncio
+    async def test_missing_token_fails_on_first_call(self, monkeypatch):
+        monkeypatch.delenv("DCISIONAI_ACCESS_TOKEN", raising=False)
+        server = DcisionAIMCPServer()
+        with pytest.raises(ValueError, match="Access token is required"):
+            await server.call_tool("get_workflow_templates", {})
+
+    @pytest.mark.asyncio
+    async def test_unknown_tool(self):
+        server = DcisionAIMCPServer()
+        assert await server.call_tool("nope", {}) == {"error": "Unknown tool: nope"}
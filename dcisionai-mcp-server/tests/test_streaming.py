@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Tests for streaming tool results
+================================
+
+Exercises SSE consumption, progress/partial events and their forwarding
+to MCP clients against a local stub gateway that streams.
+"""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+from dcisionai_mcp_server.config import Config
+from dcisionai_mcp_server.streaming import PARTIAL_RESULT_LOGGER, progress_reporter
+from dcisionai_mcp_server.tools import DcisionAITools
+from dcisionai_mcp_server.transport import iter_sse
+from .stub_gateway import StubGateway
+
+
+def make_tools(url: str) -> DcisionAITools:
+    return DcisionAITools(Config(
+        gateway_url=url,
+        gateway_target="test-target",
+        access_token="test-token"
+    ))
+
+
+async def lines(*items):
+    for item in items:
+        yield item
+
+
+class FakeSession:
+    """Records what would be sent to the MCP client."""
+
+    def __init__(self):
+        self.progress = []
+        self.logs = []
+
+    async def send_progress_notification(self, token, progress, total=None):
+        self.progress.append((token, progress, total))
+
+    async def send_log_message(self, level, data, logger=None):
+        self.logs.append((level, data, logger))
+
+
+class TestSSE:
+    """Test cases for the SSE decoder."""
+
+    @pytest.mark.asyncio
+    async def test_decodes_messages(self):
+        messages = [m async for m in iter_sse(lines(
+            ": keep-alive", "",
+            'data: {"a": 1}', "",
+            "data: {", 'data: "b": 2}', "",
+            "event: ping", "data: {}", "",
+            'data: {"c": 3}',
+        ))]
+
+        assert messages == [{"a": 1}, {"b": 2}, {"c": 3}]
+
+
+class TestStreamingTools:
+    """Test cases for DcisionAITools.stream and call_streaming."""
+
+    @pytest.mark.asyncio
+    async def test_first_event_arrives_before_result(self):
+        """Progress reaches the caller long before the call completes."""
+        async with StubGateway(stream_tools={"solve_optimization"}, stream_interval=0.2) as gateway:
+            async with make_tools(gateway.url) as tools:
+                started = time.perf_counter()
+                arrivals = []
+                async for event in tools.stream("solve_optimization", {"objective": "min cost"}):
+                    arrivals.append((time.perf_counter() - started, event))
+
+        first_at = arrivals[0][0]
+        total = arrivals[-1][0]
+        assert first_at < 0.5
+        assert total >= 0.8
+        assert first_at < total / 2
+
+    @pytest.mark.asyncio
+    async def test_events_and_result(self):
+        async with StubGateway(stream_tools={"execute_workflow"}) as gateway:
+            async with make_tools(gateway.url) as tools:
+                events = [e async for e in tools.stream(
+                    "execute_workflow", "manufacturing", "production_planning", {"horizon": 30}
+                )]
+
+        progress = [e for e in events if e["event"] == "progress"]
+        partial = [e for e in events if e["event"] == "partial"]
+        assert [e["progress"] for e in progress] == [1, 2, 3, 4]
+        assert all(e["total"] == 4 for e in progress)
+        assert [e["stage"] for e in partial] == [
+            "classify_intent", "analyze_data", "build_model", "solve_optimization"
+        ]
+
+        assert events[-1]["event"] == "result"
+        result = events[-1]["result"]
+        assert result["status"] == "success"
+        assert result["workflow_id"] == "production_planning"
+        assert result["workflow_results"]["arguments"]["parameters"] == {"horizon": 30}
+
+    @pytest.mark.asyncio
+    async def test_plain_json_gateway(self):
+        """Gateways that do not stream still produce a single result event."""
+        async with StubGateway() as gateway:
+            async with make_tools(gateway.url) as tools:
+                events = [e async for e in tools.stream("solve_optimization", {"objective": "max"})]
+
+        assert len(events) == 1
+        assert events[0]["result"]["status"] == "success"
+
+    @pytest.mark.asyncio
+    async def test_error_result(self):
+        async with StubGateway(fault_statuses=[400]) as gateway:
+            async with make_tools(gateway.url) as tools:
+                result = await tools.call_streaming("solve_optimization", {})
+
+        assert result["status"] == "error"
+        assert "HTTP 400" in result["error"]
+        assert result["fallback"] == "Default optimization solving"
+
+    @pytest.mark.asyncio
+    async def test_pipeline_reports_each_stage(self):
+        events = []
+
+        async def on_event(event):
+            events.append(event)
+
+        async with StubGateway() as gateway:
+            async with make_tools(gateway.url) as tools:
+                result = await tools.run_pipeline("Plan production", on_event=on_event)
+
+        assert result["status"] == "success"
+        progress = [e for e in events if e["event"] == "progress"]
+        assert sorted(e["message"] for e in progress) == sorted(
+            ["classify_intent", "analyze_data", "build_model", "solve_optimization"]
+        )
+        assert progress[-1]["progress"] == progress[-1]["total"] == 4
+
+
+class TestProgressReporter:
+    """Test cases for forwarding events to the MCP session."""
+
+    @pytest.mark.asyncio
+    async def test_forwards_progress_and_partials(self):
+        session = FakeSession()
+        server = SimpleNamespace(request_context=SimpleNamespace(
+            meta=SimpleNamespace(progressToken="tok-1"), session=session
+        ))
+        report = progress_reporter(server)
+
+        async with StubGateway(stream_tools={"solve_optimization"}) as gateway:
+            async with make_tools(gateway.url) as tools:
+                result = await tools.call_streaming("solve_optimization", {}, on_event=report)
+
+        assert result["status"] == "success"
+        assert session.progress == [("tok-1", i, 4) for i in range(1, 5)]
+        assert len(session.logs) == 4
+        assert all(logger == PARTIAL_RESULT_LOGGER for _, _, logger in session.logs)
+
+    def test_no_progress_token(self):
+        server = SimpleNamespace(request_context=SimpleNamespace(meta=None, session=FakeSession()))
+        assert progress_reporter(server) is None
+
+    def test_outside_request(self):
+        class Idle:
+            @property
+            def request_context(self):
+                raise LookupError("no request")
+
+        assert progress_reporter(Idle()) is None
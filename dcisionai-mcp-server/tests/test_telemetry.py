@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Tests for gateway call telemetry
+================================
+
+Checks per-phase timings and sizes recorded for calls to a local stub
+gateway, the Prometheus exposition served at ``/metrics`` and measured
+processing times in tool results.
+"""
+
+import re
+
+import httpx
+import pytest
+from dcisionai_mcp_server.config import Config
+from dcisionai_mcp_server.telemetry import RequestTrace, Telemetry, get_telemetry, reset_telemetry
+from dcisionai_mcp_server.tools import DcisionAITools
+from .stub_gateway import StubGateway
+
+# name{labels} value, as in the Prometheus text format
+SAMPLE_LINE = re.compile(r'^[a-z_]+(\{([a-z]+="[^"]*",?)*\})? [0-9.e+-]+$')
+
+
+def make_tools(url: str, **overrides) -> DcisionAITools:
+    return DcisionAITools(Config(
+        gateway_url=url,
+        gateway_target="test-target",
+        access_token="test-token",
+        **overrides
+    ))
+
+
+@pytest.fixture(autouse=True)
+def fresh_telemetry():
+    reset_telemetry()
+    yield
+    reset_telemetry()
+
+
+class TestRequestTrace:
+    """Test cases for phases derived from httpx trace events."""
+
+    @pytest.mark.asyncio
+    async def test_phases_from_events(self):
+        trace = RequestTrace()
+        for event in ("connection.connect_tcp.started", "connection.connect_tcp.complete",
+                      "http11.send_request_headers.started", "http11.send_request_body.complete",
+                      "http11.receive_response_headers.complete"):
+            await trace(event, {})
+
+        assert set(trace.phases()) == {"connect", "send", "server"}
+        assert all(seconds >= 0 for seconds in trace.phases().values())
+
+
+class TestGatewayTelemetry:
+    """Test cases for instrumented gateway calls."""
+
+    @pytest.mark.asyncio
+    async def test_calls_record_phases_and_sizes(self):
+        async with StubGateway(latency=0.02) as gateway:
+            async with make_tools(gateway.url) as tools:
+                await tools.classify_intent("Optimize shifts")
+                await tools.build_model("Optimize shifts")
+
+        tools_seen = get_telemetry().snapshot()["tools"]
+        classify = tools_seen["classify_intent"]
+        assert classify["requests"] == {"200": 1}
+        assert {"connect", "send", "server", "receive", "parse", "total"} <= set(classify["phases"])
+        assert classify["phases"]["server"]["min"] >= 0.02
+        assert classify["phases"]["total"]["max"] >= classify["phases"]["server"]["max"]
+        assert classify["request_bytes"]["max"] > 0
+        assert classify["response_bytes"]["max"] > 0
+        # The second call reused the pooled connection
+        assert "connect" not in tools_seen["build_model"]["phases"]
+
+    @pytest.mark.asyncio
+    async def test_retries_and_errors_are_counted(self):
+        async with StubGateway(fault_statuses=[503]) as gateway:
+            async with make_tools(gateway.url, retry_backoff_base=0.01) as tools:
+                result = await tools.analyze_data("Forecast demand")
+
+        assert result["status"] == "success"
+        analyze = get_telemetry().snapshot()["tools"]["analyze_data"]
+        assert analyze["requests"] == {"503": 1, "200": 1}
+        assert analyze["retries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_processing_time_is_measured(self):
+        async with StubGateway(latency=0.05) as gateway:
+            async with make_tools(gateway.url) as tools:
+                result = await tools.solve_optimization({"variables": 3})
+
+        assert 0.05 <= result["processing_time"] < 1.0
+
+
+class TestPrometheus:
+    """Test cases for the Prometheus exposition."""
+
+    def test_text_format(self):
+        telemetry = Telemetry()
+        telemetry.observe_request("classify_intent", "200", {"server": 0.02}, 512, 2048)
+        telemetry.count_retry("classify_intent")
+
+        text = telemetry.prometheus()
+        lines = text.splitlines()
+        assert '# TYPE dcisionai_gateway_phase_seconds histogram' in lines
+        assert 'dcisionai_gateway_phase_seconds_bucket{tool="classify_intent",phase="server",le="+Inf"} 1' in lines
+        assert 'dcisionai_gateway_requests_total{tool="classify_intent",status="200"} 1' in lines
+        assert 'dcisionai_gateway_retries_total{tool="classify_intent"} 1' in lines
+        assert 'dcisionai_gateway_response_bytes_sum{tool="classify_intent"} 2048' in lines
+        for line in lines:
+            assert line.startswith("#") or SAMPLE_LINE.match(line), line
+
+    @pytest.mark.asyncio
+    async def test_metrics_route(self):
+        from dcisionai_mcp_server.server import DcisionAIMCPServer
+
+        get_telemetry().observe_request("build_model", "200", {"server": 0.5}, 100, 200)
+        app = DcisionAIMCPServer(Config(access_token="test-token")).mcp.http_app()
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app),
+                                     base_url="http://test") as client:
+            text = await client.get("/metrics")
+            snapshot = await client.get("/metrics/json")
+
+        assert text.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert 'dcisionai_gateway_phase_seconds_count{tool="build_model",phase="server"} 1' in text.text
+        assert snapshot.json()["tools"]["build_model"]["requests"] == {"200": 1}
+
+
+class TestOpenTelemetry:
+    """Test cases for mirroring metrics to OpenTelemetry."""
+
+    def test_enable_with_api_only(self):
+        pytest.importorskip("opentelemetry.metrics")
+        telemetry = Telemetry()
+
+        assert telemetry.enable_opentelemetry()
+        telemetry.observe_request("classify_intent", "200", {"server": 0.01}, 10, 20)
+        assert telemetry.snapshot()["tools"]["classify_intent"]["requests"] == {"200": 1}
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Tests for the DcisionAI Gateway Transport
+=========================================
+
+Exercises the pooled transport against a local stub gateway.
+"""
+
+import asyncio
+import pytest
+from dcisionai_mcp_server import tools as tools_module
+from dcisionai_mcp_server.config import Config
+from dcisionai_mcp_server.tools import DcisionAITools
+from dcisionai_mcp_server.transport import GatewayError, GatewayTransport
+from .stub_gateway import StubGateway
+
+
+def make_config(url: str, **overrides) -> Config:
+    return Config(
+        gateway_url=url,
+        gateway_target="test-target",
+        access_token="test-token",
+        **overrides
+    )
+
+
+class TestGatewayTransport:
+    """Test cases for GatewayTransport."""
+
+    @pytest.mark.asyncio
+    async def test_call_tool_uses_prefixed_tool_name(self):
+        """Tool names are prefixed with the gateway target."""
+        async with StubGateway() as gateway:
+            async with GatewayTransport(make_config(gateway.url)) as transport:
+                result = await transport.call_tool("classify_intent", {"user_input": "x"})
+
+        assert gateway.calls == ["classify_intent"]
+        assert result["result"]["arguments"] == {"user_input": "x"}
+        assert gateway.headers[0]["Authorization"].startswith("Bearer ")
+
+    @pytest.mark.asyncio
+    async def test_connections_are_reused(self):
+        """Concurrent calls share a bounded pool of connections."""
+        async with StubGateway(latency=0.01) as gateway:
+            config = make_config(gateway.url, max_connections=4, max_keepalive_connections=4)
+            async with DcisionAITools(config) as tools:
+                await asyncio.gather(*(
+                    tools.classify_intent(f"request {i}") for i in range(40)
+                ))
+
+        assert len(gateway.calls) == 40
+        assert len(gateway.connections) <= 4
+
+    @pytest.mark.asyncio
+    async def test_request_ids_are_unique(self):
+        """Each envelope gets a fresh JSON-RPC id."""
+        transport = GatewayTransport(make_config("http://localhost"))
+        ids = {transport.envelope("build_model", {})["id"] for _ in range(10)}
+        await transport.aclose()
+
+        assert len(ids) == 10
+
+    @pytest.mark.asyncio
+    async def test_non_200_raises_gateway_error(self):
+        """Non-200 responses surface as GatewayError."""
+        async with StubGateway() as gateway:
+            transport = GatewayTransport(make_config(gateway.url + "/missing"))
+            with pytest.raises(GatewayError) as exc_info:
+                await transport.call_tool("classify_intent", {})
+            await transport.aclose()
+
+        assert exc_info.value.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_get_tools_recreates_closed_instance(self, monkeypatch):
+        """get_tools hands out a fresh instance once the old one is closed."""
+        monkeypatch.setattr(tools_module, "_tools_instance", None)
+        monkeypatch.setattr(
+            tools_module, "DcisionAITools",
+            lambda: DcisionAITools(make_config("http://localhost"))
+        )
+
+        first = tools_module.get_tools()
+        await first.aclose()
+        second = tools_module.get_tools()
+
+        assert second is not first
+        await tools_module.close_tools()
+        assert tools_module._tools_instance is None
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Tests for the local workflow engine
+===================================
+
+Runs workflow templates stage by stage against a local stub gateway and
+checks checkpoint reuse, resume after failure and bounded concurrency.
+"""
+
+import pytest
+from dcisionai_mcp_server.config import Config
+from dcisionai_mcp_server.tools import DcisionAITools
+from dcisionai_mcp_server.workflow_engine import CheckpointStore, WorkflowError
+from .stub_gateway import StubGateway
+
+STAGES = ["classify_intent", "analyze_data", "build_model", "solve_optimization"]
+
+
+def make_tools(url: str, **overrides) -> DcisionAITools:
+    return DcisionAITools(Config(
+        gateway_url=url,
+        gateway_target="test-target",
+        access_token="test-token",
+        **overrides
+    ))
+
+
+class TestWorkflowEngine:
+    """Test cases for execute_workflow with the local engine."""
+
+    @pytest.mark.asyncio
+    async def test_runs_template_stages(self):
+        async with StubGateway(latency=0.05) as gateway:
+            async with make_tools(gateway.url) as tools:
+                result = await tools.execute_workflow(
+                    "manufacturing", "production_planning", {"horizon": 30}
+                )
+
+        assert result["status"] == "success"
+        assert result["industry"] == "manufacturing"
+        assert result["run_id"] == "manufacturing/production_planning"
+        assert sorted(result["executed_stages"]) == sorted(STAGES)
+        assert set(result["workflow_results"]) == set(STAGES)
+
+        # Intent and data analysis are independent and run side by side
+        assert sorted(gateway.calls[:2]) == ["analyze_data", "classify_intent"]
+        assert gateway.calls[2:] == ["build_model", "solve_optimization"]
+        assert result["execution_time"] < 4 * 0.05
+
+        analysis = result["workflow_results"]["analyze_data"]["data_analysis"]
+        assert analysis["arguments"]["constraints"] == '{"horizon": 30}'
+
+    @pytest.mark.asyncio
+    async def test_solver_change_reruns_only_solve(self):
+        async with StubGateway() as gateway:
+            async with make_tools(gateway.url) as tools:
+                await tools.execute_workflow("retail", "pricing_optimization", {"solver_config": {"gap": 0.01}})
+                calls = len(gateway.calls)
+                result = await tools.execute_workflow(
+                    "retail", "pricing_optimization", {"solver_config": {"gap": 0.05}}
+                )
+
+        assert result["executed_stages"] == ["solve_optimization"]
+        assert sorted(result["reused_stages"]) == ["analyze_data", "build_model", "classify_intent"]
+        assert gateway.calls[calls:] == ["solve_optimization"]
+        solved = result["workflow_results"]["solve_optimization"]["optimization_results"]
+        assert solved["arguments"]["solver_config"] == {"gap": 0.05}
+
+    @pytest.mark.asyncio
+    async def test_force_reruns_stage(self):
+        async with StubGateway() as gateway:
+            async with make_tools(gateway.url) as tools:
+                await tools.execute_workflow("energy", "grid_optimization")
+                outcome = await tools.engine.run("energy", "grid_optimization", force={"classify_intent"})
+
+        assert outcome["executed"] == ["classify_intent"]
+
+    @pytest.mark.asyncio
+    async def test_resume_after_failure(self, tmp_path):
+        """A new process picks up persisted checkpoints and resumes at the failed stage."""
+        async with StubGateway(failing_tools={"build_model"}) as gateway:
+            async with make_tools(gateway.url, checkpoint_dir=str(tmp_path)) as tools:
+                failed = await tools.execute_workflow("logistics", "route_optimization")
+
+        assert failed["status"] == "error"
+        assert failed["failed_stage"] == "build_model"
+        assert "build_model failed" in failed["error"]
+        assert failed["fallback"] == "Default workflow execution"
+        assert "solve_optimization" not in failed["workflow_results"]
+
+        async with StubGateway() as gateway:
+            async with make_tools(gateway.url, checkpoint_dir=str(tmp_path)) as tools:
+                resumed = await tools.execute_workflow("logistics", "route_optimization")
+
+        assert resumed["status"] == "success"
+        assert resumed["executed_stages"] == ["build_model", "solve_optimization"]
+        assert sorted(resumed["reused_stages"]) == ["analyze_data", "classify_intent"]
+        assert gateway.calls == ["build_model", "solve_optimization"]
+
+    @pytest.mark.asyncio
+    async def test_run_many_bounds_concurrency(self):
+        active = 0
+        peak = 0
+
+        async with StubGateway(latency=0.02) as gateway:
+            async with make_tools(gateway.url, workflow_concurrency=2) as tools:
+                run = tools.engine.run
+
+                async def tracked(*args, **kwargs):
+                    nonlocal active, peak
+                    active += 1
+                    peak = max(peak, active)
+                    try:
+                        return await run(*args, **kwargs)
+                    finally:
+                        active -= 1
+
+                tools.engine.run = tracked
+                results = await tools.execute_workflows([
+                    {"industry": "healthcare", "workflow_id": workflow_id}
+                    for workflow_id in ("staff_scheduling", "patient_flow", "resource_allocation")
+                ] + [{"industry": "healthcare", "workflow_id": "unknown"}])
+
+        assert peak == 2
+        assert [r["status"] for r in results] == ["success", "success", "success", "error"]
+        assert results[3]["fallback"] == "Default workflow execution"
+
+    @pytest.mark.asyncio
+    async def test_streams_stage_progress(self):
+        events = []
+
+        async def on_event(event):
+            events.append(event)
+
+        async with StubGateway() as gateway:
+            async with make_tools(gateway.url) as tools:
+                result = await tools.call_streaming(
+                    "execute_workflow", "marketing", "campaign_optimization", on_event=on_event
+                )
+
+        assert result["status"] == "success"
+        progress = [e for e in events if e["event"] == "progress"]
+        assert [e["progress"] for e in progress] == [1, 2, 3, 4]
+        assert sorted(e["stage"] for e in events if e["event"] == "partial") == sorted(STAGES)
+
+
+class TestRemoteFallback:
+    """Workflows the engine cannot run go to the gateway."""
+
+    @pytest.mark.asyncio
+    async def test_unknown_template_runs_remotely(self):
+        async with StubGateway() as gateway:
+            async with make_tools(gateway.url) as tools:
+                result = await tools.execute_workflow("mining", "haul_dispatch")
+
+        assert gateway.calls == ["execute_workflow"]
+        assert result["status"] == "success"
+        assert result["workflow_id"] == "haul_dispatch"
+
+    @pytest.mark.asyncio
+    async def test_remote_engine(self):
+        async with StubGateway() as gateway:
+            async with make_tools(gateway.url, workflow_engine="remote") as tools:
+                await tools.execute_workflow("manufacturing", "production_planning")
+
+        assert gateway.calls == ["execute_workflow"]
+
+    def test_plan_checks_step_dependencies(self):
+        tools = make_tools("http://127.0.0.1:9")
+        tools.workflow_manager.add_workflows({
+            "energy": {"solve_only": {"name": "Solve Only", "steps": ["Optimization Solving"]}}
+        })
+
+        assert tools.engine.plan("energy", "grid_optimization") == STAGES
+        with pytest.raises(WorkflowError, match="needs build_model"):
+            tools.engine.plan("energy", "solve_only")
+
+
+class TestCheckpointStore:
+    """Test cases for checkpoint persistence."""
+
+    def test_round_trip(self, tmp_path):
+        store = CheckpointStore(tmp_path)
+        store.save({"run_id": "a/b", "stages": {"classify_intent": {"fingerprint": "x", "result": {}}}})
+
+        loaded = CheckpointStore(tmp_path).get("a/b")
+        assert loaded["stages"]["classify_intent"]["fingerprint"] == "x"
+
+        store.delete("a/b")
+        assert CheckpointStore(tmp_path).get("a/b") is None
+
+    def test_corrupt_file_is_ignored(self, tmp_path):
+        store = CheckpointStore(tmp_path)
+        store.save({"run_id": "a/b", "stages": {}})
+        store._file("a/b").write_text("{not json")
+
+        assert CheckpointStore(tmp_path).get("a/b") is None
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Tests for workflow templates and search
+=======================================
+
+Covers ranked full-text search (prefix and typo matching), precomputed
+statistics and loading customer templates from JSON/YAML files.
+"""
+
+import json
+
+import pytest
+import yaml
+from dcisionai_mcp_server.workflow_index import WorkflowIndex
+from dcisionai_mcp_server.workflows import TEMPLATES_ENV, WorkflowManager
+
+
+@pytest.fixture
+def manager():
+    return WorkflowManager(template_paths=[])
+
+
+def ids(results):
+    return [r["workflow_id"] for r in results]
+
+
+class TestWorkflowSearch:
+    """Test cases for WorkflowManager.search_workflows."""
+
+    def test_exact_match_ranks_name_first(self, manager):
+        results = manager.search_workflows("inventory")
+
+        assert ids(results)[0] == "inventory_optimization"
+        assert all(r["score"] > 0 for r in results)
+        assert [r["score"] for r in results] == sorted((r["score"] for r in results), reverse=True)
+
+    def test_prefix_and_typo(self, manager):
+        assert "inventory_optimization" in ids(manager.search_workflows("invent"))
+        assert "inventory_optimization" in ids(manager.search_workflows("inventroy"))
+        assert "portfolio_optimization" in ids(manager.search_workflows("portfolo"))
+
+    def test_all_terms_must_match(self, manager):
+        assert ids(manager.search_workflows("supply chain")) == ["supply_chain"]
+        assert manager.search_workflows("supply zzzz") == []
+        assert manager.search_workflows("") == []
+
+    def test_limit_keeps_best_results(self, manager):
+        everything = manager.search_workflows("optimization")
+        top = manager.search_workflows("optimization", limit=3)
+
+        assert len(everything) > 3
+        assert top == everything[:3]
+
+    def test_matches_industry(self, manager):
+        results = manager.search_workflows("healthcare")
+        assert {r["industry"] for r in results} == {"healthcare"}
+        assert len(results) == 3
+
+    def test_memoized_results_are_independent(self, manager):
+        first = manager.search_workflows("optimization")
+        first.clear()
+        assert manager.search_workflows("optimization")
+
+    def test_rank_matches_any_term(self, manager):
+        text = "Schedule healthcare staff across shifts at minimum cost"
+        assert manager.search_workflows(text) == []
+
+        results = manager.rank_workflows(text, limit=3)
+        assert results[0]["workflow_id"] == "staff_scheduling"
+        assert results[0]["score"] >= results[-1]["score"]
+
+
+class TestWorkflowIndex:
+    """Test cases for the index on its own."""
+
+    def test_prefix_scores_below_exact(self):
+        index = WorkflowIndex([
+            {"workflow_id": "a", "name": "Route Planning", "description": ""},
+            {"workflow_id": "b", "name": "Routes Planning", "description": ""},
+        ])
+        results = index.search("route")
+
+        assert ids(results) == ["a", "b"]
+        assert results[0]["score"] > results[1]["score"]
+
+    def test_single_token_limit_matches_full_ranking(self):
+        documents = [
+            {"workflow_id": str(i), "name": f"{'route ' * (i % 4)}routing", "description": "x " * i}
+            for i in range(50)
+        ]
+        index = WorkflowIndex(documents)
+
+        assert index.search("rout", limit=5) == index.search("rout")[:5]
+
+
+class TestWorkflowTemplates:
+    """Test cases for loading external templates and precomputed responses."""
+
+    def test_statistics(self, manager):
+        stats = manager.get_workflow_statistics()
+
+        assert stats["total_workflows"] == 21
+        assert sum(stats["complexity_distribution"].values()) == 21
+        assert set(stats["complexity_distribution"]) == {"low", "medium", "high"}
+
+    def test_load_json_and_yaml(self, tmp_path):
+        (tmp_path / "acme.json").write_text(json.dumps({
+            "manufacturing": {
+                "kiln_scheduling": {
+                    "title": "Kiln Firing Scheduling",
+                    "description": "Sequence kiln batches to cut energy use",
+                    "difficulty": "advanced",
+                    "estimated_time": "5-10 minutes"
+                }
+            }
+        }))
+        (tmp_path / "fleet.yaml").write_text(yaml.safe_dump({"templates": [
+            {"industry": "mining", "id": "haul_dispatch", "name": "Haul Truck Dispatch"},
+        ]}))
+        (tmp_path / "notes.txt").write_text("ignored")
+
+        manager = WorkflowManager(template_paths=[tmp_path])
+        details = manager.get_workflow_details("manufacturing", "kiln_scheduling")
+        stats = manager.get_workflow_statistics()
+
+        assert details["name"] == "Kiln Firing Scheduling"
+        assert details["complexity"] == "high"
+        assert manager.validate_workflow("mining", "haul_dispatch")
+        assert manager.get_workflow_template("mining", "haul_dispatch")["template"]["parameters"]["complexity"] == "medium"
+        assert stats["total_workflows"] == 23
+        assert stats["total_industries"] == 8
+        assert ids(manager.search_workflows("kiln")) == ["kiln_scheduling"]
+        assert ids(manager.search_workflows("haul dispach")) == ["haul_dispatch"]
+
+    def test_templates_from_env(self, tmp_path, monkeypatch):
+        path = tmp_path / "extra.json"
+        path.write_text(json.dumps([
+            {"industry": "retail", "workflow_id": "shelf_layout", "name": "Shelf Layout"},
+        ]))
+        monkeypatch.setenv(TEMPLATES_ENV, str(path))
+
+        manager = WorkflowManager()
+
+        assert manager.get_industry_workflows("retail")["workflow_count"] == 4
+
+    def test_add_workflows_rebuilds(self, manager):
+        assert manager.search_workflows("kiln") == []
+
+        manager.add_workflows({"energy": {"kiln": {"name": "Kiln Load Shifting"}}})
+
+        assert ids(manager.search_workflows("kiln")) == ["kiln"]
+        assert manager.get_all_workflows()["total_workflows"] == 22
+
+    def test_invalid_template(self, manager):
+        with pytest.raises(ValueError, match="industry and an id"):
+            manager.add_workflows([{"name": "Orphan"}])